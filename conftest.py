@@ -6,18 +6,295 @@ G마켓 자동화 테스트 공통 설정 파일
 - 봇 탐지 우회 설정
 - 스크린샷 자동 저장
 - 테스트 계정 정보 관리
+- think-time pacing 프로필 설정
+- 로그인 상태(storage_state) 캐시
+- 리소스 차단 정책 (이미지/폰트/미디어/트래커)
+- HAR 녹화/재생 모드
+- 로컬 G마켓 스탠드인 서버
+- 비동기(playwright.async_api) Browser/Context/Page fixture
+- 프레임워크 로그 (레벨 설정 / 테스트별 JSONL 파일)
+- 실패한 테스트만 남기는 Playwright trace
+- 백그라운드 스레드 스크린샷 저장 (형식/품질 설정, 중복 제거)
+- 페이지 방문별 Web Vitals / Navigation Timing 수집 (opt-in)
+- 실행 기록 SQLite 저장 (테스트/메서드/페이지 지표, 성능 회귀 검사용)
 """
 
+import asyncio
+import glob
+import json
 import os
-from datetime import datetime
+import time
+from urllib.parse import urlparse
 
 import pytest
+import pytest_asyncio
 import pytest_html
 from dotenv import load_dotenv
+from playwright.async_api import async_playwright
 from playwright.sync_api import sync_playwright
 
+from framework.base.base_page import BasePage
+from framework.config.locators import GmarketLocators
+from framework.history.regression import detect
+from framework.history.store import HistoryStore
+from framework.standin.server import StandinServer
+from framework.standin.store import StandinConfig
+from framework.utils.auth_cache import AuthStateCache
+from framework.utils.clock import VirtualClock, get_clock, set_clock
+from framework.utils.context_pool import ContextPool
+from framework.utils.dialogs import set_dialog_preempt
+from framework.utils.har import MODES as HAR_MODES
+from framework.utils.har import NOT_FOUND_ACTIONS as HAR_NOT_FOUND_ACTIONS
+from framework.utils.har import HarSettings
+from framework.utils.logger import (
+    configure_logging,
+    get_logger,
+    set_current_test,
+    shutdown_logging,
+)
+from framework.utils.pacing import PROFILES, get_pacer
+from framework.utils.resource_policy import POLICIES, ResourceBlocker
+from framework.utils.round_trips import get_round_trip_counter
+from framework.utils.screenshots import FORMATS as SCREENSHOT_FORMATS
+from framework.utils.screenshots import (
+    ScreenshotService,
+    get_screenshot_service,
+    set_screenshot_service,
+)
+from framework.utils.timing import ActionTimer, get_action_timer, write_prometheus
+from framework.utils.tracing import MODES as TRACE_MODES
+from framework.utils.tracing import TraceRecorder
+from framework.utils.web_vitals import VitalsCollector, html_table, summarize_by_path
+
+logger = get_logger(__name__)
+
 load_dotenv()
 
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# 자동화 감지 제거 스크립트
+STEALTH_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined,
+    });
+
+    // Chrome 객체 추가 (자연스러운 브라우저처럼 보이게)
+    window.chrome = {
+        runtime: {}
+    };
+"""
+
+# 🤖 봇 탐지 우회를 위한 브라우저 실행 옵션
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-automation",
+    "--exclude-switches=enable-automation",
+]
+
+CONTEXT_OPTIONS = {
+    "user_agent": USER_AGENT,
+    "viewport": {"width": 1920, "height": 1080},
+    "locale": "ko-KR",
+    "timezone_id": "Asia/Seoul",
+}
+
+
+def _headless():
+    return os.getenv("HEADLESS", "false").lower() == "true"
+
+
+# ==================== Command Line Options ====================
+
+
+def pytest_addoption(parser):
+    """
+    프레임워크 실행 옵션을 등록합니다.
+
+    - --pacing: think-time 프로필 (human / fast / zero)
+    - --think-budget: 테스트당 think-time 예산 (초)
+    - --virtual-clock: 딜레이를 가상 시계로 처리
+    - --context-max-uses: 컨텍스트 풀 재사용 횟수
+    - --resource-policy: 리소스 차단 정책 (assertions-only / visual / full)
+    - --har-mode / --har-dir / --har-not-found: HAR 녹화/재생 설정
+    - --standin: 로컬 스탠드인 서버를 띄우고 대상 URL을 바꿈
+    - --page-log-level / --quiet-logs / --page-log-dir: 프레임워크 로그 레벨과 JSONL 저장 위치
+    - --trace-mode / --trace-keep-chunks / --trace-dir: 실패한 테스트의 Playwright trace 저장
+    - --screenshot-format / --screenshot-quality: 스크린샷 저장 형식과 품질
+    - --web-vitals: 페이지 방문별 Web Vitals / Navigation Timing 수집
+    - --dialog-preempt: 정책 블록 안의 alert/confirm/prompt를 init script로 페이지 안에서 처리
+    - --history-db / --history-env / --no-history: 실행 기록 저장 위치와 비교 환경
+    """
+    group = parser.getgroup("gmarket", "G마켓 프레임워크 옵션")
+    group.addoption(
+        "--pacing",
+        action="store",
+        default=os.getenv("PACING_PROFILE", "human"),
+        choices=sorted(PROFILES),
+        help="think-time pacing 프로필 (기본값: PACING_PROFILE 환경 변수 또는 human)",
+    )
+    group.addoption(
+        "--think-budget",
+        action="store",
+        type=float,
+        default=float(os.getenv("THINK_TIME_BUDGET")) if os.getenv("THINK_TIME_BUDGET") else None,
+        help="테스트당 think-time 예산(초). 초과한 딜레이는 생략됩니다.",
+    )
+    group.addoption(
+        "--virtual-clock",
+        action="store_true",
+        default=False,
+        help="딜레이를 실제로 기다리지 않고 가상 시계로 기록만 합니다.",
+    )
+    group.addoption(
+        "--context-max-uses",
+        action="store",
+        type=int,
+        default=int(os.getenv("CONTEXT_POOL_MAX_USES", "50")),
+        help="풀에서 컨텍스트 하나를 재사용할 최대 횟수 (1이면 매 테스트 새로 생성)",
+    )
+    group.addoption(
+        "--resource-policy",
+        action="store",
+        default=os.getenv("RESOURCE_POLICY", "full"),
+        choices=sorted(POLICIES),
+        help='리소스 차단 정책 (테스트별로는 @pytest.mark.resources("visual")로 지정)',
+    )
+    group.addoption(
+        "--har-mode",
+        action="store",
+        default=os.getenv("HAR_MODE", "off"),
+        choices=HAR_MODES,
+        help="HAR 녹화/재생 모드 (record: 모듈별 HAR 녹화, replay: HAR로 응답해서 네트워크 없이 실행)",
+    )
+    group.addoption(
+        "--har-dir",
+        action="store",
+        default=os.getenv("HAR_DIR", "tests/har"),
+        help="HAR 파일 저장 위치 (기본값: tests/har)",
+    )
+    group.addoption(
+        "--har-not-found",
+        action="store",
+        default=os.getenv("HAR_NOT_FOUND", "abort"),
+        choices=HAR_NOT_FOUND_ACTIONS,
+        help="재생 시 HAR에 없는 요청 처리 (abort: 차단, fallback: 실제 네트워크로 보냄)",
+    )
+    group.addoption(
+        "--standin",
+        action="store_true",
+        default=os.getenv("STANDIN", "false").lower() == "true",
+        help="로컬 G마켓 스탠드인 서버를 띄우고 그 서버를 대상으로 실행",
+    )
+    group.addoption(
+        "--standin-results",
+        action="store",
+        type=int,
+        default=int(os.getenv("STANDIN_RESULTS", "60")),
+        help="스탠드인 서버의 검색어당 결과 수",
+    )
+    group.addoption(
+        "--standin-cart-size",
+        action="store",
+        type=int,
+        default=int(os.getenv("STANDIN_CART_SIZE", "0")),
+        help="스탠드인 서버에서 새 세션 장바구니에 미리 담을 상품 수",
+    )
+    group.addoption(
+        "--standin-latency-ms",
+        action="store",
+        type=int,
+        default=int(os.getenv("STANDIN_LATENCY_MS", "0")),
+        help="스탠드인 서버 응답마다 추가할 지연 (밀리초)",
+    )
+    group.addoption(
+        "--page-log-level",
+        action="store",
+        default=os.getenv("PAGE_LOG_LEVEL", "INFO"),
+        choices=("DEBUG", "INFO", "WARNING", "ERROR"),
+        type=str.upper,
+        help="페이지 객체 로그 레벨 (DEBUG이면 로그 전용 브라우저 호출까지 수행)",
+    )
+    group.addoption(
+        "--quiet-logs",
+        action="store_true",
+        default=os.getenv("QUIET_LOGS", "false").lower() == "true",
+        help="WARNING 이상만 기록 (로그 전용 브라우저 호출 생략)",
+    )
+    group.addoption(
+        "--page-log-dir",
+        action="store",
+        default=os.getenv("PAGE_LOG_DIR", "reports/logs"),
+        help="테스트별 JSONL 로그 저장 디렉토리",
+    )
+    group.addoption(
+        "--trace-mode",
+        action="store",
+        default=os.getenv("TRACE_MODE", "failure"),
+        choices=TRACE_MODES,
+        help="Playwright trace (failure: 테스트마다 청크를 기록하고 실패한 테스트만 저장)",
+    )
+    group.addoption(
+        "--trace-keep-chunks",
+        action="store",
+        type=int,
+        default=int(os.getenv("TRACE_KEEP_CHUNKS", "1")),
+        help="실패 시 함께 남길 청크 수 (현재 테스트 포함, 2 이상이면 통과한 테스트 청크도 임시 파일로 보관)",
+    )
+    group.addoption(
+        "--trace-dir",
+        action="store",
+        default=os.getenv("TRACE_DIR", "reports/traces"),
+        help="실패 trace 저장 디렉토리",
+    )
+    group.addoption(
+        "--screenshot-format",
+        action="store",
+        default=os.getenv("SCREENSHOT_FORMAT", "jpeg"),
+        choices=SCREENSHOT_FORMATS,
+        help="스크린샷 형식 (webp는 Pillow 필요)",
+    )
+    group.addoption(
+        "--screenshot-quality",
+        action="store",
+        type=int,
+        default=int(os.getenv("SCREENSHOT_QUALITY", "80")),
+        help="jpeg / webp 스크린샷 품질 (0~100)",
+    )
+    group.addoption(
+        "--web-vitals",
+        action="store_true",
+        default=os.getenv("WEB_VITALS", "false").lower() == "true",
+        help="페이지 방문별 LCP/CLS/INP/TTFB/리소스 타이밍 수집",
+    )
+    group.addoption(
+        "--dialog-preempt",
+        action="store_true",
+        default=os.getenv("DIALOG_PREEMPT", "false").lower() == "true",
+        help="다이얼로그 정책 블록 안의 alert/confirm/prompt를 페이지 안에서 바로 처리 (다이얼로그별 왕복 제거)",
+    )
+    group.addoption(
+        "--history-db",
+        action="store",
+        default=os.getenv("HISTORY_DB", "reports/history.sqlite"),
+        help="실행 기록 SQLite 파일 (python -m framework.history check 로 회귀 검사)",
+    )
+    group.addoption(
+        "--history-env",
+        action="store",
+        default=os.getenv("HISTORY_ENV") or None,
+        help="실행 기록 비교 환경 이름 (기본값: 대상 호스트:pacing 프로필)",
+    )
+    group.addoption(
+        "--no-history",
+        action="store_true",
+        default=os.getenv("HISTORY", "true").lower() == "false",
+        help="실행 기록을 저장하지 않음",
+    )
+
 
 # ==================== Browser Fixtures ====================
 
@@ -33,176 +310,463 @@ def browser():
     - webdriver 속성 제거
     """
     with sync_playwright() as p:
-        headless = os.getenv("HEADLESS", "false").lower() == "true"
-
-        # 🤖 봇 탐지 우회를 위한 브라우저 설정
-        browser = p.chromium.launch(
-            headless=headless,
-            args=[
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-automation",
-                "--exclude-switches=enable-automation",
-            ],
-        )
+        browser = p.chromium.launch(headless=_headless(), args=BROWSER_ARGS)
         yield browser
         browser.close()
 
 
+def _new_context(browser, **options):
+    """공통 설정(User-Agent, 뷰포트, 로케일, 자동화 감지 제거)이 적용된 컨텍스트 생성"""
+    context = browser.new_context(**CONTEXT_OPTIONS, **options)
+    context.add_init_script(STEALTH_SCRIPT)
+    return context
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, trace_recorder, request):
+    """
+    워커(세션)별 브라우저 컨텍스트 풀
+
+    테스트가 끝나면 컨텍스트를 닫지 않고 상태만 초기화해서 다음 테스트에 재사용합니다.
+    --context-max-uses 번 사용한 컨텍스트는 새로 만듭니다.
+    """
+    pool = ContextPool(
+        lambda: _new_context(browser),
+        max_uses=request.config.getoption("--context-max-uses"),
+        on_close=trace_recorder.forget,
+    )
+
+    yield pool
+
+    pool.close()
+    if pool.created:
+        _write_worker_report("context-pool", pool.stats())
+
+
+@pytest.fixture(scope="session")
+def har_settings(request):
+    """--har-mode / --har-dir / --har-not-found 옵션으로 만든 HAR 설정"""
+    return HarSettings(
+        request.config.getoption("--har-mode"),
+        directory=request.config.getoption("--har-dir"),
+        not_found=request.config.getoption("--har-not-found"),
+    )
+
+
+def _har_module_name(request):
+    return request.node.module.__name__.rsplit(".", 1)[-1]
+
+
+@pytest.fixture(scope="session")
+def trace_recorder(request):
+    """워커(세션)별 trace 청크 기록기 (--trace-mode / --trace-keep-chunks / --trace-dir)"""
+    recorder = TraceRecorder(
+        request.config.getoption("--trace-mode"),
+        directory=request.config.getoption("--trace-dir"),
+        keep_chunks=request.config.getoption("--trace-keep-chunks"),
+    )
+
+    yield recorder
+
+    recorder.close()
+    if recorder.chunks:
+        _write_worker_report("tracing", recorder.stats())
+
+
+def _test_failed(request):
+    """setup 또는 call 단계가 실패했는지 (pytest_runtest_makereport가 기록한 item.rep_<when>)"""
+    return any(getattr(getattr(request.node, f"rep_{when}", None), "failed", False) for when in ("setup", "call"))
+
+
+@pytest.fixture(scope="session")
+def web_vitals(request):
+    """--web-vitals 옵션이 켜져 있으면 워커(세션)별 VitalsCollector, 아니면 None"""
+    if not request.config.getoption("--web-vitals"):
+        yield None
+        return
+
+    collector = VitalsCollector()
+    yield collector
+
+    if collector.navigations:
+        _write_worker_report("web-vitals", collector.navigations)
+
+
+def _begin_vitals(request, web_vitals, context):
+    if web_vitals is not None:
+        web_vitals.install(context).begin(request.node.nodeid)
+
+
+def _end_vitals(request, web_vitals, context):
+    """이번 테스트의 navigation 요약을 teardown 리포트에 첨부하도록 기록 (page fixture가 먼저 수집했으면 건너뜀)"""
+    if web_vitals is not None and web_vitals.active:
+        request.node.web_vitals = web_vitals.end(context)
+
+
+def _end_trace(request, trace_recorder, context):
+    """테스트 청크 종료: 실패면 trace를 저장하고 teardown 리포트에 첨부할 경로를 기록"""
+    try:
+        paths = trace_recorder.end(context, request.node.nodeid, _test_failed(request))
+    except Exception as e:
+        logger.warning("trace 저장 실패: %s", e)
+        return
+    if paths:
+        request.node.trace_paths = paths
+
+
 @pytest.fixture
-def context(browser):
+def context(browser, context_pool, har_settings, trace_recorder, web_vitals, request):
     """
-    각 테스트마다 새로운 브라우저 컨텍스트를 생성합니다.
+    각 테스트마다 깨끗한 상태의 브라우저 컨텍스트를 제공합니다.
 
     - 한국어 로케일 및 타임존 설정
     - 자동화 감지 제거 스크립트 주입
     - 자연스러운 User-Agent 설정
+    - 풀에서 재사용된 경우 쿠키/저장소/권한/페이지가 초기화된 상태
+    - HAR 녹화/재생 모드에서는 풀을 거치지 않고 테스트마다 새 컨텍스트 사용
+    - 테스트마다 trace 청크를 기록하고 실패한 경우에만 저장
+    - --web-vitals 옵션이면 페이지 방문마다 Web Vitals 수집
     """
+    if har_settings.enabled:
+        module_name = _har_module_name(request)
+        context = _new_context(browser, **har_settings.context_options(module_name, request.node.name))
+        har_settings.attach(context, module_name)
+    else:
+        context = context_pool.acquire()
+        request.node.user_properties.append(
+            ("context_setup_saved_ms", round(context_pool.last_saved_seconds * 1000, 1))
+        )
+    blocker = _install_resource_blocker(request, context)
+    trace_recorder.begin(context, request.node.nodeid)
+    _begin_vitals(request, web_vitals, context)
 
-    context = browser.new_context(
-        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        viewport={"width": 1920, "height": 1080},
-        locale="ko-KR",
-        timezone_id="Asia/Seoul",
-    )
+    yield context
 
-    # 자동화 감지 제거 스크립트
-    context.add_init_script(
-        """
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined,
-        });
+    _end_vitals(request, web_vitals, context)
+    _end_trace(request, trace_recorder, context)
+    _uninstall_resource_blocker(request, context, blocker)
 
-        // Chrome 객체 추가 (자연스러운 브라우저처럼 보이게)
-        window.chrome = {
-            runtime: {}
-        };
-    """
-    )
+    if har_settings.enabled:
+        # 녹화 중인 HAR은 컨텍스트를 닫을 때 저장됨
+        trace_recorder.forget(context)
+        context.close()
+    else:
+        # 열린 페이지 정리 + 상태 초기화 후 풀에 반환
+        context_pool.release(context)
 
-    yield context
 
-    # Context 닫을 때 모든 페이지 정리
+_resource_totals = {"blocked_requests": 0, "blocked_bytes_estimated": 0, "allowed_requests": 0}
+
+
+def _install_resource_blocker(request, context):
+    """마커(@pytest.mark.resources) 또는 --resource-policy 옵션의 정책을 컨텍스트에 적용"""
+    marker = request.node.get_closest_marker("resources")
+    policy = marker.args[0] if marker else request.config.getoption("--resource-policy")
+
+    blocker = ResourceBlocker(policy).install(context)
+    request.node.resource_blocker = blocker
+    return blocker
+
+
+def _uninstall_resource_blocker(request, context, blocker):
     try:
-        for p in context.pages:
-            if not p.is_closed():
-                p.close()
+        blocker.uninstall(context)
     except Exception:
         pass
-    context.close()
+
+    stats = blocker.stats()
+    for key in _resource_totals:
+        _resource_totals[key] += stats[key]
+    request.node.user_properties.append(("blocked_requests", stats["blocked_requests"]))
+    request.node.user_properties.append(("blocked_bytes_estimated", stats["blocked_bytes_estimated"]))
 
 
 @pytest.fixture
-def page(context):
+def page(context, web_vitals, request):
     """
     각 테스트마다 새로운 페이지를 생성합니다.
 
     - 기본 타임아웃: 30초
     - 네비게이션 타임아웃: 30초
-    """
-    try:
-        context.clear_cookies()
-    except Exception:
-        pass
 
+    쿠키 등 상태 초기화는 context fixture(컨텍스트 풀)가 담당합니다.
+    마지막 문서의 Web Vitals는 페이지를 닫기 전에 수집합니다.
+    """
     page = context.new_page()
     page.set_default_timeout(30000)
     page.set_default_navigation_timeout(30000)
 
     yield page
 
-    # 쿠키 삭제
-    context.clear_cookies()
+    _end_vitals(request, web_vitals, context)
+    if not page.is_closed():
+        page.close()
+
+
+# ==================== Async Fixtures ====================
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    비동기 테스트/fixture가 세션 전체에서 하나의 이벤트 루프를 공유합니다.
+
+    async_browser를 세션 동안 재사용하기 위해 필요합니다.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_browser():
+    """
+    비동기 테스트용 브라우저 (세션 공유)
+
+    한 이벤트 루프에서 여러 페이지의 journey를 asyncio.gather로 동시에 실행할 수 있습니다.
+    """
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=_headless(), args=BROWSER_ARGS)
+        yield browser
+        await browser.close()
+
 
-    page.close()
+@pytest_asyncio.fixture
+async def async_context(async_browser):
+    """각 비동기 테스트마다 새 컨텍스트 (동기 context fixture와 같은 설정)"""
+    context = await async_browser.new_context(**CONTEXT_OPTIONS)
+    await context.add_init_script(STEALTH_SCRIPT)
+
+    yield context
+
+    await context.close()
+
+
+@pytest_asyncio.fixture
+async def async_page(async_context):
+    """비동기 테스트용 페이지 (기본/네비게이션 타임아웃 30초)"""
+    page = await async_context.new_page()
+    page.set_default_timeout(30000)
+    page.set_default_navigation_timeout(30000)
+
+    yield page
+
+    if not page.is_closed():
+        await page.close()
 
 
 # ==================== Logged In Fixtures ====================
 
 
+def _open_cached_context(browser, state_path, **options):
+    """
+    캐시된 storage_state로 컨텍스트를 열고 로그인 상태인지 확인합니다.
+
+    로그아웃 버튼이 보이지 않으면(세션 만료 등) 컨텍스트를 닫고 None을 반환합니다.
+    """
+    context = _new_context(browser, storage_state=state_path, **options)
+    probe_page = context.new_page()
+    try:
+        probe_page.goto(BasePage.base_url, wait_until="domcontentloaded", timeout=30000)
+        probe_page.locator(GmarketLocators.LOGOUT_BUTTON).first.wait_for(state="attached", timeout=10000)
+        return context
+    except Exception:
+        context.close()
+        return None
+    finally:
+        if not probe_page.is_closed():
+            probe_page.close()
+
+
+def _open_cached_state(browser, auth_state_cache, account, base_url, **options):
+    """
+    캐시된 로그인 상태로 컨텍스트를 엽니다 (캐시가 없거나 로그인 상태가 아니면 None).
+
+    확인에 실패한 상태는 바로 삭제해서 락을 잡은 뒤 같은 상태를 다시 확인하지 않도록 합니다.
+    """
+    state_path = auth_state_cache.load(account, base_url)
+    if not state_path:
+        return None
+    context = _open_cached_context(browser, state_path, **options)
+    if context is None:
+        logger.info("🔐 저장된 로그인 상태가 만료되어 삭제합니다")
+        auth_state_cache.invalidate(account, base_url)
+    return context
+
+
+@pytest.fixture(scope="session")
+def auth_state_cache():
+    """
+    로그인 상태 캐시 (.auth/ 디렉토리)
+
+    - AUTH_STATE_DIR: 저장 위치 (기본값: .auth)
+    - AUTH_STATE_TTL: 유효 시간(초, 기본값: 3600, 0이면 캐시 사용 안 함)
+    """
+    return AuthStateCache(os.getenv("AUTH_STATE_DIR", ".auth"), ttl=float(os.getenv("AUTH_STATE_TTL", "3600")))
+
+
+# 로그인 세션의 HAR 이름 (tests/har/logged_in_session.har)
+LOGGED_IN_HAR_NAME = "logged_in_session"
+
+
+def _auth_cache_target(config):
+    """
+    로그인 상태 캐시 키에 쓸 대상 이름
+
+    stand-in 서버는 실행(워커)마다 빈 포트를 새로 받으므로 URL 대신 고정 이름을 씁니다.
+    stand-in 로그인은 쿠키(포트 구분 없음)라서 저장된 상태를 다른 포트에서도 그대로 쓸 수 있습니다.
+    """
+    return "standin" if config.getoption("--standin") else BasePage.base_url
+
+
 @pytest.fixture(scope="session")
-def logged_in_context(browser, test_account):
+def logged_in_context(browser, test_account, auth_state_cache, har_settings, trace_recorder, pytestconfig):
     """
     세션 전체에서 재사용할 수 있는 로그인된 컨텍스트
 
     한 번만 로그인하고, 이 컨텍스트를 여러 테스트에서 재사용합니다.
     Rate Limiting 문제를 해결합니다.
-    """
-    from framework.pages.home_page import HomePage
 
-    # 새로운 컨텍스트 생성
-    context = browser.new_context(
-        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        viewport={"width": 1920, "height": 1080},
-        locale="ko-KR",
-        timezone_id="Asia/Seoul",
-    )
+    로그인 결과(storage_state)는 디스크에 캐시되어 다음 실행과 다른 xdist 워커가 재사용합니다.
+    캐시가 없거나 만료된 경우에만 한 워커가 락을 잡고 UI 로그인을 수행하고,
+    나머지 워커는 락이 풀릴 때까지 기다린 뒤 저장된 상태를 사용합니다.
 
-    # 자동화 감지 제거 스크립트
-    context.add_init_script(
-        """
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined,
-        });
-        window.chrome = { runtime: {} };
-        """
-    )
-
-    # 임시 페이지를 만들어서 로그인 수행
-    temp_page = context.new_page()
-    temp_page.set_default_timeout(30000)
-    temp_page.set_default_navigation_timeout(30000)
+    HAR 재생 모드에서는 녹화된 로그인 세션 HAR로 응답하므로 로그인하지 않습니다.
+    """
+    from framework.pages.home_page import HomePage
 
-    print("\n🔐 세션용 로그인 수행 중...")
-    homepage = HomePage(temp_page)
-    homepage.visit()
-    homepage.click_login_button(test_account["id"], test_account["password"])
-    print("✅ 세션 로그인 완료\n")
+    if har_settings.mode == "replay":
+        context = har_settings.attach(
+            _new_context(browser, **har_settings.context_options(LOGGED_IN_HAR_NAME, "")), LOGGED_IN_HAR_NAME
+        )
+        logger.info("🔐 녹화된 로그인 세션(HAR)을 재생합니다")
+        yield context
+        trace_recorder.forget(context)
+        context.close()
+        return
+
+    # 녹화 모드에서는 워커별로 세션 전체를 HAR 하나에 녹화
+    har_options = har_settings.context_options(LOGGED_IN_HAR_NAME, os.getenv("PYTEST_XDIST_WORKER", "main"))
+
+    account = test_account["id"]
+    base_url = _auth_cache_target(pytestconfig)
+
+    context = _open_cached_state(browser, auth_state_cache, account, base_url, **har_options)
+
+    if context is None:
+        with auth_state_cache.lock(account, base_url):
+            # 락을 기다리는 동안 다른 워커가 로그인했는지 다시 확인
+            context = _open_cached_state(browser, auth_state_cache, account, base_url, **har_options)
+
+            if context is None:
+                # 새로운 컨텍스트 생성
+                context = _new_context(browser, **har_options)
+
+                # 임시 페이지를 만들어서 로그인 수행
+                temp_page = context.new_page()
+                temp_page.set_default_timeout(30000)
+                temp_page.set_default_navigation_timeout(30000)
+
+                logger.info("🔐 세션용 로그인 수행 중...")
+                homepage = HomePage(temp_page)
+                homepage.visit()
+                if homepage.click_login_button(test_account["id"], test_account["password"]):
+                    if auth_state_cache.enabled:
+                        auth_state_cache.save(account, base_url, context.storage_state())
+                    logger.info("✅ 세션 로그인 완료")
+                else:
+                    auth_state_cache.invalidate(account, base_url)
 
-    # 로그인에 사용한 임시 페이지는 닫기 (context는 유지!)
-    temp_page.close()
+                # 로그인에 사용한 임시 페이지는 닫기 (context는 유지!)
+                temp_page.close()
+            else:
+                logger.info("🔐 다른 워커가 저장한 로그인 상태를 재사용합니다")
+    else:
+        logger.info("🔐 저장된 로그인 상태를 재사용합니다")
 
     yield context  # 로그인된 context를 반환
 
     # 모든 테스트 끝난 후에만 context 닫기
+    trace_recorder.forget(context)
     context.close()
 
 
 @pytest.fixture
-def logged_in_page(logged_in_context):
+def logged_in_page(logged_in_context, trace_recorder, web_vitals, request):
     """
     로그인된 컨텍스트에서 새 페이지를 생성합니다.
 
     이미 로그인된 상태이므로 다시 로그인할 필요 없습니다.
     로그인이 필요한 테스트에서 사용합니다.
     """
+    blocker = _install_resource_blocker(request, logged_in_context)
+    trace_recorder.begin(logged_in_context, request.node.nodeid)
+    _begin_vitals(request, web_vitals, logged_in_context)
+
     page = logged_in_context.new_page()
     page.set_default_timeout(30000)
     page.set_default_navigation_timeout(30000)
 
     yield page
 
+    _end_vitals(request, web_vitals, logged_in_context)
+    _end_trace(request, trace_recorder, logged_in_context)
+    _uninstall_resource_blocker(request, logged_in_context, blocker)
+
     try:
         # context에 열린 모든 페이지 확인
         for p in logged_in_context.pages:
             if not p.is_closed():
                 p.close()
-                print(f"🧹 페이지 닫음: {p.url if hasattr(p, 'url') else '알 수 없음'}")
+                logger.debug("🧹 페이지 닫음: %s", p.url if hasattr(p, "url") else "알 수 없음")
     except Exception as e:
-        print(f"⚠️ 페이지 정리 중 오류: {e}")
+        logger.warning("⚠️ 페이지 정리 중 오류: %s", e)
+
+
+# ==================== Pacing Fixtures ====================
+
+
+@pytest.fixture(autouse=True)
+def think_time_budget(request):
+    """
+    테스트마다 think-time 예산을 초기화하고, 사용한 시간을 기록합니다.
+    """
+    pacer = get_pacer()
+    pacer.begin_test(request.node.nodeid)
+
+    yield pacer
+
+    spent = pacer.end_test()
+    request.node.user_properties.append(("think_time_seconds", round(spent, 3)))
+
+
+@pytest.fixture
+def virtual_clock(request):
+    """
+    테스트 동안 전역 기본 시계를 VirtualClock으로 바꿉니다.
+
+    페이지 객체의 딜레이가 즉시 끝나고, 호출 위치별 가상 대기 시간이 기록됩니다.
+    """
+    previous = get_clock()
+    clock = set_clock(VirtualClock())
+
+    yield clock
+
+    set_clock(previous)
+    request.node.user_properties.append(("simulated_delay_seconds", round(clock.slept, 3)))
 
 
 # ==================== Test Account Fixture ====================
 
 
 @pytest.fixture(scope="session")
-def test_account():
+def test_account(pytestconfig):
     """
     테스트 계정 정보를 제공합니다.
 
     .env 파일에서 TEST_ID, TEST_PASSWORD를 읽어옵니다.
     환경 변수가 설정되지 않은 경우 테스트를 스킵합니다.
+    (스탠드인 서버는 어떤 계정이든 로그인되므로 기본 계정을 사용)
 
     Returns:
         dict: {'id': str, 'password': str}
@@ -210,6 +774,9 @@ def test_account():
     test_id = os.getenv("TEST_ID")
     test_password = os.getenv("TEST_PASSWORD")
 
+    if getattr(pytestconfig, "standin_server", None) and not (test_id and test_password):
+        return {"id": "standin", "password": "standin"}
+
     if not test_id or not test_password:
         pytest.skip("테스트 계정 정보가 설정되지 않았습니다. .env 파일을 확인하세요.")
 
@@ -226,10 +793,366 @@ def pytest_configure(config):
     - reports/
     - reports/screenshots/
     - videos/
+
+    --standin 옵션이면 스탠드인 서버를 띄우고 BasePage.base_url을 그 주소로 바꿉니다.
     """
     os.makedirs("reports", exist_ok=True)
     os.makedirs("reports/screenshots", exist_ok=True)
 
+    # 이전 실행의 워커별 기록 정리 (xdist 워커는 건너뜀)
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        for path in (
+            glob.glob("reports/*-worker-*.json")
+            + glob.glob("reports/action-timings.*")
+            + glob.glob("reports/web-vitals.json")
+        ):
+            os.remove(path)
+
+    # 페이지 객체 로그는 백그라운드 스레드에서 테스트별 JSONL 파일로 기록 (이전 실행 로그는 정리)
+    log_dir = config.getoption("--page-log-dir")
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        for path in glob.glob(os.path.join(log_dir, "*.jsonl")):
+            os.remove(path)
+    level = "WARNING" if config.getoption("--quiet-logs") else config.getoption("--page-log-level")
+    configure_logging(level, log_dir)
+
+    # 스크린샷은 백그라운드 스레드에서 저장
+    set_screenshot_service(
+        ScreenshotService(
+            image_format=config.getoption("--screenshot-format"),
+            quality=config.getoption("--screenshot-quality"),
+        )
+    )
+
+    # 전역 Pacer에 프로필/예산 적용
+    pacer = get_pacer()
+    pacer.set_profile(config.getoption("--pacing"))
+    pacer.budget = config.getoption("--think-budget")
+
+    if config.getoption("--virtual-clock"):
+        set_clock(VirtualClock())
+
+    set_dialog_preempt(config.getoption("--dialog-preempt"))
+
+    # .env의 BASE_URL은 BasePage를 import한 뒤에 로드되므로 여기서 다시 적용
+    BasePage.base_url = (os.getenv("BASE_URL") or BasePage.base_url).rstrip("/")
+
+    # 스탠드인 서버는 프로세스(xdist 워커)마다 빈 포트로 하나씩 띄움
+    if config.getoption("--standin"):
+        config.standin_server = StandinServer(
+            StandinConfig(
+                result_count=config.getoption("--standin-results"),
+                cart_size=config.getoption("--standin-cart-size"),
+                latency_ms=config.getoption("--standin-latency-ms"),
+            )
+        ).start()
+        BasePage.base_url = config.standin_server.url
+
+
+def pytest_unconfigure(config):
+    """스탠드인 서버 종료, 남은 스크린샷/로그 기록"""
+    server = getattr(config, "standin_server", None)
+    if server is not None:
+        server.stop()
+    get_screenshot_service().close()
+    shutdown_logging()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """setup부터 teardown까지의 로그를 테스트별 JSONL 파일로 보냄"""
+    set_current_test(item.nodeid)
+    yield
+    set_current_test(None)
+
+
+_session_started = None
+_test_results = {}
+
+
+def pytest_sessionstart(session):
+    global _session_started
+    _session_started = time.monotonic()
+
+
+def pytest_runtest_logreport(report):
+    """테스트별 결과와 소요 시간(setup + call + teardown) 기록 (xdist 실행 시 메인 프로세스에서 모두 받음)"""
+    result = _test_results.setdefault(report.nodeid, ["passed", 0.0])
+    result[1] += report.duration
+    if report.failed:
+        result[0] = "failed" if report.when == "call" else "error"
+    elif report.skipped and result[0] == "passed":
+        result[0] = "skipped"
+
+
+def _history_environment(config):
+    """같은 조건의 실행끼리만 비교하도록 대상 호스트와 pacing 프로필로 환경 이름을 만듦"""
+    environment = config.getoption("--history-env")
+    if environment:
+        return environment
+    host = "standin" if config.getoption("--standin") else urlparse(BasePage.base_url).hostname
+    environment = f"{host}:{config.getoption('--pacing')}"
+    if config.getoption("--virtual-clock"):
+        environment += "-virtual"
+    return environment
+
+
+def _record_history(session, exitstatus, timings, pages):
+    """이번 실행을 실행 기록 DB에 추가"""
+    config = session.config
+    if config.getoption("--no-history") or not _test_results:
+        return
+    environment = _history_environment(config)
+    with HistoryStore(config.getoption("--history-db")) as store:
+        config.history_run = store.get_run(
+            store.record_run(
+                environment,
+                {nodeid: tuple(result) for nodeid, result in _test_results.items()},
+                timings=timings,
+                pages=pages,
+                base_url=BasePage.base_url,
+                exitstatus=int(exitstatus),
+                duration=round(time.monotonic() - _session_started, 3) if _session_started else None,
+            )
+        )
+        config.history_regressions = detect(store, run=config.history_run)
+
+
+def _write_worker_report(name, data):
+    """워커별 기록을 reports/<name>-worker-<id>.json 으로 저장"""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    with open(f"reports/{name}-worker-{worker}.json", "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _load_worker_reports(name):
+    """모든 워커의 기록을 불러옴"""
+    reports = []
+    for path in sorted(glob.glob(f"reports/{name}-worker-*.json")):
+        with open(path, encoding="utf-8") as f:
+            reports.append(json.load(f))
+    return reports
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    pacing 사용량과 딜레이 호출 위치 기록을 reports/에 저장합니다.
+
+    xdist 실행 시 워커마다 파일이 생성되고, 터미널 요약에서 합산합니다.
+    페이지 객체 메서드별 실행 시간은 메인 프로세스에서 합쳐
+    reports/action-timings.json 과 reports/action-timings.prom(Prometheus textfile)으로 내보냅니다.
+    --web-vitals 수집 결과는 reports/web-vitals.json (경로별 p75 + navigation 원본)으로 저장합니다.
+    테스트 결과/메서드 실행 시간/페이지 지표는 실행 기록 DB(--history-db)에 추가합니다.
+    HAR 녹화 모드이면 테스트별 HAR을 모듈 HAR로 합칩니다.
+    """
+    report = get_pacer().report()
+    if report:
+        _write_worker_report("pacing", report)
+
+    clock = get_clock()
+    if clock.sites:
+        _write_worker_report("clock", {"virtual": clock.virtual, "sites": clock.report()})
+
+    round_trips = get_round_trip_counter().report()
+    if round_trips:
+        _write_worker_report("round-trips", round_trips)
+
+    if _resource_totals["blocked_requests"] or _resource_totals["allowed_requests"]:
+        _write_worker_report("resources", _resource_totals)
+
+    screenshots = get_screenshot_service().flush()
+    if screenshots.captured:
+        _write_worker_report("screenshots", screenshots.stats())
+
+    # 백분위수는 워커별 요약으로 합칠 수 없으므로 원본 측정값을 저장
+    timer = get_action_timer()
+    if timer.samples:
+        _write_worker_report("action-timings", timer.samples)
+
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        timings = pages = None
+        merged = ActionTimer()
+        for samples in _load_worker_reports("action-timings"):
+            merged.merge(samples)
+        if merged.samples:
+            timings = merged.report()
+            with open("reports/action-timings.json", "w", encoding="utf-8") as f:
+                json.dump(timings, f, ensure_ascii=False, indent=2)
+            write_prometheus(timings, "reports/action-timings.prom")
+
+        navigations = [navigation for report in _load_worker_reports("web-vitals") for navigation in report]
+        if navigations:
+            pages = summarize_by_path(navigations)
+            with open("reports/web-vitals.json", "w", encoding="utf-8") as f:
+                json.dump({"pages": pages, "navigations": navigations}, f, ensure_ascii=False, indent=2)
+
+        _record_history(session, exitstatus, timings, pages)
+
+    # 녹화한 HAR은 모든 워커가 끝난 뒤 메인 프로세스에서 모듈별로 합침
+    if session.config.getoption("--har-mode") == "record" and not os.getenv("PYTEST_XDIST_WORKER"):
+        settings = HarSettings("record", directory=session.config.getoption("--har-dir"))
+        for path in settings.merge_recordings():
+            logger.info("💾 HAR 저장: %s", path)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    실행 요약을 출력합니다.
+
+    - pacing 프로필별 think-time 사용량과 절약 시간
+    - 호출 위치별 딜레이 시간 (가상 시계인 경우 실제 실행이었다면 기다렸을 시간)
+    - 액션별 브라우저 왕복(round trip) 횟수
+    - 페이지 객체 메서드별 실행 시간 (브라우저 대기 / 의도적 딜레이 / 파이썬 처리)
+    - 컨텍스트 풀 재사용으로 절약한 준비 시간
+    - 리소스 정책으로 차단한 요청 수/추정 바이트
+    - 스크린샷 촬영/중복 제외/저장 수
+    - 경로별 Web Vitals p75
+    - 실패 trace 저장 수와 트레이싱 오버헤드
+    - 실행 기록 run id와 이전 실행 대비 느려진 항목
+    """
+    report = {}
+    for worker_report in _load_worker_reports("pacing"):
+        for name, stats in worker_report.items():
+            merged = report.setdefault(name, {"projected": {}})
+            for key in ("calls", "requested", "actual", "saved", "over_budget"):
+                merged[key] = merged.get(key, 0) + stats[key]
+            for profile, seconds in stats["projected"].items():
+                merged["projected"][profile] = merged["projected"].get(profile, 0) + seconds
+
+    if report:
+        terminalreporter.section("think-time pacing")
+        for name, stats in report.items():
+            terminalreporter.write_line(
+                f"[{name}] 호출 {stats['calls']}회, 사람 기준 {stats['requested']:.1f}초 → "
+                f"실제 {stats['actual']:.1f}초 (절약 {stats['saved']:.1f}초, 예산 초과 {stats['over_budget']}회)"
+            )
+            projected = ", ".join(f"{profile}={seconds:.1f}초" for profile, seconds in stats["projected"].items())
+            terminalreporter.write_line(f"    프로필별 예상 대기 시간: {projected}")
+
+    sites = {}
+    virtual = False
+    for worker_report in _load_worker_reports("clock"):
+        virtual = virtual or worker_report["virtual"]
+        for site, stats in worker_report["sites"].items():
+            calls, seconds = sites.get(site, (0, 0.0))
+            sites[site] = (calls + stats["calls"], seconds + stats["seconds"])
+
+    if sites:
+        title = "simulated delays (virtual clock)" if virtual else "delays by call site"
+        terminalreporter.section(title)
+        ordered = sorted(sites.items(), key=lambda item: item[1][1], reverse=True)
+        for site, (calls, seconds) in ordered[:15]:
+            terminalreporter.write_line(f"{site:<45} {calls:>5}회 {seconds:>8.1f}초")
+        total = sum(seconds for _, seconds in sites.values())
+        terminalreporter.write_line(f"{'합계':<45} {'':>6} {total:>8.1f}초")
+
+    actions = {}
+    for worker_report in _load_worker_reports("round-trips"):
+        for action, stats in worker_report.items():
+            calls, trips = actions.get(action, (0, 0))
+            actions[action] = (calls + stats["calls"], trips + stats["round_trips"])
+
+    if actions:
+        terminalreporter.section("browser round trips")
+        for action, (calls, trips) in sorted(actions.items()):
+            terminalreporter.write_line(f"{action:<25} {calls:>6}회 {trips:>8} round trips ({trips / calls:.2f}/회)")
+
+    if os.path.exists("reports/action-timings.json"):
+        with open("reports/action-timings.json", encoding="utf-8") as f:
+            timings = json.load(f)
+        terminalreporter.section("page action timings")
+        terminalreporter.write_line(
+            f"{'method':<40} {'calls':>6} {'p50':>7} {'p95':>7} {'p99':>7}   평균 구성 (browser/delay/python)"
+        )
+        for name, stats in list(timings.items())[:15]:
+            wall = stats["wall"]
+            terminalreporter.write_line(
+                f"{name:<40} {stats['calls']:>6} {wall['p50']:>6.2f}s {wall['p95']:>6.2f}s {wall['p99']:>6.2f}s   "
+                f"{stats['browser_wait']['mean']:.2f} / {stats['delay']['mean']:.2f} / {stats['python']['mean']:.2f}s"
+            )
+
+    resource_reports = _load_worker_reports("resources")
+    if resource_reports:
+        blocked = sum(report["blocked_requests"] for report in resource_reports)
+        blocked_bytes = sum(report["blocked_bytes_estimated"] for report in resource_reports)
+        allowed = sum(report["allowed_requests"] for report in resource_reports)
+        terminalreporter.section("resource policy")
+        terminalreporter.write_line(
+            f"차단 {blocked}개 요청 (약 {blocked_bytes / 1024 / 1024:.1f} MB 절약), 허용 {allowed}개 요청"
+        )
+
+    if os.path.exists("reports/web-vitals.json"):
+        with open("reports/web-vitals.json", encoding="utf-8") as f:
+            pages = json.load(f)["pages"]
+        terminalreporter.section("web vitals (p75)")
+        terminalreporter.write_line(
+            f"{'path':<30} {'visits':>6} {'TTFB':>8} {'LCP':>8} {'CLS':>7} {'INP':>7} {'TBT':>7}"
+        )
+        for path, row in pages.items():
+            values = [
+                "-" if row[metric] is None else f"{row[metric]:g}"
+                for metric in ("ttfb", "lcp", "cls", "inp", "total_blocking_time")
+            ]
+            terminalreporter.write_line(
+                f"{path[:30]:<30} {row['visits']:>6} {values[0]:>8} {values[1]:>8} {values[2]:>7} {values[3]:>7} {values[4]:>7}"
+            )
+
+    screenshot_reports = _load_worker_reports("screenshots")
+    if screenshot_reports:
+        totals = {
+            key: sum(report[key] for report in screenshot_reports)
+            for key in ("captured", "duplicates", "written", "written_bytes", "failures")
+        }
+        terminalreporter.section("screenshots")
+        terminalreporter.write_line(
+            f"촬영 {totals['captured']}개, 중복 제외 {totals['duplicates']}개, "
+            f"저장 {totals['written']}개 ({totals['written_bytes'] / 1024 / 1024:.1f} MB), 실패 {totals['failures']}개"
+        )
+
+    trace_reports = _load_worker_reports("tracing")
+    if trace_reports:
+        totals = {
+            key: sum(report[key] for report in trace_reports)
+            for key in ("chunks", "persisted", "discarded", "persisted_bytes", "overhead_seconds")
+        }
+        terminalreporter.section("tracing")
+        terminalreporter.write_line(
+            f"청크 {totals['chunks']}개 중 저장 {totals['persisted']}개 "
+            f"({totals['persisted_bytes'] / 1024 / 1024:.1f} MB), 버림 {totals['discarded']}개, "
+            f"trace API 오버헤드 {totals['overhead_seconds']:.2f}초 "
+            f"(테스트당 {totals['overhead_seconds'] / totals['chunks'] * 1000:.0f}ms)"
+        )
+
+    pool_reports = _load_worker_reports("context-pool")
+    if pool_reports:
+        totals = {
+            key: sum(report[key] for report in pool_reports)
+            for key in ("created", "reused", "recycled", "reset_failures", "saved_seconds")
+        }
+        terminalreporter.section("context pool")
+        terminalreporter.write_line(
+            f"생성 {totals['created']}회, 재사용 {totals['reused']}회, 교체 {totals['recycled']}회 "
+            f"(초기화 실패 {totals['reset_failures']}회), 절약한 준비 시간 {totals['saved_seconds']:.1f}초"
+        )
+
+    run = getattr(config, "history_run", None)
+    if run:
+        regressions = config.history_regressions
+        terminalreporter.section("run history")
+        terminalreporter.write_line(
+            f"실행 #{run['id']} 저장 ({config.getoption('--history-db')}, 환경 {run['environment']}), "
+            f"이전 실행 대비 느려진 항목 {len(regressions)}개"
+        )
+        for r in regressions[:10]:
+            terminalreporter.write_line(
+                f"    {r.series:<10} {r.key[-60:]:<60} {r.baseline_median:.3f} → {r.current:.3f} ({r.slowdown:+.0%})"
+            )
+
+
+def _attach_extra(rep, extra):
+    """pytest-html 리포트에 extra 첨부"""
+    rep.extras = getattr(rep, "extras", []) + [extra]
+
 
 def pytest_html_report_title(report):
     """pytest-html 리포트 제목을 변경합니다."""
@@ -243,9 +1166,28 @@ def pytest_runtest_makereport(item, call):
 
     - 실패한 테스트의 스크린샷을 reports/screenshots/에 저장
     - pytest-html 리포트에 스크린샷 첨부
+    - 리소스 차단 통계를 리포트에 첨부
+    - 단계별 리포트를 item.rep_setup / rep_call / rep_teardown 으로 저장 (fixture 정리 시 실패 여부 확인용)
+    - 저장된 trace 경로와 페이지별 Web Vitals 요약을 teardown 리포트에 첨부
     """
     outcome = yield
     rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+
+    # trace / Web Vitals는 fixture 정리(teardown) 중에 모이므로 teardown 리포트에 첨부
+    if rep.when == "teardown":
+        for path in getattr(item, "trace_paths", []):
+            item.user_properties.append(("trace", path))
+            _attach_extra(rep, pytest_html.extras.url(path, name=f"trace: {os.path.basename(path)}"))
+
+        navigations = getattr(item, "web_vitals", None)
+        if navigations:
+            item.user_properties.append(("navigations", len(navigations)))
+            _attach_extra(rep, pytest_html.extras.html(html_table(navigations)))
+
+    blocker = getattr(item, "resource_blocker", None)
+    if rep.when == "call" and blocker is not None:
+        _attach_extra(rep, pytest_html.extras.text(blocker.summary(), name="resources"))
 
     # 테스트 실패 시에만 스크린샷 저장
     if rep.when == "call" and rep.failed:
@@ -255,18 +1197,14 @@ def pytest_runtest_makereport(item, call):
             try:
                 # 페이지가 닫혀있지 않은지 확인
                 if not page.is_closed():
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    screenshot_path = f"reports/screenshots/{item.name}_{timestamp}.png"
-                    os.makedirs("reports/screenshots/", exist_ok=True)
-
-                    page.screenshot(path=screenshot_path)
-                    print(f"\n📸 스크린샷 저장: {screenshot_path}")
+                    # 파일은 백그라운드 스레드가 저장 (리포트는 세션 종료 시 생성되므로 경로만 첨부)
+                    screenshot_path = get_screenshot_service().capture(page, item.name)
+                    logger.info("📸 스크린샷 저장: %s", screenshot_path)
 
                     # pytest-html 리포트에 스크린샷 첨부
-                    if hasattr(rep, "extra"):
-                        rep.extra.append(pytest_html.extras.image(screenshot_path))
+                    _attach_extra(rep, pytest_html.extras.image(screenshot_path))
                 else:
-                    print("\n⚠️  페이지가 닫혀있어 스크린샷을 저장할 수 없습니다.")
+                    logger.warning("⚠️  페이지가 닫혀있어 스크린샷을 저장할 수 없습니다.")
 
             except Exception as e:
-                print(f"\n❌ 스크린샷 저장 실패: {e}")
+                logger.warning("❌ 스크린샷 저장 실패: %s", e)
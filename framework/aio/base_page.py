@@ -0,0 +1,244 @@
+# aio/base_page.py
+"""
+playwright.async_api 기반 BasePage
+
+framework.base.base_page.BasePage와 메서드 이름/반환값이 같고, 모든 액션이 코루틴입니다.
+한 이벤트 루프에서 여러 페이지의 journey를 동시에 실행할 수 있습니다.
+
+    homepage = HomePage(page)
+    await homepage.visit()
+    search_page = await homepage.search_product("마우스")
+"""
+
+import random
+import time
+
+from playwright.async_api import Page, expect
+
+from framework.base.base_page import BasePage as SyncBasePage
+from framework.utils.clock import get_clock
+from framework.utils.logger import get_logger
+from framework.utils.pacing import get_pacer
+from framework.utils.round_trips import get_round_trip_counter
+from framework.utils.screenshots import get_screenshot_service
+from framework.utils.settle import get_async_settle_detector
+
+logger = get_logger(__name__)
+
+
+class BasePage(Page):
+    def __init__(self, page: Page, pacer=None, delay_clock=None, round_trips=None, screenshots=None):
+        self.page = page
+        self.pacer = pacer or get_pacer()
+        self.delay_clock = delay_clock or get_clock()
+        self.round_trips = round_trips or get_round_trip_counter()
+        self.screenshots = screenshots or get_screenshot_service()
+
+        # 네트워크 요청 추적은 페이지 객체 생성 시점부터 시작
+        if page is not None:
+            get_async_settle_detector(page)
+
+    # 동기 BasePage와 같은 대상 서버 사용 (BASE_URL / --standin)
+    @property
+    def base_url(self):
+        return SyncBasePage.base_url
+
+    # 같은 pacer/clock/round trip 카운터/스크린샷 서비스를 공유하는 다른 페이지 객체 생성
+    def _spawn(self, page_class, page=None):
+        return page_class(
+            page or self.page,
+            pacer=self.pacer,
+            delay_clock=self.delay_clock,
+            round_trips=self.round_trips,
+            screenshots=self.screenshots,
+        )
+
+    # ==============================================
+    # 페이지 네비게이션
+    # ==============================================
+
+    async def goto(self, path=""):
+        url = f"{self.base_url}{path}"
+        logger.debug("페이지 이동 : %s", url)
+
+        await self.page.goto(url, wait_until="domcontentloaded")
+        self.round_trips.hit()
+
+        return self
+
+    # 페이지 완전 로딩대기
+    async def wait_for_load(self, timeout=30000):
+        await self.page.wait_for_load_state("load", timeout=timeout)
+        self.round_trips.hit()
+        await self._pause(0.2, 0.5)
+        return self
+
+    # ==============================================
+    # 사용자 액션 (자연스러운 동작)
+    # ==============================================
+
+    async def safe_click(self, selector, timeout=10000, hover_first=False):
+        logger.debug("클릭 : %s", selector)
+
+        with self.round_trips.action("safe_click"):
+            element = self.page.locator(selector)
+
+            if hover_first:
+                await element.hover(timeout=timeout)
+                self.round_trips.hit()
+                await self._pause(0.2, 0.5)
+
+            await element.click(timeout=timeout)
+            self.round_trips.hit()
+            await self._settle_then_pause(0.3, 0.8)
+
+        return self
+
+    async def safe_type(self, selector, text, clear=True, delay_range=(50, 150), timeout=10000):
+        logger.debug("텍스트 입력 : %s -> '%s'", selector, text)
+
+        with self.round_trips.action("safe_type"):
+            element = self.page.locator(selector)
+
+            if clear:
+                await element.fill("", timeout=timeout)
+                self.round_trips.hit()
+
+            await element.type(text, delay=self.pacer.keystroke_delay(delay_range), timeout=timeout)
+            self.round_trips.hit()
+            await self._pause(0.3, 0.8)
+
+        return self
+
+    async def safe_press(self, key):
+        logger.debug("키 입력 : %s", key)
+
+        with self.round_trips.action("safe_press"):
+            await self.page.keyboard.press(key)
+            self.round_trips.hit()
+            await self._settle_then_pause(0.5, 1.0)
+
+        return self
+
+    # 자연스러운 딜레이
+    async def human_delay(self, min_seconds=1, max_seconds=3):
+        await self._pause(min_seconds, max_seconds)
+        return self
+
+    # pacing 프로필에 맞춘 think-time 대기 (다른 코루틴은 그동안 계속 실행됨)
+    async def _pause(self, min_seconds, max_seconds):
+        delay = self.pacer.delay(min_seconds, max_seconds)
+        await self.delay_clock.sleep_async(delay)
+        return delay
+
+    # 페이지 안정화 대기 후 남은 think-time만 대기 (동기 버전과 동일)
+    async def _settle_then_pause(self, min_seconds, max_seconds, quiet_ms=300):
+        detector = get_async_settle_detector(self.page)
+        round_trips = detector.round_trips
+        requested = self.pacer.pick(min_seconds, max_seconds)
+        think = self.pacer.profile.apply(requested)
+        started = time.monotonic()
+
+        await detector.wait(quiet_ms=quiet_ms, timeout=max(think * 1000, 2 * quiet_ms))
+
+        elapsed = time.monotonic() - started
+        self.round_trips.hit(detector.round_trips - round_trips)
+
+        allowed = self.pacer.record(min_seconds, max_seconds, requested, max(think, elapsed))
+        await self.delay_clock.sleep_async(max(allowed - elapsed, 0.0))
+        return self
+
+    # 페이지 안정화 대기 (DOM 변경 없음 + 진행 중인 XHR/fetch 없음)
+    async def wait_for_settle(self, quiet_ms=300, timeout=5000):
+        detector = get_async_settle_detector(self.page)
+        round_trips = detector.round_trips
+
+        settled = await detector.wait(quiet_ms=quiet_ms, timeout=timeout)
+        self.round_trips.hit(detector.round_trips - round_trips)
+        if not settled:
+            logger.warning("페이지 안정화 대기 시간 초과 (%sms)", timeout)
+        return self
+
+    # 페이지 타이틀 검증
+    async def should_have_title(self, expected_title):
+        assert expected_title in await self.page.title(), f"타이틀이 {expected_title}이 포함되지 않았습니다"
+        return self
+
+    # 페이지 url 검증
+    async def should_have_url(self, expected_url):
+        assert expected_url in self.page.url, f"URL에 {expected_url}이 포함되지 않았습니다"
+        return self
+
+    # 요소 존재 검증
+    async def should_see_element(self, selector):
+        await expect(self.page.locator(selector)).to_be_visible()
+        return self
+
+    # 요소 부재 검증
+    async def should_not_see_element(self, selector):
+        await expect(self.page.locator(selector)).not_to_be_visible()
+        return self
+
+    # 텍스트 존재 검증
+    async def should_see_text(self, text, selector=None):
+        if selector:
+            await expect(self.page.locator(selector)).to_contain_text(text)
+            logger.info("텍스트 '%s'를 요소 '%s'에서 찾았습니다", text, selector)
+        else:
+            await expect(self.page.locator("body")).to_contain_text(text)
+            logger.info("텍스트 '%s'를 페이지에서 찾았습니다", text)
+
+        return self
+
+    # 페이지 읽는것같은 행동
+    async def simulate_reading(self):
+        logger.info("페이지 읽는중")
+
+        await self.page.evaluate("window.scrollTo(0,0)")
+        await self._pause(1, 2)
+
+        for _ in range(random.randint(2, 4)):
+            scroll_distance = random.randint(200, 500)
+            await self.page.evaluate(f"window.scrollBy(0,{scroll_distance})")
+            await self._pause(0.8, 2.0)
+
+        return self
+
+    # 자연스러운 마우스 움직임
+    async def simulate_mouse_movement(self):
+        viewport = self.page.viewport_size
+        x = random.randint(100, viewport["width"] - 100)
+        y = random.randint(100, viewport["height"] - 100)
+
+        await self.page.mouse.move(x, y)
+        await self._pause(0.2, 0.5)
+        return self
+
+    # 스크린샷 촬영 (파일 저장은 백그라운드 스레드, selector를 주면 요소 영역만)
+    async def take_screenshot(self, name=None, selector=None, full_page=False):
+        options = self.screenshots.screenshot_options()
+        if selector:
+            data = await self.page.locator(selector).screenshot(**options)
+        else:
+            data = await self.page.screenshot(full_page=full_page, **options)
+
+        path = self.screenshots.submit(data, name)
+        logger.info("스크린샷 저장 : %s", path)
+        return self
+
+    # 페이지 새로고침
+    async def refresh_page(self):
+        logger.info("페이지 새로고침")
+
+        with self.round_trips.action("refresh_page"):
+            await self.page.reload()
+            self.round_trips.hit()
+            await self._settle_then_pause(2, 4)
+        return self
+
+    # 요소까지 스크롤
+    async def scroll_to_element(self, selector):
+        await self.page.locator(selector).scroll_into_view_if_needed()
+        self.round_trips.hit()
+        await self._pause(0.5, 1.0)
+        return self
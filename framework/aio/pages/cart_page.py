@@ -0,0 +1,321 @@
+# aio/pages/cart_page.py
+
+import re
+
+from playwright.async_api import expect
+
+from framework.aio.base_page import BasePage
+from framework.config.locators import CartPageLocators
+from framework.models.records import CartItem, parse_price
+from framework.pages.cart_page import CART_ROWS_SCRIPT
+from framework.utils.cart_observer import get_async_cart_observer
+from framework.utils.dialogs import get_async_dialog_manager
+from framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CartPage(BasePage):
+    def __init__(self, page, **kwargs):
+        super().__init__(page, **kwargs)
+        self.url_path = "/cart/"
+        self.cart_observer = get_async_cart_observer(page)
+        self.dialogs = get_async_dialog_manager(page)
+
+    async def should_be_on_cart_page(self):
+        logger.info("장바구니 페이지 확인")
+
+        await self.should_see_element(CartPageLocators.CART_CONTAINER)
+        await self.human_delay(0.5, 0.8)
+
+        logger.info("장바구니 페이지 확인 완료")
+        return self
+
+    def get_cart_state(self):
+        """장바구니 API 응답으로 유지하는 장바구니 상태 (CartState, 아직 응답을 못 봤으면 None)"""
+        return self.cart_observer.state
+
+    async def get_cart_items(self, from_dom=False):
+        """장바구니 상품 목록 (장바구니 API 응답을 본 뒤에는 그 상태로, 아니면 한 번의 evaluate로 수집)"""
+        logger.info("장바구니 상품 목록 수집")
+
+        state = None if from_dom else self.cart_observer.state
+        if state is not None:
+            return list(state.items)
+
+        try:
+            rows = await self.page.locator(CartPageLocators.CART_ITEMS).evaluate_all(
+                CART_ROWS_SCRIPT,
+                {
+                    "title": CartPageLocators.ITEM_TITLE,
+                    "price": CartPageLocators.ITEM_PRICE,
+                    "image": CartPageLocators.ITEM_IMAGE,
+                    "quantity": CartPageLocators.QUANTITY,
+                },
+            )
+            self.round_trips.hit()
+
+        except Exception as e:
+            logger.warning("상품정보를 가져오지 못했습니다 %s", e)
+            return []
+
+        if not rows:
+            logger.info("장바구니가 비었습니다")
+            return []
+
+        items = [CartItem.from_row(row) for row in rows]
+        logger.info("총 %s개 상품 정보 수집", len(items))
+        return items
+
+    async def remove_item(self, index=1):
+        logger.info("%s번째 상품 제거 시도", index)
+
+        try:
+            items = await self.get_cart_items()
+            if len(items) < index or index == 0:
+                raise IndexError(f"제거 할 수 없습니다: {index}번째 상품이 없음")
+
+            remove_btn = self.page.locator(CartPageLocators.ITEM_REMOVE).nth(index - 1)
+            await remove_btn.scroll_into_view_if_needed()
+            await self.human_delay(1, 2)
+            async with self.dialogs.accept(), self.cart_observer.expect_update() as update:
+                await remove_btn.click()
+
+            if update.state is not None and len(update.state.items) != len(items) - 1:
+                logger.warning("상품 제거 실패: 남은 상품 %s개", len(update.state.items))
+                return False
+
+            await self.human_delay(1, 2)
+            logger.info("%s번째 상품 제거 완료", index)
+            return True
+
+        except Exception as e:
+            logger.warning("상품 제거 실패: %s", e)
+            return False
+
+    async def remove_items(self, indices):
+        """여러 상품을 한 번에 제거 (동기 버전과 동일: 한 번 읽고, 뒤쪽부터 지우고, 마지막에 한 번 확인)"""
+        targets = sorted(set(indices), reverse=True)
+        logger.info("상품 %s개 제거 시도: %s", len(targets), targets[::-1])
+        if not targets:
+            return True
+
+        try:
+            items = await self.get_cart_items()
+            invalid = [index for index in targets if not 0 < index <= len(items)]
+            if invalid:
+                raise IndexError(f"제거 할 수 없습니다: {invalid}번째 상품이 없음")
+            expected = len(items) - len(targets)
+
+            version = self.cart_observer.version
+            remove_btn = self.page.locator(CartPageLocators.ITEM_REMOVE)
+            await self.human_delay(1, 2)
+            async with self.dialogs.accept():
+                for index in targets:
+                    async with self.cart_observer.expect_update():
+                        await remove_btn.nth(index - 1).click()
+                    await self.wait_for_settle()
+
+            remaining = await self._read_cart_after(version)
+            if len(remaining) != expected:
+                logger.warning("상품 제거 실패: %s개 남음 (예상 %s개)", len(remaining), expected)
+                return False
+
+            logger.info("상품 %s개 제거 완료", len(targets))
+            return True
+
+        except Exception as e:
+            logger.warning("상품 제거 실패: %s", e)
+            return False
+
+    async def set_quantities(self, quantities):
+        """여러 상품의 수량을 한 번에 변경 ({index: 수량}, 동기 버전과 동일)"""
+        changes = dict(sorted(quantities.items()))
+        logger.info("수량 일괄 변경 시도: %s", changes)
+
+        try:
+            items = await self.get_cart_items()
+            invalid = [index for index in changes if not 0 < index <= len(items)]
+            if invalid:
+                raise IndexError(f"수량 변경 불가: {invalid}번째 상품이 없음")
+
+            version = self.cart_observer.version
+            quantity_inputs = self.page.locator(CartPageLocators.QUANTITY)
+            pending = {index: quantity for index, quantity in changes.items() if items[index - 1].quantity != quantity}
+            async with self.dialogs.accept() as dialogs:
+                for index, quantity in pending.items():
+                    rejected = len(dialogs)
+                    async with self.cart_observer.expect_update(timeout=5000, cancel=lambda: len(dialogs) > rejected):
+                        await quantity_inputs.nth(index - 1).fill(str(quantity))
+                        await quantity_inputs.nth(index - 1).dispatch_event("change")
+                    await self.wait_for_settle()
+
+            final = await self._read_cart_after(version) if pending else items
+            failed = {index: quantity for index, quantity in changes.items() if final[index - 1].quantity != quantity}
+            if failed:
+                logger.warning("수량 변경 실패: %s (다이얼로그 %s회)", failed, len(dialogs))
+                return False
+
+            logger.info("수량 %s개 변경 완료", len(pending))
+            return True
+
+        except Exception as e:
+            logger.warning("수량 변경 실패: %s", e)
+            return False
+
+    async def _read_cart_after(self, version):
+        state = self.cart_observer.state
+        if self.cart_observer.version > version and state is not None:
+            return list(state.items)
+        return await self.get_cart_items(from_dom=True)
+
+    async def clear_cart(self):
+        logger.info("장바구니 전체 비우기")
+
+        checkbox = self.page.locator(CartPageLocators.CHECKBOX)
+        if not await checkbox.is_visible():
+            logger.info("장바구니가 이미 비어있습니다.")
+            return self
+
+        await checkbox.check()
+        await self.human_delay(1, 2)
+
+        async with self.dialogs.accept(), self.cart_observer.expect_update():
+            await self.page.locator(CartPageLocators.ITEM_REMOVE_ALL).click()
+
+        await self.human_delay(1, 2)
+        logger.info("전체 삭제 완료")
+        return self
+
+    async def update_quantity(self, index: int, quantity: int):
+        logger.info("%s번째 상품을 %s개 직접 입력으로 변경", index, quantity)
+
+        try:
+            items = await self.get_cart_items()
+            if len(items) < index or index == 0:
+                raise IndexError(f"수량 변경 불가: {index}번째 상품이 없음")
+
+            quantity_btn = self.page.locator(CartPageLocators.QUANTITY).nth(index - 1)
+            quantity_value = items[index - 1].quantity
+            logger.info("현재 수량: %s, 목표 수량: %s", quantity_value, quantity)
+
+            if quantity_value == quantity:
+                logger.info("✅ 이미 목표 수량입니다: %s", quantity)
+                return True
+
+            # 고정 대기 대신 이 변경에 대한 장바구니 API 응답을 기다림 (다이얼로그로 거부되면 즉시 중단)
+            async with (
+                self.dialogs.accept() as dialogs,
+                self.cart_observer.expect_update(timeout=5000, cancel=lambda: bool(dialogs)) as update,
+            ):
+                await quantity_btn.click(click_count=3)
+                await self.human_delay(0.2, 0.3)
+
+                await quantity_btn.fill(str(quantity))
+                await self.human_delay(0.3, 0.5)
+
+                await self.page.locator("body").click(position={"x": 100, "y": 100})
+
+            if dialogs:
+                logger.warning("수량 변경 실패 (다이얼로그: %s)", dialogs[0].message)
+                return False
+
+            if update.state is not None:
+                new_quantity = update.state.quantity_of(index)
+            else:
+                await self.wait_for_settle()
+                new_quantity = int(parse_price(await quantity_btn.get_attribute("value")) or 0)
+
+            if new_quantity == quantity:
+                logger.info("수량 변경 완료: %s → %s", quantity_value, new_quantity)
+                return True
+            logger.warning("수량 변경 실패: 현재 %s", new_quantity)
+            return False
+
+        except Exception as e:
+            logger.warning("수량 변경 실패: %s", e)
+            return False
+
+    async def get_total_price(self):
+        logger.info("총 결제 금액 가져오기")
+
+        state = self.cart_observer.state
+        if state is not None:
+            return state.total
+
+        try:
+            total_price = self.page.locator(CartPageLocators.ORDER_SUMMARY).locator(CartPageLocators.TOTAL_PRICE)
+            return int(re.sub(r"[^\d]", "", await total_price.inner_text()))
+
+        except Exception as e:
+            logger.warning("총 금액 확인 실패: %s", e)
+            return None
+
+    async def click_logo(self):
+        logger.info("쇼핑 계속하기")
+
+        await self.safe_click(CartPageLocators.LOGO)
+        from framework.aio.pages.home_page import HomePage
+
+        return self._spawn(HomePage)
+
+    async def proceed_to_checkout(self):
+        logger.info("결제 페이지로 이동")
+
+        checkout_btn = self.page.locator(CartPageLocators.CHECKOUT_BUTTON)
+
+        await expect(checkout_btn).to_be_visible()
+        await expect(checkout_btn).to_be_enabled()
+
+        await checkout_btn.scroll_into_view_if_needed()
+        await self.human_delay(1, 2)
+        await checkout_btn.click()
+
+        await self.page.wait_for_url("**/checkout**", timeout=15000)
+        logger.info("결제 페이지 이동 완료")
+        await self.human_delay(0.3, 0.8)
+
+        return self
+
+    async def click_login_button(self, username, password):
+        logger.info("로그인 버튼 클릭")
+
+        from framework.aio.pages.login_page import LoginPage
+
+        try:
+            login_btn = self.page.locator(CartPageLocators.LOGIN_BUTTON)
+
+            try:
+                async with self.page.context.expect_page(timeout=5000) as new_page_info:
+                    await login_btn.click()
+
+                new_page = await new_page_info.value
+                await new_page.wait_for_load_state("networkidle")
+                login_page = self._spawn(LoginPage, new_page)
+
+            except Exception:
+                await self.page.wait_for_load_state("networkidle")
+                login_page = self._spawn(LoginPage)
+
+            await login_page.should_be_on_login_page()
+            return self if await login_page.login(username, password) else None
+
+        except Exception as e:
+            logger.warning("로그인 실패: %s", e)
+            return None
+
+    async def logout(self):
+        logger.info("로그아웃 시도")
+
+        try:
+            await self.safe_click(CartPageLocators.LOGOUT_BUTTON)
+            await self.wait_for_load()
+
+            logger.info("로그아웃 완료")
+            from framework.aio.pages.home_page import HomePage
+
+            return self._spawn(HomePage)
+
+        except Exception as e:
+            logger.warning("로그아웃 실패: %s", e)
+            return None
@@ -0,0 +1,241 @@
+# aio/pages/home_page.py
+
+from urllib.parse import urlparse
+
+from framework.aio.base_page import BasePage
+from framework.config.locators import GmarketLocators, SearchPageLocators
+from framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# G마켓 홈페이지 클래스 (비동기)
+class HomePage(BasePage):
+    def __init__(self, page, **kwargs):
+        super().__init__(page, **kwargs)
+        self.url_path = ""
+
+    async def visit(self):
+        logger.info("G마켓 홈페이지 방문")
+        await self.goto(self.url_path)
+        return self
+
+    async def should_be_on_homepage(self):
+        logger.info("홈페이지 도달 확인")
+
+        await self.human_delay(0.8, 1)
+
+        current_title = await self.page.title()
+        logger.info("페이지 제목 : %s", current_title)
+        if "G마켓" not in current_title and "gmarket" not in current_title.lower():
+            raise AssertionError(f"홈페이지가 아닙니다. 현재 제목 : {current_title}")
+
+        current_url = self.page.url
+        if urlparse(self.base_url).hostname not in current_url:
+            raise AssertionError(f"G마켓 도메인이 아닙니다. 현재 URL: {current_url}")
+
+        await self.should_see_element(GmarketLocators.LOGO)
+        logger.info("홈페이지 도달 확인 완료")
+        return self
+
+    # 홈페이지 주요 요소들 보이는지 확인
+    async def should_see_main_elements(self):
+        logger.info("홈페이지 주요 요소 확인")
+
+        await self.should_see_element(GmarketLocators.HEADER)
+        await self.should_see_element(GmarketLocators.LOGO)
+        await self.should_see_element(GmarketLocators.SEARCH_INPUT)
+        await self.should_see_element(GmarketLocators.SEARCH_BUTTON)
+
+        logger.info("주요 요소 확인됨")
+        return self
+
+    # 상품 검색
+    async def search_product(self, keyword):
+        logger.info("상품 검색 : '%s'", keyword)
+
+        await self.safe_type(GmarketLocators.SEARCH_INPUT, keyword)
+        await self.safe_click(GmarketLocators.SEARCH_BUTTON)
+
+        await self.page.wait_for_url("**/search**", timeout=15000)
+        logger.info("검색 결과 페이지로 이동 완료")
+
+        from framework.aio.pages.search_page import SearchPage
+
+        return self._spawn(SearchPage)
+
+    # 엔터키로 검색
+    async def search_with_enter(self, keyword):
+        logger.info("Enter 키로 검색 : %s", keyword)
+
+        await self.safe_click(GmarketLocators.SEARCH_INPUT)
+        await self.safe_type(GmarketLocators.SEARCH_INPUT, keyword, clear=True)
+        await self.safe_press("Enter")
+
+        await self.page.wait_for_url("**/search**", timeout=15000)
+        logger.info("검색결과 페이지 이동 완료")
+
+        from framework.aio.pages.search_page import SearchPage
+
+        return self._spawn(SearchPage)
+
+    async def should_see_search_suggestions(self):
+        """검색 자동완성이 나타나는지 확인"""
+        logger.info("검색 자동완성 확인")
+        return self.page.locator(GmarketLocators.SEARCH_SUGGESTION)
+
+    async def type_in_search_without_submit(self, keyword):
+        """검색만 입력하고 제출하지 않음 (자동완성 테스트용)"""
+        logger.info("검색어만 입력: '%s'", keyword)
+
+        await self.safe_type(GmarketLocators.SEARCH_INPUT, keyword, clear=True)
+        await self.human_delay(1, 2)
+        return self
+
+    # ==============================================
+    # 🔗 네비게이션 기능
+    # ==============================================
+
+    async def click_logo(self):
+        logger.info("쇼핑 계속하기")
+
+        await self.safe_click(SearchPageLocators.LOGO)
+        await self.should_see_element(".top_banner")
+        logger.info("추천픽 페이지로 이동")
+        return True
+
+    async def click_login_button(self, username, password):
+        logger.info("로그인 버튼 클릭")
+
+        from framework.aio.pages.login_page import LoginPage
+
+        try:
+            login_btn = self.page.locator(GmarketLocators.LOGIN_BUTTON)
+
+            try:
+                async with self.page.context.expect_page(timeout=5000) as new_page_info:
+                    await login_btn.click()
+
+                new_page = await new_page_info.value
+                await new_page.wait_for_load_state("load")
+                login_page = self._spawn(LoginPage, new_page)
+
+            except Exception:
+                # 현재 페이지에서 전환
+                await self.page.wait_for_load_state("networkidle")
+                login_page = self._spawn(LoginPage)
+
+            await login_page.should_be_on_login_page()
+            return self if await login_page.login(username, password) else None
+
+        except Exception as e:
+            logger.warning("로그인 실패: %s", e)
+            return None
+
+    async def logout(self):
+        logger.info("로그아웃 시도")
+
+        try:
+            await self.safe_click(GmarketLocators.LOGOUT_BUTTON)
+            await self.wait_for_load()
+
+            await self.page.goto(self.base_url)
+            await self.page.wait_for_load_state("load")
+            logger.info("로그아웃 완료")
+            return self._spawn(HomePage)
+
+        except Exception as e:
+            logger.warning("로그아웃 실패: %s", e)
+            return None
+
+    async def click_cart_button(self):
+        """장바구니 버튼 클릭"""
+        logger.info("장바구니 버튼 클릭")
+        await self.safe_click(GmarketLocators.CART_BUTTON)
+
+        await self.page.wait_for_url("**/cart/**", timeout=10000)
+        logger.info("✓ 장바구니 페이지 이동")
+
+        from framework.aio.pages.cart_page import CartPage
+
+        return self._spawn(CartPage)
+
+    # ==============================================
+    # 🎭 사용자 행동 시뮬레이션
+    # ==============================================
+
+    async def browse_homepage_naturally(self):
+        """홈페이지를 자연스럽게 둘러보기"""
+        logger.info("홈페이지 자연스럽게 둘러보기")
+
+        await self.human_delay(0.3, 0.8)
+        await self.simulate_reading()
+        await self.simulate_mouse_movement()
+        await self.human_delay(1, 2)
+
+        await self.page.evaluate("window.scrollTo(0, 0)")
+        await self.human_delay(1, 2)
+
+        logger.info("자연스러운 브라우징 완료")
+        return self
+
+    async def hover_over_categories(self):
+        """카테고리에 마우스 올려보기"""
+        logger.info("카테고리 메뉴 hover")
+
+        category_menu = self.page.locator(GmarketLocators.CATEGORY_MENU)
+        count = await category_menu.count()
+        logger.debug("카테고리 메뉴 개수: %s", count)
+
+        for i in range(count):
+            element = category_menu.nth(i)
+            if await element.is_visible():
+                await element.hover()
+                await self.human_delay(0.5, 1)
+                logger.info("✓ 카테고리 메뉴 hover 완료 (index: %s)", i)
+
+        return self
+
+    # ==============================================
+    # 유틸리티 메서드
+    # ==============================================
+
+    async def is_login_button_visible(self):
+        """로그인 버튼이 보이는지 확인 (로그인 상태 체크용)"""
+        try:
+            is_visible = await self.page.locator(GmarketLocators.LOGIN_BUTTON).is_visible()
+            logger.info("현재 상태: %s", "로그아웃 상태" if is_visible else "로그인 상태")
+            return is_visible
+        except Exception:
+            return True  # 에러 시 로그아웃 상태로 가정
+
+    async def wait_for_page_load(self):
+        """페이지 완전 로딩 대기"""
+        logger.info("페이지 로딩 대기")
+
+        await self.wait_for_load()
+        await self.page.wait_for_selector(GmarketLocators.SEARCH_INPUT, timeout=15000)
+        await self.wait_for_settle(timeout=3000)
+
+        logger.info("페이지 로딩 완료")
+        return self
+
+    # ==============================================
+    #  테스트 지원 메서드
+    # ==============================================
+
+    async def verify_no_errors(self):
+        """페이지 오류가 없는지 확인"""
+        logger.info("페이지 오류 확인")
+
+        error_messages = ["error", "오류", "문제가 발생", "접속 불가", "service unavailable"]
+        page_text = (await self.page.locator("body").inner_text()).lower()
+
+        for error_msg in error_messages:
+            if error_msg in page_text:
+                logger.warning("오류 발견: %s", error_msg)
+                await self.take_screenshot(f"error_{error_msg}")
+                raise AssertionError(f"페이지에서 오류 발견: {error_msg}")
+
+        logger.info("오류 없음")
+        return self
@@ -0,0 +1,61 @@
+# aio/pages/login_page.py
+
+from framework.aio.base_page import BasePage
+from framework.config.locators import LoginPageLocators
+from framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class LoginPage(BasePage):
+    def __init__(self, page, **kwargs):
+        super().__init__(page, **kwargs)
+        if page is None:
+            raise ValueError("Page 객체가 None입니다. fixture를 확인하세요.")
+
+    async def should_be_on_login_page(self):
+        logger.info("로그인 페이지 확인")
+        current_url = self.page.url
+        assert "login" in current_url.lower(), f"로그인 페이지가 아닙니다: {current_url}"
+
+        await self.should_see_element(LoginPageLocators.ID_INPUT)
+        logger.info("로그인 페이지 확인 완료")
+        return self
+
+    async def login(self, username, password):
+        logger.info("로그인 시도 %s", username)
+
+        try:
+            await self.safe_type(LoginPageLocators.ID_INPUT, username)
+            await self.safe_type(LoginPageLocators.PASSWORD_INPUT, password)
+            await self.safe_click(LoginPageLocators.LOGIN_BUTTON)
+
+            is_success = await self.is_logged_in()
+            logger.info("로그인 %s : %s", "성공" if is_success else "실패", is_success)
+            return is_success
+
+        except Exception as e:
+            logger.warning("로그인 실패: %s", e)
+            return False
+
+    async def is_logged_in(self):
+        logger.info("로그인 상태 확인")
+
+        try:
+            await self.page.wait_for_load_state("load", timeout=10000)
+
+            # 추가 대기 (쿠키 적용 시간)
+            await self.human_delay(0.5, 1)
+
+            logout_btn = self.page.locator(LoginPageLocators.LOGOUT_BUTTON)
+            await logout_btn.wait_for(state="visible", timeout=10000)
+
+            if await logout_btn.is_visible():
+                logger.info("로그인 상태입니다")
+                return True
+            return False
+
+        except Exception as e:
+            logger.warning("❌ 로그인 상태 확인 실패: %s", e)
+            await self.take_screenshot("is_logged_in_error")
+            return False
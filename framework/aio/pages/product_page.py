@@ -0,0 +1,257 @@
+# aio/pages/product_page.py
+import time
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from framework.aio.base_page import BasePage
+from framework.config.locators import ProductPageLocators
+from framework.models.records import ProductDetail, ProductOption, parse_price
+from framework.pages.product_page import (
+    ADD_CART_POLL_MS,
+    ADD_CART_RESPONSE,
+    DETAIL_SELECTORS,
+    PRODUCT_DETAIL_SCRIPT,
+    PRODUCT_OPTIONS_SCRIPT,
+    SET_QUANTITY_SCRIPT,
+    is_add_cart_response,
+)
+from framework.utils.cart_observer import get_async_cart_observer
+from framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ProductPage(BasePage):
+    add_cart_api = ADD_CART_RESPONSE
+
+    def __init__(self, page, **kwargs):
+        super().__init__(page, **kwargs)
+        self.url_path = "/item"
+
+    async def should_be_on_product_page(self):
+        logger.info("상품 상세 페이지에 있는지 확인")
+
+        await self.should_see_element(ProductPageLocators.PRODUCT_CONTAINER)
+        await self.human_delay(1, 2)
+
+        logger.info("상품 상세 페이지 확인 완료")
+        return self
+
+    async def get_product_info(self):
+        """
+        상품 정보를 한 번의 evaluate로 수집 (ProductDetail 반환)
+
+        옵션 목록은 처음 await info.load_options() 할 때 한 번 더 읽어옵니다 (동기 버전의 info.options와 같음).
+        """
+        logger.info("상품 정보 수집")
+
+        row = await self.page.evaluate(PRODUCT_DETAIL_SCRIPT, {"selectors": DETAIL_SELECTORS, "includeOptions": False})
+        self.round_trips.hit()
+        info = ProductDetail.from_row(row, load_options=self.get_product_options)
+
+        logger.debug("상품명: %s...", info.title[:50])
+        logger.debug("가격: %s (정가 %s)", info.price_text, info.list_price)
+        logger.debug("배송: %s", info.shipping)
+
+        return info
+
+    async def get_product_options(self):
+        """옵션 목록 (ProductOption 리스트, 옵션이 없는 상품이면 빈 리스트)"""
+        rows = await self.page.locator(ProductPageLocators.OPTION_DROPDOWN).evaluate_all(PRODUCT_OPTIONS_SCRIPT)
+        self.round_trips.hit()
+        return [ProductOption.from_row(row) for row in rows]
+
+    async def scroll_and_explore(self):
+        logger.info("상품 페이지 탐색")
+
+        await self.page.evaluate("window.scrollTo(0, window.innerHeight)")
+        await self.human_delay(1, 2)
+
+        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await self.human_delay(1, 2)
+
+        await self.page.evaluate("window.scrollTo(0, 0)")
+        await self.human_delay(0.5, 1)
+
+        logger.info("페이지 탐색 완료")
+        return self
+
+    async def add_to_cart(self, quantity=1, timeout=10000):
+        """구매 가능한 첫 번째 옵션 선택 + 수량 직접 입력 + 장바구니 담기 API 응답으로 확인 (동기 버전과 동일)"""
+        logger.info("수량 %s개로 장바구니에 담기", quantity)
+
+        try:
+            if await self._select_first_available_option() is False:
+                return False
+
+            await self._set_quantity(quantity)
+
+            # 선택 버튼이 있으면 클릭
+            select_btn = self.page.locator(ProductPageLocators.PRODUCT_SELECT).first
+            if await select_btn.count() > 0:
+                await select_btn.click()
+                self.round_trips.hit(2)
+
+            if not await self._submit_add_to_cart(timeout):
+                return False
+
+            # 팝업 닫기 (담기는 이미 확인했으므로 팝업이 없는 사이트를 위해 짧게만 기다림)
+            popup_btn = self.page.locator(ProductPageLocators.POPUP_BUTTON).first
+            try:
+                await popup_btn.wait_for(state="visible", timeout=1000)
+                await popup_btn.click(force=True)
+                self.round_trips.hit(2)
+            except PlaywrightTimeoutError:
+                self.round_trips.hit()
+
+            logger.info("장바구니 담기 성공")
+            return True
+
+        except Exception as e:
+            logger.warning("장바구니 담기 실패: %s", e)
+            return False
+
+    async def _select_first_available_option(self):
+        """옵션이 없으면 None, 구매 가능한 옵션을 골랐으면 True, 모두 품절이면 False"""
+        options = await self.get_product_options()
+        if not options:
+            return None
+
+        available = next((option for option in options if not option.sold_out), None)
+        if available is None:
+            logger.warning("모든 옵션이 품절입니다")
+            return False
+
+        await self.page.locator(ProductPageLocators.OPTION_BUTTON).click()
+        await self.page.locator(ProductPageLocators.OPTION_DROPDOWN).nth(available.index - 1).click()
+        self.round_trips.hit(2)
+        logger.debug("옵션 선택: %s", available.name)
+        await self.human_delay(0.3, 0.5)
+        return True
+
+    async def _set_quantity(self, quantity):
+        """수량 입력창에 바로 설정 (입력창이 없거나 값이 바뀌지 않으면 + 버튼 클릭)"""
+        value = await self.page.evaluate(
+            SET_QUANTITY_SCRIPT, {"selector": ", ".join(ProductPageLocators.QUANTITY_INPUT), "quantity": quantity}
+        )
+        self.round_trips.hit()
+        current = int(parse_price(value) or 1)
+        if current == quantity:
+            return
+        if current > quantity:
+            # 최소 구매 수량 등으로 사이트가 값을 조정한 경우 (+ 버튼으로는 줄일 수 없음)
+            logger.warning("수량 %s개 요청, 사이트가 %s개로 조정", quantity, current)
+            return
+
+        # 입력창이 없거나 사이트가 직접 입력을 되돌린 경우
+        logger.debug("수량 직접 입력 불가 (현재 %s개), + 버튼으로 증가", current)
+        plus_btn = None
+        for selector in ProductPageLocators.PRODUCT_PLUS:
+            self.round_trips.hit()
+            if await self.page.locator(selector).count() > 0:
+                plus_btn = self.page.locator(selector).first
+                break
+        if plus_btn is None:
+            raise ValueError(f"수량 {quantity}개 설정 불가: 수량 입력창과 + 버튼이 없음 (현재 {current}개)")
+
+        for _ in range(quantity - current):
+            await plus_btn.click()
+            self.round_trips.hit()
+
+    async def _submit_add_to_cart(self, timeout):
+        """담기 API 응답과 완료 팝업 중 먼저 오는 쪽으로 확인 (동기 버전과 동일)"""
+        responses = []
+
+        def on_response(response):
+            if is_add_cart_response(response, self.add_cart_api):
+                responses.append(response)
+
+        get_async_cart_observer(self.page)
+        popup = self.page.locator(ProductPageLocators.POPUP_BUTTON).first
+        self.page.on("response", on_response)
+        try:
+            await self.page.locator(ProductPageLocators.ADD_CART).click()
+            self.round_trips.hit(2)
+
+            deadline = time.monotonic() + timeout / 1000
+            while not responses:
+                self.round_trips.hit()
+                if await popup.is_visible():
+                    logger.debug("장바구니 담기 API 응답 없이 완료 팝업 확인")
+                    return True
+                if time.monotonic() >= deadline:
+                    logger.warning("장바구니 담기 API 응답과 완료 팝업이 %sms 안에 없음", timeout)
+                    return False
+                self.round_trips.hit()
+                await self.page.wait_for_timeout(ADD_CART_POLL_MS)
+        finally:
+            self.page.remove_listener("response", on_response)
+
+        response = responses[0]
+        if not response.ok:
+            logger.warning("장바구니 담기 API 실패: %s %s", response.status, response.url)
+            return False
+        return True
+
+    async def click_logo(self):
+        logger.info("쇼핑 계속하기")
+
+        await self.safe_click(ProductPageLocators.LOGO)
+        from framework.aio.pages.home_page import HomePage
+
+        return self._spawn(HomePage)
+
+    async def click_cart_button(self):
+        """장바구니 버튼 클릭"""
+        logger.info("장바구니 버튼 클릭")
+        await self.safe_click(ProductPageLocators.CART_BUTTON)
+
+        await self.page.wait_for_url("**/cart/**", timeout=10000)
+        logger.info("✓ 장바구니 페이지 이동")
+
+        from framework.aio.pages.cart_page import CartPage
+
+        return self._spawn(CartPage)
+
+    async def click_login_button(self, username, password):
+        logger.info("로그인 버튼 클릭")
+
+        from framework.aio.pages.login_page import LoginPage
+
+        try:
+            login_btn = self.page.locator(ProductPageLocators.LOGIN_BUTTON)
+
+            try:
+                async with self.page.context.expect_page(timeout=5000) as new_page_info:
+                    await login_btn.click()
+
+                new_page = await new_page_info.value
+                await new_page.wait_for_load_state("networkidle")
+                login_page = self._spawn(LoginPage, new_page)
+
+            except Exception:
+                await self.page.wait_for_load_state("networkidle")
+                login_page = self._spawn(LoginPage)
+
+            await login_page.should_be_on_login_page()
+            return self if await login_page.login(username, password) else None
+
+        except Exception as e:
+            logger.warning("❌ 로그인 실패: %s", e)
+            return None
+
+    async def logout(self):
+        logger.info("로그아웃 시도")
+
+        try:
+            await self.safe_click(ProductPageLocators.LOGOUT_BUTTON)
+            await self.wait_for_load()
+
+            logger.info("로그아웃 완료")
+            from framework.aio.pages.home_page import HomePage
+
+            return self._spawn(HomePage)
+
+        except Exception as e:
+            logger.warning("로그아웃 실패: %s", e)
+            return None
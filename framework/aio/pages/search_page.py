@@ -0,0 +1,397 @@
+# aio/pages/search_page.py
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+
+from playwright.async_api import expect
+
+from framework.aio.base_page import BasePage
+from framework.config.locators import SearchPageLocators
+from framework.models.records import ProductCard
+from framework.pages.search_page import PRODUCT_CARDS_SCRIPT
+from framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SearchPage(BasePage):
+    # 검색 결과 페이지 번호 쿼리 파라미터
+    PAGE_PARAM = "p"
+
+    def __init__(self, page, **kwargs):
+        super().__init__(page, **kwargs)
+        self.url_path = "/search"
+
+    async def should_be_on_search_page(self):
+        """검색 결과 페이지에 있는지 확인"""
+        logger.info("검색 결과 페이지 확인")
+
+        await self.should_see_element(SearchPageLocators.SEARCH_CONTAINER)
+        await self.human_delay(0.5, 1)
+
+        if await self.page.locator(SearchPageLocators.NO_RESULT).count() > 0:
+            logger.warning("검색 결과가 없습니다")
+            return self
+
+        logger.info("검색 결과 페이지 확인 완료")
+        return self
+
+    async def should_have_search_results(self, min_results=1):
+        """검색 결과가 있는지 확인 및 개수 반환"""
+        logger.info("최소 %s개 검색 결과 존재 확인", min_results)
+
+        results = self.page.locator(SearchPageLocators.PRODUCT_CARDS)
+        count = await results.count()
+        logger.info("검색 결과: %s개 상품 발견", count)
+
+        if count >= min_results:
+            await expect(results.first).to_be_visible(timeout=10000)
+        else:
+            logger.warning("검색 결과 부족: %s개 (최소 %s개 필요) - URL: %s", count, min_results, self.page.url)
+        return self
+
+    async def get_product_title(self, index):
+        try:
+            if index < 1:
+                raise IndexError(f"요소를 찾을 수 없습니다: {index}")
+
+            cards = await self.extract_cards(limit=index)
+            if len(cards) < index:
+                raise IndexError(f"요소를 찾을 수 없습니다: {index}")
+
+            card = cards[index - 1]
+            logger.debug("상품명 : %s", card.title)
+            logger.debug("상품가격 : %s", card.price_text)
+
+            return card.title, card.price_text
+        except Exception as e:
+            logger.warning("상품 가져오기 실패 : %s", e)
+            return None
+
+    async def extract_cards(self, limit=None):
+        """검색 결과 카드의 상품명/가격/링크/상품번호/순서를 한 번의 evaluate로 수집"""
+        return await self._extract_cards(self.page, limit=limit)
+
+    async def _extract_cards(self, page, offset=0, limit=None):
+        rows = await page.locator(SearchPageLocators.PRODUCT_CARDS).evaluate_all(
+            PRODUCT_CARDS_SCRIPT,
+            {
+                "selectors": {
+                    "title": SearchPageLocators.PRODUCT_TITLE,
+                    "price": SearchPageLocators.PRODUCT_PRICE,
+                    "link": SearchPageLocators.PRODUCT_IMAGE,
+                },
+                "offset": offset,
+                "limit": limit,
+            },
+        )
+        self.round_trips.hit()
+        return [ProductCard.from_row(row) for row in rows]
+
+    async def iter_products(self, max_items=None, mode="paginate", max_pages=None, prefetch=True, timeout=15000):
+        """
+        검색 결과를 페이지 이동(paginate) 또는 무한 스크롤(scroll)로 넘기면서 ProductCard를 하나씩 반환 (async for)
+
+        동작은 동기 SearchPage.iter_products와 같습니다.
+        """
+        if mode not in ("paginate", "scroll"):
+            raise ValueError(f"지원하지 않는 mode입니다: {mode}")
+
+        seen = set()
+        rank = 0
+        batches = (
+            self._iter_pages(max_pages, prefetch, timeout)
+            if mode == "paginate"
+            else self._iter_scroll(max_pages, prefetch, timeout)
+        )
+
+        try:
+            async for cards in batches:
+                for card in cards:
+                    key = card.item_id or card.href
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+                    rank += 1
+                    card.position = rank
+                    yield card
+
+                    if max_items is not None and rank >= max_items:
+                        return
+        finally:
+            await batches.aclose()
+
+    def _page_url(self, page_number):
+        parts = urlparse(self.page.url)
+        query = parse_qs(parts.query)
+        query[self.PAGE_PARAM] = [str(page_number)]
+        return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+    # 다음 페이지 이동을 시작만 하고 바로 반환 (로딩은 브라우저가 백그라운드로 진행)
+    async def _start_loading(self, page_number):
+        upcoming = await self.page.context.new_page()
+        await upcoming.evaluate("url => { window.location.href = url; }", self._page_url(page_number))
+        self.round_trips.hit(2)
+        return upcoming
+
+    async def _wait_for_results(self, page, timeout):
+        await page.wait_for_function("() => location.href !== 'about:blank'", timeout=timeout)
+        await page.wait_for_selector(
+            f"{SearchPageLocators.PRODUCT_CARDS}, {SearchPageLocators.NO_RESULT}", state="attached", timeout=timeout
+        )
+        self.round_trips.hit(2)
+
+    async def _iter_pages(self, max_pages, prefetch, timeout, idle_rounds=1):
+        page_number = int(parse_qs(urlparse(self.page.url).query).get(self.PAGE_PARAM, ["1"])[0])
+        current = self.page
+        upcoming = None
+        loaded = 0
+        seen = set()
+        idle = 0
+
+        try:
+            while max_pages is None or loaded < max_pages:
+                cards = await self._extract_cards(current)
+                loaded += 1
+                logger.debug("%s페이지 상품 %s개 수집", page_number, len(cards))
+
+                keys = {card.item_id or card.href for card in cards}
+                if keys <= seen:
+                    idle += 1
+                    if idle >= idle_rounds:
+                        logger.debug("%s페이지에 새 상품이 없어 종료", page_number)
+                        return
+                else:
+                    idle = 0
+                seen |= keys
+
+                if max_pages is None or loaded < max_pages:
+                    upcoming = await self._start_loading(page_number + 1) if prefetch else None
+
+                yield cards
+
+                if max_pages is not None and loaded >= max_pages:
+                    return
+
+                if upcoming is None:
+                    upcoming = await self._start_loading(page_number + 1)
+                await self._wait_for_results(upcoming, timeout)
+
+                if current is not self.page:
+                    await current.close()
+                current, upcoming = upcoming, None
+                page_number += 1
+        finally:
+            for page in (current, upcoming):
+                if page is not None and page is not self.page and not page.is_closed():
+                    await page.close()
+
+    async def _iter_scroll(self, max_rounds, prefetch, timeout, idle_rounds=2):
+        offset = 0
+        idle = 0
+        rounds = 0
+
+        while max_rounds is None or rounds < max_rounds:
+            cards = await self._extract_cards(self.page, offset=offset)
+            rounds += 1
+            offset += len(cards)
+
+            if not cards:
+                idle += 1
+                if idle >= idle_rounds:
+                    return
+            else:
+                idle = 0
+
+            if prefetch:
+                await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                self.round_trips.hit()
+
+            if cards:
+                yield cards
+
+            if not prefetch:
+                await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                self.round_trips.hit()
+            await self.wait_for_settle(timeout=timeout)
+
+    async def click_product_by_index(self, index):
+        logger.info("상품 클릭 시작")
+
+        from framework.aio.pages.product_page import ProductPage
+
+        try:
+            product = self.page.locator(SearchPageLocators.PRODUCT_CARDS).nth(index - 1)
+
+            if index == 0 or not await product.is_visible():
+                raise Exception(f"{index}번째 상품을 찾을 수 없습니다")
+
+            img_element = product.locator(SearchPageLocators.PRODUCT_IMAGE)
+            await img_element.scroll_into_view_if_needed()
+            await self.human_delay(1, 2)
+
+            async with self.page.context.expect_page() as new_page_info:
+                await img_element.click()
+                logger.info("상품 클릭")
+
+            try:
+                new_page = await new_page_info.value
+                await new_page.wait_for_load_state("domcontentloaded")
+                await self.human_delay(3, 5)
+                await new_page.wait_for_load_state("networkidle")
+                await self.human_delay(1, 2)
+                await new_page.wait_for_url("**/Item**", timeout=15000)
+                logger.info("새 페이지에서 동작 : %s", new_page.url)
+
+                if "AccessDenied" in await new_page.content():
+                    raise Exception("Access Denied 페이지가 열렸습니다.")
+
+                return self._spawn(ProductPage, new_page)
+
+            except Exception:
+                logger.info("현재 페이지에서 동작 : %s", self.page.url)
+                await self.page.wait_for_url("**/Item**", timeout=15000)
+                return self._spawn(ProductPage)
+
+        except Exception as e:
+            logger.warning("%s번째 상품 클릭 실패: %s", index, e)
+            return None
+
+    async def apply_price_filter(self, min_price=None, max_price=None):
+        logger.info("필터 적용 시작")
+
+        try:
+            price_filter = self.page.locator(SearchPageLocators.PRICE_FILTER)
+            if await price_filter.count() == 0:
+                logger.warning("가격 필터 옵션을 찾을 수 없습니다")
+                return self
+
+            if min_price and max_price and min_price > max_price:
+                raise ValueError("최소금액이 최대금액보다 작아야 합니다")
+
+            if min_price:
+                min_input = price_filter.locator(SearchPageLocators.FILTER_MIN)
+                await min_input.type(str(min_price), delay=self.pacer.keystroke_delay((20, 30)))
+                await self.human_delay(0.3, 0.5)
+
+            if max_price:
+                max_input = price_filter.locator(SearchPageLocators.FILTER_MAX)
+                await max_input.type(str(max_price), delay=self.pacer.keystroke_delay((20, 30)))
+                await self.human_delay(0.3, 0.5)
+
+            await price_filter.locator(SearchPageLocators.FILTER_BUTTON).click()
+
+            await self.wait_for_load()
+            await self.human_delay(1, 2)
+
+            logger.info("가격 적용 완료")
+            return self
+
+        except Exception as e:
+            logger.warning("가격 필터 적용 실패 : %s", e)
+            return self
+
+    async def sort_by_price_low_to_high(self):
+        await self.page.locator(SearchPageLocators.SORT_OPTIONS).click()
+        await self.human_delay(2, 4)
+
+        await self.page.locator('[aria-label="낮은 가격순"]').click()
+
+        await self.wait_for_load()
+        await self.human_delay(1, 2)
+
+        logger.info("가격 낮은 순 정렬 완료")
+
+    async def get_all_product_titles(self, limit=10):
+        """모든 상품명 리스트 반환 (제한된 개수)"""
+        logger.info("상품명 리스트 수집 (최대 %s개)", limit)
+
+        titles = []
+        try:
+            titles = [card.title for card in await self.extract_cards(limit)]
+            if not titles:
+                raise ValueError("상품명 수집 실패")
+
+            logger.info("%s개 상품명 수집 완료", len(titles))
+            return titles
+
+        except Exception as e:
+            logger.warning("상품명 수집 실패: %s", e)
+            return titles
+
+    async def verify_search_keyword_in_results(self, keyword, limit=5):
+        """검색 키워드가 결과에 포함되는지 확인 (기본 상위 5개, limit=None이면 전체 카드)"""
+        logger.info("검색어 '%s' 관련성 확인", keyword)
+
+        titles = await self.get_all_product_titles(limit)
+        if not titles:
+            logger.warning("검색 결과가 없습니다")
+            return [], False
+
+        relevant_count = sum(1 for title in titles if keyword.lower() in title.lower())
+        relevance_rate = (relevant_count / len(titles)) * 100
+        logger.info("관련성: %s/%s (%.1f%%)", relevant_count, len(titles), relevance_rate)
+
+        # 최소 30% 이상 관련성이 있어야 함
+        return titles, relevance_rate >= 30
+
+    async def click_logo(self):
+        logger.info("쇼핑 계속하기")
+
+        await self.safe_click(SearchPageLocators.LOGO)
+        from framework.aio.pages.home_page import HomePage
+
+        return self._spawn(HomePage)
+
+    async def click_login_button(self, username, password):
+        logger.info("로그인 버튼 클릭")
+
+        from framework.aio.pages.login_page import LoginPage
+
+        try:
+            login_btn = self.page.locator(SearchPageLocators.LOGIN_BUTTON)
+
+            try:
+                async with self.page.context.expect_page(timeout=5000) as new_page_info:
+                    await login_btn.click()
+
+                new_page = await new_page_info.value
+                await new_page.wait_for_load_state("networkidle")
+                login_page = self._spawn(LoginPage, new_page)
+
+            except Exception:
+                await self.page.wait_for_load_state("networkidle")
+                login_page = self._spawn(LoginPage)
+
+            await login_page.should_be_on_login_page()
+            return self if await login_page.login(username, password) else None
+
+        except Exception as e:
+            logger.warning("로그인 실패: %s", e)
+            return None
+
+    async def logout(self):
+        logger.info("로그아웃 시도")
+
+        try:
+            await self.safe_click(SearchPageLocators.LOGOUT_BUTTON)
+            await self.wait_for_load()
+
+            logger.info("로그아웃 완료")
+            from framework.aio.pages.home_page import HomePage
+
+            return self._spawn(HomePage)
+
+        except Exception as e:
+            logger.warning("로그아웃 실패: %s", e)
+            return None
+
+    async def click_cart_button(self):
+        logger.info("장바구니 버튼 클릭")
+        await self.safe_click(SearchPageLocators.CART_BUTTON)
+
+        await self.page.wait_for_url("**/cart/**", timeout=10000)
+        logger.info("✓ 장바구니 페이지 이동")
+
+        from framework.aio.pages.cart_page import CartPage
+
+        return self._spawn(CartPage)
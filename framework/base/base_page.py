@@ -1,15 +1,53 @@
 # base/base_page.py
 
+import os
 import random
 import time
 
 from playwright.sync_api import Page, expect
 
+from framework.utils.clock import get_clock
+from framework.utils.logger import get_logger
+from framework.utils.pacing import get_pacer
+from framework.utils.round_trips import get_round_trip_counter
+from framework.utils.screenshots import get_screenshot_service
+from framework.utils.settle import get_settle_detector
+from framework.utils.timing import get_action_timer, instrument
+
+logger = get_logger(__name__)
+
 
 class BasePage(Page):
-    def __init__(self, page: Page):
+    # BASE_URL 환경 변수로 대상 서버 변경 (예: 로컬 스탠드인 서버)
+    base_url = (os.getenv("BASE_URL") or "https://gmarket.co.kr").rstrip("/")
+
+    def __init__(self, page: Page, pacer=None, delay_clock=None, round_trips=None, timer=None, screenshots=None):
         self.page = page
-        self.base_url = "https://gmarket.co.kr"
+        self.pacer = pacer or get_pacer()
+        self.delay_clock = delay_clock or get_clock()
+        self.round_trips = round_trips or get_round_trip_counter()
+        self.timer = timer or get_action_timer()
+        self.screenshots = screenshots or get_screenshot_service()
+
+        # 네트워크 요청 추적은 페이지 객체 생성 시점부터 시작
+        if page is not None:
+            get_settle_detector(page)
+
+    # 하위 페이지 클래스의 public 메서드도 실행 시간 측정 대상으로 등록
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument(cls)
+
+    # 같은 pacer/clock/round trip 카운터/타이머/스크린샷 서비스를 공유하는 다른 페이지 객체 생성
+    def _spawn(self, page_class, page=None):
+        return page_class(
+            page or self.page,
+            pacer=self.pacer,
+            delay_clock=self.delay_clock,
+            round_trips=self.round_trips,
+            timer=self.timer,
+            screenshots=self.screenshots,
+        )
 
     # ==============================================
     # 페이지 네비게이션
@@ -17,16 +55,18 @@ class BasePage(Page):
 
     def goto(self, path=""):
         url = f"{self.base_url}{path}"
-        print(f"페이지 이동 : {url}")
+        logger.debug("페이지 이동 : %s", url)
 
         self.page.goto(url, wait_until="domcontentloaded")
+        self.round_trips.hit()
 
         return self
 
     # 페이지 완전 로딩대기
     def wait_for_load(self, timeout=30000):
         self.page.wait_for_load_state("load", timeout=timeout)
-        time.sleep(random.uniform(0.2, 0.5))
+        self.round_trips.hit()
+        self._pause(0.2, 0.5)
         return self
 
     # ==============================================
@@ -34,49 +74,92 @@ class BasePage(Page):
     # ==============================================
 
     # 요소대기 + 자연스러운 동작
-    def safe_click(self, selector, timeout=10000):
-        print(f"클릭 : {selector}")
+    # click()이 visible/enabled/stable 대기를 직접 하므로 별도 대기 없이 한 번에 클릭
+    def safe_click(self, selector, timeout=10000, hover_first=False):
+        logger.debug("클릭 : %s", selector)
 
-        self.page.wait_for_selector(selector, timeout=timeout)
-        element = self.page.locator(selector)
-        expect(element).to_be_visible(timeout=timeout)
+        with self.round_trips.action("safe_click"):
+            element = self.page.locator(selector)
 
-        element.hover()
-        time.sleep(random.uniform(0.2, 0.5))
+            if hover_first:
+                element.hover(timeout=timeout)
+                self.round_trips.hit()
+                self._pause(0.2, 0.5)
 
-        element.click()
-        time.sleep(random.uniform(0.3, 0.8))
+            element.click(timeout=timeout)
+            self.round_trips.hit()
+            self._settle_then_pause(0.3, 0.8)
 
         return self
 
     # 자연스러운 타이핑
-    def safe_type(self, selector, text, clear=True, delay_range=(50, 150)):
-        print(f"텍스트 입력 : {selector} -> '{text}'")
+    # fill("")이 editable 대기 + 포커스 + 기존 값 삭제를 한 번에 처리
+    def safe_type(self, selector, text, clear=True, delay_range=(50, 150), timeout=10000):
+        logger.debug("텍스트 입력 : %s -> '%s'", selector, text)
 
-        self.page.wait_for_selector(selector)
-        element = self.page.locator(selector)
-        expect(element).to_be_visible()
+        with self.round_trips.action("safe_type"):
+            element = self.page.locator(selector)
+
+            if clear:
+                element.fill("", timeout=timeout)
+                self.round_trips.hit()
 
-        if clear:
-            element.click()
-            self.page.keyboard.press("Control+a")
-            time.sleep(0.1)
+            element.type(text, delay=self.pacer.keystroke_delay(delay_range), timeout=timeout)
+            self.round_trips.hit()
+            self._pause(0.3, 0.8)
 
-        element.type(text, delay=random.randint(*delay_range))
-        time.sleep(random.uniform(0.3, 0.8))
         return self
 
     # 안전한 키 입력
     def safe_press(self, key):
-        print(f"키 입력 : {key}")
-        self.page.keyboard.press(key)
-        time.sleep(random.uniform(0.5, 1.0))
+        logger.debug("키 입력 : %s", key)
+
+        with self.round_trips.action("safe_press"):
+            self.page.keyboard.press(key)
+            self.round_trips.hit()
+            self._settle_then_pause(0.5, 1.0)
+
         return self
 
     # 자연스러운 딜레이
     def human_delay(self, min_seconds=1, max_seconds=3):
-        delay = random.uniform(min_seconds, max_seconds)
-        time.sleep(delay)
+        self._pause(min_seconds, max_seconds)
+        return self
+
+    # pacing 프로필에 맞춘 think-time 대기
+    def _pause(self, min_seconds, max_seconds):
+        delay = self.pacer.delay(min_seconds, max_seconds)
+        self.delay_clock.sleep(delay)
+        return delay
+
+    # 페이지 안정화 대기 후 남은 think-time만 대기
+    # 안정화 대기 상한은 현재 프로필로 변환한 think-time (zero / fast에서도 최소 quiet_ms 두 번은 기다림)
+    # 안정화에 쓴 시간도 think-time으로 기록
+    def _settle_then_pause(self, min_seconds, max_seconds, quiet_ms=300):
+        detector = get_settle_detector(self.page)
+        round_trips = detector.round_trips
+        requested = self.pacer.pick(min_seconds, max_seconds)
+        think = self.pacer.profile.apply(requested)
+        started = time.monotonic()
+
+        detector.wait(quiet_ms=quiet_ms, timeout=max(think * 1000, 2 * quiet_ms))
+
+        elapsed = time.monotonic() - started
+        self.round_trips.hit(detector.round_trips - round_trips)
+
+        allowed = self.pacer.record(min_seconds, max_seconds, requested, max(think, elapsed))
+        self.delay_clock.sleep(max(allowed - elapsed, 0.0))
+        return self
+
+    # 페이지 안정화 대기 (DOM 변경 없음 + 진행 중인 XHR/fetch 없음)
+    def wait_for_settle(self, quiet_ms=300, timeout=5000):
+        detector = get_settle_detector(self.page)
+        round_trips = detector.round_trips
+
+        settled = detector.wait(quiet_ms=quiet_ms, timeout=timeout)
+        self.round_trips.hit(detector.round_trips - round_trips)
+        if not settled:
+            logger.warning("페이지 안정화 대기 시간 초과 (%sms)", timeout)
         return self
 
     # 페이지 타이틀 검증
@@ -106,24 +189,24 @@ class BasePage(Page):
         if selector:
             element = self.page.locator(selector)
             expect(element).to_contain_text(text)
-            print(f"텍스트 '{text}'를 요소 '{selector}'에서 찾았습니다")
+            logger.info("텍스트 '%s'를 요소 '%s'에서 찾았습니다", text, selector)
         else:
             expect(self.page.locator("body")).to_contain_text(text)
-            print(f"텍스트 '{text}'를 페이지에서 찾았습니다")
+            logger.info("텍스트 '%s'를 페이지에서 찾았습니다", text)
 
         return self
 
     # 페이지 읽는것같은 행동
     def simulate_reading(self):
-        print("페이지 읽는중")
+        logger.info("페이지 읽는중")
 
         self.page.evaluate("window.scrollTo(0,0)")
-        time.sleep(random.uniform(1, 2))
+        self._pause(1, 2)
 
         for _ in range(random.randint(2, 4)):
             scroll_distance = random.randint(200, 500)
             self.page.evaluate(f"window.scrollBy(0,{scroll_distance})")
-            time.sleep(random.uniform(0.8, 2.0))
+            self._pause(0.8, 2.0)
 
         return self
 
@@ -134,29 +217,32 @@ class BasePage(Page):
         y = random.randint(100, viewport["height"] - 100)
 
         self.page.mouse.move(x, y)
-        time.sleep(random.uniform(0.2, 0.5))
+        self._pause(0.2, 0.5)
         return self
 
-    # 스크린샷 촬영
-    def take_screenshot(self, name=None):
-        if name is None:
-            name = f"screenshot_{int(time.time())}"
-
-        path = f"reports/screenshots/{name}.png"
-        self.page.screenshot(path=path)
-        print(f"스크린샷 저장 : {path}")
+    # 스크린샷 촬영 (파일 저장은 백그라운드 스레드, selector를 주면 요소 영역만)
+    def take_screenshot(self, name=None, selector=None, full_page=False):
+        path = self.screenshots.capture(self.page, name, selector=selector, full_page=full_page)
+        logger.info("스크린샷 저장 : %s", path)
         return self
 
     # 페이지 새로고침
     def refresh_page(self):
-        print("페이지 새로고침")
-        self.page.reload()
-        time.sleep(random.uniform(2, 4))
+        logger.info("페이지 새로고침")
+
+        with self.round_trips.action("refresh_page"):
+            self.page.reload()
+            self.round_trips.hit()
+            self._settle_then_pause(2, 4)
         return self
 
     # 요소까지 스크롤
     def scroll_to_element(self, selector):
         element = self.page.locator(selector)
         element.scroll_into_view_if_needed()
-        time.sleep(random.uniform(0.5, 1.0))
+        self.round_trips.hit()
+        self._pause(0.5, 1.0)
         return self
+
+
+instrument(BasePage)
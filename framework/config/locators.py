@@ -66,12 +66,16 @@ class ProductPageLocators:
     # 상품 기본 정보
     PRODUCT_TITLE = ".box__item-info > h1"
     PRODUCT_PRICE = "span.price_innerwrap > strong.price_real"
+    PRODUCT_LIST_PRICE = "span.price_innerwrap > span.price_original"
     PRODUCT_IMAGES = ".box__viewer-container"
+    PRODUCT_IMAGE = ".box__viewer-container img"
+    SELLER_NAME = ".box__seller-info .text__seller"
 
     # 페이지 기능
     OPTION_BUTTON = "#optOrderSel_0 > button.select-item_option.uxeselect_btn"
     OPTION_DROPDOWN = "#optOrderSel_0 > ul > li"
     PRODUCT_PLUS = [".bt_increase", ".bt_increase.uxeselect_btn"]
+    QUANTITY_INPUT = ["#quantity", ".box__quantity input"]
     PRODUCT_SELECT = ".bt_select.uxeselect_btn"
     ADD_CART = "#coreAddCartBtn"
 
@@ -0,0 +1,92 @@
+# history/__main__.py
+"""
+실행 기록 조회 / 성능 회귀 검사
+
+    # 최근 실행 목록
+    python -m framework.history runs --env gmarket.co.kr:human
+
+    # 최신 실행을 이전 10회와 비교 (회귀가 있으면 종료 코드 1)
+    python -m framework.history check --env gmarket.co.kr:human --baseline 10 --alpha 0.01 --min-slowdown 0.1
+"""
+
+import argparse
+import os
+import sys
+
+from framework.history.regression import detect
+from framework.history.store import SERIES, HistoryStore
+
+
+def print_runs(store, args):
+    print(f"  {'id':>5}  {'started_at':<20}{'sha':<10}{'branch':<20}{'environment':<30}{'exit':>5}{'duration':>10}")
+    for run in store.runs(args.env, limit=args.limit):
+        duration = f"{run['duration']:.1f}s" if run["duration"] is not None else "-"
+        print(
+            f"  {run['id']:>5}  {run['started_at']:<20}{(run['git_sha'] or '')[:8]:<10}"
+            f"{(run['git_branch'] or '')[:19]:<20}{run['environment'][:29]:<30}{run['exitstatus']!s:>5}{duration:>10}"
+        )
+    return 0
+
+
+def check(store, args):
+    run = store.get_run(args.run) if args.run else store.latest_run(args.env)
+    if run is None:
+        print("실행 기록이 없습니다")
+        return 2
+
+    regressions = detect(
+        store,
+        run=run,
+        series=args.series,
+        baseline=args.baseline,
+        alpha=args.alpha,
+        min_slowdown=args.min_slowdown,
+        min_runs=args.min_runs,
+    )
+
+    print(
+        f"실행 #{run['id']} ({(run['git_sha'] or '')[:8]}, {run['environment']})을 "
+        f"이전 최대 {args.baseline}회와 비교 (alpha={args.alpha}, 최소 {args.min_slowdown:.0%} 느려짐)"
+    )
+    if not regressions:
+        print("느려진 항목 없음")
+        return 0
+
+    print(f"\n  {'series':<12}{'key':<60}{'baseline':>12}{'current':>12}{'change':>9}{'z':>8}")
+    for r in regressions:
+        print(
+            f"  {r.series:<12}{r.key[-59:]:<60}{r.baseline_median:>12.3f}{r.current:>12.3f}"
+            f"{r.slowdown:>+9.0%}{r.z_score:>8.1f}"
+        )
+    print(f"\n{len(regressions)}개 항목이 느려졌습니다")
+    return 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="G마켓 테스트 실행 기록 / 성능 회귀 검사")
+    parser.add_argument("--db", default=os.getenv("HISTORY_DB", "reports/history.sqlite"), help="SQLite 파일 경로")
+    parser.add_argument("--env", default=None, help="비교할 환경 (예: gmarket.co.kr:human)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runs_parser = commands.add_parser("runs", help="최근 실행 목록")
+    runs_parser.add_argument("--limit", type=int, default=20)
+
+    check_parser = commands.add_parser("check", help="최신 실행의 성능 회귀 검사 (회귀가 있으면 종료 코드 1)")
+    check_parser.add_argument("--run", type=int, default=None, help="검사할 run id (기본값: 최신 실행)")
+    check_parser.add_argument("--baseline", type=int, default=10, help="비교할 이전 실행 수")
+    check_parser.add_argument("--min-runs", type=int, default=5, help="비교에 필요한 최소 이전 실행 수")
+    check_parser.add_argument("--alpha", type=float, default=0.01, help="단측 유의수준")
+    check_parser.add_argument("--min-slowdown", type=float, default=0.1, help="최소 증가율 (0.1 = 10%%)")
+    check_parser.add_argument("--series", action="append", choices=list(SERIES), help="검사할 항목 (여러 번 지정)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.db):
+        print(f"실행 기록 파일이 없습니다: {args.db}")
+        return 2
+
+    with HistoryStore(args.db) as store:
+        return print_runs(store, args) if args.command == "runs" else check(store, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
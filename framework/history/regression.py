@@ -0,0 +1,77 @@
+# history/regression.py
+"""
+최근 실행을 이전 실행들(rolling baseline)과 비교해 느려진 항목 찾기
+
+값 하나(이번 실행)를 baseline 분포와 비교하므로, 이상치에 강한 중앙값/MAD로
+robust z-score를 계산하고 아래 조건을 모두 만족하면 회귀로 판단합니다.
+- baseline 실행이 min_runs개 이상
+- z-score가 유의수준 alpha의 단측 임계값보다 큼
+- 중앙값 대비 min_slowdown 이상 느려짐 (통계적으로만 유의한 아주 작은 변화 제외)
+"""
+
+from dataclasses import dataclass
+from statistics import NormalDist, median
+
+from framework.history.store import SERIES
+
+# MAD를 정규분포 표준편차로 환산하는 계수
+MAD_SCALE = 1.4826
+
+
+@dataclass
+class Regression:
+    series: str
+    key: str
+    current: float
+    baseline_median: float
+    baseline_runs: int
+    z_score: float
+
+    @property
+    def slowdown(self):
+        """중앙값 대비 증가율 (0.25 = 25% 느려짐)"""
+        return self.current / self.baseline_median - 1 if self.baseline_median else float("inf")
+
+
+def robust_z(value, baseline):
+    """중앙값/MAD 기반 z-score (baseline이 모두 같으면 값이 다를 때 inf)"""
+    center = median(baseline)
+    sigma = MAD_SCALE * median(abs(x - center) for x in baseline)
+    if sigma == 0:
+        return 0.0 if value == center else float("inf") if value > center else float("-inf")
+    return (value - center) / sigma
+
+
+def detect(store, run=None, environment=None, series=None, baseline=10, alpha=0.01, min_slowdown=0.1, min_runs=5):
+    """
+    Args:
+        run: 검사할 실행 (None이면 environment의 최신 실행)
+        series: 검사할 항목 (None이면 store.SERIES 전체)
+        baseline: 비교할 이전 실행 수
+    """
+    run = run or store.latest_run(environment)
+    if run is None:
+        return []
+
+    baseline_ids = store.baseline_runs(run, baseline)
+    if len(baseline_ids) < min_runs:
+        return []
+
+    threshold = NormalDist().inv_cdf(1 - alpha)
+    regressions = []
+    for name in series or SERIES:
+        current_values = store.values(name, [run["id"]])
+        history = store.values(name, baseline_ids)
+
+        for key, by_run in current_values.items():
+            current = by_run[run["id"]]
+            previous = list(history.get(key, {}).values())
+            if len(previous) < min_runs:
+                continue
+
+            center = median(previous)
+            z = robust_z(current, previous)
+            if z > threshold and current > center * (1 + min_slowdown):
+                regressions.append(Regression(name, key, current, center, len(previous), z))
+
+    return sorted(regressions, key=lambda r: r.slowdown, reverse=True)
@@ -0,0 +1,225 @@
+# history/store.py
+"""
+실행 기록 저장소 (SQLite)
+
+세션이 끝날 때마다 한 실행(run)을 추가합니다.
+- runs           : 실행 시각 / git SHA / 브랜치 / 환경 / 대상 URL / 종료 코드 / 소요 시간
+- test_results   : 테스트별 결과와 소요 시간 (setup + call + teardown)
+- action_timings : 페이지 객체 메서드별 실행 시간 (reports/action-timings.json)
+- page_metrics   : 경로별 Web Vitals p75 (reports/web-vitals.json)
+
+환경(environment)이 같은 실행끼리만 비교합니다 (예: 'gmarket.co.kr:human').
+"""
+
+import os
+import sqlite3
+import subprocess
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    git_sha TEXT,
+    git_branch TEXT,
+    environment TEXT NOT NULL,
+    base_url TEXT,
+    exitstatus INTEGER,
+    duration REAL
+);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS action_timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    method TEXT NOT NULL,
+    calls INTEGER NOT NULL,
+    wall_p50 REAL,
+    wall_p95 REAL,
+    wall_mean REAL,
+    browser_wait_mean REAL,
+    delay_mean REAL,
+    python_mean REAL
+);
+CREATE TABLE IF NOT EXISTS page_metrics (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    path TEXT NOT NULL,
+    visits INTEGER NOT NULL,
+    ttfb REAL,
+    lcp REAL,
+    cls REAL,
+    inp REAL,
+    total_blocking_time REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_environment ON runs(environment, id);
+CREATE INDEX IF NOT EXISTS idx_test_results_run ON test_results(run_id);
+CREATE INDEX IF NOT EXISTS idx_action_timings_run ON action_timings(run_id);
+CREATE INDEX IF NOT EXISTS idx_page_metrics_run ON page_metrics(run_id);
+"""
+
+# 회귀 검사 대상: (테이블, 키 컬럼, 값 컬럼)
+SERIES = {
+    "test": ("test_results", "nodeid", "duration"),
+    "action": ("action_timings", "method", "wall_p50"),
+    "action_p95": ("action_timings", "method", "wall_p95"),
+    "ttfb": ("page_metrics", "path", "ttfb"),
+    "lcp": ("page_metrics", "path", "lcp"),
+    "cls": ("page_metrics", "path", "cls"),
+    "inp": ("page_metrics", "path", "inp"),
+    "tbt": ("page_metrics", "path", "total_blocking_time"),
+}
+
+
+def git_info():
+    """(SHA, 브랜치) - git 저장소가 아니면 GIT_SHA / GIT_BRANCH 환경 변수"""
+
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], capture_output=True, text=True, timeout=5, check=True).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+    return (
+        os.getenv("GIT_SHA") or git("rev-parse", "HEAD") or "unknown",
+        os.getenv("GIT_BRANCH") or git("rev-parse", "--abbrev-ref", "HEAD"),
+    )
+
+
+class HistoryStore:
+    def __init__(self, path="reports/history.sqlite"):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ==============================================
+    # 기록
+    # ==============================================
+
+    def record_run(
+        self, environment, tests, timings=None, pages=None, base_url=None, exitstatus=None, duration=None, git=None
+    ):
+        """
+        실행 하나를 추가하고 run id를 반환
+
+        Args:
+            tests: {nodeid: (outcome, duration)}
+            timings: ActionTimer.report() 형식 (reports/action-timings.json)
+            pages: summarize_by_path() 형식 (reports/web-vitals.json의 pages)
+        """
+        sha, branch = git or git_info()
+
+        with self.conn:
+            run_id = self.conn.execute(
+                "INSERT INTO runs (started_at, git_sha, git_branch, environment, base_url, exitstatus, duration) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    datetime.now().isoformat(timespec="seconds"),
+                    sha,
+                    branch,
+                    environment,
+                    base_url,
+                    exitstatus,
+                    duration,
+                ),
+            ).lastrowid
+
+            self.conn.executemany(
+                "INSERT INTO test_results (run_id, nodeid, outcome, duration) VALUES (?, ?, ?, ?)",
+                [(run_id, nodeid, outcome, seconds) for nodeid, (outcome, seconds) in tests.items()],
+            )
+            self.conn.executemany(
+                "INSERT INTO action_timings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        method,
+                        stats["calls"],
+                        stats["wall"]["p50"],
+                        stats["wall"]["p95"],
+                        stats["wall"]["mean"],
+                        stats["browser_wait"]["mean"],
+                        stats["delay"]["mean"],
+                        stats["python"]["mean"],
+                    )
+                    for method, stats in (timings or {}).items()
+                ],
+            )
+            self.conn.executemany(
+                "INSERT INTO page_metrics VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        path,
+                        row["visits"],
+                        row["ttfb"],
+                        row["lcp"],
+                        row["cls"],
+                        row["inp"],
+                        row["total_blocking_time"],
+                    )
+                    for path, row in (pages or {}).items()
+                ],
+            )
+        return run_id
+
+    # ==============================================
+    # 조회
+    # ==============================================
+
+    def runs(self, environment=None, limit=20):
+        """최근 실행 목록 (최신순)"""
+        query = "SELECT * FROM runs"
+        params = []
+        if environment:
+            query += " WHERE environment = ?"
+            params.append(environment)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(limit)
+        return [dict(row) for row in self.conn.execute(query, params)]
+
+    def get_run(self, run_id):
+        row = self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def latest_run(self, environment=None):
+        runs = self.runs(environment, limit=1)
+        return runs[0] if runs else None
+
+    def baseline_runs(self, run, count):
+        """run 이전에 같은 환경에서 실행된 최근 count개의 run id"""
+        rows = self.conn.execute(
+            "SELECT id FROM runs WHERE environment = ? AND id < ? ORDER BY id DESC LIMIT ?",
+            (run["environment"], run["id"], count),
+        )
+        return [row["id"] for row in rows]
+
+    def values(self, series, run_ids, passed_only=True):
+        """{키: {run_id: 값}} - 테스트 소요 시간은 통과한 결과만 사용"""
+        table, key, column = SERIES[series]
+        if not run_ids:
+            return {}
+
+        placeholders = ",".join("?" * len(run_ids))
+        query = f"SELECT run_id, {key} AS key, {column} AS value FROM {table} WHERE run_id IN ({placeholders})"
+        query += f" AND {column} IS NOT NULL"
+        if table == "test_results" and passed_only:
+            query += " AND outcome = 'passed'"
+
+        values = {}
+        for row in self.conn.execute(query, list(run_ids)):
+            values.setdefault(row["key"], {})[row["run_id"]] = row["value"]
+        return values
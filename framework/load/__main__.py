@@ -0,0 +1,94 @@
+# load/__main__.py
+"""
+가상 사용자 부하 실행
+
+    # 30초 동안 10명까지 늘린 뒤 60초 유지 (스테이징 미러 대상)
+    python -m framework.load --base-url https://staging.example.com --users 10 --ramp-up 30 --duration 60
+
+    # 단계 직접 지정 (초:사용자수) + 로컬 스탠드인 서버
+    python -m framework.load --standin --stage 10:5 --stage 20:20 --stage 10:0 --think exponential:2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from datetime import datetime
+
+from framework.load.runner import LoadRunner, Stage, ThinkTime
+
+
+def _stage(value):
+    duration, _, users = value.partition(":")
+    return Stage(float(duration), int(users))
+
+
+def print_report(report):
+    print(
+        f"\n부하 실행 결과: {report['duration_seconds']}초, 최대 {report['peak_users']}명, "
+        f"반복 {report['iterations']}회 (실패 {report['failed_iterations']}회), think-time {report['think_time']}"
+    )
+    print(f"  {'step':<24}{'count':>7}{'errors':>8}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, step in report["steps"].items():
+        print(
+            f"  {name:<24}{step['count']:>7}{step['errors']:>8}{step['throughput_per_s']:>9.2f}"
+            f"{step['p50']:>9.3f}{step['p95']:>9.3f}{step['p99']:>9.3f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="G마켓 가상 사용자 부하 실행기")
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL") or None, help="대상 스토어 URL")
+    parser.add_argument("--standin", action="store_true", help="로컬 스탠드인 서버를 띄워서 대상으로 사용")
+    parser.add_argument("--users", type=int, default=10, help="목표 동시 사용자 수")
+    parser.add_argument("--ramp-up", type=float, default=30, help="목표 사용자 수까지 늘리는 시간 (초)")
+    parser.add_argument("--duration", type=float, default=60, help="목표 사용자 수 유지 시간 (초)")
+    parser.add_argument(
+        "--stage", type=_stage, action="append", help="단계 '초:사용자수' (여러 번 지정, 지정 시 --users 등 무시)"
+    )
+    parser.add_argument(
+        "--think", default="uniform:1,3", help="think-time 분포 (constant/uniform/exponential/lognormal)"
+    )
+    parser.add_argument("--pacing", default="zero", help="페이지 객체 내부 딜레이 프로필")
+    parser.add_argument("--keyword", action="append", help="검색어 (여러 번 지정 가능)")
+    parser.add_argument("--headed", action="store_true", help="브라우저 화면 표시")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default=None, help="리포트 JSON 경로 (기본값: reports/load-<시각>.json)")
+    args = parser.parse_args(argv)
+
+    stages = args.stage or [Stage(args.ramp_up, args.users), Stage(args.duration, args.users)]
+    options = {
+        "stages": stages,
+        "think_time": ThinkTime.parse(args.think),
+        "pacing": args.pacing,
+        "headless": not args.headed,
+        "seed": args.seed,
+    }
+    if args.keyword:
+        options["keywords"] = args.keyword
+
+    server = None
+    if args.standin:
+        from framework.standin.server import StandinServer
+
+        server = StandinServer().start()
+        print(f"스탠드인 서버 실행: {server.url}")
+
+    try:
+        runner = LoadRunner(base_url=server.url if server else args.base_url, **options)
+        report = asyncio.run(runner.run())
+    finally:
+        if server:
+            server.stop()
+
+    print_report(report)
+
+    output = args.output or f"reports/load-{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"💾 리포트 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
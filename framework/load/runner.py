@@ -0,0 +1,299 @@
+# load/runner.py
+"""
+가상 사용자(virtual user) 부하 실행기
+
+비동기 페이지 객체(framework.aio)로 스크립트된 journey를 N명이 동시에 반복 실행합니다.
+- Stage 목록으로 사용자 수를 단계적으로 늘리거나 줄임 (ramp-up / ramp-down)
+- 단계 사이 think-time은 분포(constant / uniform / exponential / lognormal)에서 추출
+- 단계(step)별 처리량과 지연 시간 p50/p95/p99를 리포트
+
+    runner = LoadRunner(stages=[Stage(30, 10), Stage(60, 10)], base_url="http://127.0.0.1:8000")
+    report = asyncio.run(runner.run())
+"""
+
+import asyncio
+import math
+import random
+import time
+from dataclasses import dataclass
+
+from framework.base.base_page import BasePage
+from framework.utils.clock import get_clock
+from framework.utils.logger import get_logger
+from framework.utils.pacing import Pacer
+from framework.utils.stats import summarize
+
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1920, "height": 1080},
+    "locale": "ko-KR",
+    "timezone_id": "Asia/Seoul",
+}
+
+logger = get_logger(__name__)
+
+
+class StepFailed(Exception):
+    """journey 단계가 실패(예외 또는 None/False 반환)해서 이번 반복을 중단"""
+
+
+class ThinkTime:
+    """
+    단계 사이 think-time 분포
+
+    - constant:2         → 항상 2초
+    - uniform:1,3        → 1~3초 균등 분포
+    - exponential:2      → 평균 2초 지수 분포
+    - lognormal:0.5,0.4  → 로그정규 분포 (mu, sigma)
+    """
+
+    KINDS = ("constant", "uniform", "exponential", "lognormal")
+
+    def __init__(self, kind="constant", *params, max_seconds=60.0):
+        if kind not in self.KINDS:
+            raise ValueError(f"알 수 없는 think-time 분포입니다: {kind} (사용 가능: {', '.join(self.KINDS)})")
+        self.kind = kind
+        self.params = params or (0.0,)
+        self.max_seconds = max_seconds
+
+    @classmethod
+    def parse(cls, spec):
+        kind, _, params = spec.partition(":")
+        return cls(kind.strip(), *(float(value) for value in params.split(",") if value.strip()))
+
+    def sample(self, rng):
+        if self.kind == "constant":
+            seconds = self.params[0]
+        elif self.kind == "uniform":
+            seconds = rng.uniform(self.params[0], self.params[-1])
+        elif self.kind == "exponential":
+            seconds = rng.expovariate(1 / self.params[0]) if self.params[0] > 0 else 0.0
+        else:
+            seconds = rng.lognormvariate(self.params[0], self.params[-1] if len(self.params) > 1 else 0.0)
+        return min(max(seconds, 0.0), self.max_seconds)
+
+    def __repr__(self):
+        return f"ThinkTime({self.kind}:{','.join(str(p) for p in self.params)})"
+
+
+@dataclass
+class Stage:
+    """duration초 동안 사용자 수를 이전 단계 목표에서 users명까지 선형으로 변경"""
+
+    duration: float
+    users: int
+
+
+class Schedule:
+    def __init__(self, stages):
+        self.stages = list(stages)
+
+    @property
+    def total_duration(self):
+        return sum(stage.duration for stage in self.stages)
+
+    @property
+    def max_users(self):
+        return max((stage.users for stage in self.stages), default=0)
+
+    def users_at(self, elapsed):
+        """경과 시간(초)에 목표 사용자 수"""
+        previous = 0
+        for stage in self.stages:
+            if elapsed < stage.duration:
+                ratio = elapsed / stage.duration if stage.duration else 1.0
+                return math.ceil(previous + (stage.users - previous) * ratio)
+            elapsed -= stage.duration
+            previous = stage.users
+        return previous
+
+
+class StepStats:
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+
+    def report(self, duration):
+        return {
+            **summarize(self.latencies),
+            "errors": self.errors,
+            "throughput_per_s": round(len(self.latencies) / duration, 3) if duration else 0.0,
+        }
+
+
+class VirtualUser:
+    """journey 함수에 전달되는 가상 사용자 (단계 측정 / think-time / 공유 설정)"""
+
+    def __init__(self, runner, user_id, rng):
+        self.runner = runner
+        self.user_id = user_id
+        self.rng = rng
+        self.pacer = runner.pacer
+        self.keyword = rng.choice(runner.keywords)
+
+    async def step(self, name, awaitable):
+        """단계 하나를 실행하고 지연 시간을 기록 (예외 또는 None/False 반환 시 StepFailed)"""
+        stats = self.runner.steps.setdefault(name, StepStats())
+        started = time.monotonic()
+        try:
+            result = await awaitable
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            stats.errors += 1
+            raise StepFailed(f"{name}: {e}") from e
+
+        if result is None or result is False:
+            stats.errors += 1
+            raise StepFailed(f"{name}: 실패 결과 반환")
+
+        stats.latencies.append(time.monotonic() - started)
+        return result
+
+    async def think(self):
+        await self.runner.clock.sleep_async(self.runner.think_time.sample(self.rng), site="think_time")
+
+
+async def shopping_journey(user, page):
+    """홈 → 검색 → 상품 클릭 → 장바구니 담기 → 장바구니 총액"""
+    from framework.aio.pages.home_page import HomePage
+
+    homepage = HomePage(page, pacer=user.pacer)
+    await user.step("visit", homepage.visit())
+    await user.think()
+
+    search_page = await user.step("search_product", homepage.search_product(user.keyword))
+    await user.think()
+
+    product_page = await user.step(
+        "click_product_by_index", search_page.click_product_by_index(user.rng.randint(1, user.runner.product_range))
+    )
+    await user.think()
+
+    await user.step("add_to_cart", product_page.add_to_cart())
+    await user.think()
+
+    cart_page = await user.step("click_cart_button", product_page.click_cart_button())
+    await user.step("get_total_price", cart_page.get_total_price())
+
+
+class LoadRunner:
+    """
+    Args:
+        journey: async def journey(user, page) (기본값: shopping_journey)
+        stages: Stage 목록 (사용자 수 스케줄)
+        think_time: ThinkTime 또는 "uniform:1,3" 같은 문자열
+        base_url: 대상 서버 (None이면 BasePage.base_url 그대로 사용)
+        pacing: 페이지 객체 내부 딜레이 프로필 (부하 테스트 기본값: zero)
+        keywords: 가상 사용자별로 무작위 선택할 검색어
+        product_range: 검색 결과 상위 몇 개 안에서 상품을 고를지
+    """
+
+    def __init__(
+        self,
+        journey=shopping_journey,
+        stages=(Stage(60, 10),),
+        think_time="uniform:1,3",
+        base_url=None,
+        pacing="zero",
+        keywords=("마우스", "키보드", "이어폰"),
+        product_range=5,
+        headless=True,
+        tick=0.2,
+        seed=None,
+    ):
+        self.journey = journey
+        self.schedule = Schedule(stages)
+        self.think_time = ThinkTime.parse(think_time) if isinstance(think_time, str) else think_time
+        self.base_url = base_url
+        self.pacer = Pacer(pacing)
+        self.keywords = list(keywords)
+        self.product_range = product_range
+        self.headless = headless
+        self.tick = tick
+        self.rng = random.Random(seed)
+        self.clock = get_clock()
+
+        self.steps = {}
+        self.iterations = 0
+        self.failed_iterations = 0
+        self.peak_users = 0
+
+    async def run(self, browser=None):
+        """스케줄이 끝날 때까지 실행하고 리포트(dict)를 반환 (browser를 넘기면 그 브라우저 사용)"""
+        previous_base_url = BasePage.base_url
+        if self.base_url:
+            BasePage.base_url = self.base_url.rstrip("/")
+
+        try:
+            if browser is not None:
+                return await self._run(browser)
+
+            from playwright.async_api import async_playwright
+
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=self.headless)
+                try:
+                    return await self._run(browser)
+                finally:
+                    await browser.close()
+        finally:
+            BasePage.base_url = previous_base_url
+
+    async def _run(self, browser):
+        users = []
+        started = time.monotonic()
+
+        try:
+            while True:
+                elapsed = time.monotonic() - started
+                if elapsed >= self.schedule.total_duration:
+                    break
+
+                target = self.schedule.users_at(elapsed)
+                while len(users) < target:
+                    user = VirtualUser(self, len(users) + 1, random.Random(self.rng.random()))
+                    users.append(asyncio.create_task(self._user_loop(browser, user)))
+                while len(users) > target:
+                    users.pop().cancel()
+                self.peak_users = max(self.peak_users, len(users))
+
+                await asyncio.sleep(self.tick)
+        finally:
+            for task in users:
+                task.cancel()
+            await asyncio.gather(*users, return_exceptions=True)
+
+        return self.report(time.monotonic() - started)
+
+    async def _user_loop(self, browser, user):
+        while True:
+            context = None
+            try:
+                context = await browser.new_context(**CONTEXT_OPTIONS)
+                page = await context.new_page()
+                await self.journey(user, page)
+                self.iterations += 1
+            except StepFailed:
+                self.failed_iterations += 1
+            except Exception as e:
+                # 단계 밖의 예외(컨텍스트/페이지 생성 실패, journey 버그 등)도 실패한 반복으로 세고 계속 실행
+                self.failed_iterations += 1
+                logger.warning("가상 사용자 %s 반복 실패: %s: %s", user.user_id, type(e).__name__, e)
+                # 같은 원인으로 계속 실패할 때 바쁜 루프가 되지 않도록 잠깐 대기
+                await asyncio.sleep(self.tick)
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+
+    def report(self, duration):
+        return {
+            "duration_seconds": round(duration, 2),
+            "peak_users": self.peak_users,
+            "iterations": self.iterations,
+            "failed_iterations": self.failed_iterations,
+            "think_time": repr(self.think_time),
+            "steps": {name: stats.report(duration) for name, stats in self.steps.items()},
+        }
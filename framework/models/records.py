@@ -0,0 +1,237 @@
+# models/records.py
+"""
+페이지에서 한 번에 추출한 데이터를 담는 레코드 타입
+
+모든 레코드는 __slots__ 기반 dataclass이며, 기존 dict 기반 코드와의 호환을 위해
+record["title"] 형태의 접근도 지원합니다.
+"""
+
+import inspect
+import re
+from dataclasses import asdict, dataclass, field, fields
+
+
+def parse_price(text):
+    """'12,900원' 같은 가격 문자열을 int로 변환 (숫자가 없으면 None)"""
+    if text is None:
+        return None
+    digits = re.sub(r"[^\d]", "", str(text))
+    return int(digits) if digits else None
+
+
+class _Record:
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def as_dict(self):
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class CartItem(_Record):
+    index: int
+    title: str
+    price: int
+    quantity: int
+    item_id: str
+    price_text: str = ""
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            index=row["index"],
+            title=(row.get("title") or "").strip(),
+            price=parse_price(row.get("price")) or 0,
+            quantity=int(parse_price(row.get("quantity")) or 1),
+            item_id=row.get("itemId") or "",
+            price_text=(row.get("price") or "").strip(),
+        )
+
+
+@dataclass(slots=True)
+class ProductCard(_Record):
+    position: int
+    title: str
+    price: int
+    href: str
+    item_id: str
+    price_text: str = ""
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            position=row["position"],
+            title=(row.get("title") or "").strip(),
+            price=parse_price(row.get("price")) or 0,
+            href=row.get("href") or "",
+            item_id=row.get("itemId") or "",
+            price_text=(row.get("price") or "").strip(),
+        )
+
+
+@dataclass(slots=True)
+class ProductOption(_Record):
+    index: int
+    name: str
+    sold_out: bool
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(index=row["index"], name=(row.get("name") or "").strip(), sold_out=bool(row.get("soldOut")))
+
+
+@dataclass(slots=True)
+class ProductDetail(_Record):
+    """
+    상품 상세 정보
+
+    options는 처음 접근할 때 load_options로 한 번만 읽어옵니다 (옵션이 없는 상품이 많고, 옵션 목록은 큼).
+    상세 페이지를 떠나기 전에 접근해야 합니다.
+    비동기 페이지에서 받은 정보는 먼저 await info.load_options()로 읽어둔 뒤 options에 접근합니다.
+    """
+
+    title: str
+    price: int
+    list_price: int | None
+    shipping: str
+    seller: str
+    images: list
+    price_text: str = ""
+    _load_options: object = field(default=None, repr=False, compare=False)
+    _options: object = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_row(cls, row, load_options=None):
+        options = row.get("options")
+        return cls(
+            title=(row.get("title") or "").strip(),
+            price=parse_price(row.get("price")) or 0,
+            list_price=parse_price(row.get("listPrice")),
+            shipping=(row.get("shipping") or "").strip(),
+            seller=(row.get("seller") or "").strip(),
+            images=list(row.get("images") or []),
+            price_text=(row.get("price") or "").strip(),
+            _load_options=load_options,
+            _options=None if options is None else [ProductOption.from_row(option) for option in options],
+        )
+
+    @property
+    def options(self):
+        if self._options is None:
+            if inspect.iscoroutinefunction(self._load_options):
+                raise RuntimeError("비동기 페이지의 옵션 목록은 await info.load_options() 후에 접근하세요")
+            self._options = list(self._load_options()) if self._load_options else []
+        return self._options
+
+    async def load_options(self):
+        """옵션 목록을 한 번만 읽어옴 (비동기 페이지용, 동기 load_options도 사용 가능)"""
+        if self._options is None:
+            options = self._load_options() if self._load_options else []
+            if inspect.isawaitable(options):
+                options = await options
+            self._options = list(options)
+        return self._options
+
+    @property
+    def options_loaded(self):
+        return self._options is not None
+
+    def as_dict(self):
+        data = {f.name: getattr(self, f.name) for f in fields(self) if not f.name.startswith("_")}
+        data["images"] = list(self.images)
+        data["options"] = [option.as_dict() for option in self.options]
+        return data
+
+
+def _first(data, *keys, default=None):
+    for key in keys:
+        if data.get(key) is not None:
+            return data[key]
+    return default
+
+
+@dataclass(slots=True)
+class CartState(_Record):
+    """장바구니 API 응답에서 읽은 장바구니 상태 (금액은 원 단위 int)"""
+
+    items: list
+    items_price: int
+    discount: int
+    shipping_fee: int
+    total: int
+    source: str = ""
+
+    # 응답마다 키 이름이 달라도 읽을 수 있도록 후보 키를 순서대로 확인
+    ITEM_KEYS = ("items", "cartItems", "itemList", "list")
+    SUMMARY_KEYS = ("summary", "orderSummary", "price")
+
+    @classmethod
+    def from_payload(cls, payload, source=""):
+        """장바구니 형태가 아닌 응답이면 None"""
+        if not isinstance(payload, dict):
+            return None
+        data = payload.get("data") if isinstance(payload.get("data"), dict) else payload
+        rows = _first(data, *cls.ITEM_KEYS)
+        summary = next((data[key] for key in cls.SUMMARY_KEYS if isinstance(data.get(key), dict)), data)
+        total = _first(summary, "total", "totalPrice", "totalAmount", "paymentAmount")
+        if not isinstance(rows, list) or total is None:
+            return None
+
+        items = []
+        for position, row in enumerate(rows, start=1):
+            quantity = int(parse_price(_first(row, "quantity", "qty", "orderQty")) or 1)
+            # 장바구니 화면의 상품 가격처럼 수량을 곱한 금액 (응답에 합계가 있으면 그대로 사용)
+            line_price = parse_price(_first(row, "linePrice", "totalPrice", "amount"))
+            if line_price is None:
+                line_price = (parse_price(_first(row, "price", "salePrice", "unitPrice")) or 0) * quantity
+            items.append(
+                CartItem(
+                    index=_first(row, "index", default=position),
+                    title=str(_first(row, "title", "name", "goodsName", default="")).strip(),
+                    price=line_price,
+                    quantity=quantity,
+                    item_id=str(_first(row, "itemId", "item_id", "goodsCode", "goodsNo", default="")),
+                    price_text=f"{line_price:,}원",
+                )
+            )
+        items_price = _first(summary, "items_price", "itemsPrice", "subtotal", "goodsPrice")
+        return cls(
+            items=items,
+            items_price=parse_price(items_price) if items_price is not None else sum(item.price for item in items),
+            discount=parse_price(_first(summary, "discount", "discountAmount", "discountPrice", default=0)) or 0,
+            shipping_fee=parse_price(_first(summary, "shipping_fee", "shippingFee", "deliveryFee", default=0)) or 0,
+            total=parse_price(total) or 0,
+            source=source,
+        )
+
+    def quantity_of(self, index):
+        """index번째(1부터) 상품 수량 (없으면 None)"""
+        return self.items[index - 1].quantity if 0 < index <= len(self.items) else None
+
+
+@dataclass(slots=True)
+class DialogEvent(_Record):
+    type: str
+    message: str
+    action: str
+    default_value: str = ""
+    # protocol: Playwright dialog 이벤트로 처리 / script: init script가 페이지 안에서 처리
+    source: str = "protocol"
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(
+            type=row.get("type") or "",
+            message=row.get("message") or "",
+            action=row.get("action") or "",
+            default_value=row.get("defaultValue") or "",
+            source="script",
+        )
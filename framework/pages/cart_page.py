@@ -4,104 +4,238 @@ from playwright.sync_api import expect
 
 from framework.base.base_page import BasePage
 from framework.config.locators import CartPageLocators
+from framework.models.records import CartItem, parse_price
+from framework.utils.cart_observer import get_cart_observer
+from framework.utils.dialogs import get_dialog_manager
+from framework.utils.logger import Lazy, get_logger
+
+logger = get_logger(__name__)
+
+# 장바구니 행 전체를 한 번에 읽는 스크립트 (행마다 inner_text를 호출하지 않음)
+CART_ROWS_SCRIPT = """
+(rows, selectors) => rows.map((row, i) => {
+    const text = selector => {
+        const el = row.querySelector(selector);
+        return el ? el.innerText.trim() : "";
+    };
+    const link = row.querySelector(selectors.title) || row.querySelector(selectors.image);
+    const href = link ? link.href : "";
+    const match = href.match(/goodscode=(\\w+)/i);
+    const quantity = row.querySelector(selectors.quantity) || document.querySelectorAll(selectors.quantity)[i];
+    return {
+        index: i + 1,
+        title: text(selectors.title),
+        price: text(selectors.price),
+        quantity: quantity ? quantity.value : "1",
+        itemId: row.dataset.itemId || (match ? match[1] : href),
+    };
+})
+"""
 
 
 class CartPage(BasePage):
-    def __init__(self, page):
-        super().__init__(page)
+    def __init__(self, page, **kwargs):
+        super().__init__(page, **kwargs)
         self.url_path = "/cart/"
+        self.cart_observer = get_cart_observer(page)
+        self.dialogs = get_dialog_manager(page)
 
     def should_be_on_cart_page(self):
-        print("장바구니 페이지 확인")
+        logger.info("장바구니 페이지 확인")
 
         current_url = self.page.url
         if "cart" in current_url.lower():
-            print(f"장바구니 페이지 URL 확인 : {current_url}")
+            logger.info("장바구니 페이지 URL 확인 : %s", current_url)
 
         self.should_see_element(CartPageLocators.CART_CONTAINER)
         self.human_delay(0.5, 0.8)
 
-        print("장바구니 페이지 확인 완료")
+        logger.info("장바구니 페이지 확인 완료")
         return self
 
-    def get_cart_items(self):
-        print("장바구니 상품 목록 수집")
+    def get_cart_state(self):
+        """장바구니 API 응답으로 유지하는 장바구니 상태 (CartState, 아직 응답을 못 봤으면 None)"""
+        return self.cart_observer.state
 
-        items = []
-        try:
-            cart_items = self.page.locator(CartPageLocators.CART_ITEMS)
-            count = cart_items.count()
+    def get_cart_items(self, from_dom=False):
+        """
+        장바구니 상품 목록 (CartItem 리스트 반환)
+
+        장바구니 API 응답을 본 뒤에는 그 상태로 바로 답하고, 아니면(또는 from_dom=True) 한 번의 evaluate로 수집
+        """
+        logger.info("장바구니 상품 목록 수집")
 
-            print(f"총 {count}개 상품 발견")
-            if count == 0:
-                raise "장바구니가 비었습니다"
+        state = None if from_dom else self.cart_observer.state
+        if state is not None:
+            logger.info("총 %s개 상품 정보 (장바구니 API 응답 기준)", len(state.items))
+            return list(state.items)
 
-            for i in range(count):
-                item = cart_items.nth(i)
+        try:
+            rows = self.page.locator(CartPageLocators.CART_ITEMS).evaluate_all(
+                CART_ROWS_SCRIPT,
+                {
+                    "title": CartPageLocators.ITEM_TITLE,
+                    "price": CartPageLocators.ITEM_PRICE,
+                    "image": CartPageLocators.ITEM_IMAGE,
+                    "quantity": CartPageLocators.QUANTITY,
+                },
+            )
+            self.round_trips.hit()
 
-                title = item.locator(CartPageLocators.ITEM_TITLE).inner_text()
-                price = item.locator(CartPageLocators.ITEM_PRICE).inner_text()
+        except Exception as e:
+            logger.warning("상품정보를 가져오지 못했습니다 %s", e)
+            return []
 
-                items.append({"index": i + 1, "title": title, "price": price})
-                print(f"{i+1}번째 상품, {title}, {price}")
+        if not rows:
+            logger.info("장바구니가 비었습니다")
+            return []
 
-            print(f"총 {len(items)}개 상품 정보 수집")
-            return items
+        items = [CartItem.from_row(row) for row in rows]
+        for item in items:
+            logger.debug("%s번째 상품, %s, %s", item.index, item.title, item.price_text)
 
-        except Exception as e:
-            print(f"상품정보를 가져오지 못했습니다 {e}")
-            return items
+        logger.info("총 %s개 상품 정보 수집", len(items))
+        return items
 
     def remove_item(self, index=1):
-        print(f"{index}번째 상품 제거 시도")
+        logger.info("%s번째 상품 제거 시도", index)
 
         try:
             items = self.get_cart_items()
             if len(items) < index or index == 0:
                 raise IndexError(f"제거 할 수 없습니다: {index}번째 상품이 없음")
 
-            # 다이얼로그 자동 수락 설정
-            self.page.on("dialog", lambda dialog: dialog.accept())
-
             remove_btn = self.page.locator(CartPageLocators.ITEM_REMOVE)
             remove_btn.nth(index - 1).scroll_into_view_if_needed()
             self.human_delay(1, 2)
-            remove_btn.nth(index - 1).click()
+            # 삭제 확인 다이얼로그는 수락
+            with self.dialogs.accept(), self.cart_observer.expect_update() as update:
+                remove_btn.nth(index - 1).click()
+
+            if update.state is not None and len(update.state.items) != len(items) - 1:
+                logger.warning("상품 제거 실패: 남은 상품 %s개", len(update.state.items))
+                return False
 
             self.human_delay(1, 2)
-            print(f"{index}번째 상품 제거 완료")
+            logger.info("%s번째 상품 제거 완료", index)
+            return True
+
+        except Exception as e:
+            logger.warning("상품 제거 실패: %s", e)
+            return False
+
+    def remove_items(self, indices):
+        """
+        여러 상품을 한 번에 제거 (index는 1부터, 호출 시점의 장바구니 기준)
+
+        - 상품 목록은 한 번만 읽고, 뒤쪽 상품부터 지워서 남은 대상의 index가 바뀌지 않게 함
+        - 삭제 확인 다이얼로그는 작업 동안 등록한 핸들러 하나로 수락
+        - 마지막에 장바구니 상태를 한 번 읽어 모두 반영됐는지 확인
+        """
+        targets = sorted(set(indices), reverse=True)
+        logger.info("상품 %s개 제거 시도: %s", len(targets), targets[::-1])
+        if not targets:
+            return True
+
+        try:
+            items = self.get_cart_items()
+            invalid = [index for index in targets if not 0 < index <= len(items)]
+            if invalid:
+                raise IndexError(f"제거 할 수 없습니다: {invalid}번째 상품이 없음")
+            expected = len(items) - len(targets)
+
+            version = self.cart_observer.version
+            remove_btn = self.page.locator(CartPageLocators.ITEM_REMOVE)
+            self.human_delay(1, 2)
+            with self.dialogs.accept():
+                for index in targets:
+                    with self.cart_observer.expect_update():
+                        remove_btn.nth(index - 1).click()
+                    self.wait_for_settle()
+
+            remaining = self._read_cart_after(version)
+            if len(remaining) != expected:
+                logger.warning("상품 제거 실패: %s개 남음 (예상 %s개)", len(remaining), expected)
+                return False
+
+            logger.info("상품 %s개 제거 완료", len(targets))
             return True
 
         except Exception as e:
-            print(f"상품 제거 실패: {e}")
+            logger.warning("상품 제거 실패: %s", e)
             return False
 
+    def set_quantities(self, quantities):
+        """
+        여러 상품의 수량을 한 번에 변경 ({index: 수량}, index는 1부터)
+
+        - 상품 목록은 한 번만 읽고, 이미 목표 수량인 상품은 건너뜀
+        - 입력창에 값을 넣고 change 이벤트만 보냄 (클릭/포커스 이동 없음)
+        - 다이얼로그(수량 제한 안내 등)는 수락하고 해당 변경은 실패로 기록
+        - 마지막에 장바구니 상태를 한 번 읽어 모두 반영됐는지 확인
+        """
+        changes = dict(sorted(quantities.items()))
+        logger.info("수량 일괄 변경 시도: %s", changes)
+
+        try:
+            items = self.get_cart_items()
+            invalid = [index for index in changes if not 0 < index <= len(items)]
+            if invalid:
+                raise IndexError(f"수량 변경 불가: {invalid}번째 상품이 없음")
+
+            version = self.cart_observer.version
+            quantity_inputs = self.page.locator(CartPageLocators.QUANTITY)
+            pending = {index: quantity for index, quantity in changes.items() if items[index - 1].quantity != quantity}
+            with self.dialogs.accept() as dialogs:
+                for index, quantity in pending.items():
+                    rejected = len(dialogs)
+                    with self.cart_observer.expect_update(timeout=5000, cancel=lambda: len(dialogs) > rejected):
+                        quantity_inputs.nth(index - 1).fill(str(quantity))
+                        quantity_inputs.nth(index - 1).dispatch_event("change")
+                    self.wait_for_settle()
+
+            final = self._read_cart_after(version) if pending else items
+            failed = {index: quantity for index, quantity in changes.items() if final[index - 1].quantity != quantity}
+            if failed:
+                logger.warning("수량 변경 실패: %s (다이얼로그 %s회)", failed, len(dialogs))
+                return False
+
+            logger.info("수량 %s개 변경 완료", len(pending))
+            return True
+
+        except Exception as e:
+            logger.warning("수량 변경 실패: %s", e)
+            return False
+
+    def _read_cart_after(self, version):
+        """일괄 변경 후 상태 한 번 읽기 (장바구니 응답을 받았으면 그 상태, 아니면 DOM)"""
+        state = self.cart_observer.state
+        if self.cart_observer.version > version and state is not None:
+            return list(state.items)
+        return self.get_cart_items(from_dom=True)
+
     def clear_cart(self):
-        print("장바구니 전체 비우기")
+        logger.info("장바구니 전체 비우기")
 
         checkbox = self.page.locator(CartPageLocators.CHECKBOX)
         if not checkbox.is_visible():
-            print("장바구니가 이미 비어있습니다.")
+            logger.info("장바구니가 이미 비어있습니다.")
             return self
 
         checkbox.check()
         self.human_delay(1, 2)
 
-        # 다이얼로그 자동 수락 설정
-        self.page.once("dialog", lambda dialog: dialog.accept())
-
+        # 삭제 확인 다이얼로그는 수락
         clear_btn = self.page.locator(CartPageLocators.ITEM_REMOVE_ALL)
-        clear_btn.click()
+        with self.dialogs.accept(), self.cart_observer.expect_update():
+            clear_btn.click()
 
         self.human_delay(1, 2)
-        print("전체 삭제 완료")
+        logger.info("전체 삭제 완료")
         return self
 
     def update_quantity(self, index: int, quantity: int):
-        print(f"{index}번째 상품을 {quantity}개 직접 입력으로 변경")
-
-        dialog_occurred = [False]
-        self.page.on("dialog", lambda dialog: [dialog.accept(), dialog_occurred.__setitem__(0, True)])
+        logger.info("%s번째 상품을 %s개 직접 입력으로 변경", index, quantity)
 
         try:
             items = self.get_cart_items()
@@ -109,38 +243,60 @@ class CartPage(BasePage):
                 raise IndexError(f"수량 변경 불가: {index}번째 상품이 없음")
 
             quantity_btn = self.page.locator(CartPageLocators.QUANTITY).nth(index - 1)
-            quantity_value = int(quantity_btn.get_attribute("value"))
-            print(f"현재 수량: {quantity_value}, 목표 수량: {quantity}")
+            quantity_value = items[index - 1].quantity
+            logger.info("현재 수량: %s, 목표 수량: %s", quantity_value, quantity)
 
             if quantity_value == quantity:
-                print(f"✅ 이미 목표 수량입니다: {quantity}")
+                logger.info("✅ 이미 목표 수량입니다: %s", quantity)
                 return True
 
-            quantity_btn.click(click_count=3)
-            self.human_delay(0.2, 0.3)
+            # 고정 대기 대신 이 변경에 대한 장바구니 API 응답을 기다림 (다이얼로그로 거부되면 즉시 중단)
+            with (
+                self.dialogs.accept() as dialogs,
+                self.cart_observer.expect_update(timeout=5000, cancel=lambda: bool(dialogs)) as update,
+            ):
+                quantity_btn.click(click_count=3)
+                self.human_delay(0.2, 0.3)
 
-            quantity_btn.fill(str(quantity))
-            self.human_delay(0.3, 0.5)
+                quantity_btn.fill(str(quantity))
+                self.human_delay(0.3, 0.5)
 
-            self.page.locator("body").click(position={"x": 100, "y": 100})
-            self.human_delay(0.5, 1)
+                self.page.locator("body").click(position={"x": 100, "y": 100})
 
-            self.page.wait_for_timeout(1000)  # 서버 업데이트 대기
-            new_quantity = int(quantity_btn.get_attribute("value"))
-
-            if dialog_occurred[0]:
-                print(f"수량 변경 실패 (다이얼로그): 현재 {new_quantity}")
+            if dialogs:
+                logger.warning("수량 변경 실패 (다이얼로그: %s)", dialogs[0].message)
                 return False
+
+            if update.state is not None:
+                new_quantity = update.state.quantity_of(index)
+            else:
+                # 장바구니 API 응답을 찾지 못한 사이트면 화면에서 확인
+                self.wait_for_settle()
+                new_quantity = int(parse_price(quantity_btn.get_attribute("value")) or 0)
+
             if new_quantity == quantity:
-                print(f"수량 변경 완료: {quantity_value} → {new_quantity}")
+                logger.info("수량 변경 완료: %s → %s", quantity_value, new_quantity)
                 return True
+            logger.warning("수량 변경 실패: 현재 %s", new_quantity)
+            return False
 
         except Exception as e:
-            print(f"수량 변경 실패: {e}")
+            logger.warning("수량 변경 실패: %s", e)
             return False
 
     def get_total_price(self):
-        print("총 결제 금액 가져오기")
+        logger.info("총 결제 금액 가져오기")
+
+        state = self.cart_observer.state
+        if state is not None:
+            logger.debug(
+                "상품가격: %s + 배송비: %s - 할인: %s = 총 가격: %s",
+                state.items_price,
+                state.shipping_fee,
+                state.discount,
+                state.total,
+            )
+            return state.total
 
         try:
             item_info = self.page.locator(CartPageLocators.ORDER_SUMMARY)
@@ -150,32 +306,36 @@ class CartPage(BasePage):
             item_price = price.nth(0)
             shipping_fee = price.nth(1)
 
-            total_price = item_info.locator(CartPageLocators.TOTAL_PRICE)
+            total_text = item_info.locator(CartPageLocators.TOTAL_PRICE).inner_text()
 
-            print(
-                f"상품가격: {item_price.inner_text()} + 배송비: {shipping_fee.inner_text()}- 할인: {discount.inner_text()}"
-                f"=총 가격: {total_price.inner_text()}"
+            # 금액 구성은 로그 전용이므로 DEBUG가 꺼져 있으면 브라우저에 묻지 않음
+            logger.debug(
+                "상품가격: %s + 배송비: %s- 할인: %s=총 가격: %s",
+                Lazy(item_price.inner_text),
+                Lazy(shipping_fee.inner_text),
+                Lazy(discount.inner_text),
+                total_text,
             )
 
-            int_total_price = int(re.sub(r"[^\d]", "", total_price.inner_text()))
+            int_total_price = int(re.sub(r"[^\d]", "", total_text))
 
             return int_total_price
 
         except Exception as e:
-            print(f"총 금액 확인 실패: {e}")
+            logger.warning("총 금액 확인 실패: %s", e)
             return None
 
     def click_logo(self):
-        print("쇼핑 계속하기")
+        logger.info("쇼핑 계속하기")
 
         self.safe_click(CartPageLocators.LOGO)
-        print("로고 클릭으로 홈페이지로 이동")
+        logger.info("로고 클릭으로 홈페이지로 이동")
         from framework.pages.home_page import HomePage
 
-        return HomePage(self.page)
+        return self._spawn(HomePage)
 
     def proceed_to_checkout(self):
-        print("결제 페이지로 이동")
+        logger.info("결제 페이지로 이동")
 
         checkout_btn = self.page.locator(CartPageLocators.CHECKOUT_BUTTON)
 
@@ -187,13 +347,13 @@ class CartPage(BasePage):
         checkout_btn.click()
 
         self.page.wait_for_url("**/checkout**", timeout=15000)
-        print("결제 페이지 이동 완료")
+        logger.info("결제 페이지 이동 완료")
         self.human_delay(0.3, 0.8)
 
         return self
 
     def click_login_button(self, username, password):
-        print("로그인 버튼 클릭")
+        logger.info("로그인 버튼 클릭")
 
         try:
             login_btn = self.page.locator(CartPageLocators.LOGIN_BUTTON)
@@ -207,7 +367,7 @@ class CartPage(BasePage):
 
                 from framework.pages.login_page import LoginPage
 
-                login_page = LoginPage(new_page)
+                login_page = self._spawn(LoginPage, new_page)
                 login_page.should_be_on_login_page()
 
                 # 자신(CartPage)을 전달
@@ -222,7 +382,7 @@ class CartPage(BasePage):
 
                 from framework.pages.login_page import LoginPage
 
-                login_page = LoginPage(self.page)
+                login_page = self._spawn(LoginPage)
                 login_page.should_be_on_login_page()
 
                 if login_page.login(username, password):
@@ -231,20 +391,20 @@ class CartPage(BasePage):
                     return None
 
         except Exception as e:
-            print(f"로그인 실패: {e}")
+            logger.warning("로그인 실패: %s", e)
             return None
 
     def logout(self):
-        print("로그아웃 시도")
+        logger.info("로그아웃 시도")
 
         try:
             self.safe_click(CartPageLocators.LOGOUT_BUTTON)
             self.wait_for_load()
 
-            print("로그아웃 완료")
+            logger.info("로그아웃 완료")
             from framework.pages.home_page import HomePage
 
-            return HomePage(self.page)
+            return self._spawn(HomePage)
 
         except Exception as e:
-            print(f"로그아웃 실패: {e}")
+            logger.warning("로그아웃 실패: %s", e)
@@ -1,112 +1,116 @@
 # pages/home_page.py
 
+from urllib.parse import urlparse
 
 from framework.base.base_page import BasePage
 from framework.config.locators import GmarketLocators, SearchPageLocators
+from framework.utils.logger import Lazy, get_logger
+
+logger = get_logger(__name__)
 
 
 # G마켓 홈페이지 클래스
 class HomePage(BasePage):
-    def __init__(self, page):
-        super().__init__(page)
+    def __init__(self, page, **kwargs):
+        super().__init__(page, **kwargs)
         self.url_path = ""
 
     def visit(self):
-        print("G마켓 홈페이지 방문")
+        logger.info("G마켓 홈페이지 방문")
         self.goto(self.url_path)
         return self
 
     def should_be_on_homepage(self):
-        print("홈페이지 도달 확인")
+        logger.info("홈페이지 도달 확인")
 
         self.human_delay(0.8, 1)
 
         current_title = self.page.title()
-        print(f"페이지 제목 : {current_title}")
+        logger.info("페이지 제목 : %s", current_title)
         if "G마켓" not in current_title and "gmarket" not in current_title.lower():
             raise AssertionError(f"홈페이지가 아닙니다. 현재 제목 : {current_title}")
 
         current_url = self.page.url
-        if "gmarket.co.kr" not in current_url:
+        if urlparse(self.base_url).hostname not in current_url:
             raise AssertionError(f"G마켓 도메인이 아닙니다. 현재 URL: {current_url}")
 
         # 로고 확인
         self.should_see_element(GmarketLocators.LOGO)
-        print("홈페이지 도달 확인 완료")
+        logger.info("홈페이지 도달 확인 완료")
         return self
 
     # 홈페이지 주요 요소들 보이는지 확인
     def should_see_main_elements(self):
-        print("홈페이지 주요 요소 확인")
+        logger.info("홈페이지 주요 요소 확인")
 
         # 헤더 확인
         self.should_see_element(GmarketLocators.HEADER)
-        print("헤더 표시됨")
+        logger.info("헤더 표시됨")
         # 로고 확인
         self.should_see_element(GmarketLocators.LOGO)
-        print("로고 표시됨")
+        logger.info("로고 표시됨")
         # 검색창 확인
         self.should_see_element(GmarketLocators.SEARCH_INPUT)
-        print("검색창 표시됨")
+        logger.info("검색창 표시됨")
         # 검색 버튼 확인
         self.should_see_element(GmarketLocators.SEARCH_BUTTON)
-        print("검색 버튼 표시 됨")
+        logger.info("검색 버튼 표시 됨")
 
-        print("주요 요소 확인됨")
+        logger.info("주요 요소 확인됨")
         return self
 
     # 상품 검색
     def search_product(self, keyword):
-        print(f"상품 검색 : '{keyword}'")
+        logger.info("상품 검색 : '%s'", keyword)
 
         # 검색창에 키워드 입력
         self.safe_type(GmarketLocators.SEARCH_INPUT, keyword)
-        print(f"검색어 입력 : '{keyword}'")
+        logger.info("검색어 입력 : '%s'", keyword)
 
         # 검색버튼 클릭
         self.safe_click(GmarketLocators.SEARCH_BUTTON)
 
         # 검색 결과 페이지로 이동될 때까지 대기
         self.page.wait_for_url("**/search**", timeout=15000)
-        print("검색 결과 페이지로 이동 완료")
+        logger.info("검색 결과 페이지로 이동 완료")
 
         # SearchPage객체 반환
         from framework.pages.search_page import SearchPage
 
-        return SearchPage(self.page)
+        return self._spawn(SearchPage)
 
     # 엔터키로 검색
     def search_with_enter(self, keyword):
-        print(f"Enter 키로 검색 : {keyword}")
+        logger.info("Enter 키로 검색 : %s", keyword)
 
         self.safe_click(GmarketLocators.SEARCH_INPUT)
         self.safe_type(GmarketLocators.SEARCH_INPUT, keyword, clear=True)
 
         self.safe_press("Enter")
-        print("Enter 키 입력")
+        logger.info("Enter 키 입력")
 
         # 검색 결과 페이지 대기
         self.page.wait_for_url("**/search**", timeout=15000)
-        print("검색결과 페이지 이동 완료")
+        logger.info("검색결과 페이지 이동 완료")
 
         # SearchPage객체 반환
         from framework.pages.search_page import SearchPage
 
-        return SearchPage(self.page)
+        return self._spawn(SearchPage)
 
     def should_see_search_suggestions(self):
         """검색 자동완성이 나타나는지 확인"""
-        print(" 검색 자동완성 확인")
+        logger.info("검색 자동완성 확인")
 
         # 자동완성 목록이 보이는지 확인
         suggestions = self.page.locator(GmarketLocators.SEARCH_SUGGESTION)
 
-        print(" 자동완성 목록 표시됨")
+        logger.info("자동완성 목록 표시됨")
         return suggestions
 
     def type_in_search_without_submit(self, keyword):
         """검색만 입력하고 제출하지 않음 (자동완성 테스트용)"""
-        print(f" 검색어만 입력: '{keyword}'")
+        logger.info("검색어만 입력: '%s'", keyword)
 
         self.safe_type(GmarketLocators.SEARCH_INPUT, keyword, clear=True)
 
@@ -119,15 +123,15 @@ class HomePage(BasePage):
     # ==============================================
 
     def click_logo(self):
-        print("쇼핑 계속하기")
+        logger.info("쇼핑 계속하기")
 
         self.safe_click(SearchPageLocators.LOGO)
         self.should_see_element(".top_banner")
-        print("추천픽 페이지로 이동")
+        logger.info("추천픽 페이지로 이동")
         return True
 
     def click_login_button(self, username, password):
-        print("로그인 버튼 클릭")
+        logger.info("로그인 버튼 클릭")
 
         try:
             login_btn = self.page.locator(GmarketLocators.LOGIN_BUTTON)
@@ -141,7 +145,7 @@ class HomePage(BasePage):
 
                 from framework.pages.login_page import LoginPage
 
-                login_page = LoginPage(new_page)
+                login_page = self._spawn(LoginPage, new_page)
                 login_page.should_be_on_login_page()
 
                 # 자신(HomePage)을 전달
@@ -156,7 +160,7 @@ class HomePage(BasePage):
 
                 from framework.pages.login_page import LoginPage
 
-                login_page = LoginPage(self.page)
+                login_page = self._spawn(LoginPage)
                 login_page.should_be_on_login_page()
 
                 if login_page.login(username, password):
@@ -165,38 +169,38 @@ class HomePage(BasePage):
                     return None
 
         except Exception as e:
-            print(f"로그인 실패: {e}")
+            logger.warning("로그인 실패: %s", e)
             return None
 
     def logout(self):
-        print("로그아웃 시도")
+        logger.info("로그아웃 시도")
 
         try:
             self.safe_click(GmarketLocators.LOGOUT_BUTTON)
             self.wait_for_load()
 
-            self.page.goto("https://www.gmarket.co.kr")
+            self.page.goto(self.base_url)
             self.page.wait_for_load_state("load")
-            print(f"💡 현재 페이지 URL: {self.page.url}")
-            print("로그아웃 완료")
-            return HomePage(self.page)
+            logger.debug("💡 현재 페이지 URL: %s", self.page.url)
+            logger.info("로그아웃 완료")
+            return self._spawn(HomePage)
 
         except Exception as e:
-            print(f"로그아웃 실패: {e}")
+            logger.warning("로그아웃 실패: %s", e)
             return None
 
     def click_cart_button(self):
         """장바구니 버튼 클릭"""
-        print("장바구니 버튼 클릭")
+        logger.info("장바구니 버튼 클릭")
         self.safe_click(GmarketLocators.CART_BUTTON)
 
         # 장바구니 페이지로 이동 대기
         self.page.wait_for_url("**/cart/**", timeout=10000)
-        print("  ✓ 장바구니 페이지 이동")
+        logger.info("✓ 장바구니 페이지 이동")
 
         from framework.pages.cart_page import CartPage
 
-        return CartPage(self.page)
+        return self._spawn(CartPage)
 
     # ==============================================
     # 🎭 사용자 행동 시뮬레이션
@@ -204,7 +208,7 @@ class HomePage(BasePage):
 
     def browse_homepage_naturally(self):
         """홈페이지를 자연스럽게 둘러보기"""
-        print("홈페이지 자연스럽게 둘러보기")
+        logger.info("홈페이지 자연스럽게 둘러보기")
 
         # 페이지 로딩 후 잠시 대기
         self.human_delay(0.3, 0.8)
@@ -220,31 +224,32 @@ class HomePage(BasePage):
         self.page.evaluate("window.scrollTo(0, 0)")
         self.human_delay(1, 2)
 
-        print("자연스러운 브라우징 완료")
+        logger.info("자연스러운 브라우징 완료")
         return self
 
     def hover_over_categories(self):
         """카테고리에 마우스 올려보기"""
-        print("카테고리 메뉴 hover")
+        logger.info("카테고리 메뉴 hover")
 
         category_menu = self.page.locator(GmarketLocators.CATEGORY_MENU)
         count = category_menu.count()
-        print(f"카테고리 메뉴 개수: {count}")
+        logger.debug("카테고리 메뉴 개수: %s", count)
 
         # 각 요소를 개별적으로 확인
         for i in range(count):
             element = category_menu.nth(i)
 
-            # 각 요소의 정보 출력
-            text_content = element.text_content()
+            # 각 요소의 정보 출력 (텍스트는 DEBUG일 때만 가져옴)
             is_visible = element.is_visible()
-            print(f"Element {i}: visible={is_visible}, text='{text_content[:50]}...'")
+            logger.debug(
+                "Element %s: visible=%s, text='%s...'", i, is_visible, Lazy(lambda: element.text_content()[:50])
+            )
 
             # 첫 번째로 보이는 요소에 hover
             if is_visible:  # 또는 원하는 조건
                 element.hover()
                 self.human_delay(0.5, 1)
-                print(f"  ✓ 카테고리 메뉴 hover 완료 (index: {i})")
+                logger.info("✓ 카테고리 메뉴 hover 완료 (index: %s)", i)
 
         return self
 
@@ -258,14 +263,14 @@ class HomePage(BasePage):
             login_btn = self.page.locator(GmarketLocators.LOGIN_BUTTON)
             is_visible = login_btn.is_visible()
             status = "로그아웃 상태" if is_visible else "로그인 상태"
-            print(f"현재 상태: {status}")
+            logger.info("현재 상태: %s", status)
             return is_visible
         except Exception:
             return True  # 에러 시 로그아웃 상태로 가정
 
     def wait_for_page_load(self):
         """페이지 완전 로딩 대기"""
-        print("페이지 로딩 대기")
+        logger.info("페이지 로딩 대기")
 
         # 네트워크 유휴 상태까지 대기
         self.wait_for_load()
@@ -273,10 +278,10 @@ class HomePage(BasePage):
         # 주요 요소들이 보일 때까지 대기
         self.page.wait_for_selector(GmarketLocators.SEARCH_INPUT, timeout=15000)
 
-        # 추가 안정화 시간
-        self.human_delay(2, 3)
+        # 추가 안정화 대기 (최대 3초)
+        self.wait_for_settle(timeout=3000)
 
-        print("  페이지 로딩 완료")
+        logger.info("페이지 로딩 완료")
         return self
 
     # ==============================================
@@ -285,7 +290,7 @@ class HomePage(BasePage):
 
     def verify_no_errors(self):
         """페이지 오류가 없는지 확인"""
-        print("페이지 오류 확인")
+        logger.info("페이지 오류 확인")
 
         # 일반적인 오류 메시지들 확인
         error_messages = ["error", "오류", "문제가 발생", "접속 불가", "service unavailable"]
@@ -294,9 +299,9 @@ class HomePage(BasePage):
 
         for error_msg in error_messages:
             if error_msg in page_text:
-                print(f"오류 발견: {error_msg}")
+                logger.warning("오류 발견: %s", error_msg)
                 self.take_screenshot(f"error_{error_msg}")
                 raise AssertionError(f"페이지에서 오류 발견: {error_msg}")
 
-        print("오류 없음")
+        logger.info("오류 없음")
         return self
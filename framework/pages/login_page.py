@@ -1,25 +1,28 @@
 from framework.base.base_page import BasePage
 from framework.config.locators import LoginPageLocators
+from framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class LoginPage(BasePage):
-    def __init__(self, page):
-        super().__init__(page)
+    def __init__(self, page, **kwargs):
+        super().__init__(page, **kwargs)
         if page is None:
             raise ValueError("Page 객체가 None입니다. fixture를 확인하세요.")
 
     def should_be_on_login_page(self):
-        print("로그인 페이지 확인")
+        logger.info("로그인 페이지 확인")
         current_url = self.page.url
         assert "login" in current_url.lower(), f"로그인 페이지가 아닙니다: {current_url}"
 
         # 아이디 입력창 있는지 확인
         self.should_see_element(LoginPageLocators.ID_INPUT)
-        print("로그인 페이지 확인 완료")
+        logger.info("로그인 페이지 확인 완료")
         return self
 
     def login(self, username, password):
-        print(f"로그인 시도 {username}")
+        logger.info("로그인 시도 %s", username)
 
         try:
             # id입력
@@ -33,19 +36,19 @@ class LoginPage(BasePage):
 
             is_success = self.is_logged_in()
             if is_success:
-                print(f"로그인 성공 :{is_success}")
+                logger.info("로그인 성공 :%s", is_success)
             else:
-                print(f"로그인 실패 : {is_success}")
+                logger.warning("로그인 실패 : %s", is_success)
 
             return is_success
 
         except Exception as e:
-            print(f"로그인 실패: {e}")
+            logger.warning("로그인 실패: %s", e)
             return False
 
     def is_logged_in(self):
-        print("로그인 상태 확인")
-        print(f"현재 URL: {self.page.url}")
+        logger.info("로그인 상태 확인")
+        logger.debug("현재 URL: %s", self.page.url)
 
         try:
             # 페이지 완전히 로드 대기
@@ -58,17 +61,17 @@ class LoginPage(BasePage):
             logout_btn = self.page.locator(LoginPageLocators.LOGOUT_BUTTON)
 
             count = logout_btn.count()
-            print(f"매칭되는 요소 개수: {count}")
+            logger.debug("매칭되는 요소 개수: %s", count)
 
             # 10초간 기다림 (timeout 증가)
 
             logout_btn.wait_for(state="visible", timeout=10000)
 
             if logout_btn.is_visible():
-                print("로그인 상태입니다")
+                logger.info("로그인 상태입니다")
                 return True
 
         except Exception as e:
-            print(f"❌ 로그인 상태 확인 실패: {e}")
-            self.page.screenshot(path="is_logged_in_error.png")
+            logger.warning("❌ 로그인 상태 확인 실패: %s", e)
+            self.take_screenshot("is_logged_in_error")
             return False
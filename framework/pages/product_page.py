@@ -1,60 +1,139 @@
+import re
+import time
+from urllib.parse import urlparse
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
 from framework.base.base_page import BasePage
 from framework.config.locators import ProductPageLocators
+from framework.models.records import ProductDetail, ProductOption, parse_price
+from framework.utils.cart_observer import get_cart_observer
+from framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 옵션 목록 (이름 / 품절 여부)
+PRODUCT_OPTIONS_SCRIPT = """
+rows => rows.map((row, i) => ({
+    index: i + 1,
+    name: row.dataset.option || row.innerText.replace(/\\(품절\\)\\s*$/, "").trim(),
+    soldOut: row.classList.contains("soldout"),
+}))
+"""
+
+# 상세 정보 전체를 한 번에 읽는 스크립트 (가격/배송은 두 번째 요소가 있으면 두 번째 요소 사용)
+PRODUCT_DETAIL_SCRIPT = """
+({ selectors, includeOptions }) => {
+    const pick = selector => {
+        const els = document.querySelectorAll(selector);
+        return els.length >= 2 ? els[1] : els[0];
+    };
+    const text = selector => {
+        const el = pick(selector);
+        return el ? el.innerText.trim() : "";
+    };
+    const images = [];
+    document.querySelectorAll(selectors.image).forEach(img => {
+        const src = img.currentSrc || img.src || img.dataset.src;
+        if (src && !images.includes(src)) images.push(src);
+    });
+    const title = document.querySelector(selectors.title);
+    const readOptions = READ_OPTIONS;
+    return {
+        title: title ? title.innerText.trim() : "",
+        price: text(selectors.price),
+        listPrice: text(selectors.listPrice),
+        shipping: text(selectors.shipping),
+        seller: text(selectors.seller),
+        images,
+        options: includeOptions ? readOptions(Array.from(document.querySelectorAll(selectors.option))) : null,
+    };
+}
+""".replace(
+    "READ_OPTIONS", PRODUCT_OPTIONS_SCRIPT.strip()
+)
+
+# 수량 입력창에 값을 직접 설정하고 사이트 핸들러가 반영한 값을 반환 (입력창이 없으면 null)
+SET_QUANTITY_SCRIPT = """
+({ selector, quantity }) => {
+    const input = document.querySelector(selector);
+    if (!input) return null;
+    if (input.readOnly || input.disabled) return input.value;
+    // 프레임워크가 value setter를 감싸는 경우에도 이벤트가 반영되도록 원래 setter 사용
+    Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set.call(input, String(quantity));
+    ["input", "change", "blur"].forEach(type => input.dispatchEvent(new Event(type, { bubbles: true })));
+    return input.value;
+}
+"""
+
+# 장바구니 담기 API 경로 (스탠드인 서버의 /api/cart/add, G마켓의 .../cart/AddCart 등)
+# 쿼리는 보지 않으므로 .../log?evt=addCart 같은 로그 비콘은 제외됨
+ADD_CART_RESPONSE = re.compile(r"/cart/add\w*/?$|/add_?cart\w*/?$", re.IGNORECASE)
+
+# 담기 응답 / 완료 팝업 확인 간격
+ADD_CART_POLL_MS = 100
+
+
+def is_add_cart_response(response, pattern=ADD_CART_RESPONSE):
+    """장바구니 담기 API 응답인지 (POST이고 URL 경로가 pattern과 일치)"""
+    return response.request.method == "POST" and pattern.search(urlparse(response.url).path) is not None
+
+
+DETAIL_SELECTORS = {
+    "title": ProductPageLocators.PRODUCT_TITLE,
+    "price": ProductPageLocators.PRODUCT_PRICE,
+    "listPrice": ProductPageLocators.PRODUCT_LIST_PRICE,
+    "shipping": ProductPageLocators.SHIPPING_INFO,
+    "seller": ProductPageLocators.SELLER_NAME,
+    "image": ProductPageLocators.PRODUCT_IMAGE,
+    "option": ProductPageLocators.OPTION_DROPDOWN,
+}
 
 
 class ProductPage(BasePage):
-    def __init__(self, page):
-        super().__init__(page)
+    # 장바구니 담기 API 경로 패턴 (사이트별로 바꿀 때 덮어쓰기)
+    add_cart_api = ADD_CART_RESPONSE
+
+    def __init__(self, page, **kwargs):
+        super().__init__(page, **kwargs)
         self.url_path = "/item"
 
     def should_be_on_product_page(self):
-        print("상품 상세 페이지에 있는지 확인")
+        logger.info("상품 상세 페이지에 있는지 확인")
 
         # 상품 정보 컨테이너 있는지 확인
         self.should_see_element(ProductPageLocators.PRODUCT_CONTAINER)
         self.human_delay(1, 2)
 
-        print("상품 상세 페이지 확인 완료")
+        logger.info("상품 상세 페이지 확인 완료")
         return self
 
     def get_product_info(self):
-        print("상품 정보 수집")
-
-        # 상품명
-        title_element = self.page.locator(ProductPageLocators.PRODUCT_TITLE)
-        print(title_element.is_visible())
-        title = title_element.inner_text()
-
-        # 가격
-        price_element = self.page.locator(ProductPageLocators.PRODUCT_PRICE)
+        """
+        상품명/판매가/정가/배송/판매자/이미지를 한 번의 evaluate로 수집 (ProductDetail 반환)
 
-        if price_element.count() >= 2:
-            price = price_element.nth(1).inner_text()
-        else:
-            price = price_element.nth(0).inner_text()
+        옵션 목록은 info.options에 처음 접근할 때 한 번 더 읽어옵니다.
+        """
+        logger.info("상품 정보 수집")
 
-        # 배송 정보
-        shipping_element = self.page.locator(ProductPageLocators.SHIPPING_INFO)
+        row = self.page.evaluate(PRODUCT_DETAIL_SCRIPT, {"selectors": DETAIL_SELECTORS, "includeOptions": False})
+        self.round_trips.hit()
+        info = ProductDetail.from_row(row, load_options=self.get_product_options)
 
-        if shipping_element.count() >= 2:
-            shipping = shipping_element.nth(1).inner_text()
-        else:
-            shipping = shipping_element.nth(0).inner_text()
+        logger.debug("상품명: %s...", info.title[:50])
+        logger.debug("가격: %s (정가 %s)", info.price_text, info.list_price)
+        logger.debug("배송: %s", info.shipping)
 
-        product_info = {
-            "title": title,
-            "price": price,
-            "shipping": shipping,
-        }
+        return info
 
-        print(f" 상품명: {title[:50]}...")
-        print(f" 가격: {price}")
-        print(f" 배송: {shipping}")
-
-        return product_info
+    def get_product_options(self):
+        """옵션 목록 (ProductOption 리스트, 옵션이 없는 상품이면 빈 리스트)"""
+        rows = self.page.locator(ProductPageLocators.OPTION_DROPDOWN).evaluate_all(PRODUCT_OPTIONS_SCRIPT)
+        self.round_trips.hit()
+        return [ProductOption.from_row(row) for row in rows]
 
     def scroll_and_explore(self):
-        print("상품 페이지 탐색")
+        logger.info("상품 페이지 탐색")
 
         # 페이지 중간까지 스크롤
         self.page.evaluate("window.scrollTo(0, window.innerHeight)")
@@ -68,99 +147,161 @@ class ProductPage(BasePage):
         self.page.evaluate("window.scrollTo(0, 0)")
         self.human_delay(0.5, 1)
 
-        print("페이지 탐색 완료")
+        logger.info("페이지 탐색 완료")
         return self
 
-    def add_to_cart(self, quantity=1):
-        print(f"수량 {quantity}개로 장바구니에 담기")
+    def add_to_cart(self, quantity=1, timeout=10000):
+        """
+        구매 가능한 첫 번째 옵션을 고르고 수량을 직접 입력한 뒤 장바구니에 담기
 
-        try:
-            option_btn = self.page.locator(ProductPageLocators.OPTION_BUTTON)
-            option_dropdown = self.page.locator(ProductPageLocators.OPTION_DROPDOWN)
-            available_options = False
-
-            # 옵션 선택창이 있다면 선택
-            if option_btn.count() > 0:
-                option_btn.click()
-                self.human_delay(0.3, 0.5)
-
-                for i in range(option_dropdown.count()):
-                    # 매진 확인
-                    if "soldout" in option_dropdown.nth(i).get_attribute("class"):
-                        continue
-
-                    # 구매 가능한 옵션 선택
-                    option_dropdown.nth(i).click()
-                    self.human_delay(0.3, 0.5)
-                    available_options = True
-                    break
-
-                # 모든 옵션이 매진인 경우
-                if not available_options:
-                    print("모든 옵션이 품절입니다")
-                    option_btn.click()
-                    return False
+        - 옵션은 get_product_options() 한 번으로 품절 여부를 확인
+        - 수량은 입력창에 바로 설정 (입력창이 없거나 값이 바뀌지 않으면 + 버튼을 딜레이 없이 클릭)
+        - 고정 대기 대신 장바구니 담기 API 응답으로 성공 여부 확인
+        """
+        logger.info("수량 %s개로 장바구니에 담기", quantity)
 
-            # 수량 증가
-            for selector in ProductPageLocators.PRODUCT_PLUS:
-                if self.page.locator(selector).count() > 0:
-                    plus_btn = self.page.locator(selector).first
-                    break
-            current = 1
+        try:
+            if self._select_first_available_option() is False:
+                return False
 
-            while current < quantity:
-                plus_btn.click()
-                self.human_delay(0.3, 0.5)
-                current += 1
+            self._set_quantity(quantity)
 
             # 선택 버튼이 있으면 클릭
             select_btn = self.page.locator(ProductPageLocators.PRODUCT_SELECT).first
             if select_btn.count() > 0:
                 select_btn.click()
-                self.human_delay(0.3, 0.5)
+                self.round_trips.hit(2)
 
-            # 장바구니 담기
-            add_cart = self.page.locator(ProductPageLocators.ADD_CART)
-            add_cart.click()
-            self.human_delay(1, 2)
+            if not self._submit_add_to_cart(timeout):
+                return False
 
-            # 팝업 닫기
-            popup_btn = self.page.locator(ProductPageLocators.POPUP_BUTTON)
-            if popup_btn.count() > 0 and popup_btn.is_visible(timeout=3000):
+            # 팝업 닫기 (담기는 이미 확인했으므로 팝업이 없는 사이트를 위해 짧게만 기다림)
+            popup_btn = self.page.locator(ProductPageLocators.POPUP_BUTTON).first
+            try:
+                popup_btn.wait_for(state="visible", timeout=1000)
                 popup_btn.click(force=True)
-                self.human_delay(0.3, 0.5)
+                self.round_trips.hit(2)
+            except PlaywrightTimeoutError:
+                self.round_trips.hit()
 
-            print("장바구니 담기 성공")
+            logger.info("장바구니 담기 성공")
             return True
 
         except Exception as e:
-            print(f"장바구니 담기 실패: {e}")
+            logger.warning("장바구니 담기 실패: %s", e)
+            return False
+
+    def _select_first_available_option(self):
+        """옵션이 없으면 None, 구매 가능한 옵션을 골랐으면 True, 모두 품절이면 False"""
+        options = self.get_product_options()
+        if not options:
+            return None
+
+        available = next((option for option in options if not option.sold_out), None)
+        if available is None:
+            logger.warning("모든 옵션이 품절입니다")
+            return False
+
+        self.page.locator(ProductPageLocators.OPTION_BUTTON).click()
+        self.page.locator(ProductPageLocators.OPTION_DROPDOWN).nth(available.index - 1).click()
+        self.round_trips.hit(2)
+        logger.debug("옵션 선택: %s", available.name)
+        self.human_delay(0.3, 0.5)
+        return True
+
+    def _set_quantity(self, quantity):
+        """수량 입력창에 바로 설정 (입력창이 없거나 값이 바뀌지 않으면 + 버튼 클릭)"""
+        value = self.page.evaluate(
+            SET_QUANTITY_SCRIPT, {"selector": ", ".join(ProductPageLocators.QUANTITY_INPUT), "quantity": quantity}
+        )
+        self.round_trips.hit()
+        current = int(parse_price(value) or 1)
+        if current == quantity:
+            return
+        if current > quantity:
+            # 최소 구매 수량 등으로 사이트가 값을 조정한 경우 (+ 버튼으로는 줄일 수 없음)
+            logger.warning("수량 %s개 요청, 사이트가 %s개로 조정", quantity, current)
+            return
+
+        # 입력창이 없거나 사이트가 직접 입력을 되돌린 경우
+        logger.debug("수량 직접 입력 불가 (현재 %s개), + 버튼으로 증가", current)
+        plus_btn = None
+        for selector in ProductPageLocators.PRODUCT_PLUS:
+            self.round_trips.hit()
+            if self.page.locator(selector).count() > 0:
+                plus_btn = self.page.locator(selector).first
+                break
+        if plus_btn is None:
+            raise ValueError(f"수량 {quantity}개 설정 불가: 수량 입력창과 + 버튼이 없음 (현재 {current}개)")
+
+        for _ in range(quantity - current):
+            plus_btn.click()
+            self.round_trips.hit()
+
+    def _submit_add_to_cart(self, timeout):
+        """
+        장바구니 담기 버튼 클릭 후 담기 API 응답과 완료 팝업 중 먼저 오는 쪽으로 확인
+
+        응답을 찾지 못하는 경우에도 팝업이 뜨는 즉시 끝나므로 timeout은 둘 다 없을 때만 기다립니다.
+        """
+        responses = []
+
+        def on_response(response):
+            if is_add_cart_response(response, self.add_cart_api):
+                responses.append(response)
+
+        # 담기 응답도 장바구니 상태에 반영되도록 감시기 설치
+        get_cart_observer(self.page)
+        popup = self.page.locator(ProductPageLocators.POPUP_BUTTON).first
+        self.page.on("response", on_response)
+        try:
+            self.page.locator(ProductPageLocators.ADD_CART).click()
+            self.round_trips.hit(2)
+
+            deadline = time.monotonic() + timeout / 1000
+            while not responses:
+                self.round_trips.hit()
+                if popup.is_visible():
+                    logger.debug("장바구니 담기 API 응답 없이 완료 팝업 확인")
+                    return True
+                if time.monotonic() >= deadline:
+                    logger.warning("장바구니 담기 API 응답과 완료 팝업이 %sms 안에 없음", timeout)
+                    return False
+                self.round_trips.hit()
+                self.page.wait_for_timeout(ADD_CART_POLL_MS)
+        finally:
+            self.page.remove_listener("response", on_response)
+
+        response = responses[0]
+        if not response.ok:
+            logger.warning("장바구니 담기 API 실패: %s %s", response.status, response.url)
             return False
+        return True
 
     def click_logo(self):
-        print("쇼핑 계속하기")
+        logger.info("쇼핑 계속하기")
 
         self.safe_click(ProductPageLocators.LOGO)
-        print("메인 페이지로 이동")
+        logger.info("메인 페이지로 이동")
         from framework.pages.home_page import HomePage
 
-        return HomePage(self.page)
+        return self._spawn(HomePage)
 
     def click_cart_button(self):
         """장바구니 버튼 클릭"""
-        print("장바구니 버튼 클릭")
+        logger.info("장바구니 버튼 클릭")
         self.safe_click(ProductPageLocators.CART_BUTTON)
 
         # 장바구니 페이지로 이동 대기
         self.page.wait_for_url("**/cart/**", timeout=10000)
-        print("  ✓ 장바구니 페이지 이동")
+        logger.info("✓ 장바구니 페이지 이동")
 
         from framework.pages.cart_page import CartPage
 
-        return CartPage(self.page)
+        return self._spawn(CartPage)
 
     def click_login_button(self, username, password):
-        print("로그인 버튼 클릭")
+        logger.info("로그인 버튼 클릭")
         try:
             login_btn = self.page.locator(ProductPageLocators.LOGIN_BUTTON)
 
@@ -173,7 +314,7 @@ class ProductPage(BasePage):
 
                 from framework.pages.login_page import LoginPage
 
-                login_page = LoginPage(new_page)
+                login_page = self._spawn(LoginPage, new_page)
                 login_page.should_be_on_login_page()
 
                 # 자신(ProductPage)을 전달
@@ -188,7 +329,7 @@ class ProductPage(BasePage):
 
                 from framework.pages.login_page import LoginPage
 
-                login_page = LoginPage(self.page)
+                login_page = self._spawn(LoginPage)
                 login_page.should_be_on_login_page()
 
                 if login_page.login(username, password):
@@ -197,21 +338,21 @@ class ProductPage(BasePage):
                     return None
 
         except Exception as e:
-            print(f"❌ 로그인 실패: {e}")
+            logger.warning("❌ 로그인 실패: %s", e)
             return None
 
     def logout(self):
-        print("로그아웃 시도")
+        logger.info("로그아웃 시도")
 
         try:
             self.safe_click(ProductPageLocators.LOGOUT_BUTTON)
             self.wait_for_load()
 
-            print("로그아웃 완료")
+            logger.info("로그아웃 완료")
             from framework.pages.home_page import HomePage
 
-            return HomePage(self.page)
+            return self._spawn(HomePage)
 
         except Exception as e:
-            print(f"로그아웃 실패: {e}")
+            logger.warning("로그아웃 실패: %s", e)
             return None
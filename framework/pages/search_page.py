@@ -1,20 +1,47 @@
 # pages/search_page.py
-import random
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from playwright.sync_api import expect
 
 from framework.base.base_page import BasePage
 from framework.config.locators import SearchPageLocators
+from framework.models.records import ProductCard
+from framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 검색 결과 카드 전체를 한 번에 읽는 스크립트
+PRODUCT_CARDS_SCRIPT = """
+(cards, { selectors, offset, limit }) => cards.slice(offset, limit === null ? cards.length : offset + limit).map((card, i) => {
+    const text = selector => {
+        const el = card.querySelector(selector);
+        return el ? el.innerText.trim() : "";
+    };
+    const link = card.querySelector(selectors.link);
+    const href = link ? link.href : "";
+    const match = href.match(/goodscode=(\\w+)/i);
+    return {
+        position: offset + i + 1,
+        title: text(selectors.title),
+        price: text(selectors.price),
+        href: href,
+        itemId: card.dataset.itemId || (match ? match[1] : href),
+    };
+})
+"""
 
 
 class SearchPage(BasePage):
-    def __init__(self, page):
-        super().__init__(page)
+    # 검색 결과 페이지 번호 쿼리 파라미터
+    PAGE_PARAM = "p"
+
+    def __init__(self, page, **kwargs):
+        super().__init__(page, **kwargs)
         self.url_path = "/search"
 
     def should_be_on_search_page(self):
         """검색 결과 페이지에 있는지 확인"""
-        print("검색 결과 페이지 확인")
+        logger.info("검색 결과 페이지 확인")
 
         # 검색 결과 컨테이너 확인
         self.should_see_element(SearchPageLocators.SEARCH_CONTAINER)
@@ -22,49 +49,203 @@ class SearchPage(BasePage):
 
         no_result = self.page.locator(SearchPageLocators.NO_RESULT)
         if no_result.count() > 0:
-            print("검색 결과가 없습니다")
+            logger.warning("검색 결과가 없습니다")
             return self
 
-        print(" 검색 결과 페이지 확인 완료")
+        logger.info("검색 결과 페이지 확인 완료")
         return self
 
     def should_have_search_results(self, min_results=1):
         """검색 결과가 있는지 확인 및 개수 반환"""
-        print(f" 최소 {min_results}개 검색 결과 존재 확인")
+        logger.info("최소 %s개 검색 결과 존재 확인", min_results)
 
         results = self.page.locator(SearchPageLocators.PRODUCT_CARDS)
         count = results.count()
-        print(f" 검색 결과: {count}개 상품 발견")
+        logger.info("검색 결과: %s개 상품 발견", count)
 
         if count >= min_results:
-            print(f" 검색 결과 확인: {count}개 상품")
+            logger.info("검색 결과 확인: %s개 상품", count)
             expect(results.first).to_be_visible(timeout=10000)
             return self
         else:
-            print(f" 검색 결과 부족: {count}개 (최소 {min_results}개 필요) - URL: {self.page.url}")
+            logger.warning("검색 결과 부족: %s개 (최소 %s개 필요) - URL: %s", count, min_results, self.page.url)
             return self
 
     def get_product_title(self, index):
         try:
-            element = self.page.locator(SearchPageLocators.PRODUCT_CARDS).nth(index - 1)
-            if not element.is_visible() or index == 0:
+            if index < 1:
                 raise IndexError(f"요소를 찾을 수 없습니다: {index}")
 
-            title_element = element.locator(SearchPageLocators.PRODUCT_TITLE)
-            title = title_element.inner_text()
-            print(f"상품명 : {title}")
+            cards = self.extract_cards(limit=index)
+            if len(cards) < index:
+                raise IndexError(f"요소를 찾을 수 없습니다: {index}")
 
-            price_element = element.locator(SearchPageLocators.PRODUCT_PRICE)
-            price = price_element.inner_text()
-            print(f"상품가격 : {price}")
+            card = cards[index - 1]
+            logger.debug("상품명 : %s", card.title)
+            logger.debug("상품가격 : %s", card.price_text)
 
-            return title, price
+            return card.title, card.price_text
         except Exception as e:
-            print(f"상품 가져오기 실패 : {e}")
+            logger.warning("상품 가져오기 실패 : %s", e)
             return None
 
+    def extract_cards(self, limit=None):
+        """검색 결과 카드의 상품명/가격/링크/상품번호/순서를 한 번의 evaluate로 수집"""
+        return self._extract_cards(self.page, limit=limit)
+
+    def _extract_cards(self, page, offset=0, limit=None):
+        rows = page.locator(SearchPageLocators.PRODUCT_CARDS).evaluate_all(
+            PRODUCT_CARDS_SCRIPT,
+            {
+                "selectors": {
+                    "title": SearchPageLocators.PRODUCT_TITLE,
+                    "price": SearchPageLocators.PRODUCT_PRICE,
+                    "link": SearchPageLocators.PRODUCT_IMAGE,
+                },
+                "offset": offset,
+                "limit": limit,
+            },
+        )
+        self.round_trips.hit()
+        return [ProductCard.from_row(row) for row in rows]
+
+    def iter_products(self, max_items=None, mode="paginate", max_pages=None, prefetch=True, timeout=15000):
+        """
+        검색 결과를 페이지 이동(paginate) 또는 무한 스크롤(scroll)로 넘기면서 ProductCard를 하나씩 반환
+
+        - 상품번호(item_id) 기준으로 중복 제거
+        - prefetch=True이면 현재 결과를 처리하는 동안 다음 페이지/스크롤을 미리 불러옴
+        - 호출한 쪽에서 반복을 멈추면 즉시 종료 (미리 연 페이지도 정리)
+        - position은 전체 결과 기준 순위로 다시 매겨짐
+        """
+        if mode not in ("paginate", "scroll"):
+            raise ValueError(f"지원하지 않는 mode입니다: {mode}")
+
+        seen = set()
+        rank = 0
+        batches = (
+            self._iter_pages(max_pages, prefetch, timeout)
+            if mode == "paginate"
+            else self._iter_scroll(max_pages, prefetch, timeout)
+        )
+
+        try:
+            for cards in batches:
+                for card in cards:
+                    key = card.item_id or card.href
+                    if key in seen:
+                        continue
+                    seen.add(key)
+
+                    rank += 1
+                    card.position = rank
+                    yield card
+
+                    if max_items is not None and rank >= max_items:
+                        return
+        finally:
+            batches.close()
+
+    def _page_url(self, page_number):
+        parts = urlparse(self.page.url)
+        query = parse_qs(parts.query)
+        query[self.PAGE_PARAM] = [str(page_number)]
+        return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+    # 다음 페이지 이동을 시작만 하고 바로 반환 (로딩은 브라우저가 백그라운드로 진행)
+    def _start_loading(self, page_number):
+        upcoming = self.page.context.new_page()
+        upcoming.evaluate("url => { window.location.href = url; }", self._page_url(page_number))
+        self.round_trips.hit(2)
+        return upcoming
+
+    def _wait_for_results(self, page, timeout):
+        page.wait_for_function("() => location.href !== 'about:blank'", timeout=timeout)
+        page.wait_for_selector(
+            f"{SearchPageLocators.PRODUCT_CARDS}, {SearchPageLocators.NO_RESULT}", state="attached", timeout=timeout
+        )
+        self.round_trips.hit(2)
+
+    def _iter_pages(self, max_pages, prefetch, timeout, idle_rounds=1):
+        page_number = int(parse_qs(urlparse(self.page.url).query).get(self.PAGE_PARAM, ["1"])[0])
+        current = self.page
+        upcoming = None
+        loaded = 0
+        seen = set()
+        idle = 0
+
+        try:
+            while max_pages is None or loaded < max_pages:
+                cards = self._extract_cards(current)
+                loaded += 1
+                logger.debug("%s페이지 상품 %s개 수집", page_number, len(cards))
+
+                # 범위를 넘은 페이지 번호를 마지막 페이지로 돌려주는 사이트도 있으므로
+                # 새 상품번호가 하나도 없는 페이지가 idle_rounds번 이어지면 종료 (_iter_scroll과 같은 방식)
+                keys = {card.item_id or card.href for card in cards}
+                if keys <= seen:
+                    idle += 1
+                    if idle >= idle_rounds:
+                        logger.debug("%s페이지에 새 상품이 없어 종료", page_number)
+                        return
+                else:
+                    idle = 0
+                seen |= keys
+
+                # 현재 페이지를 처리하는 동안 다음 페이지를 미리 불러옴
+                if max_pages is None or loaded < max_pages:
+                    upcoming = self._start_loading(page_number + 1) if prefetch else None
+
+                yield cards
+
+                if max_pages is not None and loaded >= max_pages:
+                    return
+
+                if upcoming is None:
+                    upcoming = self._start_loading(page_number + 1)
+                self._wait_for_results(upcoming, timeout)
+
+                if current is not self.page:
+                    current.close()
+                current, upcoming = upcoming, None
+                page_number += 1
+        finally:
+            for page in (current, upcoming):
+                if page is not None and page is not self.page and not page.is_closed():
+                    page.close()
+
+    def _iter_scroll(self, max_rounds, prefetch, timeout, idle_rounds=2):
+        offset = 0
+        idle = 0
+        rounds = 0
+
+        while max_rounds is None or rounds < max_rounds:
+            cards = self._extract_cards(self.page, offset=offset)
+            rounds += 1
+            offset += len(cards)
+
+            if not cards:
+                idle += 1
+                if idle >= idle_rounds:
+                    return
+            else:
+                idle = 0
+
+            # 현재 카드를 처리하는 동안 다음 결과 로딩을 시작
+            if prefetch:
+                self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                self.round_trips.hit()
+
+            if cards:
+                yield cards
+
+            if not prefetch:
+                self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                self.round_trips.hit()
+            self.wait_for_settle(timeout=timeout)
+
     def click_product_by_index(self, index):
-        print("상품 클릭 시작")
+        logger.info("상품 클릭 시작")
         try:
             product = self.page.locator(SearchPageLocators.PRODUCT_CARDS).nth(index - 1)
 
@@ -86,7 +267,7 @@ class SearchPage(BasePage):
 
             with self.page.context.expect_page() as new_page_info:
                 img_element.click()
-                print("상품 클릭")
+                logger.info("상품 클릭")
 
             try:
                 new_page = new_page_info.value
@@ -95,30 +276,30 @@ class SearchPage(BasePage):
                 new_page.wait_for_load_state("networkidle")
                 self.human_delay(1, 2)
                 new_page.wait_for_url("**/Item**", timeout=15000)
-                print(f"새 페이지에서 동작 : {new_page.url}")
+                logger.info("새 페이지에서 동작 : %s", new_page.url)
 
                 if "AccessDenied" in new_page.content():
                     raise Exception("Access Denied 페이지가 열렸습니다.")
 
                 from framework.pages.product_page import ProductPage
 
-                return ProductPage(new_page)
+                return self._spawn(ProductPage, new_page)
 
             except Exception:
-                print(f"현재 페이지에서 동작 : {self.page.url}")
+                logger.info("현재 페이지에서 동작 : %s", self.page.url)
                 self.page.wait_for_url("**/Item**", timeout=15000)
 
                 from framework.pages.product_page import ProductPage
 
-                return ProductPage(self.page)
+                return self._spawn(ProductPage)
 
         except Exception as e:
-            print(f"{index}번째 상품 클릭 실패: {e}")
+            logger.warning("%s번째 상품 클릭 실패: %s", index, e)
 
             return None
 
     def apply_price_filter(self, min_price=None, max_price=None):
-        print("필터 적용 시작")
+        logger.info("필터 적용 시작")
 
         try:
             price_filter = self.page.locator(SearchPageLocators.PRICE_FILTER)
@@ -127,15 +308,15 @@ class SearchPage(BasePage):
                     raise ValueError("최소금액이 최대금액보다 작아야 합니다")
 
                 if min_price:
-                    print(f"최소 금액 : {min_price}")
+                    logger.info("최소 금액 : %s", min_price)
                     min_input = price_filter.locator(SearchPageLocators.FILTER_MIN)
-                    min_input.type(str(min_price), delay=random.randint(20, 30))
+                    min_input.type(str(min_price), delay=self.pacer.keystroke_delay((20, 30)))
                     self.human_delay(0.3, 0.5)
 
                 if max_price:
-                    print(f"최대 금액 : {max_price}")
+                    logger.info("최대 금액 : %s", max_price)
                     max_input = price_filter.locator(SearchPageLocators.FILTER_MAX)
-                    max_input.type(str(max_price), delay=random.randint(20, 30))
+                    max_input.type(str(max_price), delay=self.pacer.keystroke_delay((20, 30)))
                     self.human_delay(0.3, 0.5)
 
                 apply_btn = price_filter.locator(SearchPageLocators.FILTER_BUTTON)
@@ -144,14 +325,14 @@ class SearchPage(BasePage):
                 self.wait_for_load()
                 self.human_delay(1, 2)
 
-                print("가격 적용 완료")
+                logger.info("가격 적용 완료")
                 return self
             else:
-                print("가격 필터 옵션을 찾을 수 없습니다")
+                logger.warning("가격 필터 옵션을 찾을 수 없습니다")
                 return self
 
         except Exception as e:
-            print(f"가격 필터 적용 실패 : {e}")
+            logger.warning("가격 필터 적용 실패 : %s", e)
             return self
 
     def sort_by_price_low_to_high(self):
@@ -166,73 +347,66 @@ class SearchPage(BasePage):
         self.wait_for_load()
         self.human_delay(1, 2)
 
-        print("가격 낮은 순 정렬 완료")
+        logger.info("가격 낮은 순 정렬 완료")
 
     def get_all_product_titles(self, limit=10):
         """모든 상품명 리스트 반환 (제한된 개수)"""
-        print(f" 상품명 리스트 수집 (최대 {limit}개)")
+        logger.info("상품명 리스트 수집 (최대 %s개)", limit)
 
         titles = []
         try:
-            products = self.page.locator(SearchPageLocators.PRODUCT_CARDS)
-            count = min(products.count(), limit)
-            if count == 0:
+            titles = [card.title for card in self.extract_cards(limit)]
+            if not titles:
                 raise ValueError("상품명 수집 실패")
 
-            for i in range(count):
-                product = products.nth(i)
-                title_element = product.locator(SearchPageLocators.PRODUCT_TITLE)
-                title = title_element.inner_text()
-                titles.append(title)
-
-            print(f" {len(titles)}개 상품명 수집 완료")
-            print(titles)
+            logger.info("%s개 상품명 수집 완료", len(titles))
+            logger.debug("상품명: %s", titles)
             return titles
 
         except Exception as e:
-            print(f" 상품명 수집 실패: {e}")
+            logger.warning("상품명 수집 실패: %s", e)
             return titles
 
-    def verify_search_keyword_in_results(self, keyword):
-        """검색 키워드가 결과에 포함되는지 확인"""
-        print(f" 검색어 '{keyword}' 관련성 확인")
+    def verify_search_keyword_in_results(self, keyword, limit=5):
+        """검색 키워드가 결과에 포함되는지 확인 (기본 상위 5개, limit=None이면 전체 카드)"""
+        logger.info("검색어 '%s' 관련성 확인", keyword)
 
-        titles = self.get_all_product_titles(5)  # 상위 5개만 확인
+        titles = self.get_all_product_titles(limit)
         if titles:
             relevant_count = 0
 
             for title in titles:
                 if keyword.lower() in title.lower():
                     relevant_count += 1
-                    print(f"관련 상품: {title[:50]}...")
+                    logger.debug("관련 상품: %s...", title[:50])
                 else:
-                    print(f"비관련 상품 : {title[:50]}...")
+                    logger.debug("비관련 상품 : %s...", title[:50])
 
             relevance_rate = (relevant_count / len(titles)) * 100
-            print(f" 관련성: {relevant_count}/{len(titles)} ({relevance_rate:.1f}%)")
+            logger.info("관련성: %s/%s (%.1f%%)", relevant_count, len(titles), relevance_rate)
 
             # 최소 30% 이상 관련성이 있어야 함
             if relevance_rate >= 30:
-                print(" 검색 결과 관련성 양호")
+                logger.info("검색 결과 관련성 양호")
                 return titles, True
             else:
-                print(f"️ 검색 결과 관련성 낮음: {relevance_rate:.1f}%")
+                logger.warning("️ 검색 결과 관련성 낮음: %.1f%%", relevance_rate)
                 return titles, False
         else:
-            print("검색 결과가 없습니다")
+            logger.warning("검색 결과가 없습니다")
             return [], False
 
     def click_logo(self):
-        print("쇼핑 계속하기")
+        logger.info("쇼핑 계속하기")
 
         self.safe_click(SearchPageLocators.LOGO)
-        print("메인 페이지로 이동")
+        logger.info("메인 페이지로 이동")
         from framework.pages.home_page import HomePage
 
-        return HomePage(self.page)
+        return self._spawn(HomePage)
 
     def click_login_button(self, username, password):
-        print("로그인 버튼 클릭")
+        logger.info("로그인 버튼 클릭")
 
         try:
             login_btn = self.page.locator(SearchPageLocators.LOGIN_BUTTON)
@@ -246,7 +420,7 @@ class SearchPage(BasePage):
 
                 from framework.pages.login_page import LoginPage
 
-                login_page = LoginPage(new_page)
+                login_page = self._spawn(LoginPage, new_page)
                 login_page.should_be_on_login_page()
 
                 # 자신(Search Page)을 전달
@@ -261,7 +435,7 @@ class SearchPage(BasePage):
 
                 from framework.pages.login_page import LoginPage
 
-                login_page = LoginPage(self.page)
+                login_page = self._spawn(LoginPage)
                 login_page.should_be_on_login_page()
 
                 if login_page.login(username, password):
@@ -270,33 +444,33 @@ class SearchPage(BasePage):
                     return None
 
         except Exception as e:
-            print(f"로그인 실패: {e}")
+            logger.warning("로그인 실패: %s", e)
             return None
 
     def logout(self):
-        print("로그아웃 시도")
+        logger.info("로그아웃 시도")
 
         try:
             self.safe_click(SearchPageLocators.LOGOUT_BUTTON)
             self.wait_for_load()
 
-            print("로그아웃 완료")
+            logger.info("로그아웃 완료")
             from framework.pages.home_page import HomePage
 
-            return HomePage(self.page)
+            return self._spawn(HomePage)
 
         except Exception as e:
-            print(f"로그아웃 실패: {e}")
+            logger.warning("로그아웃 실패: %s", e)
             return None
 
     def click_cart_button(self):
-        print("장바구니 버튼 클릭")
+        logger.info("장바구니 버튼 클릭")
         self.safe_click(SearchPageLocators.CART_BUTTON)
 
         # 장바구니 페이지로 이동 대기
         self.page.wait_for_url("**/cart/**", timeout=10000)
-        print("  ✓ 장바구니 페이지 이동")
+        logger.info("✓ 장바구니 페이지 이동")
 
         from framework.pages.cart_page import CartPage
 
-        return CartPage(self.page)
+        return self._spawn(CartPage)
@@ -0,0 +1,44 @@
+# standin/__main__.py
+"""
+스탠드인 서버 단독 실행
+
+    python -m framework.standin --port 8000 --results 100 --latency-ms 50
+    BASE_URL=http://127.0.0.1:8000 pytest ...
+"""
+
+import argparse
+
+from framework.standin.server import StandinServer
+from framework.standin.store import StandinConfig
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 G마켓 스탠드인 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--results", type=int, default=60, help="검색어당 검색 결과 수")
+    parser.add_argument("--page-size", type=int, default=20, help="검색 결과 페이지당 상품 수")
+    parser.add_argument("--cart-size", type=int, default=0, help="새 세션 장바구니에 미리 담을 상품 수")
+    parser.add_argument("--latency-ms", type=int, default=0, help="응답마다 추가할 지연 (밀리초)")
+    parser.add_argument("--no-dialogs", action="store_true", help="confirm/alert 다이얼로그 사용 안 함")
+    args = parser.parse_args(argv)
+
+    config = StandinConfig(
+        result_count=args.results,
+        page_size=args.page_size,
+        cart_size=args.cart_size,
+        latency_ms=args.latency_ms,
+        dialogs=not args.no_dialogs,
+    )
+    server = StandinServer(config, host=args.host, port=args.port)
+    print(f"G마켓 스탠드인 서버 실행 중: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
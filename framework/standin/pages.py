@@ -0,0 +1,365 @@
+# standin/pages.py
+"""
+스탠드인 서버의 HTML 페이지
+
+framework/config/locators.py의 selector가 모두 그대로 동작하도록 G마켓과 같은 DOM 구조로 만듭니다.
+"""
+
+from html import escape
+from urllib.parse import urlencode
+
+
+def _price(value):
+    return f"{value:,}"
+
+
+def _header(logged_in):
+    account = '<a href="/logout">로그아웃</a>' if logged_in else '<a href="/login">로그인</a>'
+    return f"""
+<div id="header">
+  <h1 class="box__title"><a class="link__head" href="/">G마켓</a></h1>
+  <form class="box__search" action="/search" method="get">
+    <input type="text" name="keyword" autocomplete="off" placeholder="검색어를 입력해 주세요">
+    <button type="submit">검색</button>
+    <div id="box__search-keyword" style="display:none"><div><ul></ul></div></div>
+  </form>
+  <ul class="list__util">
+    <li class="list-item list-item--account">{account}</li>
+    <li class="list-item list-item--cart"><a href="/cart/">장바구니</a></li>
+  </ul>
+</div>
+"""
+
+
+FOOTER = '<div id="desktop_layout-footer">(주)스탠드인 | 로컬 벤치마크용 G마켓 대체 서버</div>'
+
+SUGGEST_SCRIPT = """
+<script>
+  const input = document.querySelector("input[name='keyword']");
+  const box = document.querySelector("#box__search-keyword");
+  input.addEventListener("input", () => {
+    const keyword = input.value.trim();
+    box.style.display = keyword ? "block" : "none";
+    box.querySelector("ul").innerHTML = keyword
+      ? [1, 2, 3].map(n => `<li><a href="/search?keyword=${encodeURIComponent(keyword)}">${keyword} 추천 ${n}</a></li>`).join("")
+      : "";
+  });
+</script>
+"""
+
+
+def _document(title, body, logged_in, script=""):
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>{escape(title)}</title></head>
+<body>
+{_header(logged_in)}
+{body}
+{FOOTER}
+{SUGGEST_SCRIPT}
+{script}
+</body>
+</html>
+"""
+
+
+def home_page(logged_in):
+    categories = "".join(
+        f'<li class="list-item__1depth"><a href="/search?keyword={escape(name)}">{escape(name)}</a></li>'
+        for name in ("패션", "뷰티", "식품", "디지털", "가구", "스포츠")
+    )
+    body = f"""
+<div id="container">
+  <div class="top_banner">오늘의 추천픽</div>
+  <div id="box__category-all-layer"><ul>{categories}</ul></div>
+</div>
+"""
+    return _document("G마켓 - 쇼핑을 바꾸는 쇼핑", body, logged_in)
+
+
+def product_card(product):
+    return f"""
+<div class="box__component box__component-itemcard box__component-itemcard--general" data-item-id="{product.item_id}">
+  <div class="box__image"><a href="/Item?goodscode={product.item_id}" target="_blank"><img alt=""></a></div>
+  <div class="box__information">
+    <span class="text__item">{escape(product.title)}</span>
+    <strong class="text text__value">{_price(product.price)}</strong>원
+  </div>
+</div>
+"""
+
+
+SEARCH_SCRIPT = """
+<script>
+  document.querySelector(".button__toggle-sort").addEventListener("click", () => {
+    const layer = document.querySelector(".box__sort-layer");
+    layer.style.display = layer.style.display === "none" ? "block" : "none";
+  });
+  document.querySelector(".button__filter-price").addEventListener("click", () => {
+    const params = new URLSearchParams(location.search);
+    const min = document.querySelector("input[placeholder*='최소']").value;
+    const max = document.querySelector("input[placeholder*='최대']").value;
+    min ? params.set("min", min) : params.delete("min");
+    max ? params.set("max", max) : params.delete("max");
+    params.delete("p");
+    location.href = "/search?" + params.toString();
+  });
+</script>
+"""
+
+INFINITE_SCROLL_SCRIPT = """
+<script>
+  let nextPage = Number(new URLSearchParams(location.search).get("p") || 1) + 1;
+  let loading = false;
+  window.addEventListener("scroll", async () => {
+    const list = document.querySelector(".box__item-list");
+    if (loading || !nextPage || !list) return;
+    if (window.innerHeight + window.scrollY < document.body.scrollHeight - 200) return;
+    loading = true;
+    const params = new URLSearchParams(location.search);
+    params.set("p", nextPage);
+    const response = await fetch("/api/search?" + params.toString());
+    const data = await response.json();
+    list.insertAdjacentHTML("beforeend", data.html);
+    nextPage = data.hasMore ? nextPage + 1 : 0;
+    loading = false;
+  });
+</script>
+"""
+
+
+def search_page(keyword, products, query, logged_in, infinite_scroll):
+    if products:
+        results = f'<div class="box__item-list">{"".join(product_card(product) for product in products)}</div>'
+    else:
+        results = f"<div class=\"box__ment\">'{escape(keyword)}'에 대한 검색결과가 없습니다.</div>"
+
+    sort_query = urlencode({**query, "s": "1", "p": "1"})
+    body = f"""
+<div id="container">
+  <div class="box__sort">
+    <button type="button" class="button__toggle-sort">정렬</button>
+    <ul class="box__sort-layer" style="display:none">
+      <li><a href="/search?{escape(sort_query)}" aria-label="낮은 가격순">낮은 가격순</a></li>
+    </ul>
+  </div>
+  <div class="box__component box__component-filter box__component-price-filter">
+    <input type="text" placeholder="최소 금액" value="{escape(query.get("min", ""))}">
+    <input type="text" placeholder="최대 금액" value="{escape(query.get("max", ""))}">
+    <button type="button" class="button__filter-price montelena-post">적용</button>
+  </div>
+  {results}
+</div>
+"""
+    script = SEARCH_SCRIPT + (INFINITE_SCROLL_SCRIPT if infinite_scroll else "")
+    return _document(f"{keyword} - G마켓 검색", body, logged_in, script)
+
+
+# 상세 페이지 이미지 (1x1 투명 GIF, 네트워크 요청 없음)
+BLANK_IMAGE = "data:image/gif;base64,R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"
+
+ITEM_SCRIPT = """
+<script>
+  const optionBox = document.querySelector("#optOrderSel_0");
+  let selectedOption = "";
+  if (optionBox) {
+    const list = optionBox.querySelector("ul");
+    optionBox.querySelector("button").addEventListener("click", () => {
+      list.style.display = list.style.display === "none" ? "block" : "none";
+    });
+    list.querySelectorAll("li").forEach(li => li.addEventListener("click", () => {
+      if (li.classList.contains("soldout")) return;
+      selectedOption = li.dataset.option;
+      optionBox.querySelector("button").innerText = selectedOption;
+      list.style.display = "none";
+    }));
+  }
+  const quantity = document.querySelector("#quantity");
+  document.querySelector(".bt_increase").addEventListener("click", () => {
+    quantity.value = Number(quantity.value) + 1;
+  });
+  document.querySelector(".bt_select").addEventListener("click", () => {});
+  document.querySelector("#coreAddCartBtn").addEventListener("click", async () => {
+    if (optionBox && !selectedOption) {
+      if (DIALOGS) alert("옵션을 선택해 주세요.");
+      return;
+    }
+    await fetch("/api/cart/add", {
+      method: "POST",
+      headers: {"Content-Type": "application/json"},
+      body: JSON.stringify({itemId: ITEM_ID, quantity: Number(quantity.value), option: selectedOption}),
+    });
+    document.querySelector(".box__layer-cart").style.display = "block";
+  });
+  document.querySelector(".btn_round.btn_gray").addEventListener("click", () => {
+    document.querySelector(".box__layer-cart").style.display = "none";
+  });
+</script>
+"""
+
+
+def item_page(product, logged_in, dialogs):
+    options = ""
+    if product.options:
+        rows = "".join(
+            f'<li class="{"soldout" if option in product.soldout else ""}" data-option="{escape(option)}">'
+            f"{escape(option)}{' (품절)' if option in product.soldout else ''}</li>"
+            for option in product.options
+        )
+        options = f"""
+    <div id="optOrderSel_0" class="select-item">
+      <button type="button" class="select-item_option uxeselect_btn">옵션 선택</button>
+      <ul style="display:none">{rows}</ul>
+    </div>"""
+
+    body = f"""
+<div id="container">
+  <div class="box__viewer-container"><img alt="" src="{BLANK_IMAGE}"></div>
+  <div class="box__item-info">
+    <h1>{escape(product.title)}</h1>
+    <span class="price_innerwrap">
+      <span class="price_original">{_price(product.price * 5 // 4)}원</span>
+      <strong class="price_real">{_price(product.price)}원</strong>
+    </span>
+    <div class="box__txt-information">무료배송 (스탠드인)</div>
+    <div class="box__seller-info"><span class="text__seller">스탠드인 셀러</span></div>
+    {options}
+    <div class="box__quantity">
+      <input type="text" id="quantity" value="1">
+      <button type="button" class="bt_increase uxeselect_btn">+</button>
+      <button type="button" class="bt_select uxeselect_btn">선택</button>
+    </div>
+    <button type="button" id="coreAddCartBtn">장바구니</button>
+  </div>
+  <div class="box__layer-cart" style="display:none">
+    장바구니에 담았습니다.
+    <button type="button" class="btn_round btn_gray">쇼핑 계속하기</button>
+  </div>
+</div>
+"""
+    script = ITEM_SCRIPT.replace("DIALOGS", "true" if dialogs else "false").replace("ITEM_ID", f'"{product.item_id}"')
+    return _document(f"{product.title} - G마켓", body, logged_in, script)
+
+
+CART_SCRIPT = """
+<script>
+  const post = (path, data) => fetch(path, {
+    method: "POST",
+    headers: {"Content-Type": "application/json"},
+    body: JSON.stringify(data),
+  }).then(response => response.json());
+  // 변경 후 새로고침 없이 장바구니 영역만 다시 그림 (핸들러는 document에 위임)
+  const refresh = async () => {
+    const html = await fetch(location.href).then(response => response.text());
+    const next = new DOMParser().parseFromString(html, "text/html").querySelector("#container");
+    document.querySelector("#container").replaceWith(next);
+  };
+  const mutate = async (path, data) => {
+    await post(path, data);
+    await refresh();
+  };
+  const confirmed = () => !DIALOGS || confirm("선택하신 상품을 삭제하시겠습니까?");
+  const step = (button, delta) => {
+    const input = document.querySelectorAll(".item_qty_count")[Number(button.dataset.index) - 1];
+    input.value = Number(input.value) + delta;
+    input.dispatchEvent(new Event("change", {bubbles: true}));
+  };
+  document.addEventListener("click", event => {
+    const button = event.target.closest("button");
+    if (!button) return;
+    if (button.matches(".btn_cart_item_del")) {
+      if (confirmed()) mutate("/api/cart/remove", {index: Number(button.dataset.index)});
+    } else if (button.matches(".btn_plus")) {
+      step(button, 1);
+    } else if (button.matches(".btn_minus")) {
+      step(button, -1);
+    } else if (button.matches(".button__remove-selected")) {
+      if (document.querySelector("#item_all_select").checked && confirmed()) mutate("/api/cart/clear", {});
+    } else if (button.matches(".btn_submit")) {
+      location.href = "/checkout";
+    }
+  });
+  document.addEventListener("change", event => {
+    const input = event.target;
+    if (!input.matches(".item_qty_count")) return;
+    const quantity = Number(input.value);
+    if (!(quantity >= 1 && quantity <= MAX_QUANTITY)) {
+      if (DIALOGS) alert(`최대 ${MAX_QUANTITY}개까지 구매 가능합니다.`);
+      input.value = input.getAttribute("value");
+      return;
+    }
+    mutate("/api/cart/quantity", {index: Number(input.dataset.index), quantity});
+  });
+</script>
+"""
+
+
+def _cart_row(index, line):
+    return f"""
+<li>
+  <div class="item" data-item-id="{line.product.item_id}">
+    <div class="item_img"><a href="/Item?goodscode={line.product.item_id}"><img alt=""></a></div>
+    <div class="section item_title"><a href="/Item?goodscode={line.product.item_id}">{escape(line.product.title)}</a></div>
+    <div class="section item_option">{escape(line.option)}</div>
+    <div class="section item_price">{_price(line.product.price * line.quantity)}원</div>
+    <div class="section item_qty">
+      <button type="button" class="btn_minus sprite__cart" data-index="{index}">-</button>
+      <input type="text" class="item_qty_count" data-index="{index}" value="{line.quantity}">
+      <button type="button" class="btn_plus sprite__cart" data-index="{index}">+</button>
+    </div>
+    <button type="button" class="icon sprite__cart btn_cart_item_del" data-index="{index}">삭제</button>
+  </div>
+</li>
+"""
+
+
+def cart_page(lines, summary, logged_in, dialogs, max_quantity):
+    if lines:
+        rows = "".join(_cart_row(index, line) for index, line in enumerate(lines, start=1))
+        select_all = """
+  <div class="box__select">
+    <input type="checkbox" id="item_all_select"><label for="item_all_select">전체선택</label>
+    <button type="button" class="button__remove-selected"><span>선택삭제</span></button>
+  </div>"""
+    else:
+        rows = ""
+        select_all = '<div class="box__empty">장바구니에 담긴 상품이 없습니다.</div>'
+
+    body = f"""
+<div id="container">
+  <h1 class="box__title-logo"><a href="/">G마켓</a></h1>
+  {select_all}
+  <ul class="order--list">{rows}</ul>
+  <div id="cart_order">
+    <dl>
+      <dt>상품금액</dt><dd><span class="format-price"><span class="box__format-amount">{_price(summary["items_price"])}</span>원</span></dd>
+      <dt>배송비</dt><dd><span class="format-price"><span class="box__format-amount">{_price(summary["shipping_fee"])}</span>원</span></dd>
+      <dt>할인</dt><dd><span class="format-price discount"><span class="box__format-amount">{_price(summary["discount"])}</span>원</span></dd>
+    </dl>
+    <div class="order_summary">결제예정금액 <span class="format-price">{_price(summary["total"])}원</span></div>
+    <button type="button" class="btn_submit">주문하기</button>
+  </div>
+</div>
+"""
+    script = CART_SCRIPT.replace("DIALOGS", "true" if dialogs else "false").replace("MAX_QUANTITY", str(max_quantity))
+    return _document("장바구니 - G마켓", body, logged_in, script)
+
+
+def login_page(error=""):
+    message = f'<p class="text__error">{escape(error)}</p>' if error else ""
+    body = f"""
+<div id="container">
+  <form class="box__login" action="/login" method="post">
+    <input type="text" id="typeMemberInputId" name="id" placeholder="아이디">
+    <input type="password" id="typeMemberInputPassword" name="password" placeholder="비밀번호">
+    {message}
+    <button type="submit" id="btn_memberLogin">로그인</button>
+  </form>
+</div>
+"""
+    return _document("로그인 - G마켓", body, False)
+
+
+def checkout_page(summary, logged_in):
+    body = f'<div id="container"><h2>주문/결제</h2><p>결제예정금액 {_price(summary["total"])}원</p></div>'
+    return _document("주문/결제 - G마켓", body, logged_in)
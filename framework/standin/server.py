@@ -0,0 +1,265 @@
+# standin/server.py
+"""
+로컬 G마켓 스탠드인 서버 (표준 라이브러리 http.server)
+
+홈/검색/상품/장바구니/로그인 페이지와 장바구니 JSON API를 제공합니다.
+BasePage.base_url을 이 서버 주소로 바꾸면 페이지 객체 journey를 실제 사이트 없이 실행할 수 있습니다.
+
+    with StandinServer(StandinConfig(result_count=100, latency_ms=50)) as server:
+        BasePage.base_url = server.url
+"""
+
+import json
+import secrets
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+from framework.standin import pages
+from framework.standin.store import CartStore, Catalog, StandinConfig
+
+SESSION_COOKIE = "standin_session"
+USER_COOKIE = "standin_user"
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    server_version = "GmarketStandin/1.0"
+
+    # 요청마다 콘솔에 로그를 남기지 않음 (벤치마크 중 출력 비용 제거)
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def config(self):
+        return self.server.config
+
+    # ==============================================
+    # 요청 처리
+    # ==============================================
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method):
+        if self.config.latency_ms:
+            time.sleep(self.config.latency_ms / 1000)
+
+        parts = urlparse(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+        self.cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        self._new_cookies = {}
+        self.session = self._cookie(SESSION_COOKIE)
+        if not self.session:
+            self.session = secrets.token_hex(8)
+            self._new_cookies[SESSION_COOKIE] = self.session
+
+        path = parts.path.rstrip("/").lower() or "/"
+        routes = {
+            ("GET", "/"): self._home,
+            ("GET", "/search"): self._search,
+            ("GET", "/api/search"): self._search_api,
+            ("GET", "/item"): self._item,
+            ("GET", "/cart"): self._cart,
+            ("GET", "/checkout"): self._checkout,
+            ("GET", "/login"): self._login_form,
+            ("POST", "/login"): self._login,
+            ("GET", "/logout"): self._logout,
+            ("GET", "/api/cart"): self._cart_api,
+            ("POST", "/api/cart/add"): self._cart_add,
+            ("POST", "/api/cart/remove"): self._cart_remove,
+            ("POST", "/api/cart/quantity"): self._cart_quantity,
+            ("POST", "/api/cart/clear"): self._cart_clear,
+        }
+        handler = routes.get((method, path))
+        if handler is None:
+            self._send(404, "text/plain; charset=utf-8", "Not Found")
+            return
+
+        try:
+            handler()
+        except (IndexError, ValueError) as e:
+            self._json({"error": str(e)}, status=400)
+
+    # ==============================================
+    # 응답 헬퍼
+    # ==============================================
+
+    def _cookie(self, name):
+        morsel = self.cookies.get(name)
+        return morsel.value if morsel else ""
+
+    @property
+    def logged_in(self):
+        return bool(self._cookie(USER_COOKIE))
+
+    def _send(self, status, content_type, body, headers=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in self._new_cookies.items():
+            max_age = "; Max-Age=0" if value == "" else ""
+            self.send_header("Set-Cookie", f"{name}={value}; Path=/{max_age}")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _html(self, body):
+        self._send(200, "text/html; charset=utf-8", body)
+
+    def _json(self, data, status=200):
+        self._send(status, "application/json; charset=utf-8", json.dumps(data, ensure_ascii=False))
+
+    def _redirect(self, location):
+        self._send(302, "text/plain; charset=utf-8", "", headers={"Location": location})
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        raw = self.rfile.read(length).decode("utf-8") if length else ""
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            return json.loads(raw or "{}")
+        return {key: values[-1] for key, values in parse_qs(raw).items()}
+
+    # ==============================================
+    # 페이지
+    # ==============================================
+
+    def _home(self):
+        self._html(pages.home_page(self.logged_in))
+
+    def _search_results(self):
+        keyword = self.query.get("keyword", "")
+        products = self.server.catalog.search(keyword)
+
+        min_price = int(self.query["min"]) if self.query.get("min", "").isdigit() else None
+        max_price = int(self.query["max"]) if self.query.get("max", "").isdigit() else None
+        if min_price is not None:
+            products = [product for product in products if product.price >= min_price]
+        if max_price is not None:
+            products = [product for product in products if product.price <= max_price]
+        if self.query.get("s") == "1":
+            products = sorted(products, key=lambda product: product.price)
+
+        page_number = max(int(self.query.get("p", "1")) if self.query.get("p", "1").isdigit() else 1, 1)
+        start = (page_number - 1) * self.config.page_size
+        end = start + self.config.page_size
+        return keyword, products[start:end], end < len(products)
+
+    def _search(self):
+        keyword, products, _ = self._search_results()
+        self._html(pages.search_page(keyword, products, self.query, self.logged_in, self.config.infinite_scroll))
+
+    def _search_api(self):
+        _, products, has_more = self._search_results()
+        self._json({"html": "".join(pages.product_card(product) for product in products), "hasMore": has_more})
+
+    def _item(self):
+        product = self.server.catalog.get(self.query.get("goodscode", "0"))
+        self._html(pages.item_page(product, self.logged_in, self.config.dialogs))
+
+    def _cart(self):
+        store = self.server.carts
+        self._html(
+            pages.cart_page(
+                store.items(self.session),
+                store.summary(self.session),
+                self.logged_in,
+                self.config.dialogs,
+                self.config.max_quantity,
+            )
+        )
+
+    def _checkout(self):
+        self._html(pages.checkout_page(self.server.carts.summary(self.session), self.logged_in))
+
+    def _login_form(self):
+        self._html(pages.login_page())
+
+    def _login(self):
+        form = self._body()
+        if not form.get("id") or not form.get("password"):
+            self._html(pages.login_page("아이디와 비밀번호를 입력해 주세요."))
+            return
+        self._new_cookies[USER_COOKIE] = quote(form["id"])
+        self._redirect("/")
+
+    def _logout(self):
+        self._new_cookies[USER_COOKIE] = ""
+        self._redirect("/")
+
+    # ==============================================
+    # 장바구니 API
+    # ==============================================
+
+    def _cart_api(self):
+        self._json(self.server.carts.as_json(self.session))
+
+    def _cart_add(self):
+        data = self._body()
+        self.server.carts.add(self.session, str(data["itemId"]), int(data.get("quantity", 1)), data.get("option", ""))
+        self._json(self.server.carts.as_json(self.session))
+
+    def _cart_remove(self):
+        self.server.carts.remove(self.session, int(self._body()["index"]))
+        self._json(self.server.carts.as_json(self.session))
+
+    def _cart_quantity(self):
+        data = self._body()
+        self.server.carts.set_quantity(self.session, int(data["index"]), int(data["quantity"]))
+        self._json(self.server.carts.as_json(self.session))
+
+    def _cart_clear(self):
+        self.server.carts.clear(self.session)
+        self._json(self.server.carts.as_json(self.session))
+
+
+class StandinServer:
+    """
+    백그라운드 스레드에서 스탠드인 서버를 실행
+
+    Args:
+        config: StandinConfig (없으면 기본 설정)
+        host / port: 바인드 주소 (port=0이면 빈 포트 자동 선택)
+    """
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or StandinConfig()
+        self.httpd = ThreadingHTTPServer((host, port), StandinHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.config = self.config
+        self.httpd.catalog = Catalog(self.config)
+        self.httpd.carts = CartStore(self.config, self.httpd.catalog)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="gmarket-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def serve_forever(self):
+        self.httpd.serve_forever()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,170 @@
+# standin/store.py
+"""
+스탠드인 서버의 설정, 상품 카탈로그, 장바구니 저장소
+"""
+
+import threading
+import zlib
+from dataclasses import dataclass, field
+
+# 기존 테스트에서 "검색 결과 없음"으로 쓰는 키워드
+DEFAULT_NO_RESULT_KEYWORDS = ("존재하지않는상품", "뭭뤡", "줵숄", "쉣숍")
+
+
+@dataclass
+class StandinConfig:
+    """
+    Args:
+        result_count: 검색어 하나당 전체 검색 결과 수
+        page_size: 검색 결과 한 페이지(또는 스크롤 한 번)에 보여줄 상품 수
+        cart_size: 새 세션의 장바구니에 미리 담아둘 상품 수
+        latency_ms: 모든 응답 전에 넣을 인위적인 지연 (밀리초)
+        dialogs: 장바구니 삭제 확인(confirm) / 수량 초과 경고(alert) 등 다이얼로그 사용 여부
+        option_count: 옵션이 있는 상품의 옵션 개수 (0이면 옵션 없음)
+        max_quantity: 장바구니 상품당 최대 수량 (초과 시 alert)
+        infinite_scroll: 검색 결과 하단까지 스크롤하면 다음 결과를 이어 붙임
+    """
+
+    result_count: int = 60
+    page_size: int = 20
+    cart_size: int = 0
+    latency_ms: int = 0
+    dialogs: bool = True
+    option_count: int = 3
+    max_quantity: int = 99
+    infinite_scroll: bool = True
+    free_shipping_over: int = 30000
+    shipping_fee: int = 3000
+    no_result_keywords: tuple = field(default=DEFAULT_NO_RESULT_KEYWORDS)
+
+
+@dataclass
+class Product:
+    item_id: str
+    title: str
+    price: int
+    options: list = field(default_factory=list)
+    soldout: set = field(default_factory=set)
+
+
+class Catalog:
+    """검색어별로 항상 같은 상품 목록을 만들어 주는 카탈로그 (상품번호로 다시 조회 가능)"""
+
+    def __init__(self, config):
+        self.config = config
+        self._products = {}
+        self._lock = threading.Lock()
+
+    def _make(self, item_id, title):
+        seed = zlib.crc32(item_id.encode("utf-8"))
+        options = []
+        soldout = set()
+        # 상품 3개 중 1개는 옵션 선택이 필요한 상품
+        if self.config.option_count and seed % 3 == 0:
+            options = [f"옵션 {n + 1}" for n in range(self.config.option_count)]
+            # 첫 번째 옵션은 매진 (매진 옵션 건너뛰기 확인용)
+            soldout = {options[0]} if len(options) > 1 else set()
+        return Product(item_id, title, 1000 + (seed % 500) * 100, options, soldout)
+
+    def search(self, keyword):
+        keyword = keyword.strip()
+        if not keyword or any(word in keyword for word in self.config.no_result_keywords):
+            return []
+
+        prefix = zlib.crc32(keyword.encode("utf-8")) % 9000 + 1000
+        products = []
+        with self._lock:
+            for n in range(1, self.config.result_count + 1):
+                item_id = f"{prefix}{n:05d}"
+                if item_id not in self._products:
+                    self._products[item_id] = self._make(item_id, f"{keyword} 스탠드인 상품 {n}")
+                products.append(self._products[item_id])
+        return products
+
+    def get(self, item_id):
+        with self._lock:
+            if item_id not in self._products:
+                self._products[item_id] = self._make(item_id, f"스탠드인 상품 {item_id}")
+            return self._products[item_id]
+
+
+@dataclass
+class CartLine:
+    product: Product
+    quantity: int
+    option: str = ""
+
+
+class CartStore:
+    """세션(쿠키)별 장바구니"""
+
+    def __init__(self, config, catalog):
+        self.config = config
+        self.catalog = catalog
+        self._carts = {}
+        self._lock = threading.Lock()
+
+    def _cart(self, session):
+        if session not in self._carts:
+            seeded = self.catalog.search("기본")[: self.config.cart_size]
+            self._carts[session] = [CartLine(product, 1) for product in seeded]
+        return self._carts[session]
+
+    def items(self, session):
+        with self._lock:
+            return list(self._cart(session))
+
+    def add(self, session, item_id, quantity=1, option=""):
+        product = self.catalog.get(item_id)
+        with self._lock:
+            cart = self._cart(session)
+            for line in cart:
+                if line.product.item_id == item_id and line.option == option:
+                    line.quantity = min(line.quantity + quantity, self.config.max_quantity)
+                    return line
+            line = CartLine(product, min(quantity, self.config.max_quantity), option)
+            cart.append(line)
+            return line
+
+    def remove(self, session, index):
+        """index는 1부터 시작"""
+        with self._lock:
+            cart = self._cart(session)
+            if not 1 <= index <= len(cart):
+                raise IndexError(f"{index}번째 상품이 없습니다")
+            return cart.pop(index - 1)
+
+    def set_quantity(self, session, index, quantity):
+        with self._lock:
+            cart = self._cart(session)
+            if not 1 <= index <= len(cart):
+                raise IndexError(f"{index}번째 상품이 없습니다")
+            if not 1 <= quantity <= self.config.max_quantity:
+                raise ValueError(f"수량은 1~{self.config.max_quantity}개까지 가능합니다")
+            cart[index - 1].quantity = quantity
+            return cart[index - 1]
+
+    def clear(self, session):
+        with self._lock:
+            self._carts[session] = []
+
+    def summary(self, session):
+        items_price = sum(line.product.price * line.quantity for line in self.items(session))
+        shipping = 0 if not items_price or items_price >= self.config.free_shipping_over else self.config.shipping_fee
+        return {"items_price": items_price, "shipping_fee": shipping, "discount": 0, "total": items_price + shipping}
+
+    def as_json(self, session):
+        return {
+            "items": [
+                {
+                    "index": index,
+                    "itemId": line.product.item_id,
+                    "title": line.product.title,
+                    "price": line.product.price,
+                    "quantity": line.quantity,
+                    "option": line.option,
+                }
+                for index, line in enumerate(self.items(session), start=1)
+            ],
+            **self.summary(session),
+        }
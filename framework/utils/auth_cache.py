@@ -0,0 +1,133 @@
+# utils/auth_cache.py
+"""
+로그인 상태(storage_state) 디스크 캐시
+
+- 계정 + base URL 별로 storage_state JSON을 저장
+- TTL이 지난 상태는 사용하지 않음
+- 파일 락으로 여러 프로세스(xdist 워커) 중 한 곳만 로그인하고 나머지는 결과를 재사용
+"""
+
+import hashlib
+import json
+import os
+import time
+
+
+def _pid_alive(pid):
+    """같은 머신에서 pid 프로세스가 살아 있는지 (확인할 수 없으면 True)"""
+    if os.name == "nt":
+        # Windows의 os.kill(pid, 0)은 존재 확인이 아니라 프로세스를 종료시킴
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # 권한이 없는 경우 등 → 살아 있는 것으로 간주
+        return True
+    return True
+
+
+class FileLock:
+    """
+    O_EXCL 락 파일을 이용한 프로세스 간 락 (OS 무관)
+
+    락 파일에는 잡은 프로세스의 PID를 기록합니다. 그 프로세스가 이미 종료됐거나
+    락 파일이 stale_after 초 이상 남아 있으면 비정상 종료로 보고 제거합니다.
+    stale_after는 timeout보다 짧아야 기다리던 프로세스가 포기하기 전에 락을 되찾을 수 있습니다.
+    """
+
+    def __init__(self, path, timeout=300, stale_after=180, poll=0.2):
+        self.path = path
+        self.timeout = timeout
+        self.stale_after = stale_after
+        self.poll = poll
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._remove_if_stale()
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"락을 얻지 못했습니다: {self.path}")
+                time.sleep(self.poll)
+                continue
+
+            with os.fdopen(fd, "w") as f:
+                f.write(str(os.getpid()))
+            return self
+
+    def release(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _owner_alive(self):
+        try:
+            with open(self.path) as f:
+                pid = int(f.read().strip())
+        except ValueError:
+            # 락 파일을 만들고 아직 PID를 쓰지 않은 순간
+            return True
+        return pid == os.getpid() or _pid_alive(pid)
+
+    def _remove_if_stale(self):
+        try:
+            if time.time() - os.path.getmtime(self.path) > self.stale_after or not self._owner_alive():
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class AuthStateCache:
+    def __init__(self, root=".auth", ttl=3600):
+        self.root = root
+        self.ttl = ttl
+
+    @property
+    def enabled(self):
+        return self.ttl > 0
+
+    def key(self, account, base_url):
+        return hashlib.sha256(f"{account}|{base_url}".encode("utf-8")).hexdigest()[:16]
+
+    def path(self, account, base_url):
+        return os.path.join(self.root, f"{self.key(account, base_url)}.json")
+
+    def load(self, account, base_url):
+        """TTL 안의 storage_state 파일 경로 (없거나 만료되면 None)"""
+        path = self.path(account, base_url)
+        if not self.enabled or not os.path.exists(path):
+            return None
+        if time.time() - os.path.getmtime(path) > self.ttl:
+            return None
+        return path
+
+    def save(self, account, base_url, state):
+        """storage_state를 원자적으로 저장 (다른 워커가 쓰다 만 파일을 읽지 않도록)"""
+        os.makedirs(self.root, exist_ok=True)
+        path = self.path(account, base_url)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
+        return path
+
+    def invalidate(self, account, base_url):
+        try:
+            os.remove(self.path(account, base_url))
+        except FileNotFoundError:
+            pass
+
+    def lock(self, account, base_url, timeout=300):
+        os.makedirs(self.root, exist_ok=True)
+        return FileLock(f"{self.path(account, base_url)}.lock", timeout=timeout)
@@ -0,0 +1,178 @@
+# utils/cart_observer.py
+"""
+장바구니 API 응답 감시
+
+페이지의 장바구니 XHR/fetch 응답(담기 / 삭제 / 수량 변경 / 조회)을 가로채
+마지막 장바구니 상태(CartState)를 메모리에 유지합니다.
+페이지 객체는 자기가 일으킨 변경의 응답만 기다리고, 금액/수량 확인에 DOM을 읽지 않습니다.
+
+    observer = get_cart_observer(page)
+    with observer.expect_update() as update:
+        page.locator(".item_qty_count").fill("3")
+    update.state.quantity_of(1)
+
+같은 페이지에서 일어난 변경만 보이므로, 메인 프레임이 다른 문서로 이동하면 상태를 버립니다.
+(다른 탭에서 담은 상품이 서버 렌더링된 장바구니 페이지에만 보이는 경우 등) 그 뒤에는 새 응답을 볼 때까지 DOM을 읽습니다.
+"""
+
+import asyncio
+import re
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+
+from framework.models.records import CartState
+from framework.utils.settle import TRACKED_RESOURCE_TYPES
+
+# G마켓 장바구니 API / 스탠드인 서버의 /api/cart/*
+CART_API = re.compile(r"cart", re.IGNORECASE)
+
+
+class CartUpdate:
+    """expect_update()가 돌려주는 결과 (블록이 끝난 뒤 state가 채워짐, 응답이 없으면 None)"""
+
+    __slots__ = ("state",)
+
+    def __init__(self):
+        self.state = None
+
+
+class CartObserver:
+    """
+    페이지 하나의 장바구니 응답 감시기
+
+    응답 리스너는 페이지당 한 번만 등록됩니다. get_cart_observer()로 가져오세요.
+    """
+
+    def __init__(self, page, pattern=CART_API, poll_ms=50, discovery_timeout=2000):
+        self.page = page
+        self.pattern = pattern
+        self.poll_ms = poll_ms
+        # 장바구니 응답을 한 번도 못 본 페이지는 API 형식이 다를 수 있으므로 이 시간까지만 대기
+        self.discovery_timeout = discovery_timeout
+        self.version = 0
+        self.round_trips = 0
+        self._state = None
+
+        page.on("response", self._on_response)
+        page.on("framenavigated", self._on_navigated)
+
+    def _matches(self, response):
+        return (
+            response.ok
+            and response.request.resource_type in TRACKED_RESOURCE_TYPES
+            and "json" in response.headers.get("content-type", "")
+            and self.pattern.search(response.url) is not None
+        )
+
+    def _on_response(self, response):
+        # 변경 후 바로 새로고침하는 페이지는 본문이 곧 사라지므로 응답을 받는 즉시 파싱
+        if not self._matches(response):
+            return
+        try:
+            payload = response.json()
+        except Exception:
+            return
+        self.round_trips += 1
+        self._apply(response, payload)
+
+    def _on_navigated(self, frame):
+        # 새 문서의 장바구니는 이전 문서에서 본 응답과 다를 수 있음 (version은 대기 중인 호출을 위해 유지)
+        if frame.parent_frame is None:
+            self._state = None
+
+    def _apply(self, response, payload):
+        state = CartState.from_payload(payload, source=response.url)
+        if state is not None:
+            self._state = state
+            self.version += 1
+
+    @property
+    def state(self):
+        """현재 문서에서 마지막으로 본 장바구니 상태 (아직 응답을 못 봤으면 None)"""
+        return self._state
+
+    def _timeout(self, timeout):
+        return timeout if self.version else min(timeout, self.discovery_timeout)
+
+    def invalidate(self):
+        self._state = None
+        return self
+
+    def wait_for_update(self, since, timeout=10000, cancel=None):
+        """
+        version이 since보다 커질 때까지 대기
+
+        Args:
+            cancel: True를 반환하면 즉시 중단 (예: 변경이 다이얼로그로 거부된 경우)
+
+        Returns:
+            CartState 또는 None (timeout / 취소)
+        """
+        deadline = time.monotonic() + self._timeout(timeout) / 1000
+        while True:
+            if self.version > since:
+                return self._state
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0 or (cancel and cancel()) or self.page.is_closed():
+                return None
+
+            # 이벤트를 처리하면서 응답 대기
+            self.round_trips += 1
+            self.page.wait_for_timeout(min(self.poll_ms, remaining_ms))
+
+    @contextmanager
+    def expect_update(self, timeout=10000, cancel=None):
+        """블록 안에서 일으킨 변경의 장바구니 응답을 기다림"""
+        since = self.version
+        update = CartUpdate()
+        yield update
+        update.state = self.wait_for_update(since, timeout=timeout, cancel=cancel)
+
+
+class AsyncCartObserver(CartObserver):
+    """playwright.async_api 페이지용 (대기 함수가 코루틴)"""
+
+    async def _on_response(self, response):
+        if not self._matches(response):
+            return
+        try:
+            payload = await response.json()
+        except Exception:
+            return
+        self.round_trips += 1
+        self._apply(response, payload)
+
+    async def wait_for_update(self, since, timeout=10000, cancel=None):
+        deadline = time.monotonic() + self._timeout(timeout) / 1000
+        while self.version <= since:
+            if time.monotonic() >= deadline or (cancel and cancel()) or self.page.is_closed():
+                return None
+            await asyncio.sleep(self.poll_ms / 1000)
+        return self._state
+
+    @asynccontextmanager
+    async def expect_update(self, timeout=10000, cancel=None):
+        since = self.version
+        update = CartUpdate()
+        yield update
+        update.state = await self.wait_for_update(since, timeout=timeout, cancel=cancel)
+
+
+_observers = weakref.WeakKeyDictionary()
+
+
+def get_cart_observer(page):
+    """페이지별 CartObserver (최초 호출 시 설치)"""
+    observer = _observers.get(page)
+    if observer is None:
+        observer = _observers[page] = CartObserver(page)
+    return observer
+
+
+def get_async_cart_observer(page):
+    """비동기 페이지별 AsyncCartObserver (최초 호출 시 설치)"""
+    observer = _observers.get(page)
+    if observer is None:
+        observer = _observers[page] = AsyncCartObserver(page)
+    return observer
@@ -0,0 +1,133 @@
+# utils/clock.py
+"""
+프레임워크 딜레이용 시계(clock) 추상화
+
+- SystemClock  : 실제로 sleep (운영/실제 실행용)
+- VirtualClock : 즉시 시간을 앞당기고 호출 위치별 가상 대기 시간을 기록 (로직 테스트용)
+
+BasePage(page, delay_clock=...)로 주입하거나 set_clock()으로 전역 기본값을 바꿉니다.
+비동기 페이지 객체(framework.aio)는 sleep_async()를 사용합니다.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from abc import ABC, abstractmethod
+
+# 호출 위치 계산 시 건너뛸 프레임워크 내부 파일
+_INTERNAL_FILES = (
+    os.path.join("framework", "base", "base_page.py"),
+    os.path.join("framework", "aio", "base_page.py"),
+    os.path.join("framework", "utils", ""),
+)
+
+
+def call_site(depth=2):
+    """딜레이를 요청한 페이지 객체 메서드 이름 (예: 'CartPage.remove_item')"""
+    frame = sys._getframe(depth)
+    while frame is not None and any(name in frame.f_code.co_filename for name in _INTERNAL_FILES):
+        frame = frame.f_back
+    if frame is None:
+        return "<unknown>"
+
+    owner = frame.f_locals.get("self")
+    if owner is not None:
+        return f"{type(owner).__name__}.{frame.f_code.co_name}"
+    return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}"
+
+
+class Clock(ABC):
+    """딜레이 기록 공통 기능 (now / sleep / sleep_async는 하위 클래스에서 구현)"""
+
+    virtual = False
+
+    def __init__(self):
+        self.slept = 0.0
+        self.sites = {}
+
+    @abstractmethod
+    def now(self):
+        """현재 시각 (초)"""
+
+    @abstractmethod
+    def sleep(self, seconds, site=None):
+        """seconds만큼 대기하고 호출 위치(site)별로 기록"""
+
+    @abstractmethod
+    async def sleep_async(self, seconds, site=None):
+        """sleep()의 비동기 버전"""
+
+    def _record(self, seconds, site):
+        self.slept += seconds
+        calls, total = self.sites.get(site, (0, 0.0))
+        self.sites[site] = (calls + 1, total + seconds)
+
+    def report(self):
+        """호출 위치별 대기 시간 (총 시간 내림차순)"""
+        ordered = sorted(self.sites.items(), key=lambda item: item[1][1], reverse=True)
+        return {site: {"calls": calls, "seconds": round(total, 3)} for site, (calls, total) in ordered}
+
+    def reset(self):
+        self.slept = 0.0
+        self.sites = {}
+        return self
+
+
+class SystemClock(Clock):
+    def now(self):
+        return time.monotonic()
+
+    def sleep(self, seconds, site=None):
+        if seconds <= 0:
+            return
+        self._record(seconds, site or call_site())
+        time.sleep(seconds)
+
+    async def sleep_async(self, seconds, site=None):
+        if seconds <= 0:
+            return
+        self._record(seconds, site or call_site())
+        await asyncio.sleep(seconds)
+
+
+class VirtualClock(Clock):
+    virtual = True
+
+    def __init__(self, start=0.0):
+        super().__init__()
+        self._now = start
+
+    def now(self):
+        return self._now
+
+    def sleep(self, seconds, site=None):
+        if seconds <= 0:
+            return
+        self._record(seconds, site or call_site())
+        self._now += seconds
+
+    async def sleep_async(self, seconds, site=None):
+        if seconds <= 0:
+            return
+        self._record(seconds, site or call_site())
+        self._now += seconds
+        # 다른 코루틴에 실행 기회를 넘김
+        await asyncio.sleep(0)
+
+
+_default_clock = None
+
+
+def get_clock():
+    """프로세스 전역 기본 Clock"""
+    global _default_clock
+    if _default_clock is None:
+        _default_clock = SystemClock()
+    return _default_clock
+
+
+def set_clock(clock):
+    global _default_clock
+    _default_clock = clock
+    return clock
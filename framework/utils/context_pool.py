@@ -0,0 +1,172 @@
+# utils/context_pool.py
+"""
+워커별 브라우저 컨텍스트 풀
+
+테스트마다 browser.new_context()를 새로 만드는 대신, 사용한 컨텍스트의 상태를
+초기화(reset)해서 재사용합니다.
+
+- 초기화 대상: 열린 페이지, 쿠키, 권한, localStorage, sessionStorage, IndexedDB
+- max_uses 번 사용했거나 초기화에 실패한 컨텍스트는 닫고 새로 만듦(recycle)
+"""
+
+import time
+from urllib.parse import urlparse
+
+from framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+RESET_PATH = "/__context_reset__"
+
+# 현재 origin의 저장소 전체 삭제
+RESET_STORAGE_SCRIPT = """
+async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        const databases = await indexedDB.databases();
+        await Promise.all(databases.map(db => new Promise(resolve => {
+            const request = indexedDB.deleteDatabase(db.name);
+            request.onsuccess = request.onerror = request.onblocked = () => resolve();
+        })));
+    }
+}
+"""
+
+
+class PooledContext:
+    def __init__(self, context):
+        self.context = context
+        self.uses = 0
+        self.origins = set()
+        self.reset_seconds = 0.0
+
+        context.on("page", self._track_page)
+
+    def _track_page(self, page):
+        page.on("framenavigated", self._track_frame)
+
+    def _track_frame(self, frame):
+        parts = urlparse(frame.url)
+        if parts.scheme in ("http", "https"):
+            self.origins.add(f"{parts.scheme}://{parts.netloc}")
+
+
+class ContextPool:
+    """
+    Args:
+        factory: 새 컨텍스트를 만드는 함수 (인자 없음)
+        max_uses: 컨텍스트 하나를 재사용할 최대 횟수 (1 이하면 풀링하지 않음)
+        on_close: 컨텍스트를 닫기 직전에 호출할 함수 (예: TraceRecorder.forget)
+    """
+
+    def __init__(self, factory, max_uses=50, on_close=None):
+        self.factory = factory
+        self.max_uses = max_uses
+        self.on_close = on_close
+        self._idle = []
+        self._entries = {}
+
+        self.created = 0
+        self.reused = 0
+        self.recycled = 0
+        self.reset_failures = 0
+        self.create_seconds = 0.0
+        self.reset_seconds = 0.0
+        self.saved_seconds = 0.0
+        self.last_saved_seconds = 0.0
+
+    @property
+    def average_create_seconds(self):
+        return self.create_seconds / self.created if self.created else 0.0
+
+    def acquire(self):
+        """재사용 가능한 컨텍스트를 반환 (없으면 새로 생성)"""
+        if self._idle:
+            entry = self._idle.pop()
+            self.reused += 1
+            # 새로 만들었다면 걸렸을 시간 - 초기화에 쓴 시간
+            self.last_saved_seconds = max(self.average_create_seconds - entry.reset_seconds, 0.0)
+            self.saved_seconds += self.last_saved_seconds
+        else:
+            started = time.perf_counter()
+            entry = PooledContext(self.factory())
+            self.create_seconds += time.perf_counter() - started
+            self.created += 1
+            self.last_saved_seconds = 0.0
+
+        entry.uses += 1
+        self._entries[entry.context] = entry
+        return entry.context
+
+    def release(self, context):
+        """컨텍스트 상태를 초기화하고 풀에 반환 (초기화 실패 또는 사용 횟수 초과 시 닫음)"""
+        entry = self._entries.pop(context)
+
+        if entry.uses >= self.max_uses:
+            self._discard(entry)
+            return
+
+        started = time.perf_counter()
+        try:
+            self._reset(entry)
+        except Exception as e:
+            logger.warning("컨텍스트 초기화 실패, 새로 생성합니다: %s", e)
+            self.reset_failures += 1
+            self._discard(entry)
+            return
+        entry.reset_seconds = time.perf_counter() - started
+        self.reset_seconds += entry.reset_seconds
+
+        self._idle.append(entry)
+
+    def _reset(self, entry):
+        context = entry.context
+
+        for page in context.pages:
+            if not page.is_closed():
+                page.close()
+
+        context.clear_cookies()
+        context.clear_permissions()
+
+        if entry.origins:
+            # 방문했던 origin마다 빈 페이지를 띄워 저장소를 비움 (실제 서버 요청 없음)
+            page = context.new_page()
+            try:
+                page.route(f"**{RESET_PATH}", lambda route: route.fulfill(body="<html></html>"))
+                for origin in sorted(entry.origins):
+                    page.goto(f"{origin}{RESET_PATH}", wait_until="commit")
+                    page.evaluate(RESET_STORAGE_SCRIPT)
+            finally:
+                page.close()
+            entry.origins.clear()
+
+    def _discard(self, entry):
+        self.recycled += 1
+        self._close(entry)
+
+    def _close(self, entry):
+        try:
+            if self.on_close is not None:
+                self.on_close(entry.context)
+            entry.context.close()
+        except Exception:
+            pass
+
+    def close(self):
+        for entry in self._idle + list(self._entries.values()):
+            self._close(entry)
+        self._idle = []
+        self._entries = {}
+
+    def stats(self):
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "recycled": self.recycled,
+            "reset_failures": self.reset_failures,
+            "average_create_seconds": round(self.average_create_seconds, 4),
+            "reset_seconds": round(self.reset_seconds, 3),
+            "saved_seconds": round(self.saved_seconds, 3),
+        }
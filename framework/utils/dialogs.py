@@ -0,0 +1,256 @@
+# utils/dialogs.py
+"""
+페이지별 다이얼로그(alert / confirm / prompt) 관리
+
+dialog 리스너는 페이지당 한 번만 등록하고, 처리 방식은 with 블록 단위 정책으로 정합니다.
+- accept: 수락 (prompt는 prompt_text 또는 기본값 입력)
+- dismiss: 취소
+- record: 기록만 하고 취소 (리스너가 없을 때 Playwright 기본 동작과 같음, 블록 밖의 기본 정책)
+
+처리한 다이얼로그는 모두 events에 DialogEvent로 남으므로 테스트에서 확인할 수 있습니다.
+
+    dialogs = get_dialog_manager(page)
+    with dialogs.accept() as events:
+        page.locator(".btn_delete").click()
+    assert events[0].type == "confirm"
+
+preempt 모드(--dialog-preempt)에서는 init script가 window.alert / confirm / prompt를 바꿔서
+정책 블록 안의 다이얼로그를 페이지 안에서 바로 처리합니다 (다이얼로그마다 Playwright와 주고받는 왕복이 없음).
+정책은 문서(window)마다 따로 두고 메인 프레임이 이동하면 새 문서에 다시 적용합니다.
+정책이 아직 적용되지 않은 문서(로딩 중 / iframe)의 다이얼로그는 dialog 이벤트로 같은 정책에 따라 처리됩니다.
+"""
+
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+
+from playwright.sync_api import Error
+
+from framework.models.records import DialogEvent
+
+ACTIONS = ("accept", "dismiss", "record")
+DEFAULT_ACTION = "record"
+
+BINDING = "__gmarketReportDialog"
+
+# 정책이 저장되어 있으면 페이지 안에서 처리하고 바인딩으로 기록만 보냄 (응답을 기다리지 않음)
+PREEMPT_SCRIPT = """
+(() => {
+    if (window.__gmarketDialogs) return;
+    const state = window.__gmarketDialogs = { policy: null };
+
+    const native = { alert: window.alert, confirm: window.confirm, prompt: window.prompt };
+    const handle = (type, message, defaultValue) => {
+        const policy = state.policy;
+        if (!policy) return native[type].call(window, message, defaultValue);
+
+        const row = { type, message: String(message ?? ""), defaultValue: String(defaultValue ?? ""), action: policy.action };
+        try {
+            Promise.resolve(window.__gmarketReportDialog(row)).catch(() => {});
+        } catch (e) {}
+
+        const accepted = policy.action === "accept";
+        if (type === "confirm") return accepted;
+        if (type === "prompt") return accepted ? (policy.promptText ?? row.defaultValue) : null;
+    };
+
+    window.alert = message => handle("alert", message);
+    window.confirm = message => handle("confirm", message);
+    window.prompt = (message, defaultValue) => handle("prompt", message, defaultValue);
+})();
+"""
+
+# 현재 문서에도 스크립트를 적용하고 정책 저장 (null이면 제거 → dialog 이벤트로 처리)
+SYNC_SCRIPT = "policy => {\n" + PREEMPT_SCRIPT + "    window.__gmarketDialogs.policy = policy;\n}\n"
+
+
+class DialogManager:
+    """
+    페이지 하나의 다이얼로그 관리자
+
+    dialog 리스너는 페이지당 한 번만 등록됩니다. get_dialog_manager()로 가져오세요.
+    """
+
+    def __init__(self, page, preempt=False):
+        self.page = page
+        self.preempt = preempt
+        self.events = []
+        self.round_trips = 0
+        self._policies = []
+        self._scopes = []
+        self._script_installed = False
+
+        page.on("dialog", self._on_dialog)
+        if preempt:
+            page.on("framenavigated", self._on_navigated)
+
+    @property
+    def action(self):
+        """지금 적용되는 정책"""
+        return self._policies[-1][0] if self._policies else DEFAULT_ACTION
+
+    def clear(self):
+        self.events.clear()
+        return self
+
+    def _record(self, event):
+        self.events.append(event)
+        for scope in self._scopes:
+            scope.append(event)
+        return event
+
+    def _decide(self, dialog):
+        action, prompt_text = self._policies[-1] if self._policies else (DEFAULT_ACTION, None)
+        self._record(DialogEvent(dialog.type, dialog.message, action, dialog.default_value))
+        self.round_trips += 1
+        return action, prompt_text
+
+    def _on_dialog(self, dialog):
+        action, prompt_text = self._decide(dialog)
+        try:
+            if action == "accept":
+                dialog.accept(prompt_text)
+            else:
+                dialog.dismiss()
+        except Error:
+            # 이미 처리됐거나 페이지가 닫힌 경우
+            pass
+
+    def _needs_resync(self, frame):
+        """새 문서에는 정책이 없으므로 블록 안에서 메인 프레임이 이동하면 다시 적용"""
+        return frame.parent_frame is None and self._script_installed and self._script_policy() is not None
+
+    def _on_navigated(self, frame):
+        if self._needs_resync(frame):
+            self._sync_script()
+
+    def _on_script_dialog(self, source, row):
+        self._record(DialogEvent.from_row(row))
+
+    def _script_policy(self):
+        """페이지에 저장할 정책 (블록 밖이면 None → dialog 이벤트로 처리)"""
+        if not self._policies:
+            return None
+        action, prompt_text = self._policies[-1]
+        return {"action": action, "promptText": prompt_text}
+
+    def _enter(self, action, prompt_text):
+        """정책을 쌓고 (블록 이벤트 리스트, 페이지 정책이 바뀌었는지) 반환"""
+        if action not in ACTIONS:
+            raise ValueError(f"알 수 없는 다이얼로그 정책: {action} ({', '.join(ACTIONS)})")
+        before = self._script_policy()
+        self._policies.append((action, prompt_text))
+        scope = []
+        self._scopes.append(scope)
+        return scope, self.preempt and before != self._script_policy()
+
+    def _exit(self, scope):
+        before = self._script_policy()
+        self._policies.pop()
+        self._scopes.remove(scope)
+        return self.preempt and before != self._script_policy()
+
+    def _sync_script(self):
+        try:
+            if not self._script_installed:
+                self.page.expose_binding(BINDING, self._on_script_dialog)
+                self.page.add_init_script(PREEMPT_SCRIPT)
+                self._script_installed = True
+                self.round_trips += 2
+            self.round_trips += 1
+            self.page.evaluate(SYNC_SCRIPT, self._script_policy())
+        except Error:
+            # 네비게이션 중이거나 닫힌 페이지 → 다이얼로그는 dialog 이벤트 쪽에서 같은 정책으로 처리
+            pass
+
+    @contextmanager
+    def policy(self, action, prompt_text=None):
+        """
+        블록 동안 다이얼로그 처리 정책 지정 (블록이 중첩되면 안쪽 정책 우선)
+
+        Yields:
+            list: 블록 동안 발생한 DialogEvent (블록 안에서도 실시간으로 늘어남)
+        """
+        scope, changed = self._enter(action, prompt_text)
+        if changed:
+            self._sync_script()
+        try:
+            yield scope
+        finally:
+            if self._exit(scope):
+                self._sync_script()
+
+    def accept(self, prompt_text=None):
+        return self.policy("accept", prompt_text)
+
+    def dismiss(self):
+        return self.policy("dismiss")
+
+    def record(self):
+        return self.policy("record")
+
+
+class AsyncDialogManager(DialogManager):
+    """playwright.async_api 페이지용 (policy()가 async with 블록)"""
+
+    async def _on_dialog(self, dialog):
+        action, prompt_text = self._decide(dialog)
+        try:
+            if action == "accept":
+                await dialog.accept(prompt_text)
+            else:
+                await dialog.dismiss()
+        except Error:
+            pass
+
+    async def _on_navigated(self, frame):
+        if self._needs_resync(frame):
+            await self._sync_script()
+
+    async def _sync_script(self):
+        try:
+            if not self._script_installed:
+                await self.page.expose_binding(BINDING, self._on_script_dialog)
+                await self.page.add_init_script(PREEMPT_SCRIPT)
+                self._script_installed = True
+                self.round_trips += 2
+            self.round_trips += 1
+            await self.page.evaluate(SYNC_SCRIPT, self._script_policy())
+        except Error:
+            pass
+
+    @asynccontextmanager
+    async def policy(self, action, prompt_text=None):
+        scope, changed = self._enter(action, prompt_text)
+        if changed:
+            await self._sync_script()
+        try:
+            yield scope
+        finally:
+            if self._exit(scope):
+                await self._sync_script()
+
+
+_managers = weakref.WeakKeyDictionary()
+_preempt = False
+
+
+def set_dialog_preempt(enabled):
+    """이후 새로 만들어지는 관리자의 preempt 모드 설정"""
+    global _preempt
+    _preempt = bool(enabled)
+
+
+def get_dialog_manager(page):
+    """페이지별 DialogManager (최초 호출 시 설치)"""
+    manager = _managers.get(page)
+    if manager is None:
+        manager = _managers[page] = DialogManager(page, preempt=_preempt)
+    return manager
+
+
+def get_async_dialog_manager(page):
+    """비동기 페이지별 AsyncDialogManager (최초 호출 시 설치)"""
+    manager = _managers.get(page)
+    if manager is None:
+        manager = _managers[page] = AsyncDialogManager(page, preempt=_preempt)
+    return manager
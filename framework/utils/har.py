@@ -0,0 +1,101 @@
+# utils/har.py
+"""
+HAR 녹화/재생 모드
+
+- record : 테스트마다 HAR을 녹화하고, 세션이 끝나면 모듈별로 tests/har/<모듈>.har 하나로 합침
+- replay : route_from_har로 모듈 HAR에서 응답을 제공 (네트워크 없이 로컬 디스크 속도로 실행)
+- off    : 사용 안 함 (기본값)
+
+재생 시 HAR에 없는 요청은 not_found 설정에 따라 차단(abort)하거나 네트워크로 보냄(fallback)
+"""
+
+import glob
+import json
+import os
+import re
+import shutil
+
+MODES = ("off", "record", "replay")
+NOT_FOUND_ACTIONS = ("abort", "fallback")
+
+
+class HarSettings:
+    def __init__(self, mode="off", directory="tests/har", not_found="abort"):
+        if mode not in MODES:
+            raise ValueError(f"알 수 없는 HAR 모드입니다: {mode} (사용 가능: {', '.join(MODES)})")
+        if not_found not in NOT_FOUND_ACTIONS:
+            raise ValueError(f"알 수 없는 not_found 설정입니다: {not_found}")
+        self.mode = mode
+        self.directory = directory
+        self.not_found = not_found
+
+    @property
+    def enabled(self):
+        return self.mode != "off"
+
+    def module_path(self, module_name):
+        return os.path.join(self.directory, f"{module_name}.har")
+
+    def _recording_dir(self, module_name):
+        return os.path.join(self.directory, f".{module_name}")
+
+    def context_options(self, module_name, test_name):
+        """new_context()에 넘길 옵션 (녹화 시 테스트별 임시 HAR 경로 포함)"""
+        if self.mode == "record":
+            os.makedirs(self._recording_dir(module_name), exist_ok=True)
+            safe_name = re.sub(r"[^\w.-]", "_", test_name)
+            return {
+                "record_har_path": os.path.join(self._recording_dir(module_name), f"{safe_name}.har"),
+                "record_har_mode": "minimal",
+                "service_workers": "block",
+            }
+        if self.mode == "replay":
+            return {"service_workers": "block"}
+        return {}
+
+    def attach(self, context, module_name):
+        """재생 모드이면 컨텍스트의 요청을 모듈 HAR로 처리"""
+        if self.mode != "replay":
+            return context
+
+        path = self.module_path(module_name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"재생할 HAR 파일이 없습니다: {path} (--har-mode=record로 먼저 녹화하세요)")
+
+        context.route_from_har(path, not_found=self.not_found)
+        return context
+
+    def merge_recordings(self):
+        """녹화 디렉토리마다 모듈 HAR을 만들고 경로 목록을 반환 (모든 워커가 끝난 뒤 호출)"""
+        merged = []
+        for recording_dir in sorted(glob.glob(os.path.join(self.directory, ".*"))):
+            if os.path.isdir(recording_dir):
+                path = self.merge_module(os.path.basename(recording_dir)[1:])
+                if path:
+                    merged.append(path)
+        return merged
+
+    def merge_module(self, module_name):
+        """테스트별로 녹화한 HAR을 모듈 HAR 하나로 합침 (컨텍스트를 모두 닫은 뒤 호출)"""
+        recording_dir = self._recording_dir(module_name)
+        paths = sorted(glob.glob(os.path.join(recording_dir, "*.har")))
+        if not paths:
+            return None
+
+        merged = None
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                log = json.load(f)["log"]
+            if merged is None:
+                merged = log
+                continue
+            merged.setdefault("pages", []).extend(log.get("pages", []))
+            merged["entries"].extend(log.get("entries", []))
+
+        merged["entries"].sort(key=lambda entry: entry.get("startedDateTime", ""))
+
+        module_path = self.module_path(module_name)
+        with open(module_path, "w", encoding="utf-8") as f:
+            json.dump({"log": merged}, f, ensure_ascii=False)
+        shutil.rmtree(recording_dir, ignore_errors=True)
+        return module_path
@@ -0,0 +1,140 @@
+# utils/logger.py
+"""
+프레임워크 로거
+
+- get_logger(__name__)로 'gmarket.*' 로거를 얻어 레벨별로 기록 (%-포맷은 레벨이 켜져 있을 때만 계산)
+- 로그 전용 브라우저 호출은 Lazy로 감싸면 해당 레벨이 꺼져 있을 때 아예 호출하지 않음
+- configure_logging()은 QueueHandler → QueueListener(백그라운드 스레드)로 테스트별 JSONL 파일에 기록
+
+    logger = get_logger(__name__)
+    logger.debug("상품가격: %s", Lazy(price.inner_text))
+
+비동기 페이지 객체는 코루틴을 Lazy로 감쌀 수 없으므로 logger.isEnabledFor()로 직접 확인합니다.
+"""
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+from datetime import datetime
+
+ROOT_LOGGER = "gmarket"
+
+_current_test = None
+_listener = None
+_queue_handler = None
+
+
+def get_logger(name):
+    """'framework.pages.cart_page' → 'gmarket.pages.cart_page'"""
+    if name.startswith("framework."):
+        name = name[len("framework.") :]
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class Lazy:
+    """str() 될 때 (= 로그 메시지를 만들 때) 한 번만 계산되는 값"""
+
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+
+    def __str__(self):
+        return str(self.func(*self.args))
+
+
+def set_current_test(nodeid):
+    """이후 기록되는 로그를 nodeid 테스트의 JSONL 파일로 보냄 (None이면 세션 로그)"""
+    global _current_test
+    _current_test = nodeid
+
+
+class _TestFilter(logging.Filter):
+    """로그를 남긴 스레드에서 현재 테스트 id를 기록에 붙임"""
+
+    def filter(self, record):
+        record.test = _current_test
+        return True
+
+
+class JsonlTestHandler(logging.Handler):
+    """테스트별 <directory>/<test id>.jsonl 파일에 한 줄씩 JSON으로 기록"""
+
+    def __init__(self, directory):
+        super().__init__()
+        self.directory = directory
+        self._test = None
+        self._file = None
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, test):
+        name = re.sub(r"[^\w.-]", "_", test) if test else "session"
+        return os.path.join(self.directory, f"{name}.jsonl")
+
+    def emit(self, record):
+        try:
+            test = getattr(record, "test", None)
+            if self._file is None or test != self._test:
+                self._close_file()
+                self._test = test
+                self._file = open(self.path_for(test), "a", encoding="utf-8")
+
+            entry = {
+                "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+                "level": record.levelname,
+                "logger": record.name,
+                "func": record.funcName,
+                "message": record.getMessage(),
+                "test": test,
+            }
+            self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._file.flush()
+        except Exception:
+            self.handleError(record)
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        self._close_file()
+        super().close()
+
+
+def configure_logging(level="INFO", directory="reports/logs"):
+    """
+    'gmarket' 로거에 QueueHandler를 붙이고 백그라운드 리스너를 시작
+
+    메시지 포맷(Lazy 계산 포함)은 로그를 남긴 스레드에서 끝나고,
+    파일 쓰기만 리스너 스레드에서 처리합니다.
+    """
+    global _listener, _queue_handler
+    shutdown_logging()
+
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.setLevel(level.upper() if isinstance(level, str) else level)
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _queue_handler.addFilter(_TestFilter())
+    logger.addHandler(_queue_handler)
+
+    _listener = logging.handlers.QueueListener(log_queue, JsonlTestHandler(directory))
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """남은 로그를 모두 기록하고 리스너 종료"""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger(ROOT_LOGGER).removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
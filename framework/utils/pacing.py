@@ -0,0 +1,178 @@
+# utils/pacing.py
+"""
+페이지 객체의 think-time(사람처럼 기다리는 시간)을 관리하는 pacing 엔진
+
+- human : 기존과 동일한 랜덤 딜레이 (모니터링 실행용)
+- fast  : 딜레이를 줄이고 상한을 둠 (로컬 개발용)
+- zero  : 딜레이 없음 (CI용)
+
+프로필은 PACING_PROFILE 환경 변수 또는 pytest --pacing 옵션으로 선택합니다.
+"""
+
+import os
+import random
+
+DEFAULT_PROFILE = "human"
+
+
+class PacingProfile:
+    def __init__(self, name, scale=1.0, max_delay=None):
+        self.name = name
+        self.scale = scale
+        self.max_delay = max_delay
+
+    # 사람 기준 딜레이를 이 프로필 기준으로 변환
+    def apply(self, seconds):
+        seconds = seconds * self.scale
+        if self.max_delay is not None:
+            seconds = min(seconds, self.max_delay)
+        return max(seconds, 0.0)
+
+    def __repr__(self):
+        return f"PacingProfile({self.name!r}, scale={self.scale}, max_delay={self.max_delay})"
+
+
+PROFILES = {
+    "human": PacingProfile("human", scale=1.0),
+    "fast": PacingProfile("fast", scale=0.25, max_delay=0.5),
+    "zero": PacingProfile("zero", scale=0.0, max_delay=0.0),
+}
+
+
+class PacingStats:
+    """프로필별 딜레이 누적 기록 (사람 기준 요청 시간 / 실제 대기 시간)"""
+
+    def __init__(self):
+        self.requested = 0.0
+        self.actual = 0.0
+        self.calls = 0
+        self.over_budget = 0
+        # 같은 요청을 다른 프로필로 실행했다면 기다렸을 시간 (기대값)
+        self.projected = {name: 0.0 for name in PROFILES}
+
+    @property
+    def saved(self):
+        return self.requested - self.actual
+
+    def as_dict(self):
+        return {
+            "requested": round(self.requested, 3),
+            "actual": round(self.actual, 3),
+            "saved": round(self.saved, 3),
+            "calls": self.calls,
+            "over_budget": self.over_budget,
+            "projected": {name: round(value, 3) for name, value in self.projected.items()},
+        }
+
+
+class Pacer:
+    """
+    모든 페이지 객체가 공유하는 think-time 계산기
+
+    - delay(): 사람 기준 범위(min, max)를 받아 현재 프로필로 변환한 딜레이를 반환
+    - 테스트별 think-time 예산(budget)을 넘기면 이후 딜레이는 0으로 처리
+    - 프로필별 절약 시간을 기록
+    """
+
+    def __init__(self, profile=DEFAULT_PROFILE, budget=None, rng=None):
+        self.profile = get_profile(profile)
+        self.budget = budget
+        self.rng = rng or random.Random()
+        self.stats = {}
+        self.test_spent = 0.0
+        self.current_test = None
+
+    def set_profile(self, profile):
+        self.profile = get_profile(profile)
+        return self
+
+    # 테스트 시작 시 예산 초기화
+    def begin_test(self, name=None, budget=None):
+        self.current_test = name
+        self.test_spent = 0.0
+        if budget is not None:
+            self.budget = budget
+        return self
+
+    def end_test(self):
+        spent = self.test_spent
+        self.current_test = None
+        self.test_spent = 0.0
+        return spent
+
+    def delay(self, min_seconds, max_seconds):
+        """사람 기준 범위의 딜레이를 현재 프로필에 맞게 계산 (초)"""
+        requested = self.pick(min_seconds, max_seconds)
+        return self.record(min_seconds, max_seconds, requested, self.profile.apply(requested))
+
+    def pick(self, min_seconds, max_seconds):
+        """사람 기준 범위에서 요청 시간을 고름 (기록은 record()에서)"""
+        return self.rng.uniform(min_seconds, max_seconds)
+
+    def record(self, min_seconds, max_seconds, requested, actual):
+        """
+        요청 시간과 실제로 쓴 시간을 기록하고 예산 안에서 허용되는 시간 반환
+
+        actual에는 think-time 대신 쓴 시간(페이지 안정화 대기 등)도 포함합니다.
+        """
+        stats = self.stats.setdefault(self.profile.name, PacingStats())
+        stats.calls += 1
+        stats.requested += requested
+
+        # 테스트별 예산 초과 시 딜레이 생략
+        if self.budget is not None and self.test_spent + actual > self.budget:
+            stats.over_budget += 1
+            actual = max(self.budget - self.test_spent, 0.0)
+
+        stats.actual += actual
+        self.test_spent += actual
+
+        expected = (min_seconds + max_seconds) / 2
+        for name, profile in PROFILES.items():
+            stats.projected[name] = stats.projected.get(name, 0.0) + profile.apply(expected)
+
+        return actual
+
+    def keystroke_delay(self, delay_range):
+        """타이핑 키 간격(ms)을 현재 프로필에 맞게 계산"""
+        requested = self.rng.randint(*delay_range)
+        return int(self.profile.apply(requested / 1000) * 1000)
+
+    def report(self):
+        return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+    def reset(self):
+        self.stats = {}
+        self.test_spent = 0.0
+        return self
+
+
+def get_profile(profile):
+    if isinstance(profile, PacingProfile):
+        return profile
+    try:
+        return PROFILES[profile.lower()]
+    except KeyError:
+        raise ValueError(f"알 수 없는 pacing 프로필입니다: {profile} (사용 가능: {', '.join(PROFILES)})")
+
+
+def _budget_from_env():
+    value = os.getenv("THINK_TIME_BUDGET")
+    return float(value) if value else None
+
+
+_default_pacer = None
+
+
+def get_pacer():
+    """프로세스 전역 기본 Pacer (환경 변수로 초기화)"""
+    global _default_pacer
+    if _default_pacer is None:
+        _default_pacer = Pacer(os.getenv("PACING_PROFILE", DEFAULT_PROFILE), budget=_budget_from_env())
+    return _default_pacer
+
+
+def set_pacer(pacer):
+    global _default_pacer
+    _default_pacer = pacer
+    return pacer
@@ -0,0 +1,129 @@
+# utils/resource_policy.py
+"""
+리소스 차단 정책
+
+검증에 필요 없는 이미지/폰트/미디어와 광고·분석 트래커 요청을 context.route로 차단합니다.
+
+- full            : 아무것도 차단하지 않음 (기본값)
+- visual          : 트래커/광고만 차단 (화면 확인용)
+- assertions-only : 트래커/광고 + 이미지/폰트/미디어 차단 (기능 검증용)
+"""
+
+from urllib.parse import urlparse
+
+TRACKER_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "facebook.net",
+    "facebook.com",
+    "criteo.com",
+    "criteo.net",
+    "adnxs.com",
+    "scorecardresearch.com",
+    "wcs.naver.net",
+    "wcs.naver.com",
+    "adfit.kakao.com",
+    "mobon.net",
+    "tenping.kr",
+    "hotjar.com",
+    "clarity.ms",
+)
+
+# 차단한 요청은 응답을 받지 않으므로 리소스 종류별 평균 크기로 절약량을 추정
+ESTIMATED_BYTES = {
+    "image": 60_000,
+    "font": 40_000,
+    "media": 500_000,
+    "script": 30_000,
+    "stylesheet": 20_000,
+    "document": 50_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+
+class ResourcePolicy:
+    def __init__(self, name, block_types=(), block_hosts=()):
+        self.name = name
+        self.block_types = frozenset(block_types)
+        self.block_hosts = tuple(block_hosts)
+
+    @property
+    def blocks_anything(self):
+        return bool(self.block_types or self.block_hosts)
+
+    def should_block(self, resource_type, url):
+        if resource_type in self.block_types:
+            return True
+        host = urlparse(url).hostname or ""
+        return any(host == pattern or host.endswith(f".{pattern}") for pattern in self.block_hosts)
+
+
+POLICIES = {
+    "full": ResourcePolicy("full"),
+    "visual": ResourcePolicy("visual", block_hosts=TRACKER_HOSTS),
+    "assertions-only": ResourcePolicy(
+        "assertions-only", block_types=("image", "font", "media"), block_hosts=TRACKER_HOSTS
+    ),
+}
+
+
+def get_policy(name):
+    try:
+        return POLICIES[name]
+    except KeyError:
+        raise ValueError(f"알 수 없는 리소스 정책입니다: {name} (사용 가능: {', '.join(POLICIES)})")
+
+
+class ResourceBlocker:
+    """컨텍스트에 정책을 적용하고 차단한 요청 수/추정 바이트를 기록"""
+
+    def __init__(self, policy):
+        self.policy = get_policy(policy) if isinstance(policy, str) else policy
+        self.blocked_requests = 0
+        self.blocked_bytes = 0
+        self.allowed_requests = 0
+        self.by_type = {}
+
+    def install(self, context):
+        # full 정책은 라우팅 자체를 하지 않음 (요청마다 Python 왕복이 생기므로)
+        if self.policy.blocks_anything:
+            context.route("**/*", self._handle)
+        return self
+
+    def uninstall(self, context):
+        if self.policy.blocks_anything:
+            context.unroute("**/*", self._handle)
+        return self
+
+    def _handle(self, route):
+        request = route.request
+        if not self.policy.should_block(request.resource_type, request.url):
+            self.allowed_requests += 1
+            # 다른 핸들러(HAR 재생 등)가 이어서 처리하도록 넘김
+            route.fallback()
+            return
+
+        self.blocked_requests += 1
+        self.blocked_bytes += ESTIMATED_BYTES.get(request.resource_type, DEFAULT_ESTIMATED_BYTES)
+        self.by_type[request.resource_type] = self.by_type.get(request.resource_type, 0) + 1
+        route.abort("blockedbyclient")
+
+    def stats(self):
+        return {
+            "policy": self.policy.name,
+            "blocked_requests": self.blocked_requests,
+            "blocked_bytes_estimated": self.blocked_bytes,
+            "allowed_requests": self.allowed_requests,
+            "by_type": dict(self.by_type),
+        }
+
+    def summary(self):
+        return (
+            f"리소스 정책 '{self.policy.name}': 요청 {self.blocked_requests}개 차단 "
+            f"(약 {self.blocked_bytes / 1024:.0f} KB 절약), {self.allowed_requests}개 허용"
+        )
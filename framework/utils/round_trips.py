@@ -0,0 +1,71 @@
+# utils/round_trips.py
+"""
+액션별 브라우저 프로토콜 왕복(round trip) 횟수 집계
+
+BasePage의 액션 헬퍼가 Playwright 호출마다 hit()을 기록합니다.
+action()을 중첩하면 안쪽 액션의 왕복 횟수가 바깥 액션에도 합산되므로,
+journey 전체를 action("journey")로 감싸 총 왕복 횟수를 확인할 수 있습니다.
+
+진행 중인 액션 스택은 ContextVar에 저장하므로, 비동기 페이지 객체가 여러 journey를
+동시에 실행해도 코루틴(Task)마다 따로 집계됩니다.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class RoundTripCounter:
+    def __init__(self):
+        self.actions = {}
+        self._stack = ContextVar("round_trip_stack", default=())
+
+    @contextmanager
+    def action(self, name):
+        frame = [name, 0]
+        token = self._stack.set(self._stack.get() + (frame,))
+        try:
+            yield self
+        finally:
+            self._stack.reset(token)
+            name, trips = frame
+            calls, total = self.actions.get(name, (0, 0))
+            self.actions[name] = (calls + 1, total + trips)
+            parent = self._stack.get()
+            if parent:
+                parent[-1][1] += trips
+
+    def hit(self, count=1):
+        stack = self._stack.get()
+        if stack:
+            stack[-1][1] += count
+        else:
+            calls, total = self.actions.get("<untracked>", (0, 0))
+            self.actions["<untracked>"] = (calls + 1, total + count)
+
+    def report(self):
+        return {
+            name: {"calls": calls, "round_trips": total, "per_call": round(total / calls, 2)}
+            for name, (calls, total) in self.actions.items()
+        }
+
+    def reset(self):
+        self.actions = {}
+        self._stack = ContextVar("round_trip_stack", default=())
+        return self
+
+
+_default_counter = None
+
+
+def get_round_trip_counter():
+    """프로세스 전역 기본 RoundTripCounter"""
+    global _default_counter
+    if _default_counter is None:
+        _default_counter = RoundTripCounter()
+    return _default_counter
+
+
+def set_round_trip_counter(counter):
+    global _default_counter
+    _default_counter = counter
+    return counter
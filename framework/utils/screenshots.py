@@ -0,0 +1,197 @@
+# utils/screenshots.py
+"""
+비동기(백그라운드 스레드) 스크린샷 저장 서비스
+
+- 테스트 스레드는 page.screenshot()으로 이미지 바이트만 받고, 파일 쓰기는 writer 스레드가 처리
+- 형식: png / jpeg (quality 적용) / webp (Pillow 필요, writer 스레드에서 변환)
+- selector를 주면 해당 요소 영역만 촬영
+- 내용 해시가 같은 스크린샷은 다시 저장하지 않고 처음 저장한 경로를 반환
+- 파일명: <name>_<xdist 워커>_<순번>.<확장자> (워커/프로세스 사이에 겹치지 않음)
+
+    path = get_screenshot_service().capture(page, "cart", selector="#cart")
+"""
+
+import atexit
+import hashlib
+import io
+import itertools
+import os
+import queue
+import re
+import threading
+
+from framework.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FORMATS = ("png", "jpeg", "webp")
+EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+
+class ScreenshotService:
+    """
+    Args:
+        directory: 저장 위치
+        image_format: png / jpeg / webp
+        quality: jpeg / webp 품질 (0~100)
+        dedupe: 내용이 같은 스크린샷은 한 번만 저장
+    """
+
+    def __init__(self, directory="reports/screenshots", image_format="jpeg", quality=80, dedupe=True):
+        if image_format not in FORMATS:
+            raise ValueError(f"알 수 없는 스크린샷 형식입니다: {image_format} (사용 가능: {', '.join(FORMATS)})")
+        if image_format == "webp" and not _has_pillow():
+            logger.warning("WebP 변환에 Pillow가 필요합니다. JPEG로 저장합니다")
+            image_format = "jpeg"
+
+        self.directory = directory
+        self.image_format = image_format
+        self.quality = quality
+        self.dedupe = dedupe
+        self.worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+
+        self._sequence = itertools.count(1)
+        self._hashes = {}
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._thread = None
+
+        self.captured = 0
+        self.duplicates = 0
+        self.written = 0
+        self.written_bytes = 0
+        self.failures = 0
+
+        # close()를 부르지 않고 끝나도 남은 스크린샷은 저장
+        atexit.register(self.close)
+
+    # ==============================================
+    # 촬영
+    # ==============================================
+
+    def screenshot_options(self):
+        """page.screenshot()에 넘길 형식 옵션 (WebP는 PNG로 받아서 writer 스레드에서 변환)"""
+        if self.image_format == "jpeg":
+            return {"type": "jpeg", "quality": self.quality}
+        return {"type": "png"}
+
+    def capture(self, page, name=None, selector=None, full_page=False):
+        """동기 Page 촬영 후 저장 예약 (저장될 경로 반환)"""
+        options = self.screenshot_options()
+        if selector:
+            data = page.locator(selector).screenshot(**options)
+        else:
+            data = page.screenshot(full_page=full_page, **options)
+        return self.submit(data, name)
+
+    def submit(self, data, name=None):
+        """이미 촬영한 이미지 바이트를 저장 예약 (비동기 페이지 객체용)"""
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+        with self._lock:
+            self.captured += 1
+            if self.dedupe and digest in self._hashes:
+                self.duplicates += 1
+                return self._hashes[digest]
+
+            path = os.path.join(self.directory, self._file_name(name))
+            self._hashes[digest] = path
+
+        self._ensure_writer()
+        self._queue.put((path, data, digest))
+        return path
+
+    def _file_name(self, name):
+        base = re.sub(r"[^\w.-]", "_", name or "screenshot")
+        return f"{base}_{self.worker}_{next(self._sequence):04d}.{EXTENSIONS[self.image_format]}"
+
+    # ==============================================
+    # writer 스레드
+    # ==============================================
+
+    def _ensure_writer(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._write_loop, name="screenshot-writer", daemon=True)
+            self._thread.start()
+
+    def _write_loop(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._write(*job)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path, data, digest):
+        try:
+            if self.image_format == "webp":
+                data = _to_webp(data, self.quality)
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+            self.written += 1
+            self.written_bytes += len(data)
+        except Exception as e:
+            self.failures += 1
+            logger.warning("스크린샷 저장 실패: %s (%s)", path, e)
+            # 없는 파일을 중복 스크린샷의 경로로 돌려주지 않도록 해시 기록 삭제
+            with self._lock:
+                if self._hashes.get(digest) == path:
+                    del self._hashes[digest]
+
+    def flush(self):
+        """예약된 스크린샷을 모두 저장할 때까지 대기"""
+        self._queue.join()
+        return self
+
+    def close(self):
+        """남은 스크린샷을 저장하고 writer 스레드 종료"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+        return self
+
+    def stats(self):
+        return {
+            "captured": self.captured,
+            "duplicates": self.duplicates,
+            "written": self.written,
+            "written_bytes": self.written_bytes,
+            "failures": self.failures,
+        }
+
+
+def _has_pillow():
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _to_webp(data, quality):
+    from PIL import Image
+
+    output = io.BytesIO()
+    Image.open(io.BytesIO(data)).save(output, format="WEBP", quality=quality)
+    return output.getvalue()
+
+
+_default_service = None
+
+
+def get_screenshot_service():
+    """프로세스 전역 기본 ScreenshotService"""
+    global _default_service
+    if _default_service is None:
+        _default_service = ScreenshotService()
+    return _default_service
+
+
+def set_screenshot_service(service):
+    global _default_service
+    _default_service = service
+    return service
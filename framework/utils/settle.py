@@ -0,0 +1,185 @@
+# utils/settle.py
+"""
+페이지 안정화(settle) 감지
+
+클릭/키 입력 후 고정 sleep 대신, 페이지가 실제로 조용해질 때까지만 기다립니다.
+- DOM: init script로 문서마다 설치한 MutationObserver로 마지막 변경(노드 / 텍스트) 이후 quiet_ms 동안 변화가 없는지 확인
+- 네트워크: Playwright request 이벤트로 진행 중인 XHR/fetch가 없는지 확인
+"""
+
+import time
+import weakref
+
+from playwright.sync_api import Error
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+# 문서의 DOM 변경 시각을 기록하는 MutationObserver 설치 (start: 기록 시작 시각)
+# 속성 변경(캐러셀 / 광고 회전의 class, style)은 계속 일어나므로 노드 추가/삭제와 텍스트 변경만 봄
+OBSERVER_SCRIPT = """
+start => {
+    if (window.__settle) return;
+    const state = window.__settle = { last: start };
+    new MutationObserver(() => { state.last = performance.now(); }).observe(document, {
+        subtree: true,
+        childList: true,
+        characterData: true,
+    });
+}
+"""
+
+# 새 문서마다 시작 시점부터 기록 (첫 안정화 대기도 quiet_ms를 새로 기다리지 않음)
+INIT_SCRIPT = f"({OBSERVER_SCRIPT.strip()})(performance.now());"
+
+# 마지막 DOM 변경 이후 quietMs가 지났는지 확인
+# init script 이전에 열린 문서는 여기서 설치 (로딩이 끝난 문서는 이미 조용하다고 보고 0부터 기록)
+QUIET_DOM_SCRIPT = """
+quietMs => {
+    if (!window.__settle) (OBSERVER)(document.readyState === "complete" ? 0 : performance.now());
+    return performance.now() - window.__settle.last >= quietMs;
+}
+""".replace(
+    "OBSERVER", OBSERVER_SCRIPT.strip()
+)
+
+TRACKED_RESOURCE_TYPES = ("xhr", "fetch")
+
+
+class SettleDetector:
+    """
+    페이지 하나에 대한 settle 감지기
+
+    네트워크 리스너는 페이지당 한 번만 등록됩니다. get_settle_detector()로 가져오세요.
+    """
+
+    def __init__(self, page, long_request_ms=5000, poll_ms=50):
+        self.page = page
+        # 이보다 오래 걸리는 요청(long-polling 등)은 무시
+        self.long_request_ms = long_request_ms
+        self.poll_ms = poll_ms
+        self.round_trips = 0
+        self._inflight = {}
+        self._script_installed = False
+
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+
+    def _on_request(self, request):
+        if request.resource_type in TRACKED_RESOURCE_TYPES:
+            self._inflight[request] = time.monotonic()
+
+    def _on_request_done(self, request):
+        self._inflight.pop(request, None)
+
+    def inflight_requests(self):
+        """진행 중인 XHR/fetch 개수 (long-polling 제외)"""
+        now = time.monotonic()
+        limit = self.long_request_ms / 1000
+        return sum(1 for started in self._inflight.values() if now - started < limit)
+
+    def _install_script(self):
+        """이후 열리는 문서에 MutationObserver를 미리 설치 (페이지당 한 번)"""
+        if self._script_installed:
+            return
+        self._script_installed = True
+        self.round_trips += 1
+        try:
+            self.page.add_init_script(INIT_SCRIPT)
+        except Error:
+            # 닫힌 페이지 → 문서마다 QUIET_DOM_SCRIPT가 설치
+            pass
+
+    def wait(self, quiet_ms=300, timeout=5000):
+        """
+        DOM 변경과 XHR/fetch가 모두 멈출 때까지 대기합니다.
+
+        Returns:
+            bool: timeout 안에 안정화되면 True, 아니면 False
+        """
+        self._install_script()
+        deadline = time.monotonic() + timeout / 1000
+
+        while True:
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0 or self.page.is_closed():
+                return False
+
+            self.round_trips += 1
+            try:
+                self.page.wait_for_function(QUIET_DOM_SCRIPT, arg=quiet_ms, timeout=remaining_ms)
+            except PlaywrightTimeoutError:
+                return False
+            except Error:
+                # 네비게이션으로 실행 컨텍스트가 바뀐 경우 → 새 문서가 뜰 시간을 두고 남은 시간 안에서 재시도
+                if self.page.is_closed():
+                    return False
+                self.round_trips += 1
+                self.page.wait_for_timeout(min(self.poll_ms, max(remaining_ms, 1)))
+                continue
+
+            if self.inflight_requests() == 0:
+                return True
+
+            # 이벤트를 처리하면서 네트워크 요청 완료 대기
+            self.round_trips += 1
+            self.page.wait_for_timeout(min(self.poll_ms, max(remaining_ms, 1)))
+
+
+class AsyncSettleDetector(SettleDetector):
+    """playwright.async_api 페이지용 settle 감지기 (wait()가 코루틴)"""
+
+    async def _install_script(self):
+        if self._script_installed:
+            return
+        self._script_installed = True
+        self.round_trips += 1
+        try:
+            await self.page.add_init_script(INIT_SCRIPT)
+        except Error:
+            pass
+
+    async def wait(self, quiet_ms=300, timeout=5000):
+        await self._install_script()
+        deadline = time.monotonic() + timeout / 1000
+
+        while True:
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0 or self.page.is_closed():
+                return False
+
+            self.round_trips += 1
+            try:
+                await self.page.wait_for_function(QUIET_DOM_SCRIPT, arg=quiet_ms, timeout=remaining_ms)
+            except PlaywrightTimeoutError:
+                return False
+            except Error:
+                if self.page.is_closed():
+                    return False
+                self.round_trips += 1
+                await self.page.wait_for_timeout(min(self.poll_ms, max(remaining_ms, 1)))
+                continue
+
+            if self.inflight_requests() == 0:
+                return True
+
+            self.round_trips += 1
+            await self.page.wait_for_timeout(min(self.poll_ms, max(remaining_ms, 1)))
+
+
+_detectors = weakref.WeakKeyDictionary()
+
+
+def get_settle_detector(page):
+    """페이지별 SettleDetector (최초 호출 시 설치)"""
+    detector = _detectors.get(page)
+    if detector is None:
+        detector = _detectors[page] = SettleDetector(page)
+    return detector
+
+
+def get_async_settle_detector(page):
+    """비동기 페이지별 AsyncSettleDetector (최초 호출 시 설치)"""
+    detector = _detectors.get(page)
+    if detector is None:
+        detector = _detectors[page] = AsyncSettleDetector(page)
+    return detector
@@ -0,0 +1,136 @@
+# utils/timing.py
+"""
+페이지 객체 메서드별 실행 시간 측정
+
+BasePage와 그 하위 클래스의 public 메서드는 자동으로 instrument()로 감싸지고,
+호출마다 벽시계(wall) 시간을 세 구간으로 나눠 기록합니다.
+
+- delay        : Clock으로 의도적으로 기다린 시간 (clock.slept 증가분)
+- python       : 이 스레드가 실제로 CPU를 쓴 시간 (time.thread_time 증가분)
+- browser_wait : 나머지 (브라우저/네트워크 응답 대기)
+
+가상 시계(VirtualClock)의 delay는 실제로 흐르지 않으므로 browser_wait 계산에서 빼지 않습니다.
+메서드가 다른 public 메서드를 호출하면 양쪽 모두에 기록됩니다 (바깥 메서드는 안쪽 시간 포함).
+"""
+
+import functools
+import inspect
+import os
+import time
+
+from framework.utils.stats import summarize
+
+BUCKETS = ("wall", "browser_wait", "delay", "python")
+QUANTILES = (("0.5", "p50"), ("0.95", "p95"), ("0.99", "p99"))
+
+
+class ActionTimer:
+    def __init__(self):
+        self.samples = {}
+
+    def record(self, name, wall, delay=0.0, python=0.0, virtual=False):
+        browser_wait = max(wall - python - (0.0 if virtual else delay), 0.0)
+        buckets = self.samples.setdefault(name, {bucket: [] for bucket in BUCKETS})
+        for bucket, seconds in zip(BUCKETS, (wall, browser_wait, delay, python)):
+            buckets[bucket].append(seconds)
+
+    def merge(self, samples):
+        """다른 프로세스(xdist 워커)의 samples를 합침"""
+        for name, buckets in samples.items():
+            merged = self.samples.setdefault(name, {bucket: [] for bucket in BUCKETS})
+            for bucket in BUCKETS:
+                merged[bucket].extend(buckets.get(bucket, []))
+        return self
+
+    def report(self):
+        """메서드별 구간 p50/p95/p99 (총 wall 시간 내림차순)"""
+        ordered = sorted(self.samples.items(), key=lambda item: sum(item[1]["wall"]), reverse=True)
+        return {
+            name: {"calls": len(buckets["wall"]), **{bucket: summarize(buckets[bucket]) for bucket in BUCKETS}}
+            for name, buckets in ordered
+        }
+
+    def reset(self):
+        self.samples = {}
+        return self
+
+
+def to_prometheus(report, metric="gmarket_page_action_seconds"):
+    """report()를 Prometheus textfile 형식(summary)으로 변환"""
+    lines = [
+        f"# HELP {metric} Page object method time split into wall/browser_wait/delay/python buckets.",
+        f"# TYPE {metric} summary",
+    ]
+    for name, stats in report.items():
+        for bucket in BUCKETS:
+            labels = f'method="{name}",bucket="{bucket}"'
+            summary = stats[bucket]
+            for quantile, key in QUANTILES:
+                lines.append(f'{metric}{{{labels},quantile="{quantile}"}} {summary[key]}')
+            lines.append(f"{metric}_sum{{{labels}}} {round(summary['mean'] * summary['count'], 4)}")
+            lines.append(f"{metric}_count{{{labels}}} {summary['count']}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(report, path):
+    """textfile collector가 반쯤 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(to_prometheus(report))
+    os.replace(tmp_path, path)
+    return path
+
+
+def _timed(func, name):
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        timer = getattr(self, "timer", None)
+        clock = getattr(self, "delay_clock", None)
+        if timer is None or clock is None:
+            return func(self, *args, **kwargs)
+
+        slept = clock.slept
+        cpu = time.thread_time()
+        started = time.perf_counter()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            timer.record(
+                name,
+                wall=time.perf_counter() - started,
+                delay=clock.slept - slept,
+                python=time.thread_time() - cpu,
+                virtual=clock.virtual,
+            )
+
+    wrapper._timed = True
+    return wrapper
+
+
+def instrument(cls):
+    """cls에 직접 정의된 public 메서드를 '<클래스>.<메서드>' 이름으로 측정하도록 감쌈"""
+    for attr, func in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(func) or getattr(func, "_timed", False):
+            continue
+        # 제너레이터는 호출 시점에 실행되지 않으므로 측정 대상에서 제외
+        if inspect.isgeneratorfunction(func):
+            continue
+        setattr(cls, attr, _timed(func, f"{cls.__name__}.{attr}"))
+    return cls
+
+
+_default_timer = None
+
+
+def get_action_timer():
+    """프로세스 전역 기본 ActionTimer"""
+    global _default_timer
+    if _default_timer is None:
+        _default_timer = ActionTimer()
+    return _default_timer
+
+
+def set_action_timer(timer):
+    global _default_timer
+    _default_timer = timer
+    return timer
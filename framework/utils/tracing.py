@@ -0,0 +1,151 @@
+# utils/tracing.py
+"""
+실패한 테스트만 Playwright trace를 남기는 청크(chunk) 단위 트레이싱
+
+컨텍스트마다 tracing.start()는 한 번만 호출하고, 테스트마다 start_chunk()/stop_chunk()로 구간을 나눕니다.
+- 통과: stop_chunk()를 경로 없이 호출해 청크를 버림 (trace 파일 쓰기 없음)
+- 실패: 현재 청크를 <directory>/<test>.zip 으로 저장
+
+keep_chunks > 1이면 직전 테스트들의 청크도 임시 파일로 보관(링 버퍼)했다가 실패 시 함께 남깁니다.
+이전 테스트가 남긴 상태 때문에 실패한 경우를 추적할 수 있지만, 통과한 테스트도 청크를 파일로 씁니다.
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import time
+import weakref
+from collections import deque
+
+MODES = ("off", "failure")
+
+
+def _safe_name(name):
+    return re.sub(r"[^\w.-]", "_", name)
+
+
+class TraceRecorder:
+    """
+    Args:
+        mode: off / failure
+        directory: 실패 trace 저장 위치
+        keep_chunks: 실패 시 남길 청크 수 (현재 테스트 포함, 1이면 현재 테스트만)
+        screenshots / snapshots: Playwright tracing.start() 옵션
+    """
+
+    def __init__(self, mode="failure", directory="reports/traces", keep_chunks=1, screenshots=True, snapshots=True):
+        if mode not in MODES:
+            raise ValueError(f"알 수 없는 trace 모드입니다: {mode} (사용 가능: {', '.join(MODES)})")
+        if keep_chunks < 1:
+            raise ValueError(f"keep_chunks는 1 이상이어야 합니다: {keep_chunks}")
+
+        self.mode = mode
+        self.directory = directory
+        self.keep_chunks = keep_chunks
+        self.screenshots = screenshots
+        self.snapshots = snapshots
+
+        self._started = weakref.WeakSet()
+        self._ring = deque()
+        self._ring_dir = None
+
+        self.chunks = 0
+        self.persisted = 0
+        self.discarded = 0
+        self.persisted_bytes = 0
+        self.overhead_seconds = 0.0
+
+    @property
+    def enabled(self):
+        return self.mode != "off"
+
+    def begin(self, context, test_name):
+        """테스트 시작: 컨텍스트 트레이싱이 꺼져 있으면 켜고 새 청크 시작"""
+        if not self.enabled:
+            return self
+
+        started = time.perf_counter()
+        if context not in self._started:
+            context.tracing.start(screenshots=self.screenshots, snapshots=self.snapshots)
+            self._started.add(context)
+        context.tracing.start_chunk(title=test_name)
+        self.overhead_seconds += time.perf_counter() - started
+        self.chunks += 1
+        return self
+
+    def end(self, context, test_name, failed):
+        """테스트 종료: 실패면 trace zip 경로(들)를, 통과면 빈 리스트를 반환"""
+        if not self.enabled or context not in self._started:
+            return []
+
+        started = time.perf_counter()
+        try:
+            if failed:
+                return self._persist(context, test_name)
+            if self.keep_chunks > 1:
+                self._buffer(context, test_name)
+            else:
+                context.tracing.stop_chunk()
+                self.discarded += 1
+            return []
+        finally:
+            self.overhead_seconds += time.perf_counter() - started
+
+    def forget(self, context):
+        """컨텍스트를 닫기 전에 호출 (트레이싱 종료)"""
+        if context in self._started:
+            self._started.discard(context)
+            try:
+                context.tracing.stop()
+            except Exception:
+                pass
+        return self
+
+    def _persist(self, context, test_name):
+        os.makedirs(self.directory, exist_ok=True)
+        name = _safe_name(test_name)
+        path = os.path.join(self.directory, f"{name}.zip")
+        context.tracing.stop_chunk(path=path)
+        paths = [path]
+
+        # 링 버퍼의 이전 청크는 직전 테스트부터 -prev-1, -prev-2 ... 번호를 붙여 옮김
+        for offset, (previous_name, buffered) in enumerate(reversed(self._ring), start=1):
+            target = os.path.join(self.directory, f"{name}-prev-{offset}-{previous_name}.zip")
+            shutil.move(buffered, target)
+            paths.append(target)
+        self._ring.clear()
+
+        self.persisted += 1
+        self.persisted_bytes += sum(os.path.getsize(p) for p in paths if os.path.exists(p))
+        return paths
+
+    def _buffer(self, context, test_name):
+        if self._ring_dir is None:
+            self._ring_dir = tempfile.mkdtemp(prefix="trace-ring-")
+        path = os.path.join(self._ring_dir, f"{self.chunks}-{_safe_name(test_name)}.zip")
+        context.tracing.stop_chunk(path=path)
+        self._ring.append((_safe_name(test_name), path))
+
+        while len(self._ring) > self.keep_chunks - 1:
+            _, evicted = self._ring.popleft()
+            if os.path.exists(evicted):
+                os.remove(evicted)
+            self.discarded += 1
+
+    def close(self):
+        """남은 링 버퍼 임시 파일 삭제"""
+        if self._ring_dir is not None:
+            shutil.rmtree(self._ring_dir, ignore_errors=True)
+            self._ring_dir = None
+        self._ring.clear()
+        return self
+
+    def stats(self):
+        return {
+            "chunks": self.chunks,
+            "persisted": self.persisted,
+            "discarded": self.discarded,
+            "persisted_bytes": self.persisted_bytes,
+            "overhead_seconds": round(self.overhead_seconds, 3),
+        }
@@ -0,0 +1,212 @@
+# utils/web_vitals.py
+"""
+페이지 방문(navigation)별 Web Vitals / Navigation Timing 수집
+
+컨텍스트 init script로 PerformanceObserver를 등록해 문서마다 아래 값을 모읍니다.
+- TTFB / DOMContentLoaded / load (navigation timing)
+- LCP, CLS (세션 윈도우 최댓값), INP (가장 느린 상호작용), long task 수 / Total Blocking Time
+- 리소스 타이밍 (요청 수, 전송 바이트, 유형별 개수, 가장 느린 5개)
+
+문서를 떠날 때(pagehide) 바인딩으로 요약을 보내고, 테스트가 끝날 때 열려 있는 페이지의 요약을 직접 가져옵니다.
+그래서 goto / visit / 페이지를 이동시키는 클릭 모두 별도 코드 없이 기록됩니다.
+
+    collector = VitalsCollector()
+    collector.install(context)
+    collector.begin("test_search")
+    ...
+    navigations = collector.end(context)
+"""
+
+import html
+import weakref
+from urllib.parse import urlparse
+
+from framework.utils.context_pool import RESET_PATH
+from framework.utils.stats import percentile
+
+BINDING = "__gmarketReportVitals"
+
+VITALS_SCRIPT = """
+(() => {
+    if (window !== window.top || window.__gmarketVitals) return;
+
+    const state = { lcp: null, cls: 0, clsWindow: 0, clsStart: 0, clsLast: 0, inp: null, longTasks: 0, tbt: 0, taken: false };
+    const observe = (type, callback, options = {}) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({ type, buffered: true, ...options });
+        } catch (e) {}
+    };
+
+    observe("largest-contentful-paint", entry => { state.lcp = entry.startTime; });
+    observe("layout-shift", entry => {
+        if (entry.hadRecentInput) return;
+        // 1초 이내 간격, 최대 5초짜리 세션 윈도우 중 가장 큰 값
+        if (state.clsWindow && entry.startTime - state.clsLast < 1000 && entry.startTime - state.clsStart < 5000) {
+            state.clsWindow += entry.value;
+        } else {
+            state.clsWindow = entry.value;
+            state.clsStart = entry.startTime;
+        }
+        state.clsLast = entry.startTime;
+        state.cls = Math.max(state.cls, state.clsWindow);
+    });
+    observe("event", entry => {
+        if (entry.interactionId) state.inp = Math.max(state.inp || 0, entry.duration);
+    }, { durationThreshold: 40 });
+    observe("longtask", entry => {
+        state.longTasks += 1;
+        state.tbt += Math.max(entry.duration - 50, 0);
+    });
+
+    const round = value => (value == null ? null : Math.round(value * 10) / 10);
+    const summary = () => {
+        const nav = performance.getEntriesByType("navigation")[0];
+        const resources = performance.getEntriesByType("resource");
+        const byType = {};
+        let transferSize = 0;
+        resources.forEach(r => {
+            byType[r.initiatorType] = (byType[r.initiatorType] || 0) + 1;
+            transferSize += r.transferSize || 0;
+        });
+        const slowest = resources.slice().sort((a, b) => b.duration - a.duration).slice(0, 5).map(r => ({
+            name: r.name, type: r.initiatorType, duration: round(r.duration), transfer_size: r.transferSize || 0,
+        }));
+        return {
+            url: location.href,
+            ttfb: nav ? round(nav.responseStart) : null,
+            dom_content_loaded: nav ? round(nav.domContentLoadedEventEnd) : null,
+            load: nav && nav.loadEventEnd ? round(nav.loadEventEnd) : null,
+            lcp: round(state.lcp),
+            cls: Math.round(state.cls * 1000) / 1000,
+            inp: round(state.inp),
+            long_tasks: state.longTasks,
+            total_blocking_time: round(state.tbt),
+            resources: { count: resources.length, transfer_size: transferSize, by_type: byType, slowest },
+        };
+    };
+    // 한 문서의 요약은 한 번만 보냄 (pagehide 또는 테스트 종료 시 take())
+    const take = () => {
+        if (state.taken) return null;
+        state.taken = true;
+        return summary();
+    };
+
+    window.__gmarketVitals = { summary, take };
+    addEventListener("pagehide", () => {
+        const data = take();
+        if (data && typeof window.__gmarketReportVitals === "function") window.__gmarketReportVitals(data);
+    });
+})();
+"""
+
+TAKE_SCRIPT = "() => window.__gmarketVitals ? window.__gmarketVitals.take() : null"
+
+# web.dev 기준 (good 이하 / poor 초과)
+THRESHOLDS = {
+    "ttfb": (800, 1800),
+    "lcp": (2500, 4000),
+    "cls": (0.1, 0.25),
+    "inp": (200, 500),
+    "total_blocking_time": (200, 600),
+}
+METRICS = ("ttfb", "lcp", "cls", "inp", "total_blocking_time")
+
+
+def rate(metric, value):
+    """good / needs-improvement / poor (값이 없으면 None)"""
+    if value is None or metric not in THRESHOLDS:
+        return None
+    good, poor = THRESHOLDS[metric]
+    if value <= good:
+        return "good"
+    return "needs-improvement" if value <= poor else "poor"
+
+
+class VitalsCollector:
+    def __init__(self):
+        self.navigations = []
+        self._installed = weakref.WeakSet()
+        self._test = None
+        self._current = []
+
+    def install(self, context):
+        """컨텍스트에 init script와 보고용 바인딩 등록 (컨텍스트마다 한 번)"""
+        if context not in self._installed:
+            context.expose_binding(BINDING, lambda source, data: self._report(data))
+            context.add_init_script(VITALS_SCRIPT)
+            self._installed.add(context)
+        return self
+
+    @property
+    def active(self):
+        """begin() 이후 아직 end()하지 않은 테스트가 있는지"""
+        return self._test is not None
+
+    def begin(self, test_name):
+        self._test = test_name
+        self._current = []
+        return self
+
+    def end(self, context):
+        """열린 페이지의 요약까지 모아서 이번 테스트의 navigation 목록 반환"""
+        for page in list(context.pages):
+            try:
+                if not page.is_closed():
+                    data = page.evaluate(TAKE_SCRIPT)
+                    if data:
+                        self._record(data)
+            except Exception:
+                pass
+
+        navigations, self._current = self._current, []
+        self._test = None
+        return navigations
+
+    def _report(self, data):
+        """
+        pagehide 바인딩 보고
+
+        테스트 밖(풀 초기화 중 페이지 닫기 / origin마다 띄우는 초기화 페이지)에서 온 보고는 버림
+        """
+        if self._test is None or urlparse(data.get("url", "")).path == RESET_PATH:
+            return
+        self._record(data)
+
+    def _record(self, data):
+        data["test"] = self._test
+        self.navigations.append(data)
+        self._current.append(data)
+
+
+def summarize_by_path(navigations):
+    """URL 경로별 p75 (Web Vitals 권장 집계 방식)"""
+    grouped = {}
+    for navigation in navigations:
+        grouped.setdefault(urlparse(navigation["url"]).path or "/", []).append(navigation)
+
+    summary = {}
+    for path, entries in sorted(grouped.items()):
+        row = {"visits": len(entries)}
+        for metric in METRICS:
+            values = [entry[metric] for entry in entries if entry.get(metric) is not None]
+            row[metric] = round(percentile(values, 75), 3) if values else None
+            row[f"{metric}_rating"] = rate(metric, row[metric])
+        summary[path] = row
+    return summary
+
+
+def html_table(navigations):
+    """pytest-html 리포트용 페이지별 요약 표"""
+    header = "".join(f"<th>{name}</th>" for name in ("URL", "TTFB", "LCP", "CLS", "INP", "TBT", "리소스", "전송"))
+    rows = []
+    for navigation in navigations:
+        cells = [f"<td>{html.escape(navigation['url'])}</td>"]
+        for metric in METRICS:
+            value = navigation.get(metric)
+            rating = rate(metric, value) or ""
+            cells.append(f'<td class="{rating}">{"-" if value is None else value}</td>')
+        resources = navigation.get("resources", {})
+        cells.append(f"<td>{resources.get('count', 0)}</td>")
+        cells.append(f"<td>{resources.get('transfer_size', 0) / 1024:.0f} KB</td>")
+        rows.append(f"<tr>{''.join(cells)}</tr>")
+    return f"<table><tr>{header}</tr>{''.join(rows)}</table>"
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from framework.aio.pages.home_page import HomePage
+from framework.aio.pages.product_page import ProductPage
+
+DETAIL_ROW = {"title": "무선 마우스", "price": "12,900원", "shipping": "무료배송", "images": [], "options": None}
+
+
+class FakeOptionLocator:
+    def __init__(self, page):
+        self.page = page
+
+    async def evaluate_all(self, script):
+        self.page.option_reads += 1
+        return [{"index": 1, "name": "블랙", "soldOut": True}, {"index": 2, "name": "화이트", "soldOut": False}]
+
+
+class FakeProductPage:
+    """상세 정보 evaluate와 옵션 목록 evaluate_all만 흉내 낸 비동기 가짜 페이지"""
+
+    def __init__(self):
+        self.option_reads = 0
+
+    def on(self, event, handler):
+        pass
+
+    async def evaluate(self, script, arg=None):
+        return dict(DETAIL_ROW)
+
+    def locator(self, selector):
+        return FakeOptionLocator(self)
+
+
+class TestAsyncHomePage:
+    # visit(), should_be_on_homepage() 테스트
+    @pytest.mark.smoke
+    @pytest.mark.asyncio
+    async def test_homepage_loads_successfully(self, async_page):
+        homepage = HomePage(async_page)
+        await homepage.visit()
+        result = await homepage.should_be_on_homepage()
+
+        assert result is homepage
+
+    # search_product() 테스트
+    @pytest.mark.asyncio
+    async def test_search_product(self, async_page):
+        homepage = HomePage(async_page)
+        await homepage.visit()
+
+        search_page = await homepage.search_product("마우스")
+        await search_page.should_be_on_search_page()
+
+        titles = await search_page.get_all_product_titles(5)
+        assert len(titles) > 0
+
+
+class TestAsyncProductPage:
+    # 동기 버전과 같이 옵션 목록은 처음 load_options() 할 때 한 번만 읽음
+    def test_lazy_options(self):
+        page = FakeProductPage()
+
+        async def scenario():
+            product_page = ProductPage(page)
+            info = await product_page.get_product_info()
+            assert not info.options_loaded
+            with pytest.raises(RuntimeError):
+                info.options
+            first = await info.load_options()
+            second = await info.load_options()
+            return info, first, second, await product_page.get_product_options()
+
+        info, first, second, options = asyncio.run(scenario())
+
+        assert first is second is info.options
+        assert [option.name for option in first] == ["블랙", "화이트"]
+        assert options == first
+        assert page.option_reads == 2
+
+
+class TestAsyncConcurrency:
+    # 한 이벤트 루프에서 여러 journey 동시 실행 테스트
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_concurrent_journeys(self, async_context):
+        async def journey(keyword):
+            page = await async_context.new_page()
+            try:
+                homepage = HomePage(page)
+                await homepage.visit()
+                search_page = await homepage.search_product(keyword)
+                await search_page.should_be_on_search_page()
+                return [card async for card in search_page.iter_products(max_items=5)]
+            finally:
+                await page.close()
+
+        results = await asyncio.gather(*(journey(keyword) for keyword in ["마우스", "키보드", "모니터"]))
+
+        assert all(len(cards) > 0 for cards in results)
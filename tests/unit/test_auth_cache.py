@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from framework.utils.auth_cache import AuthStateCache, FileLock
+
+
+class TestAuthStateCache:
+    # 저장한 상태는 TTL 안에서만 읽혀야 함
+    def test_load_respects_ttl(self, tmp_path):
+        cache = AuthStateCache(str(tmp_path), ttl=60)
+        path = cache.save("user", "https://gmarket.co.kr", {"cookies": [], "origins": []})
+
+        assert cache.load("user", "https://gmarket.co.kr") == path
+
+        expired = time.time() - 120
+        os.utime(path, (expired, expired))
+        assert cache.load("user", "https://gmarket.co.kr") is None
+
+    # 계정 / base URL 별로 키가 달라야 함
+    def test_key_per_account_and_base_url(self, tmp_path):
+        cache = AuthStateCache(str(tmp_path))
+
+        keys = {
+            cache.key("user", "https://gmarket.co.kr"),
+            cache.key("other", "https://gmarket.co.kr"),
+            cache.key("user", "http://127.0.0.1:8000"),
+        }
+        assert len(keys) == 3
+
+    # TTL 0이면 캐시를 사용하지 않음
+    def test_disabled_cache(self, tmp_path):
+        cache = AuthStateCache(str(tmp_path), ttl=0)
+        cache.save("user", "https://gmarket.co.kr", {})
+
+        assert cache.load("user", "https://gmarket.co.kr") is None
+
+
+class TestFileLock:
+    # 이미 잡힌 락은 timeout 후 실패해야 함
+    def test_lock_is_exclusive(self, tmp_path):
+        path = str(tmp_path / "state.lock")
+
+        with FileLock(path):
+            with pytest.raises(TimeoutError):
+                FileLock(path, timeout=0.3, poll=0.05).acquire()
+
+        # 해제 후에는 다시 잡을 수 있어야 함
+        with FileLock(path, timeout=0.3):
+            pass
+
+    # 오래된 락 파일은 제거하고 잡아야 함
+    def test_stale_lock_is_removed(self, tmp_path):
+        path = tmp_path / "state.lock"
+        path.write_text("12345")
+        old = time.time() - 1000
+        os.utime(path, (old, old))
+
+        with FileLock(str(path), timeout=1, stale_after=10, poll=0.05):
+            assert path.read_text() == str(os.getpid())
+
+    # 락을 잡은 프로세스가 이미 종료됐으면 stale_after를 기다리지 않고 제거
+    @pytest.mark.skipif(os.name == "nt", reason="PID 생존 확인은 POSIX에서만")
+    def test_dead_owner_lock_is_removed(self, tmp_path):
+        path = tmp_path / "state.lock"
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        path.write_text(str(process.pid))
+
+        with FileLock(str(path), timeout=1, poll=0.05):
+            assert path.read_text() == str(os.getpid())
+
+    # 기본 stale_after는 timeout보다 짧아야 기다리던 워커가 포기하기 전에 락을 되찾음
+    def test_stale_before_timeout(self, tmp_path):
+        lock = FileLock(str(tmp_path / "state.lock"))
+
+        assert lock.stale_after < lock.timeout
@@ -2,6 +2,7 @@ import pytest
 
 from framework.config.locators import GmarketLocators
 from framework.pages.home_page import HomePage
+from framework.utils.round_trips import RoundTripCounter
 
 
 class TestBasePageNavigation:
@@ -121,6 +122,20 @@ class TestBasePageSafeActions:
         # 페이지가 여전히 gmarket인지 확인
         assert "gmarket" in homepage.page.url.lower()
 
+    # safe_click() 테스트 < hover_first = True >
+    def test_safe_click_with_hover_counts_round_trips(self, page):
+        counter = RoundTripCounter()
+        homepage = HomePage(page, round_trips=counter)
+        homepage.goto()
+
+        homepage.safe_click(GmarketLocators.LOGO)
+        homepage.safe_click(GmarketLocators.LOGO, hover_first=True)
+
+        # hover 없이 클릭 1회 + settle 대기, hover는 1회 추가
+        report = counter.report()["safe_click"]
+        assert report["calls"] == 2
+        assert report["round_trips"] >= 5
+
     # safe_type() 테스트
     @pytest.mark.smoke
     def test_safe_type_method(self, page):
@@ -242,3 +257,46 @@ class TestBasePageUtilities:
         # 메서드 체이닝 확인
         assert no_name_result == homepage
         assert name_result == homepage
+
+    # wait_for_settle() 테스트
+    def test_wait_for_settle_method(self, page):
+        homepage = HomePage(page)
+        homepage.goto()
+        homepage.should_be_on_homepage()
+
+        result = homepage.wait_for_settle(quiet_ms=200, timeout=5000)
+
+        # 메서드 체이닝 확인
+        assert result == homepage
+
+
+class TestBasePageRoundTrips:
+    # 검색 → 상품 → 장바구니 journey 전체의 왕복 횟수 (단계별 합이 journey에 합산되고 상한 안이어야 함)
+    @pytest.mark.cart
+    def test_journey_round_trips(self, page):
+        counter = RoundTripCounter()
+        homepage = HomePage(page, round_trips=counter)
+        homepage.visit().should_be_on_homepage()
+
+        steps = ("search_product", "click_product_by_index", "add_to_cart", "click_cart_button")
+        with counter.action("journey"):
+            with counter.action("search_product"):
+                search_page = homepage.search_product("마우스")
+                search_page.should_be_on_search_page()
+            with counter.action("click_product_by_index"):
+                product_page = search_page.click_product_by_index(1)
+                product_page.should_be_on_product_page()
+            with counter.action("add_to_cart"):
+                if product_page.add_to_cart(1) is False:
+                    pytest.skip("모든 옵션이 품절입니다")
+            with counter.action("click_cart_button"):
+                cart_page = product_page.click_cart_button()
+                cart_page.should_be_on_cart_page()
+                cart_page.get_cart_items()
+
+        report = counter.report()
+        assert all(report[step]["round_trips"] > 0 for step in ("search_product", "add_to_cart", "click_cart_button"))
+        assert report["journey"]["round_trips"] == sum(report[step]["round_trips"] for step in steps)
+        # 고정 sleep / 요소별 조회로 되돌아가면 넘게 되는 상한
+        assert report["journey"]["round_trips"] < 150
+        assert report["add_to_cart"]["round_trips"] < 20
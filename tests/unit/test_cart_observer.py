@@ -0,0 +1,175 @@
+import asyncio
+
+from framework.models.records import CartState
+from framework.utils.cart_observer import AsyncCartObserver, CartObserver
+
+CART = {
+    "items": [
+        {"index": 1, "itemId": "100", "title": "마우스", "price": 1000, "quantity": 2, "option": ""},
+        {"index": 2, "itemId": "200", "title": "키보드", "price": 5000, "quantity": 1, "option": ""},
+    ],
+    "items_price": 7000,
+    "shipping_fee": 3000,
+    "discount": 0,
+    "total": 10000,
+}
+
+
+class FakeRequest:
+    def __init__(self, resource_type):
+        self.resource_type = resource_type
+
+
+class FakeResponse:
+    def __init__(self, url, payload, resource_type="fetch", content_type="application/json", ok=True):
+        self.url = url
+        self.payload = payload
+        self.ok = ok
+        self.request = FakeRequest(resource_type)
+        self.headers = {"content-type": content_type}
+
+    def json(self):
+        return self.payload
+
+
+class FakeFrame:
+    def __init__(self, parent_frame=None):
+        self.parent_frame = parent_frame
+
+
+class AsyncResponse(FakeResponse):
+    async def json(self):
+        return self.payload
+
+
+class FakePage:
+    """wait_for_timeout() 동안 도착할 응답을 순서대로 흘려보내는 페이지"""
+
+    def __init__(self):
+        self.handlers = {}
+        self.arrivals = []
+        self.waits = 0
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def is_closed(self):
+        return False
+
+    def emit(self, response, event="response"):
+        for handler in self.handlers.get(event, []):
+            handler(response)
+
+    def wait_for_timeout(self, ms):
+        self.waits += 1
+        if self.arrivals:
+            self.emit(self.arrivals.pop(0))
+
+
+class TestCartState:
+    # from_payload() 테스트: 상품 가격은 수량을 곱한 금액
+    def test_from_payload(self):
+        state = CartState.from_payload(CART, source="/api/cart/add")
+
+        assert [item.item_id for item in state.items] == ["100", "200"]
+        assert state.items[0].price == 2000
+        assert state.items[0]["price_text"] == "2,000원"
+        assert state.quantity_of(1) == 2
+        assert state.quantity_of(3) is None
+        assert (state.items_price, state.shipping_fee, state.total) == (7000, 3000, 10000)
+
+    # 다른 키 이름 / data 래핑도 읽음
+    def test_from_payload_alternative_keys(self):
+        payload = {"data": {"cartItems": [{"goodsName": "A", "salePrice": "1,500", "qty": "3"}], "totalPrice": "7,500"}}
+
+        state = CartState.from_payload(payload)
+
+        assert state.items[0].title == "A"
+        assert state.items[0].price == 4500
+        assert state.items_price == 4500
+        assert state.total == 7500
+
+    # 장바구니 형태가 아니면 None
+    def test_rejects_other_payloads(self):
+        assert CartState.from_payload({"ok": True}) is None
+        assert CartState.from_payload([1, 2]) is None
+
+
+class TestCartObserver:
+    # 장바구니 API의 JSON 응답만 반영
+    def test_tracks_cart_responses_only(self):
+        page = FakePage()
+        observer = CartObserver(page)
+
+        page.emit(
+            FakeResponse("https://example.com/cart/", "<html>", resource_type="document", content_type="text/html")
+        )
+        page.emit(FakeResponse("https://example.com/api/search", CART))
+        page.emit(FakeResponse("https://example.com/api/cart/quantity", {"error": "x"}, ok=False))
+        assert observer.state is None
+
+        page.emit(FakeResponse("https://example.com/api/cart/add", CART))
+        assert observer.state.total == 10000
+        assert observer.version == 1
+
+    # 메인 프레임이 다른 문서로 이동하면 상태를 버림 (iframe 이동은 무시)
+    def test_navigation_resets_state(self):
+        page = FakePage()
+        observer = CartObserver(page)
+        page.emit(FakeResponse("https://example.com/api/cart/add", CART))
+
+        page.emit(FakeFrame(parent_frame=object()), event="framenavigated")
+        assert observer.state is not None
+
+        page.emit(FakeFrame(), event="framenavigated")
+        assert observer.state is None
+        assert observer.version == 1
+
+    # expect_update(): 블록에서 일으킨 변경의 응답까지 대기
+    def test_expect_update_waits_for_response(self):
+        page = FakePage()
+        observer = CartObserver(page)
+        page.emit(FakeResponse("https://example.com/api/cart/add", CART))
+
+        updated = dict(CART, items=CART["items"][:1], items_price=2000, total=5000)
+        page.arrivals = [FakeResponse("https://example.com/api/other", {}), FakeResponse("/api/cart/remove", updated)]
+        with observer.expect_update() as update:
+            pass
+
+        assert update.state.total == 5000
+        assert len(update.state.items) == 1
+        assert page.waits == 2
+
+    # cancel()이 True가 되면 응답을 기다리지 않음 (다이얼로그로 거부된 변경)
+    def test_expect_update_cancel(self):
+        page = FakePage()
+        observer = CartObserver(page)
+
+        with observer.expect_update(timeout=5000, cancel=lambda: True) as update:
+            pass
+
+        assert update.state is None
+        assert page.waits == 0
+
+    # 응답을 한 번도 못 본 페이지는 discovery_timeout까지만 대기
+    def test_discovery_timeout(self):
+        observer = CartObserver(FakePage(), discovery_timeout=0)
+
+        assert observer.wait_for_update(0, timeout=10000) is None
+
+
+class TestAsyncCartObserver:
+    # 비동기 응답 핸들러와 expect_update() 테스트
+    def test_expect_update(self):
+        page = FakePage()
+        observer = AsyncCartObserver(page, poll_ms=1)
+
+        async def scenario():
+            async with observer.expect_update(timeout=1000) as update:
+                await page.handlers["response"][0](AsyncResponse("https://example.com/api/cart/add", CART))
+            return update.state
+
+        state = asyncio.run(scenario())
+
+        assert state.total == 10000
+        assert observer.version == 1
@@ -54,6 +54,8 @@ class TestCartPageItems:
         assert cart_item["title"] != "", "상품명이 비어있습니다"
         assert cart_item["price"] != "", "가격이 비어있습니다"
         assert cart_item["index"] > 0, "인덱스가 유효하지 않습니다"
+        assert isinstance(cart_item.price, int), "가격이 정수로 변환되지 않았습니다"
+        assert cart_item.quantity >= 1, "수량이 유효하지 않습니다"
 
     # get_cart_items() 테스트
     @pytest.mark.slow
@@ -210,6 +212,40 @@ class TestCartPageQuantity:
         result = cart_page.update_quantity(1, 1000)
         assert not result
 
+    # set_quantities({index: quantity}) 테스트: 여러 상품 수량을 한 번에 변경
+    @pytest.mark.slow
+    def test_set_quantities(self, logged_in_page):
+        homepage = HomePage(logged_in_page)
+        homepage.visit().should_be_on_homepage()
+
+        cart_page = homepage.click_cart_button()
+        cart_page.should_be_on_cart_page()
+        cart_page.clear_cart()
+
+        homepage = cart_page.click_logo()
+        homepage.should_be_on_homepage()
+
+        for keyword in ["컵", "접시"]:
+            search_page = homepage.search_product(keyword)
+            search_page.should_be_on_search_page()
+
+            product_page = search_page.click_product_by_index(1)
+            product_page.should_be_on_product_page()
+            product_page.add_to_cart(1)
+
+            homepage = product_page.click_logo()
+            homepage.should_be_on_homepage()
+
+        cart_page = homepage.click_cart_button()
+        cart_page.should_be_on_cart_page()
+
+        result = cart_page.set_quantities({1: 3, 2: 2})
+        assert result is True, "수량 일괄 변경 실패"
+        assert [item.quantity for item in cart_page.get_cart_items(from_dom=True)] == [3, 2]
+
+        # 제한을 넘는 수량이 섞이면 False
+        assert cart_page.set_quantities({1: 1000, 2: 1}) is False
+
     # update_quantity(index, quantity) 테스트(index = 0)
     @pytest.mark.slow
     def test_zero_index_handling(self, logged_in_page):
@@ -403,6 +439,46 @@ class TestCartPageRemove:
         final_items = cart_page.get_cart_items()
         assert len(final_items) == 0, "장바구니가 비어있어야 합니다"
 
+    # remove_items(indices) 테스트: 한 번에 여러 상품 삭제
+    @pytest.mark.slow
+    def test_remove_items_in_one_pass(self, logged_in_page):
+        homepage = HomePage(logged_in_page)
+        homepage.visit().should_be_on_homepage()
+
+        cart_page = homepage.click_cart_button()
+        cart_page.should_be_on_cart_page()
+        cart_page.clear_cart()
+
+        homepage = cart_page.click_logo()
+        homepage.should_be_on_homepage()
+
+        # 상품 3개 추가
+        for keyword in ["램", "SSD", "그래픽카드"]:
+            search_page = homepage.search_product(keyword)
+            search_page.should_be_on_search_page()
+
+            product_page = search_page.click_product_by_index(1)
+            product_page.should_be_on_product_page()
+            product_page.add_to_cart(1)
+
+            homepage = product_page.click_logo()
+            homepage.should_be_on_homepage()
+
+        cart_page = homepage.click_cart_button()
+        cart_page.should_be_on_cart_page()
+        items = cart_page.get_cart_items()
+        assert len(items) == 3, "3개 상품이 있어야 합니다"
+
+        result = cart_page.remove_items([1, 3])
+        assert result is True, "상품 일괄 삭제 실패"
+
+        remaining = cart_page.get_cart_items()
+        assert [item.item_id for item in remaining] == [items[1].item_id], "두 번째 상품만 남아야 합니다"
+
+        # 없는 인덱스가 섞이면 아무것도 지우지 않음
+        assert cart_page.remove_items([1, 5]) is False
+        assert len(cart_page.get_cart_items()) == 1
+
     # remove_item(index) 테스트(없는 인덱스)
     @pytest.mark.slow
     def test_over_index_remove(self, logged_in_page):
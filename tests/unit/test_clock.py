@@ -0,0 +1,72 @@
+import asyncio
+import time
+
+import pytest
+
+from framework.aio.pages.home_page import HomePage as AsyncHomePage
+from framework.pages.home_page import HomePage
+from framework.pages.search_page import SearchPage
+from framework.utils.clock import Clock, VirtualClock
+from framework.utils.pacing import Pacer
+
+
+class FakePage:
+    """settle 감지 리스너 등록만 받아주는 가짜 페이지"""
+
+    def on(self, event, handler):
+        pass
+
+
+class TestVirtualClock:
+    # Clock은 추상 클래스 (now / sleep / sleep_async를 구현해야 생성 가능)
+    def test_clock_is_abstract(self):
+        with pytest.raises(TypeError):
+            Clock()
+
+    # sleep()은 즉시 반환하고 가상 시간을 앞당겨야 함
+    def test_sleep_advances_without_waiting(self):
+        clock = VirtualClock()
+        started = time.monotonic()
+
+        clock.sleep(30, site="test")
+
+        assert time.monotonic() - started < 1
+        assert clock.now() == 30
+        assert clock.report() == {"test": {"calls": 1, "seconds": 30}}
+
+    # 페이지 객체 메서드 이름으로 호출 위치가 기록되어야 함
+    def test_records_page_object_call_site(self):
+        clock = VirtualClock()
+        homepage = HomePage(FakePage(), pacer=Pacer("human"), delay_clock=clock)
+
+        homepage.human_delay(1, 1)
+
+        assert clock.report()["TestVirtualClock.test_records_page_object_call_site"]["seconds"] == 1
+
+    # 비동기 페이지 객체의 딜레이도 가상 시계로 기록되어야 함
+    def test_async_sleep_records_call_site(self):
+        clock = VirtualClock()
+        homepage = AsyncHomePage(FakePage(), pacer=Pacer("human"), delay_clock=clock)
+
+        async def journey():
+            await homepage.human_delay(2, 2)
+
+        started = time.monotonic()
+        asyncio.run(journey())
+
+        assert time.monotonic() - started < 1
+        assert clock.now() == 2
+        assert clock.report()["test_clock.py:journey"]["seconds"] == 2
+
+
+class TestClockInjection:
+    # 다른 페이지 객체로 이동해도 같은 clock/pacer를 공유해야 함
+    def test_spawn_shares_clock(self):
+        clock = VirtualClock()
+        pacer = Pacer("zero")
+        homepage = HomePage(FakePage(), pacer=pacer, delay_clock=clock)
+
+        search_page = homepage._spawn(SearchPage)
+
+        assert search_page.delay_clock is clock
+        assert search_page.pacer is pacer
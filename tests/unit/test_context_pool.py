@@ -0,0 +1,75 @@
+from framework.utils.context_pool import ContextPool
+
+
+class FakeContext:
+    """컨텍스트 풀이 사용하는 메서드만 흉내 낸 가짜 컨텍스트"""
+
+    def __init__(self, fail_reset=False):
+        self.pages = []
+        self.closed = False
+        self.cookies_cleared = 0
+        self.fail_reset = fail_reset
+
+    def on(self, event, handler):
+        pass
+
+    def clear_cookies(self):
+        if self.fail_reset:
+            raise RuntimeError("reset failed")
+        self.cookies_cleared += 1
+
+    def clear_permissions(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class TestContextPool:
+    # 반환한 컨텍스트는 초기화 후 재사용되어야 함
+    def test_reuses_released_context(self):
+        pool = ContextPool(FakeContext, max_uses=10)
+
+        first = pool.acquire()
+        pool.release(first)
+        second = pool.acquire()
+
+        assert second is first
+        assert first.cookies_cleared == 1
+        assert pool.stats()["created"] == 1
+        assert pool.stats()["reused"] == 1
+
+    # max_uses 번 사용한 컨텍스트는 닫고 새로 만들어야 함
+    def test_recycles_after_max_uses(self):
+        pool = ContextPool(FakeContext, max_uses=2)
+
+        first = pool.acquire()
+        pool.release(first)
+        pool.release(pool.acquire())
+        third = pool.acquire()
+
+        assert first.closed
+        assert third is not first
+        assert pool.stats()["recycled"] == 1
+
+    # 초기화에 실패한 컨텍스트는 버려야 함
+    def test_discards_context_when_reset_fails(self):
+        pool = ContextPool(lambda: FakeContext(fail_reset=True), max_uses=10)
+
+        first = pool.acquire()
+        pool.release(first)
+
+        assert first.closed
+        assert pool.acquire() is not first
+        assert pool.stats()["reset_failures"] == 1
+
+    # 닫기 직전에 on_close가 호출되어야 함 (재생성 / 풀 종료 모두)
+    def test_on_close_before_close(self):
+        closing = []
+        pool = ContextPool(FakeContext, max_uses=1, on_close=lambda context: closing.append(context.closed))
+
+        pool.release(pool.acquire())
+        pool.acquire()
+        pool.close()
+
+        assert closing == [False, False]
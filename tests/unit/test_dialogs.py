@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from framework.utils.dialogs import (
+    BINDING,
+    AsyncDialogManager,
+    DialogManager,
+    get_dialog_manager,
+)
+
+
+class FakeDialog:
+    def __init__(self, type="confirm", message="삭제하시겠습니까?", default_value=""):
+        self.type = type
+        self.message = message
+        self.default_value = default_value
+        self.handled = None
+
+    def accept(self, prompt_text=None):
+        self.handled = ("accept", prompt_text)
+
+    def dismiss(self):
+        self.handled = ("dismiss", None)
+
+
+class FakeFrame:
+    def __init__(self, parent_frame=None):
+        self.parent_frame = parent_frame
+
+
+class AsyncDialog(FakeDialog):
+    async def accept(self, prompt_text=None):
+        super().accept(prompt_text)
+
+    async def dismiss(self):
+        super().dismiss()
+
+
+class FakePage:
+    def __init__(self):
+        self.handlers = []
+        self.bindings = {}
+        self.init_scripts = []
+        self.policies = []
+
+    def on(self, event, handler):
+        self.handlers.append((event, handler))
+
+    def emit(self, dialog, event="dialog"):
+        for name, handler in self.handlers:
+            if name == event:
+                handler(dialog)
+        return dialog
+
+    def expose_binding(self, name, callback):
+        self.bindings[name] = callback
+
+    def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    def evaluate(self, script, arg=None):
+        self.policies.append(arg)
+
+
+class AsyncPage(FakePage):
+    async def expose_binding(self, name, callback):
+        super().expose_binding(name, callback)
+
+    async def add_init_script(self, script):
+        super().add_init_script(script)
+
+    async def evaluate(self, script, arg=None):
+        super().evaluate(script, arg)
+
+
+class TestDialogManager:
+    # 리스너는 페이지당 한 번만 등록
+    def test_single_listener_per_page(self):
+        page = FakePage()
+
+        assert get_dialog_manager(page) is get_dialog_manager(page)
+        assert page.handlers == [("dialog", get_dialog_manager(page)._on_dialog)]
+
+    # 블록 밖은 record(기록 후 취소), 블록 안은 지정한 정책 (중첩 시 안쪽 우선)
+    def test_scoped_policies(self):
+        page = FakePage()
+        manager = DialogManager(page)
+
+        assert page.emit(FakeDialog()).handled == ("dismiss", None)
+
+        with manager.accept() as outer:
+            assert page.emit(FakeDialog()).handled == ("accept", None)
+            with manager.policy("accept", prompt_text="3") as inner:
+                assert page.emit(FakeDialog("prompt")).handled == ("accept", "3")
+            with manager.dismiss():
+                assert page.emit(FakeDialog()).handled == ("dismiss", None)
+        assert manager.action == "record"
+
+        assert [event.action for event in manager.events] == ["record", "accept", "accept", "dismiss"]
+        assert [event.type for event in outer] == ["confirm", "prompt", "confirm"]
+        assert [event.type for event in inner] == ["prompt"]
+        assert manager.events[0]["message"] == "삭제하시겠습니까?"
+
+    # 예외가 나도 정책은 원래대로 돌아옴
+    def test_policy_restored_after_error(self):
+        manager = DialogManager(FakePage())
+
+        with pytest.raises(RuntimeError):
+            with manager.accept():
+                raise RuntimeError
+        assert manager.action == "record"
+
+        with pytest.raises(ValueError):
+            with manager.policy("ignore"):
+                pass
+
+    # preempt 모드: 정책이 바뀔 때만 페이지에 저장하고, 페이지 안에서 처리한 다이얼로그도 기록
+    def test_preempt(self):
+        page = FakePage()
+        manager = DialogManager(page, preempt=True)
+
+        with manager.accept() as events:
+            with manager.accept():
+                page.bindings[BINDING](None, {"type": "confirm", "message": "삭제?", "action": "accept"})
+        assert page.policies == [{"action": "accept", "promptText": None}, None]
+        assert len(page.init_scripts) == 1
+        assert events[0].source == "script"
+        assert manager.round_trips == 4
+
+    # 블록 안에서 메인 프레임이 이동하면 새 문서에 정책을 다시 적용 (블록 밖 / iframe 이동은 무시)
+    def test_preempt_resyncs_after_navigation(self):
+        page = FakePage()
+        manager = DialogManager(page, preempt=True)
+        policy = {"action": "accept", "promptText": None}
+
+        page.emit(FakeFrame(), event="framenavigated")
+        with manager.accept():
+            page.emit(FakeFrame(), event="framenavigated")
+            page.emit(FakeFrame(parent_frame=object()), event="framenavigated")
+        page.emit(FakeFrame(), event="framenavigated")
+
+        assert page.policies == [policy, policy, None]
+
+
+class TestAsyncDialogManager:
+    # 비동기 dialog 핸들러와 async with 정책 블록 테스트
+    def test_async_policy(self):
+        page = AsyncPage()
+        manager = AsyncDialogManager(page, preempt=True)
+        dialog = AsyncDialog()
+
+        async def scenario():
+            async with manager.accept() as events:
+                await page.handlers[0][1](dialog)
+            return events
+
+        events = asyncio.run(scenario())
+
+        assert dialog.handled == ("accept", None)
+        assert [event.action for event in events] == ["accept"]
+        assert page.policies == [{"action": "accept", "promptText": None}, None]
@@ -0,0 +1,77 @@
+import json
+import os
+
+import pytest
+
+from framework.utils.har import HarSettings
+
+
+def write_har(path, entries):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"log": {"version": "1.2", "pages": [], "entries": entries}}, f)
+
+
+class FakeContext:
+    def __init__(self):
+        self.routed = []
+
+    def route_from_har(self, path, not_found="abort"):
+        self.routed.append((path, not_found))
+
+
+class TestHarSettings:
+    # 녹화 모드는 테스트별 HAR 경로를 넘겨야 함
+    def test_record_options(self, tmp_path):
+        settings = HarSettings("record", directory=str(tmp_path))
+
+        options = settings.context_options("test_cart_page", "test_add[item-1]")
+
+        assert options["record_har_path"].endswith(os.path.join(".test_cart_page", "test_add_item-1_.har"))
+        assert options["service_workers"] == "block"
+
+    # 꺼져 있으면 아무 옵션도 추가하지 않음
+    def test_off_options(self):
+        settings = HarSettings()
+
+        assert not settings.enabled
+        assert settings.context_options("test_cart_page", "test_add") == {}
+
+    # 재생 모드는 모듈 HAR을 route_from_har로 연결해야 함
+    def test_attach_replay(self, tmp_path):
+        settings = HarSettings("replay", directory=str(tmp_path), not_found="fallback")
+        write_har(settings.module_path("test_home_page"), [])
+        context = FakeContext()
+
+        settings.attach(context, "test_home_page")
+
+        assert context.routed == [(settings.module_path("test_home_page"), "fallback")]
+
+    # 재생할 HAR이 없으면 에러
+    def test_attach_missing_har(self, tmp_path):
+        settings = HarSettings("replay", directory=str(tmp_path))
+
+        with pytest.raises(FileNotFoundError):
+            settings.attach(FakeContext(), "test_home_page")
+
+    # 알 수 없는 모드 테스트
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            HarSettings("stream")
+
+
+class TestHarMerge:
+    # 테스트별 HAR이 시간 순서대로 모듈 HAR 하나로 합쳐져야 함
+    def test_merge_recordings(self, tmp_path):
+        settings = HarSettings("record", directory=str(tmp_path))
+        first = settings.context_options("test_search_page", "test_b")["record_har_path"]
+        second = settings.context_options("test_search_page", "test_a")["record_har_path"]
+        write_har(first, [{"startedDateTime": "2026-01-01T00:00:02Z", "request": {"url": "b"}}])
+        write_har(second, [{"startedDateTime": "2026-01-01T00:00:01Z", "request": {"url": "a"}}])
+
+        paths = settings.merge_recordings()
+
+        assert paths == [settings.module_path("test_search_page")]
+        with open(paths[0], encoding="utf-8") as f:
+            entries = json.load(f)["log"]["entries"]
+        assert [entry["request"]["url"] for entry in entries] == ["a", "b"]
+        assert not os.path.exists(os.path.join(str(tmp_path), ".test_search_page"))
@@ -0,0 +1,110 @@
+import pytest
+
+from framework.history.__main__ import main
+from framework.history.regression import detect, robust_z
+from framework.history.store import HistoryStore
+
+GIT = ("abc1234", "main")
+
+
+def timings(p50):
+    bucket = {"mean": p50, "p50": p50, "p95": p50 * 1.5}
+    return {
+        "SearchPage.search_product": {
+            "calls": 3,
+            "wall": bucket,
+            "browser_wait": bucket,
+            "delay": {"mean": 0.0},
+            "python": {"mean": 0.01},
+        }
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    with HistoryStore(str(tmp_path / "history.sqlite")) as store:
+        yield store
+
+
+def record(store, duration, action=1.0, outcome="passed", environment="example.com:zero"):
+    return store.record_run(
+        environment,
+        {"tests/test_search.py::test_search": (outcome, duration)},
+        timings=timings(action),
+        pages={"/": {"visits": 1, "ttfb": 100, "lcp": 1200, "cls": 0.01, "inp": None, "total_blocking_time": 0}},
+        git=GIT,
+    )
+
+
+class TestHistoryStore:
+    # 실행 기록과 항목별 값 조회 테스트
+    def test_record_and_values(self, store):
+        run_id = record(store, 2.5)
+
+        run = store.latest_run("example.com:zero")
+        assert run["id"] == run_id
+        assert run["git_sha"] == "abc1234"
+        assert store.values("test", [run_id]) == {"tests/test_search.py::test_search": {run_id: 2.5}}
+        assert store.values("action_p95", [run_id]) == {"SearchPage.search_product": {run_id: 1.5}}
+        assert store.values("lcp", [run_id]) == {"/": {run_id: 1200}}
+        assert store.values("inp", [run_id]) == {}
+
+    # 실패한 테스트의 소요 시간은 비교하지 않음
+    def test_failed_tests_excluded(self, store):
+        run_id = record(store, 2.5, outcome="failed")
+
+        assert store.values("test", [run_id]) == {}
+
+    # baseline은 같은 환경의 이전 실행만 사용
+    def test_baseline_same_environment(self, store):
+        first = record(store, 1.0)
+        record(store, 1.0, environment="standin:zero")
+        current = record(store, 1.0)
+
+        assert store.baseline_runs(store.get_run(current), 10) == [first]
+
+
+class TestRegression:
+    # robust_z() 테스트: 이상치 하나가 기준을 흔들지 않아야 함
+    def test_robust_z(self):
+        assert robust_z(1.0, [1.0, 1.0, 1.0]) == 0.0
+        assert robust_z(2.0, [1.0, 1.0, 1.0]) == float("inf")
+        assert robust_z(1.2, [1.0, 1.1, 0.9, 1.0, 30.0]) == pytest.approx(1.35, abs=0.01)
+
+    # 느려진 테스트/메서드만 회귀로 판단
+    def test_detects_slowdown(self, store):
+        for duration in (2.0, 2.1, 1.9, 2.05, 1.95, 2.0):
+            record(store, duration)
+        record(store, 3.0, action=1.02)
+
+        regressions = detect(store, environment="example.com:zero")
+
+        assert [(r.series, r.key) for r in regressions] == [("test", "tests/test_search.py::test_search")]
+        assert regressions[0].baseline_median == 2.0
+        assert regressions[0].slowdown == pytest.approx(0.5)
+
+    # baseline 실행이 부족하거나 증가율이 작으면 회귀 아님
+    def test_ignores_small_or_unsupported_changes(self, store):
+        for duration in (2.0, 2.0, 2.0):
+            record(store, duration)
+        record(store, 3.0)
+        assert detect(store, environment="example.com:zero") == []
+
+        for duration in (2.0, 2.0):
+            record(store, duration)
+        record(store, 2.1)
+        assert detect(store, environment="example.com:zero", min_slowdown=0.1) == []
+
+
+class TestHistoryCli:
+    # check 명령 종료 코드: 회귀 있음 1, 없음 0, 기록 없음 2
+    def test_check_exit_codes(self, store, capsys):
+        for duration in (2.0, 2.1, 1.9, 2.05, 1.95):
+            record(store, duration)
+        assert main(["--db", store.path, "check"]) == 0
+
+        record(store, 4.0)
+        assert main(["--db", store.path, "check"]) == 1
+        assert "test_search" in capsys.readouterr().out
+
+        assert main(["--db", store.path + ".missing", "check"]) == 2
@@ -0,0 +1,121 @@
+import asyncio
+import random
+
+import pytest
+
+from framework.base.base_page import BasePage
+from framework.load.runner import LoadRunner, Schedule, Stage, ThinkTime
+from framework.utils.stats import percentile, summarize
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+
+    async def new_page(self):
+        return object()
+
+    async def close(self):
+        self.browser.closed += 1
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+
+    async def new_context(self, **options):
+        self.opened += 1
+        return FakeContext(self)
+
+
+class TestStats:
+    # percentile() 테스트
+    def test_percentile_interpolates(self):
+        values = list(range(1, 101))
+
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([], 95) == 0.0
+
+    # summarize() 테스트
+    def test_summarize(self):
+        summary = summarize([0.1, 0.2, 0.3])
+
+        assert summary["count"] == 3
+        assert summary["p50"] == 0.2
+        assert summary["max"] == 0.3
+
+
+class TestThinkTime:
+    # parse() 테스트
+    def test_parse(self):
+        think = ThinkTime.parse("uniform:1,3")
+
+        assert think.kind == "uniform"
+        assert think.params == (1.0, 3.0)
+
+    # 알 수 없는 분포는 거부
+    def test_rejects_unknown_kind(self):
+        with pytest.raises(ValueError):
+            ThinkTime.parse("gaussian:1")
+
+    # sample() 테스트
+    def test_sample_ranges(self):
+        rng = random.Random(0)
+
+        assert ThinkTime.parse("constant:2").sample(rng) == 2.0
+        assert all(1.0 <= ThinkTime.parse("uniform:1,3").sample(rng) <= 3.0 for _ in range(100))
+        assert all(0.0 <= ThinkTime("exponential", 2.0, max_seconds=5).sample(rng) <= 5 for _ in range(100))
+
+
+class TestSchedule:
+    # users_at() 테스트: 선형 ramp-up → 유지 → ramp-down
+    def test_ramp_up_hold_and_down(self):
+        schedule = Schedule([Stage(10, 10), Stage(20, 10), Stage(10, 0)])
+
+        assert schedule.users_at(0) == 0
+        assert schedule.users_at(5) == 5
+        assert schedule.users_at(15) == 10
+        assert schedule.users_at(35) == 5
+        assert schedule.users_at(100) == 0
+        assert schedule.total_duration == 40
+        assert schedule.max_users == 10
+
+
+class TestLoadRunner:
+    # run() 테스트: 단계별 지연 시간 / 실패 집계
+    def test_run_reports_steps(self):
+        async def journey(user, page):
+            await user.step("fast", asyncio.sleep(0.01, result=True))
+            await user.think()
+            await user.step("flaky", asyncio.sleep(0, result=user.rng.random() > 0.5))
+
+        browser = FakeBrowser()
+        runner = LoadRunner(journey=journey, stages=[Stage(0.2, 3), Stage(0.3, 3)], think_time="constant:0.01", seed=1)
+        report = asyncio.run(runner.run(browser))
+
+        assert report["peak_users"] == 3
+        assert report["steps"]["fast"]["count"] > 0
+        assert report["steps"]["fast"]["p50"] >= 0.01
+        assert report["steps"]["flaky"]["errors"] == report["failed_iterations"]
+        # 중단된 반복도 컨텍스트는 닫혀야 함
+        assert browser.closed == browser.opened
+        assert report["iterations"] + report["failed_iterations"] <= browser.closed
+
+    # 단계 밖의 예외도 실패한 반복으로 세고 가상 사용자는 계속 실행, base_url은 원래대로 복원
+    def test_unexpected_errors_counted(self):
+        async def journey(user, page):
+            raise RuntimeError("boom")
+
+        base_url = BasePage.base_url
+        browser = FakeBrowser()
+        runner = LoadRunner(
+            journey=journey, stages=[Stage(0.2, 2)], think_time="constant:0", base_url="http://127.0.0.1:1", tick=0.05
+        )
+        report = asyncio.run(runner.run(browser))
+
+        assert report["iterations"] == 0
+        assert report["failed_iterations"] > 2
+        assert browser.closed == browser.opened
+        assert BasePage.base_url == base_url
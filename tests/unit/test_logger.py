@@ -0,0 +1,63 @@
+import json
+import logging
+
+from framework.utils.logger import (
+    JsonlTestHandler,
+    Lazy,
+    _TestFilter,
+    get_logger,
+    set_current_test,
+)
+
+
+class TestLazy:
+    # 레벨이 꺼져 있으면 Lazy 값은 계산되지 않아야 함
+    def test_not_evaluated_when_disabled(self):
+        calls = []
+        logger = get_logger("framework.tests.lazy")
+        logger.setLevel(logging.WARNING)
+
+        logger.debug("값: %s", Lazy(lambda: calls.append(1)))
+
+        assert calls == []
+
+    # 레벨이 켜져 있으면 메시지를 만들 때 계산되어야 함
+    def test_evaluated_when_enabled(self):
+        logger = get_logger("framework.tests.lazy_enabled")
+        logger.setLevel(logging.DEBUG)
+        record = logger.makeRecord(logger.name, logging.DEBUG, __file__, 0, "값: %s", (Lazy(str.upper, "abc"),), None)
+
+        assert record.getMessage() == "값: ABC"
+
+
+class TestGetLogger:
+    # get_logger() 테스트
+    def test_names_under_gmarket(self):
+        assert get_logger("framework.pages.cart_page").name == "gmarket.pages.cart_page"
+
+
+class TestJsonlTestHandler:
+    # 테스트별 JSONL 파일에 기록되어야 함
+    def test_writes_per_test_files(self, tmp_path):
+        handler = JsonlTestHandler(str(tmp_path))
+        logger = logging.getLogger("gmarket.tests.jsonl")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        handler.addFilter(_TestFilter())
+        logger.addHandler(handler)
+        try:
+            set_current_test("tests/unit/test_cart.py::test_add[1]")
+            logger.info("장바구니 담기 %s개", 2)
+            set_current_test(None)
+            logger.warning("세션 로그")
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        lines = (tmp_path / "tests_unit_test_cart.py__test_add_1_.jsonl").read_text(encoding="utf-8").splitlines()
+        entry = json.loads(lines[0])
+        assert entry["message"] == "장바구니 담기 2개"
+        assert entry["level"] == "INFO"
+        assert entry["test"] == "tests/unit/test_cart.py::test_add[1]"
+        assert (tmp_path / "session.jsonl").exists()
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from framework.utils.pacing import Pacer, get_profile
+
+
+class TestPacingProfile:
+    # 프로필별 딜레이 변환 테스트
+    @pytest.mark.parametrize("profile,expected", [("human", 2.0), ("fast", 0.5), ("zero", 0.0)])
+    def test_profile_apply(self, profile, expected):
+        assert get_profile(profile).apply(2.0) == expected
+
+    # 알 수 없는 프로필 테스트
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError):
+            get_profile("turbo")
+
+
+class TestPacer:
+    # zero 프로필은 대기하지 않고 절약 시간을 기록해야 함
+    def test_zero_profile_records_saving(self):
+        pacer = Pacer("zero", rng=random.Random(0))
+        delay = pacer.delay(1, 3)
+
+        assert delay == 0
+        stats = pacer.report()["zero"]
+        assert stats["calls"] == 1
+        assert stats["saved"] == stats["requested"] > 0
+        assert stats["projected"]["human"] == 2.0
+
+    # 테스트별 예산을 넘기면 딜레이가 잘려야 함
+    def test_budget_clamps_delay(self):
+        pacer = Pacer("human", budget=1.5, rng=random.Random(0))
+        pacer.begin_test("budget")
+
+        total = sum(pacer.delay(1, 1) for _ in range(3))
+
+        assert total == 1.5
+        assert pacer.report()["human"]["over_budget"] == 2
+        assert pacer.end_test() == 1.5
+
+    # 안정화 대기에 쓴 시간도 actual로 기록 (requested와 같은 기준이라 saved가 부풀지 않음)
+    def test_record_includes_settle_time(self):
+        pacer = Pacer("zero", rng=random.Random(0))
+        pacer.begin_test("settle")
+
+        requested = pacer.pick(1, 1)
+        assert pacer.record(1, 1, requested, max(pacer.profile.apply(requested), 0.4)) == 0.4
+
+        stats = pacer.report()["zero"]
+        assert stats["requested"] == 1.0
+        assert stats["actual"] == 0.4
+        assert stats["saved"] == 0.6
+        assert pacer.end_test() == pytest.approx(0.4)
@@ -1,7 +1,37 @@
 import pytest
 
 from framework.pages.home_page import HomePage
-from framework.pages.product_page import ProductPage
+from framework.pages.product_page import ProductPage, is_add_cart_response
+
+
+class FakeLocator:
+    def __init__(self, page):
+        self.page = page
+        self.first = self
+
+    def count(self):
+        return 1 if self.page.has_plus else 0
+
+    def click(self):
+        self.page.clicks += 1
+
+
+class FakePage:
+    """수량 입력 스크립트 결과와 + 버튼 유무만 흉내내는 가짜 페이지"""
+
+    def __init__(self, value, has_plus=False):
+        self.value = value
+        self.has_plus = has_plus
+        self.clicks = 0
+
+    def on(self, event, handler):
+        pass
+
+    def evaluate(self, script, arg=None):
+        return self.value
+
+    def locator(self, selector):
+        return FakeLocator(self)
 
 
 class TestProductPageBasic:
@@ -41,6 +71,142 @@ class TestProductPageBasic:
         assert info["price"], "가격이 비어있습니다"
         assert info["shipping"], "배송 정보가 비어있습니다"
 
+    # get_product_info()는 evaluate 한 번, 옵션 목록은 처음 접근할 때 한 번만 읽음
+    @pytest.mark.smoke
+    def test_get_product_info_lazy_options(self, page):
+        homepage = HomePage(page)
+        homepage.visit()
+        search_page = homepage.search_product("마우스")
+        search_page.should_be_on_search_page()
+        product_page = search_page.click_product_by_index(1)
+        product_page.should_be_on_product_page()
+
+        with product_page.round_trips.action("product_info") as counter:
+            info = product_page.get_product_info()
+        assert counter.actions["product_info"][1] == 1
+        assert not info.options_loaded
+
+        assert info.price > 0
+        assert info.images, "상품 이미지가 없습니다"
+
+        with product_page.round_trips.action("product_options") as counter:
+            first = info.options
+            second = info.options
+        assert first is second
+        assert counter.actions["product_options"][1] == 1
+        assert all(option.name for option in first)
+
+
+class FakeRequest:
+    def __init__(self, method):
+        self.method = method
+        self.resource_type = "fetch"
+
+
+class FakeResponse:
+    def __init__(self, url, method="POST", ok=True):
+        self.url = url
+        self.request = FakeRequest(method)
+        self.ok = ok
+        self.status = 200 if ok else 500
+        self.headers = {}
+
+
+class SubmitLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+        self.first = self
+
+    def click(self):
+        self.page.emit_responses()
+
+    def is_visible(self):
+        self.page.visibility_checks += 1
+        return self.page.visibility_checks > self.page.popup_after
+
+
+class SubmitPage:
+    """담기 버튼을 누르면 responses를 보내고, popup_after번 확인한 뒤 팝업이 보이는 가짜 페이지"""
+
+    def __init__(self, responses=(), popup_after=0):
+        self.responses = list(responses)
+        self.popup_after = popup_after
+        self.visibility_checks = 0
+        self.waits = []
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.handlers[event].remove(handler)
+
+    def emit_responses(self):
+        for response in self.responses:
+            for handler in list(self.handlers.get("response", [])):
+                handler(response)
+
+    def locator(self, selector):
+        return SubmitLocator(self, selector)
+
+    def wait_for_timeout(self, ms):
+        self.waits.append(ms)
+
+
+class TestProductPageQuantity:
+    # 입력창이 값을 되돌리면 + 버튼으로 부족한 만큼만 클릭
+    def test_set_quantity_falls_back_to_plus(self):
+        page = FakePage("1", has_plus=True)
+
+        ProductPage(page)._set_quantity(3)
+
+        assert page.clicks == 2
+
+    # 입력창도 + 버튼도 없으면 명시적인 오류
+    def test_set_quantity_without_controls(self):
+        with pytest.raises(ValueError, match="수량 입력창과 \\+ 버튼이 없음"):
+            ProductPage(FakePage(None))._set_quantity(2)
+
+    # 사이트가 더 큰 값으로 조정해도 + 버튼은 누르지 않음
+    def test_set_quantity_clamped_by_site(self):
+        page = FakePage("5", has_plus=True)
+
+        ProductPage(page)._set_quantity(2)
+
+        assert page.clicks == 0
+
+
+class TestProductPageSubmit:
+    # 담기 API는 URL 경로로만 판단 (쿼리에 addCart가 있는 로그 비콘 / GET 요청 제외)
+    def test_add_cart_response_pattern(self):
+        assert is_add_cart_response(FakeResponse("http://127.0.0.1:8000/api/cart/add"))
+        assert is_add_cart_response(FakeResponse("https://cart.gmarket.co.kr/ko/pc/cart/AddCart?x=1"))
+        assert not is_add_cart_response(FakeResponse("https://log.gmarket.co.kr/log?evt=addCart"))
+        assert not is_add_cart_response(FakeResponse("http://127.0.0.1:8000/api/cart/add", method="GET"))
+
+    # 담기 응답이 오면 팝업을 기다리지 않고 응답 상태로 판단
+    def test_submit_uses_response(self):
+        page = SubmitPage([FakeResponse("https://log.example.com/log?evt=addCart"), FakeResponse("/api/cart/add")])
+
+        assert ProductPage(page)._submit_add_to_cart(timeout=10000) is True
+        assert page.visibility_checks == 0
+        # 응답 리스너는 끝나면 제거 (장바구니 감시기 리스너만 남음)
+        assert len(page.handlers["response"]) == 1
+
+    # 담기 응답이 없어도 팝업이 뜨는 즉시 성공 (timeout 전체를 기다리지 않음)
+    def test_submit_popup_wins(self):
+        page = SubmitPage([FakeResponse("https://log.example.com/log?evt=addCart")], popup_after=2)
+
+        assert ProductPage(page)._submit_add_to_cart(timeout=10000) is True
+        assert page.waits == [100, 100]
+
+    # 응답도 팝업도 없으면 timeout 후 실패
+    def test_submit_timeout(self):
+        page = SubmitPage(popup_after=10**6)
+
+        assert ProductPage(page)._submit_add_to_cart(timeout=0) is False
+
 
 class TestProductPageScroll:
     # scroll_and_explore() 테스트
@@ -108,6 +274,25 @@ class TestProductPageAddToCart:
 
         assert result is True, "옵션 선택 및 담기 실패"
 
+    # add_to_cart(20) 테스트: 수량은 직접 입력하므로 왕복 횟수가 수량에 비례하지 않아야 함
+    @pytest.mark.cart
+    def test_add_to_cart_large_quantity(self, page):
+        homepage = HomePage(page)
+        homepage.visit()
+        search_page = homepage.search_product("마우스")
+        search_page.should_be_on_search_page()
+        product_page = search_page.click_product_by_index(1)
+        product_page.should_be_on_product_page()
+
+        with product_page.round_trips.action("add_to_cart") as counter:
+            result = product_page.add_to_cart(20)
+
+        if result is False:
+            pytest.skip("모든 옵션이 품절입니다")
+
+        assert result is True, "옵션 선택 및 담기 실패"
+        assert counter.actions["add_to_cart"][1] < 20
+
 
 class TestProductPageNavigation:
     #
@@ -0,0 +1,64 @@
+import pytest
+
+from framework.utils.resource_policy import ResourceBlocker, get_policy
+
+
+class FakeRequest:
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = FakeRequest(resource_type, url)
+        self.result = None
+
+    def fallback(self):
+        self.result = "fallback"
+
+    def abort(self, error_code=None):
+        self.result = "abort"
+
+
+class TestResourcePolicy:
+    # 정책별 차단 여부 테스트
+    @pytest.mark.parametrize(
+        "policy,resource_type,url,blocked",
+        [
+            ("full", "image", "https://gdimg.gmarket.co.kr/a.jpg", False),
+            ("visual", "image", "https://gdimg.gmarket.co.kr/a.jpg", False),
+            ("visual", "script", "https://www.googletagmanager.com/gtm.js", True),
+            ("assertions-only", "image", "https://gdimg.gmarket.co.kr/a.jpg", True),
+            ("assertions-only", "document", "https://www.gmarket.co.kr/", False),
+            ("assertions-only", "xhr", "https://stats.g.doubleclick.net/collect", True),
+        ],
+    )
+    def test_should_block(self, policy, resource_type, url, blocked):
+        assert get_policy(policy).should_block(resource_type, url) is blocked
+
+    # 알 수 없는 정책 테스트
+    def test_unknown_policy(self):
+        with pytest.raises(ValueError):
+            get_policy("nothing")
+
+
+class TestResourceBlocker:
+    # 차단한 요청 수와 추정 바이트가 기록되어야 함
+    def test_counts_blocked_requests(self):
+        blocker = ResourceBlocker("assertions-only")
+        routes = [
+            FakeRoute("image", "https://gdimg.gmarket.co.kr/a.jpg"),
+            FakeRoute("font", "https://script.gmarket.co.kr/font.woff2"),
+            FakeRoute("document", "https://www.gmarket.co.kr/"),
+        ]
+
+        for route in routes:
+            blocker._handle(route)
+
+        assert [route.result for route in routes] == ["abort", "abort", "fallback"]
+        stats = blocker.stats()
+        assert stats["blocked_requests"] == 2
+        assert stats["allowed_requests"] == 1
+        assert stats["blocked_bytes_estimated"] > 0
+        assert stats["by_type"] == {"image": 1, "font": 1}
@@ -0,0 +1,57 @@
+import asyncio
+
+from framework.utils.round_trips import RoundTripCounter
+
+
+class TestRoundTripCounter:
+    # 액션별 왕복 횟수 집계 테스트
+    def test_counts_per_action(self):
+        counter = RoundTripCounter()
+
+        for _ in range(2):
+            with counter.action("safe_click"):
+                counter.hit()
+                counter.hit(2)
+
+        assert counter.report()["safe_click"] == {"calls": 2, "round_trips": 6, "per_call": 3.0}
+
+    # 중첩된 액션은 바깥 액션에도 합산되어야 함
+    def test_nested_actions_roll_up(self):
+        counter = RoundTripCounter()
+
+        with counter.action("journey"):
+            with counter.action("safe_type"):
+                counter.hit(2)
+            with counter.action("safe_click"):
+                counter.hit()
+            counter.hit()
+
+        report = counter.report()
+        assert report["journey"]["round_trips"] == 4
+        assert report["safe_type"]["round_trips"] == 2
+
+    # 액션 밖의 호출은 <untracked>로 기록
+    def test_untracked_hits(self):
+        counter = RoundTripCounter()
+        counter.hit()
+
+        assert counter.report()["<untracked>"]["round_trips"] == 1
+
+    # 동시에 실행되는 코루틴의 액션은 서로 섞이지 않아야 함
+    def test_concurrent_actions_are_isolated(self):
+        counter = RoundTripCounter()
+
+        async def journey(name, hits):
+            with counter.action(name):
+                for _ in range(hits):
+                    counter.hit()
+                    await asyncio.sleep(0)
+
+        async def main():
+            await asyncio.gather(journey("first", 3), journey("second", 5))
+
+        asyncio.run(main())
+
+        report = counter.report()
+        assert report["first"]["round_trips"] == 3
+        assert report["second"]["round_trips"] == 5
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+from framework.utils.screenshots import ScreenshotService
+
+
+class FakeLocator:
+    def __init__(self, page, selector):
+        self.page = page
+        self.selector = selector
+
+    def screenshot(self, **options):
+        self.page.calls.append(("element", self.selector, options))
+        return f"element:{self.selector}".encode()
+
+
+class FakePage:
+    def __init__(self, image=b"image"):
+        self.image = image
+        self.calls = []
+
+    def screenshot(self, **options):
+        self.calls.append(("page", None, options))
+        return self.image
+
+    def locator(self, selector):
+        return FakeLocator(self, selector)
+
+
+class TestScreenshotService:
+    # capture() 테스트: 백그라운드 스레드가 파일을 저장
+    def test_capture_writes_in_background(self, tmp_path):
+        service = ScreenshotService(directory=str(tmp_path), image_format="jpeg", quality=60)
+        page = FakePage()
+
+        path = service.capture(page, "cart")
+        service.flush()
+
+        assert os.path.basename(path) == "cart_main_0001.jpg"
+        assert (tmp_path / "cart_main_0001.jpg").read_bytes() == b"image"
+        assert page.calls[0][2] == {"type": "jpeg", "quality": 60, "full_page": False}
+        service.close()
+
+    # 내용이 같은 스크린샷은 다시 저장하지 않음
+    def test_skips_duplicates(self, tmp_path):
+        service = ScreenshotService(directory=str(tmp_path), image_format="png")
+        page = FakePage()
+
+        first = service.capture(page, "home")
+        second = service.capture(page, "home")
+        service.close()
+
+        assert first == second
+        assert service.stats()["duplicates"] == 1
+        assert len(os.listdir(tmp_path)) == 1
+
+    # 저장에 실패한 스크린샷은 중복 판정에 쓰지 않음 (없는 파일 경로를 돌려주지 않음)
+    def test_failed_write_not_deduped(self, tmp_path):
+        blocked = tmp_path / "blocked"
+        blocked.write_text("not a directory")
+        service = ScreenshotService(directory=str(blocked / "shots"), image_format="png")
+
+        first = service.submit(b"data", "home")
+        service.flush()
+        second = service.submit(b"data", "home")
+        service.close()
+
+        assert first != second
+        assert service.stats()["failures"] == 2
+        assert service.stats()["duplicates"] == 0
+
+    # selector를 주면 요소 영역만 촬영
+    def test_element_clip(self, tmp_path):
+        service = ScreenshotService(directory=str(tmp_path), image_format="png")
+        page = FakePage()
+
+        service.capture(page, "logo", selector="#logo")
+        service.close()
+
+        assert page.calls == [("element", "#logo", {"type": "png"})]
+
+    # xdist 워커 id가 파일명에 들어가야 함
+    def test_name_includes_worker(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        service = ScreenshotService(directory=str(tmp_path), image_format="png")
+
+        path = service.submit(b"data", "test_login[chromium]")
+        service.close()
+
+        assert os.path.basename(path) == "test_login_chromium__gw3_0001.png"
+
+    # 알 수 없는 형식은 거부
+    def test_rejects_unknown_format(self):
+        with pytest.raises(ValueError):
+            ScreenshotService(image_format="gif")
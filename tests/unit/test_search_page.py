@@ -1,6 +1,63 @@
 import pytest
 
+from framework.models.records import ProductCard
 from framework.pages.home_page import HomePage
+from framework.pages.search_page import SearchPage
+
+
+class ClampingPage:
+    """p가 범위를 넘으면 마지막 페이지를 다시 보여주는 검색 결과 페이지 (page_number번 페이지)"""
+
+    def __init__(self, page_number, last_page=3):
+        self.page_number = min(page_number, last_page)
+        self.url = f"https://example.com/n/search?keyword=a&p={page_number}"
+        self.closed = False
+
+    def on(self, event, handler):
+        pass
+
+    def cards(self):
+        return [
+            ProductCard(position, f"상품 {position}", 1000, f"/item?goodscode={position}", str(position))
+            for position in range(self.page_number * 10 - 9, self.page_number * 10 + 1)
+        ]
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSearchPage(SearchPage):
+    """페이지 이동 대신 ClampingPage를 여는 검색 페이지"""
+
+    def __init__(self):
+        super().__init__(ClampingPage(1))
+        self.opened = []
+
+    def _extract_cards(self, page, offset=0, limit=None):
+        return page.cards()
+
+    def _start_loading(self, page_number):
+        self.opened.append(ClampingPage(page_number))
+        return self.opened[-1]
+
+    def _wait_for_results(self, page, timeout):
+        pass
+
+
+class TestSearchPagePagination:
+    # 범위를 넘은 p를 마지막 페이지로 돌려줘도 새 상품이 없으면 종료 (무한 반복 / 탭 누적 없음)
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_stops_when_site_clamps_page(self, prefetch):
+        search_page = FakeSearchPage()
+
+        cards = list(search_page.iter_products(max_items=100, prefetch=prefetch))
+
+        assert len(cards) == 30
+        assert len(search_page.opened) <= 4
+        assert all(page.closed for page in search_page.opened)
 
 
 class TestSearchPageBasic:
@@ -226,6 +283,46 @@ class TestSearchPageProductTitles:
 
 
 class TestSearchPageProductInfo:
+    # extract_cards() 테스트
+    @pytest.mark.parametrize("limit", [None, 5])
+    def test_extract_cards(self, page, limit):
+        homepage = HomePage(page)
+        homepage.visit()
+        homepage.should_be_on_homepage()
+
+        search_page = homepage.search_product("키보드")
+        search_page.should_be_on_search_page()
+
+        cards = search_page.extract_cards(limit)
+
+        assert len(cards) > 0, "검색 결과 카드를 가져오지 못했습니다"
+        if limit:
+            assert len(cards) <= limit, f"제한({limit}개)을 초과했습니다"
+        assert [card.position for card in cards] == list(range(1, len(cards) + 1)), "카드 순서가 올바르지 않습니다"
+        assert all(card.title for card in cards), "빈 상품명이 있습니다"
+        assert all(isinstance(card.price, int) for card in cards), "가격이 정수로 변환되지 않았습니다"
+
+    # iter_products() 테스트
+    @pytest.mark.slow
+    @pytest.mark.parametrize("mode", ["paginate", "scroll"])
+    def test_iter_products(self, page, mode):
+        homepage = HomePage(page)
+        homepage.visit()
+        homepage.should_be_on_homepage()
+
+        search_page = homepage.search_product("마우스")
+        search_page.should_be_on_search_page()
+
+        cards = list(search_page.iter_products(max_items=120, mode=mode, max_pages=5))
+
+        assert len(cards) > 0, "상품을 가져오지 못했습니다"
+        assert len(cards) <= 120, "max_items를 초과했습니다"
+        assert len({card.item_id for card in cards}) == len(cards), "중복 상품이 있습니다"
+        assert [card.position for card in cards] == list(range(1, len(cards) + 1)), "순위가 올바르지 않습니다"
+
+        # 미리 열었던 페이지가 모두 정리되어야 함
+        assert page.context.pages == [page]
+
     #  get_product_title(index) 테스트
     @pytest.mark.parametrize("index", [1, 0, 10000])
     def test_get_product_title_multiple(self, page, index):
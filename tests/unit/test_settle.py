@@ -0,0 +1,64 @@
+from playwright.sync_api import Error
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from framework.utils.settle import INIT_SCRIPT, SettleDetector
+
+
+class FakePage:
+    """wait_for_function()이 errors 순서대로 예외를 던지는 가짜 페이지"""
+
+    def __init__(self, errors=()):
+        self.errors = list(errors)
+        self.function_calls = 0
+        self.waits = []
+        self.init_scripts = []
+
+    def on(self, event, handler):
+        pass
+
+    def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    def is_closed(self):
+        return False
+
+    def wait_for_function(self, script, arg=None, timeout=None):
+        self.function_calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+
+    def wait_for_timeout(self, ms):
+        self.waits.append(ms)
+
+
+class TestSettleDetector:
+    # 네비게이션 중 실행 컨텍스트 오류는 잠깐 쉬고 재시도
+    def test_backs_off_on_navigation_error(self):
+        page = FakePage([Error("Execution context was destroyed"), Error("Execution context was destroyed")])
+
+        assert SettleDetector(page, poll_ms=50).wait(timeout=5000) is True
+        assert page.function_calls == 3
+        assert page.waits == [50, 50]
+
+    # wait_for_function timeout은 곧 전체 timeout이므로 바로 False
+    def test_timeout_returns_false(self):
+        page = FakePage([PlaywrightTimeoutError("timeout")])
+
+        assert SettleDetector(page).wait(timeout=5000) is False
+        assert page.function_calls == 1
+        assert page.waits == []
+
+    # MutationObserver는 init script로 한 번만 설치 (새 문서마다 시작 시점부터 기록)
+    def test_installs_init_script_once(self):
+        page = FakePage()
+        detector = SettleDetector(page)
+
+        detector.wait()
+        detector.wait()
+
+        assert page.init_scripts == [INIT_SCRIPT]
+        assert detector.round_trips == 3
+
+    # 속성 변경(캐러셀 / 광고 회전)은 DOM 변경으로 보지 않음
+    def test_ignores_attribute_mutations(self):
+        assert "attributes" not in INIT_SCRIPT
@@ -0,0 +1,137 @@
+import json
+import re
+import time
+from urllib.request import HTTPCookieProcessor, Request, build_opener
+
+import pytest
+
+from framework.config import locators
+from framework.standin import pages
+from framework.standin.server import StandinServer
+from framework.standin.store import CartLine, Catalog, StandinConfig
+
+
+@pytest.fixture
+def server():
+    with StandinServer(StandinConfig(result_count=45, page_size=20, cart_size=2)) as server:
+        yield server
+
+
+def client():
+    return build_opener(HTTPCookieProcessor())
+
+
+def get(opener, url):
+    with opener.open(url) as response:
+        return response.read().decode("utf-8")
+
+
+def post(opener, url, data):
+    request = Request(url, json.dumps(data).encode("utf-8"), {"Content-Type": "application/json"})
+    with opener.open(request) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+class TestStandinPages:
+    # locators.py의 모든 id/class가 스탠드인 페이지 DOM에 있어야 함
+    def test_dom_matches_locators(self):
+        catalog = Catalog(StandinConfig())
+        products = catalog.search("마우스")
+        with_options = next(product for product in products if product.options)
+        lines = [CartLine(product, 2) for product in products[:2]]
+        summary = {"items_price": 1000, "shipping_fee": 3000, "discount": 0, "total": 4000}
+
+        html = "".join(
+            [
+                pages.home_page(False),
+                pages.home_page(True),
+                pages.search_page("마우스", products[:5], {"keyword": "마우스"}, False, True),
+                pages.search_page("뭭뤡", [], {"keyword": "뭭뤡"}, False, True),
+                pages.item_page(with_options, False, True),
+                pages.cart_page(lines, summary, False, True, 99),
+                pages.login_page(),
+            ]
+        )
+
+        selectors = []
+        for name in (
+            "GmarketLocators",
+            "SearchPageLocators",
+            "ProductPageLocators",
+            "CartPageLocators",
+            "LoginPageLocators",
+        ):
+            for key, value in vars(getattr(locators, name)).items():
+                if key.startswith("_"):
+                    continue
+                if isinstance(value, str):
+                    selectors.append(value)
+                elif isinstance(value, list):
+                    selectors.extend(value)
+
+        missing = []
+        for selector in selectors:
+            for kind, token in re.findall(r"([#.])([\w-]+)", selector):
+                pattern = f'id="{token}"' if kind == "#" else rf'class="[^"]*\b{re.escape(token)}\b'
+                if not re.search(pattern, html):
+                    missing.append(f"{kind}{token}")
+        assert missing == []
+
+
+class TestStandinServer:
+    # 검색 결과는 page_size 단위로 나뉘고 p 파라미터로 이동
+    def test_search_pagination(self, server):
+        opener = client()
+        card = "box__component-itemcard--general"
+
+        first = get(opener, f"{server.url}/search?keyword=%EB%A7%88%EC%9A%B0%EC%8A%A4")
+        last = get(opener, f"{server.url}/search?keyword=%EB%A7%88%EC%9A%B0%EC%8A%A4&p=3")
+        more = json.loads(get(opener, f"{server.url}/api/search?keyword=%EB%A7%88%EC%9A%B0%EC%8A%A4&p=2"))
+
+        assert first.count(card) == 20
+        assert last.count(card) == 5
+        assert more["hasMore"] is True
+
+    # 장바구니 API 추가/수량/삭제 테스트
+    def test_cart_api(self, server):
+        opener = client()
+
+        cart = json.loads(get(opener, f"{server.url}/api/cart"))
+        assert len(cart["items"]) == 2
+
+        cart = post(opener, f"{server.url}/api/cart/add", {"itemId": "123400001", "quantity": 2})
+        assert cart["items"][-1]["quantity"] == 2
+
+        cart = post(opener, f"{server.url}/api/cart/quantity", {"index": 1, "quantity": 5})
+        assert cart["items"][0]["quantity"] == 5
+
+        cart = post(opener, f"{server.url}/api/cart/remove", {"index": 1})
+        assert len(cart["items"]) == 2
+        assert cart["total"] == sum(item["price"] * item["quantity"] for item in cart["items"]) + cart["shipping_fee"]
+
+    # 세션(쿠키)마다 장바구니가 분리되어야 함
+    def test_cart_per_session(self, server):
+        first, second = client(), client()
+
+        post(first, f"{server.url}/api/cart/clear", {})
+
+        assert json.loads(get(first, f"{server.url}/api/cart"))["items"] == []
+        assert len(json.loads(get(second, f"{server.url}/api/cart"))["items"]) == 2
+
+    # 로그인 후 로그아웃 버튼이 보여야 함
+    def test_login(self, server):
+        opener = client()
+        request = Request(f"{server.url}/login", "id=user&password=pw".encode("utf-8"))
+
+        with opener.open(request) as response:
+            html = response.read().decode("utf-8")
+
+        assert "로그아웃" in html
+
+    # 인위적인 지연 설정 테스트
+    def test_latency(self):
+        with StandinServer(StandinConfig(latency_ms=100)) as server:
+            started = time.monotonic()
+            get(client(), f"{server.url}/")
+
+        assert time.monotonic() - started >= 0.1
@@ -0,0 +1,95 @@
+from framework.pages.home_page import HomePage
+from framework.pages.search_page import SearchPage
+from framework.utils.clock import VirtualClock
+from framework.utils.pacing import Pacer
+from framework.utils.timing import ActionTimer, instrument, to_prometheus
+
+
+class FakePage:
+    """settle 감지 리스너 등록만 받아주는 가짜 페이지"""
+
+    def on(self, event, handler):
+        pass
+
+
+class TestActionTimer:
+    # record() 테스트: 나머지 시간은 browser_wait로 분류
+    def test_record_splits_buckets(self):
+        timer = ActionTimer()
+        timer.record("HomePage.visit", wall=1.0, delay=0.3, python=0.1)
+
+        report = timer.report()["HomePage.visit"]
+        assert report["calls"] == 1
+        assert report["browser_wait"]["p50"] == 0.6
+        assert report["delay"]["p50"] == 0.3
+
+    # 가상 시계 딜레이는 실제 시간에서 빼지 않아야 함
+    def test_virtual_delay_not_subtracted(self):
+        timer = ActionTimer()
+        timer.record("BasePage.human_delay", wall=0.01, delay=2.0, python=0.0, virtual=True)
+
+        assert timer.report()["BasePage.human_delay"]["browser_wait"]["p50"] == 0.01
+
+    # merge() 테스트: 워커별 원본 측정값을 합쳐 백분위수 계산
+    def test_merge_worker_samples(self):
+        first, second = ActionTimer(), ActionTimer()
+        for seconds in range(1, 51):
+            first.record("CartPage.remove_item", wall=seconds)
+        for seconds in range(51, 101):
+            second.record("CartPage.remove_item", wall=seconds)
+
+        merged = ActionTimer().merge(first.samples).merge(second.samples)
+
+        assert merged.report()["CartPage.remove_item"]["wall"]["p50"] == 50.5
+
+    # to_prometheus() 테스트
+    def test_prometheus_textfile(self):
+        timer = ActionTimer()
+        timer.record("HomePage.visit", wall=2.0)
+
+        text = to_prometheus(timer.report())
+
+        assert "# TYPE gmarket_page_action_seconds summary" in text
+        assert 'gmarket_page_action_seconds{method="HomePage.visit",bucket="wall",quantile="0.95"} 2.0' in text
+        assert 'gmarket_page_action_seconds_count{method="HomePage.visit",bucket="wall"} 1' in text
+
+
+class TestInstrument:
+    # 페이지 객체의 public 메서드는 자동으로 측정되어야 함
+    def test_page_objects_are_instrumented(self):
+        assert hasattr(HomePage.visit, "__wrapped__")
+        assert hasattr(SearchPage.click_product_by_index, "__wrapped__")
+        assert hasattr(HomePage.human_delay, "__wrapped__")
+        assert not hasattr(HomePage._pause, "__wrapped__")
+        # 제너레이터는 측정하지 않음
+        assert not hasattr(SearchPage.iter_products, "__wrapped__")
+
+    # 딜레이 시간은 clock.slept 증가분으로 기록
+    def test_delay_recorded_from_clock(self):
+        timer = ActionTimer()
+        homepage = HomePage(FakePage(), pacer=Pacer("human"), delay_clock=VirtualClock(), timer=timer)
+
+        homepage.human_delay(1, 1)
+
+        report = timer.report()
+        assert report["BasePage.human_delay"]["delay"]["p50"] == 1.0
+
+    # _spawn()으로 만든 페이지 객체도 같은 타이머를 사용해야 함
+    def test_spawn_shares_timer(self):
+        timer = ActionTimer()
+        homepage = HomePage(FakePage(), pacer=Pacer("zero"), delay_clock=VirtualClock(), timer=timer)
+
+        assert homepage._spawn(SearchPage).timer is timer
+
+    # 이미 감싼 메서드는 다시 감싸지 않음
+    def test_instrument_is_idempotent(self):
+        class Dummy:
+            def run(self):
+                return "ok"
+
+        instrument(Dummy)
+        wrapped = Dummy.run
+        instrument(Dummy)
+
+        assert Dummy.run is wrapped
+        assert Dummy().run() == "ok"
@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from framework.utils.tracing import TraceRecorder
+
+
+class FakeTracing:
+    def __init__(self):
+        self.starts = 0
+        self.chunk_titles = []
+
+    def start(self, screenshots=True, snapshots=True):
+        self.starts += 1
+
+    def start_chunk(self, title=None):
+        self.chunk_titles.append(title)
+
+    def stop_chunk(self, path=None):
+        if path:
+            with open(path, "wb") as f:
+                f.write(b"trace")
+
+    def stop(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+class TestTraceRecorder:
+    # 통과한 테스트는 trace 파일을 남기지 않아야 함
+    def test_pass_discards_chunk(self, tmp_path):
+        recorder = TraceRecorder(directory=str(tmp_path))
+        context = FakeContext()
+
+        recorder.begin(context, "tests/test_a.py::test_ok")
+        paths = recorder.end(context, "tests/test_a.py::test_ok", failed=False)
+
+        assert paths == []
+        assert os.listdir(tmp_path) == []
+        assert recorder.stats()["discarded"] == 1
+
+    # 실패한 테스트는 trace zip을 저장해야 함
+    def test_failure_persists_chunk(self, tmp_path):
+        recorder = TraceRecorder(directory=str(tmp_path))
+        context = FakeContext()
+
+        recorder.begin(context, "tests/test_a.py::test_fail")
+        paths = recorder.end(context, "tests/test_a.py::test_fail", failed=True)
+
+        assert paths == [str(tmp_path / "tests_test_a.py__test_fail.zip")]
+        assert recorder.stats()["persisted"] == 1
+        assert recorder.stats()["persisted_bytes"] == 5
+
+    # 같은 컨텍스트(풀 재사용)는 tracing.start()를 한 번만 호출
+    def test_starts_tracing_once_per_context(self, tmp_path):
+        recorder = TraceRecorder(directory=str(tmp_path))
+        context = FakeContext()
+
+        for name in ("test_1", "test_2"):
+            recorder.begin(context, name)
+            recorder.end(context, name, failed=False)
+
+        assert context.tracing.starts == 1
+        assert context.tracing.chunk_titles == ["test_1", "test_2"]
+
+    # keep_chunks 만큼 직전 테스트 청크도 함께 남겨야 함
+    def test_ring_buffer_keeps_previous_chunks(self, tmp_path):
+        recorder = TraceRecorder(directory=str(tmp_path / "traces"), keep_chunks=2)
+        context = FakeContext()
+
+        for name in ("test_1", "test_2"):
+            recorder.begin(context, name)
+            recorder.end(context, name, failed=False)
+        recorder.begin(context, "test_3")
+        paths = recorder.end(context, "test_3", failed=True)
+        recorder.close()
+
+        assert [os.path.basename(path) for path in paths] == ["test_3.zip", "test_3-prev-1-test_2.zip"]
+        assert recorder.stats()["discarded"] == 1
+
+    # off 모드에서는 tracing API를 호출하지 않음
+    def test_off_mode(self):
+        recorder = TraceRecorder("off")
+        context = FakeContext()
+
+        recorder.begin(context, "test")
+
+        assert recorder.end(context, "test", failed=True) == []
+        assert context.tracing.starts == 0
+
+    # 잘못된 설정은 거부
+    def test_rejects_invalid_settings(self):
+        with pytest.raises(ValueError):
+            TraceRecorder("always")
+        with pytest.raises(ValueError):
+            TraceRecorder(keep_chunks=0)
@@ -0,0 +1,170 @@
+from framework.utils.context_pool import ContextPool
+from framework.utils.web_vitals import (
+    BINDING,
+    VitalsCollector,
+    html_table,
+    rate,
+    summarize_by_path,
+)
+
+
+def navigation(url, **metrics):
+    data = {"url": url, "ttfb": 100, "lcp": 1200, "cls": 0.01, "inp": None, "total_blocking_time": 0}
+    data.update(metrics)
+    data["resources"] = {"count": 10, "transfer_size": 20480}
+    return data
+
+
+class FakePage:
+    def __init__(self, data):
+        self.data = data
+
+    def is_closed(self):
+        return False
+
+    def evaluate(self, script):
+        data, self.data = self.data, None
+        return data
+
+
+class FakeContext:
+    def __init__(self):
+        self.bindings = {}
+        self.scripts = []
+        self.pages = []
+
+    def expose_binding(self, name, callback):
+        self.bindings[name] = callback
+
+    def add_init_script(self, script):
+        self.scripts.append(script)
+
+
+class ResetPage:
+    """풀 초기화용 페이지: 다음 origin으로 이동할 때마다 이전 문서의 pagehide 보고를 흉내 냄"""
+
+    def __init__(self, context):
+        self.context = context
+        self.url = None
+
+    def route(self, pattern, handler):
+        pass
+
+    def goto(self, url, wait_until=None):
+        self.close()
+        self.url = url
+
+    def evaluate(self, script):
+        pass
+
+    def close(self):
+        if self.url:
+            self.context.bindings[BINDING](None, navigation(self.url))
+            self.url = None
+
+
+class PooledFakeContext(FakeContext):
+    """ContextPool과 VitalsCollector가 함께 쓰는 가짜 컨텍스트"""
+
+    def on(self, event, handler):
+        pass
+
+    def clear_cookies(self):
+        pass
+
+    def clear_permissions(self):
+        pass
+
+    def new_page(self):
+        return ResetPage(self)
+
+
+class TestRate:
+    # rate() 테스트
+    def test_thresholds(self):
+        assert rate("lcp", 2000) == "good"
+        assert rate("lcp", 3000) == "needs-improvement"
+        assert rate("cls", 0.3) == "poor"
+        assert rate("inp", None) is None
+
+
+class TestVitalsCollector:
+    # 컨텍스트마다 한 번만 설치 (풀 재사용)
+    def test_install_once_per_context(self):
+        collector = VitalsCollector()
+        context = FakeContext()
+
+        collector.install(context).install(context)
+
+        assert len(context.scripts) == 1
+        assert BINDING in context.bindings
+
+    # pagehide 보고와 열린 페이지 요약을 모두 테스트 기록으로 모아야 함
+    def test_collects_reported_and_open_pages(self):
+        collector = VitalsCollector()
+        context = FakeContext()
+        collector.install(context).begin("test_search")
+
+        context.bindings[BINDING](None, navigation("https://example.com/"))
+        context.pages.append(FakePage(navigation("https://example.com/n/search?keyword=a")))
+        navigations = collector.end(context)
+
+        assert [entry["url"] for entry in navigations] == [
+            "https://example.com/",
+            "https://example.com/n/search?keyword=a",
+        ]
+        assert all(entry["test"] == "test_search" for entry in navigations)
+        assert not collector.active
+        assert collector.end(context) == []
+
+    # 테스트 밖에서 온 보고와 풀 초기화 페이지(/__context_reset__)는 기록하지 않음
+    def test_ignores_pool_reset_navigations(self):
+        collector = VitalsCollector()
+        pool = ContextPool(PooledFakeContext, max_uses=10)
+
+        context = pool.acquire()
+        collector.install(context).begin("test_search")
+        context.bindings[BINDING](None, navigation("https://www.example.com/"))
+        collector.end(context)
+
+        pool._entries[context].origins.update({"https://www.example.com", "https://cart.example.com"})
+        pool.release(context)
+        context.bindings[BINDING](None, navigation("https://www.example.com/n/search?keyword=a"))
+
+        assert pool.acquire() is context
+        collector.begin("test_cart")
+        context.bindings[BINDING](None, navigation("https://cart.example.com/__context_reset__"))
+        navigations = collector.end(context)
+
+        assert navigations == []
+        assert [entry["url"] for entry in collector.navigations] == ["https://www.example.com/"]
+
+
+class TestSummaries:
+    # summarize_by_path() 테스트: 경로별 p75
+    def test_p75_by_path(self):
+        navigations = [
+            navigation("https://example.com/n/search?keyword=a", lcp=lcp) for lcp in (1000, 2000, 3000, 4000)
+        ]
+
+        summary = summarize_by_path(navigations)
+
+        assert summary["/n/search"]["visits"] == 4
+        assert summary["/n/search"]["lcp"] == 3250
+        assert summary["/n/search"]["lcp_rating"] == "needs-improvement"
+        assert summary["/n/search"]["inp"] is None
+
+    # html_table() 테스트
+    def test_html_table(self):
+        html = html_table([navigation("https://example.com/", lcp=5000)])
+
+        assert "<td>https://example.com/</td>" in html
+        assert '<td class="poor">5000</td>' in html
+        assert "20 KB" in html
+
+    # URL은 HTML 이스케이프
+    def test_html_table_escapes_url(self):
+        html = html_table([navigation("https://example.com/n/search?keyword=<b>&page=2")])
+
+        assert "keyword=&lt;b&gt;&amp;page=2" in html
+        assert "<b>" not in html